@@ -4,14 +4,26 @@ Overcode - A supervisor for managing multiple Claude Code instances.
 
 from pathlib import Path
 
-_toml = Path(__file__).resolve().parent.parent.parent / "pyproject.toml"
-if _toml.is_file():
-    import tomllib
-    with open(_toml, "rb") as _f:
-        __version__ = tomllib.load(_f)["project"]["version"]
-else:
-    from importlib.metadata import version as _version
-    __version__ = _version("overcode")
+
+def _read_version() -> str:
+    toml = Path(__file__).resolve().parent.parent.parent / "pyproject.toml"
+    if toml.is_file():
+        import tomllib
+        with open(toml, "rb") as f:
+            return tomllib.load(f)["project"]["version"]
+    from importlib.metadata import version
+    return version("overcode")
+
+
+def __getattr__(name: str):
+    # __version__ is resolved on first access: parsing pyproject.toml (or
+    # package metadata) costs more than the rest of the package import, and
+    # the hook-handler fast path never needs it.
+    if name == "__version__":
+        global __version__
+        __version__ = _read_version()
+        return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_dev_version_suffix() -> str:
@@ -37,4 +49,6 @@ def get_full_version() -> str:
     each agent — useful for diagnosing feature-regression questions like
     "was this agent launched before the --settings hook injection landed?"
     """
-    return f"{__version__}{get_dev_version_suffix()}"
+    # A bare __version__ lookup doesn't go through the module __getattr__
+    version = globals().get("__version__") or __getattr__("__version__")
+    return f"{version}{get_dev_version_suffix()}"
@@ -0,0 +1,125 @@
+"""
+Per-agent detection scheduling.
+
+Detecting every agent on every tick makes detection work grow with the
+fleet even though most agents are idle. AgentScheduler gives each agent
+its own next-due time, derived from its last observed status: running
+agents are re-detected on every tick, waiting agents less often, and
+asleep or terminated ones rarely. Anything that suggests an agent has
+changed (a hook event, input sent to it, its pane changing) bumps it so
+it is detected straight away.
+
+Due times live in a heap keyed by time; entries superseded by a later
+observe() or bump() are skipped when they surface.
+"""
+
+import heapq
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from .status_constants import (
+    STATUS_ASLEEP,
+    STATUS_BUSY_SLEEPING,
+    STATUS_DONE,
+    STATUS_ERROR,
+    STATUS_TERMINATED,
+    STATUS_WAITING_APPROVAL,
+    STATUS_WAITING_HEARTBEAT,
+    STATUS_WAITING_OVERSIGHT,
+    STATUS_WAITING_USER,
+)
+
+
+# Monitor daemon re-detection periods by status (seconds). Statuses not
+# listed (running and its heartbeat variants) are detected every tick.
+DAEMON_CADENCES: Dict[str, float] = {
+    STATUS_WAITING_USER: 30.0,
+    STATUS_WAITING_APPROVAL: 30.0,
+    STATUS_WAITING_OVERSIGHT: 30.0,
+    STATUS_WAITING_HEARTBEAT: 30.0,
+    STATUS_ERROR: 30.0,
+    STATUS_BUSY_SLEEPING: 30.0,
+    STATUS_ASLEEP: 120.0,
+    STATUS_TERMINATED: 120.0,
+    STATUS_DONE: 120.0,
+}
+
+
+class AgentScheduler:
+    """Priority queue of agents keyed by when each is next due for detection."""
+
+    def __init__(
+        self,
+        cadences: Mapping[str, float],
+        default: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._cadences = dict(cadences)
+        self._default = default
+        self._clock = clock
+        # session_id -> due time; None means due now (new, bumped or handed out)
+        self._next_due: Dict[str, Optional[float]] = {}
+        self._status: Dict[str, str] = {}
+        self._heap: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+
+    def cadence(self, status: str) -> float:
+        """Re-detection period for an agent last seen in ``status``."""
+        return self._cadences.get(status, self._default)
+
+    def due(self, session_ids: Iterable[str]) -> Set[str]:
+        """The agents among ``session_ids`` that should be detected now.
+
+        Agents handed out here stay due until observe() reschedules them.
+        """
+        ids = set(session_ids)
+        now = self._clock()
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                at, sid = heapq.heappop(self._heap)
+                if self._next_due.get(sid) == at:
+                    self._next_due[sid] = None
+            return {sid for sid in ids if self._next_due.get(sid) is None}
+
+    def observe(self, session_id: str, status: str) -> None:
+        """Record an agent's status after a tick.
+
+        An agent that was just detected is scheduled one cadence of
+        ``status`` from now. One that wasn't keeps its due time, unless its
+        status changed anyway (e.g. it was put to sleep), in which case it
+        becomes due so the new cadence applies.
+        """
+        now = self._clock()
+        with self._lock:
+            previous = self._status.get(session_id)
+            self._status[session_id] = status
+            if self._next_due.get(session_id) is not None:
+                if status != previous:
+                    self._next_due[session_id] = None
+                return
+            at = now + self.cadence(status)
+            self._next_due[session_id] = at
+            heapq.heappush(self._heap, (at, session_id))
+
+    def bump(self, session_ids: Iterable[str]) -> None:
+        """Make agents due immediately."""
+        with self._lock:
+            for sid in session_ids:
+                self._next_due[sid] = None
+
+    def bump_all(self) -> None:
+        """Make every known agent due immediately."""
+        with self._lock:
+            for sid in self._next_due:
+                self._next_due[sid] = None
+
+    def forget(self, keep: Iterable[str]) -> None:
+        """Drop agents not in ``keep``."""
+        keep = set(keep)
+        with self._lock:
+            for sid in [s for s in self._next_due if s not in keep]:
+                del self._next_due[sid]
+                self._status.pop(sid, None)
+            self._heap = [(at, sid) for at, sid in self._heap if sid in keep]
+            heapq.heapify(self._heap)
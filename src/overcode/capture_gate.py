@@ -0,0 +1,89 @@
+"""
+Activity-gated pane capture.
+
+Most agents are idle at any moment and their panes are byte-identical
+from one poll to the next, yet each poll used to capture them in full
+only to find that out by hashing. PaneCaptureGate asks tmux for a cheap
+fingerprint of every pane first (pane id, history size, cursor position
+and window activity time, all from one list-panes call) and captures
+only the panes whose fingerprint changed. The others are served from the
+previous capture.
+
+window_activity has one-second resolution, so output landing in the same
+second as a capture would leave the fingerprint unchanged. A capture is
+therefore only reused once the window has been quiet for SETTLE_SECONDS
+at the time it was taken.
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .interfaces import TmuxInterface
+
+
+# Quiet time before a capture may be reused for an unchanged fingerprint
+SETTLE_SECONDS = 2.0
+
+
+def _activity_time(fingerprint: str) -> Optional[float]:
+    try:
+        return float(fingerprint.rsplit(" ", 1)[1])
+    except (IndexError, ValueError):
+        return None
+
+
+class PaneCaptureGate:
+    """capture_panes() that skips panes whose tmux metadata hasn't changed."""
+
+    def __init__(self, tmux_session: str):
+        self.tmux_session = tmux_session
+        # window -> (fingerprint, lines, content) of the last reusable capture
+        self._cache: Dict[str, Tuple[str, int, Optional[str]]] = {}
+        self._lock = threading.Lock()
+
+    def capture(
+        self, tmux: "TmuxInterface", windows: List[str], lines: int
+    ) -> Tuple[Dict[str, Optional[str]], Set[str]]:
+        """Capture ``windows``, reusing unchanged panes.
+
+        Returns:
+            (contents, unchanged): contents maps every window to what
+            capture_panes would return; unchanged is the set of windows
+            served from the previous capture
+        """
+        windows = list(windows)
+        if not windows:
+            return {}, set()
+        fingerprints = tmux.pane_fingerprints(self.tmux_session)
+        now = time.time()
+
+        contents: Dict[str, Optional[str]] = {}
+        unchanged: Set[str] = set()
+        with self._lock:
+            for window in windows:
+                cached = self._cache.get(window)
+                fingerprint = fingerprints.get(window)
+                if cached and fingerprint and cached[0] == fingerprint and cached[1] == lines:
+                    contents[window] = cached[2]
+                    unchanged.add(window)
+            # Forget windows that no longer exist
+            if fingerprints:
+                for window in [w for w in self._cache if w not in fingerprints]:
+                    del self._cache[window]
+
+        to_capture = [w for w in windows if w not in unchanged]
+        if to_capture:
+            captured = tmux.capture_panes(self.tmux_session, to_capture, lines=lines)
+            with self._lock:
+                for window in to_capture:
+                    content = captured.get(window)
+                    contents[window] = content
+                    fingerprint = fingerprints.get(window)
+                    activity = _activity_time(fingerprint) if fingerprint else None
+                    if content is not None and activity is not None and now - activity >= SETTLE_SECONDS:
+                        self._cache[window] = (fingerprint, lines, content)
+                    else:
+                        self._cache.pop(window, None)
+        return contents, unchanged
@@ -61,8 +61,13 @@ def _check_skill_staleness() -> None:
         rprint("[yellow]Warning:[/yellow] Installed skills are modified. Run [bold]overcode skills install[/bold] to update.")
 
 
-def _gather_session_stats(sess, pane_content_raw: str) -> dict:
-    """Gather claude_stats, git_diff, bg_bash_count, live_sub_count for a session."""
+def _gather_session_stats(sess, pane_content_raw: str, snapshot=None) -> dict:
+    """Gather claude_stats, git_diff, bg_bash_count, live_sub_count for a session.
+
+    ``snapshot`` is the session's SessionDaemonState from a fresh daemon
+    stats snapshot; when given, Claude and git stats come from it instead of
+    being recomputed.
+    """
     from ..history_reader import get_session_stats
     from ..status_patterns import (
         extract_background_bash_count,
@@ -80,22 +85,28 @@ def _gather_session_stats(sess, pane_content_raw: str) -> dict:
     auto_accept = extract_auto_accept_mode(pane_content_raw) if pane_content_raw else False
 
     claude_stats = None
-    try:
-        claude_stats = get_session_stats(sess)
-        if claude_stats:
-            live_sub_count = max(live_sub_count, claude_stats.live_subagent_count)
-    except Exception:
-        pass
-
     git_diff = None
     git_untracked = None
-    try:
-        _gdir = effective_git_directory(sess)
-        if _gdir:
-            git_diff = get_git_diff_stats(_gdir)
-            git_untracked = get_git_untracked_count(_gdir)
-    except Exception:
-        pass
+    if snapshot is not None:
+        claude_stats = snapshot.to_claude_stats()
+        live_sub_count = max(live_sub_count, claude_stats.live_subagent_count)
+        git_diff = snapshot.git_diff_stats
+        git_untracked = snapshot.git_untracked
+    else:
+        try:
+            claude_stats = get_session_stats(sess)
+            if claude_stats:
+                live_sub_count = max(live_sub_count, claude_stats.live_subagent_count)
+        except Exception:
+            pass
+
+        try:
+            _gdir = effective_git_directory(sess)
+            if _gdir:
+                git_diff = get_git_diff_stats(_gdir)
+                git_untracked = get_git_untracked_count(_gdir)
+        except Exception:
+            pass
 
     return {
         "claude_stats": claude_stats,
@@ -536,6 +547,8 @@ def list_agents(
     # Prefer daemon state for status/activity (single source of truth)
     daemon_state = get_monitor_daemon_state(session)
     use_daemon = daemon_state is not None and not daemon_state.is_stale()
+    # Daemon-published stats; sessions missing here are computed locally
+    stats_snapshot = daemon_state.stats_snapshot() if daemon_state else {}
 
     # Compute cross-session flags from daemon state
     cross_flags = _compute_cross_session_flags(sessions, daemon_state, use_daemon)
@@ -583,17 +596,24 @@ def list_agents(
             status = "asleep"
 
         claude_stats = None
-        try:
-            claude_stats = get_session_stats(sess)
-        except Exception:
-            pass
+        git_diff = None
+        git_untracked = None
+        ds_stats = stats_snapshot.get(sess.id)
+        if ds_stats is not None:
+            claude_stats = ds_stats.to_claude_stats()
+        else:
+            try:
+                claude_stats = get_session_stats(sess)
+            except Exception:
+                pass
         if claude_stats is None and getattr(sess, 'is_remote', False):
             from ..history_reader import synthesize_remote_stats
             claude_stats = synthesize_remote_stats(sess)
 
-        git_diff = None
-        git_untracked = None
-        if getattr(sess, 'is_remote', False):
+        if ds_stats is not None:
+            git_diff = ds_stats.git_diff_stats
+            git_untracked = ds_stats.git_untracked
+        elif getattr(sess, 'is_remote', False):
             git_diff = getattr(sess, 'remote_git_diff', None)
             git_untracked = getattr(sess, 'remote_git_untracked', None)
         else:
@@ -1093,6 +1113,12 @@ def show(
 
     # Capture pane content separately if needed for display or stats parsing
     need_pane = (not stats_only and lines > 0) or not no_stats
+    if need_pane and not pane_content_raw and daemon_session:
+        # The daemon publishes its latest capture of every pane
+        from ..pane_store import PaneStoreReader
+        record = PaneStoreReader(session).get(sess.id, min_lines=lines)
+        if record is not None:
+            pane_content_raw = record.content
     if need_pane and not pane_content_raw and sess.status != "terminated":
         from ..status_detector_factory import StatusDetectorDispatcher
         dispatcher = StatusDetectorDispatcher(session)
@@ -1100,7 +1126,8 @@ def show(
 
     if not no_stats:
         # Gather all stats
-        stats_data = _gather_session_stats(sess, pane_content_raw)
+        snapshot = daemon_state.stats_snapshot().get(sess.id) if daemon_state else None
+        stats_data = _gather_session_stats(sess, pane_content_raw, snapshot)
         claude_stats = stats_data["claude_stats"]
         git_diff = stats_data["git_diff"]
         git_untracked = stats_data["git_untracked"]
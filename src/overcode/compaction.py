@@ -0,0 +1,579 @@
+"""
+Retention and compaction for overcode's growing data files.
+
+Several files only ever grow: the agent status history and presence log
+CSVs, archive.json, each agent's ``claude_session_ids`` list, and the
+hook event logs of agents that have since gone away. The monitor daemon
+runs a CompactionService on a slow schedule (a few times a day, on a
+background thread at the lowest CPU priority) that enforces the
+retention windows from ``get_retention_config()``.
+
+Aged data is not deleted: it is appended to gzip-compressed daily
+segments in a ``segments/`` directory next to the live file, e.g.
+``segments/presence_log-2026-01-31.csv.gz``. Repeated runs append new
+gzip members to the same day's segment, which gzip readers handle
+transparently. Live files are rewritten by streaming into a temporary
+file and renaming it into place, so a crash leaves either the old or the
+new file, never a partial one; the updated segments are renamed into
+place only after that, so a failed pass never moves rows twice. Writers appending to those files take
+append_lock() so no row lands in the old file after it was copied.
+"""
+
+import gzip
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+from .exceptions import StateWriteError
+from .state_watcher import hook_agent_name
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+
+SEGMENTS_DIRNAME = "segments"
+
+# Delay before the first pass after daemon start, so startup stays cheap
+INITIAL_DELAY_SECONDS = 600
+
+
+class _SegmentWriter:
+    """Appends data to gzip-compressed per-day segment files.
+
+    Each day's segment is staged in a temporary copy; nothing is visible
+    under the segment's own name until commit() (or close()).
+    """
+
+    def __init__(self, segment_dir: Path, stem: str, suffix: str, header: bytes = b""):
+        self.segment_dir = Path(segment_dir)
+        self.stem = stem
+        self.suffix = suffix
+        self.header = header
+        self._files: Dict[date, tuple] = {}
+        self._staged: List[tuple] = []
+
+    def path_for(self, day: date) -> Path:
+        return self.segment_dir / f"{self.stem}-{day.isoformat()}{self.suffix}.gz"
+
+    def write(self, day: date, data: bytes) -> None:
+        entry = self._files.get(day)
+        if entry is None:
+            self.segment_dir.mkdir(parents=True, exist_ok=True)
+            path = self.path_for(day)
+            fd, tmp_name = tempfile.mkstemp(dir=str(self.segment_dir), prefix=f".{path.name}", suffix=".tmp")
+            raw = os.fdopen(fd, "wb")
+            self._staged.append((tmp_name, path))
+            is_new = True
+            try:
+                with open(path, "rb") as existing:
+                    shutil.copyfileobj(existing, raw)
+                is_new = False
+            except FileNotFoundError:
+                pass
+            entry = (raw, gzip.GzipFile(fileobj=raw, mode="ab"))
+            self._files[day] = entry
+            if is_new and self.header:
+                entry[1].write(self.header)
+        entry[1].write(data)
+
+    def finish(self) -> None:
+        """Finish every staged segment and fsync it."""
+        for raw, gz in self._files.values():
+            gz.close()
+            raw.flush()
+            os.fsync(raw.fileno())
+            raw.close()
+        self._files = {}
+
+    def commit(self) -> None:
+        """Rename the finished segments into place."""
+        for tmp_name, path in self._staged:
+            os.replace(tmp_name, path)
+        self._staged = []
+
+    def discard(self) -> None:
+        """Drop staged segments, leaving the committed ones untouched."""
+        for raw, gz in self._files.values():
+            try:
+                gz.close()
+            except (OSError, ValueError):
+                pass
+            raw.close()
+        self._files = {}
+        for tmp_name, _ in self._staged:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+        self._staged = []
+
+    def close(self) -> None:
+        """finish() and commit(), or discard() if that fails."""
+        try:
+            self.finish()
+            self.commit()
+        except BaseException:
+            self.discard()
+            raise
+
+
+def _lock_path(path: Path) -> Path:
+    return path.with_name(path.name + ".compact.lock")
+
+
+@contextmanager
+def append_lock(path: Path) -> Iterator[None]:
+    """Shared lock held by writers around each append to a compacted CSV.
+
+    Compaction rewrites the file and renames the copy into place; it takes
+    the same lock exclusively, so a row is never appended to the old file
+    after its last read, or through a descriptor left on the replaced
+    inode. Appends proceed without the lock if it can't be opened.
+    """
+    if not HAS_FCNTL:
+        yield
+        return
+    try:
+        f = open(_lock_path(Path(path)), "a")
+    except OSError:
+        yield
+        return
+    with f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+@contextmanager
+def _compaction_lock(path: Path) -> Iterator[None]:
+    """Exclusive per-file lock for a compaction pass.
+
+    Serializes two daemons compacting one file and keeps appenders (see
+    append_lock) waiting while the file is copied and replaced.
+    """
+    if not HAS_FCNTL:
+        yield
+        return
+    with open(_lock_path(path), "a") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _line_timestamp(line: bytes) -> Optional[datetime]:
+    """Parse the leading timestamp field of a CSV line, or None."""
+    try:
+        return datetime.fromisoformat(line.split(b",", 1)[0].decode("ascii"))
+    except (UnicodeDecodeError, ValueError):
+        return None
+
+
+def compact_csv_file(
+    path: Path,
+    cutoff: datetime,
+    segment_dir: Optional[Path] = None,
+) -> int:
+    """Move rows older than ``cutoff`` out of a time-ordered CSV file.
+
+    The file must have a leading ISO timestamp column and be appended in
+    time order (agent status history, presence log). Old rows are read
+    until the first row within retention; everything after it is copied
+    without parsing. Rows that can't be parsed are kept, and the scan
+    goes on past them.
+
+    Args:
+        path: CSV file to compact
+        cutoff: Rows with an earlier timestamp are moved out
+        segment_dir: Where to write aged rows; None discards them
+
+    Returns:
+        Number of rows moved out (0 if the file was left untouched)
+    """
+    path = Path(path)
+    if not path.exists():
+        return 0
+    with _compaction_lock(path):
+        return _compact_csv_locked(path, cutoff, segment_dir)
+
+
+def _compact_csv_locked(path: Path, cutoff: datetime, segment_dir: Optional[Path]) -> int:
+    moved = 0
+    segments = None
+    fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=path.name, suffix=".tmp")
+    try:
+        with open(path, "rb") as src, os.fdopen(fd, "wb") as dst:
+            header = src.readline()
+            if not header.startswith(b"timestamp"):
+                src.seek(0)
+                header = b""
+            dst.write(header)
+
+            if segment_dir is not None:
+                segments = _SegmentWriter(segment_dir, path.stem, path.suffix, header)
+            while True:
+                line = src.readline()
+                if not line:
+                    break
+                ts = _line_timestamp(line)
+                if ts is None:
+                    dst.write(line)  # malformed rows are kept
+                    continue
+                if ts >= cutoff:
+                    dst.write(line)
+                    break
+                if segments is not None:
+                    segments.write(ts.date(), line)
+                moved += 1
+
+            if moved == 0:
+                if segments is not None:
+                    segments.discard()
+                os.unlink(tmp_name)
+                return 0
+
+            if segments is not None:
+                segments.finish()
+            # Appenders are held off by the lock until the rename
+            shutil.copyfileobj(src, dst)
+            dst.flush()
+            os.fsync(dst.fileno())
+            os.replace(tmp_name, path)
+    except BaseException:
+        if segments is not None:
+            segments.discard()
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    # Only now are the rows gone from the live file: publish the
+    # segments, so a failure before this point never moves rows twice
+    if segments is not None:
+        segments.commit()
+    return moved
+
+
+def _write_jsonl_segments(segment_dir: Path, stem: str, records: List[tuple]) -> None:
+    """Append (day, dict) records to per-day JSONL segments."""
+    segments = _SegmentWriter(segment_dir, stem, ".jsonl")
+    try:
+        for day, record in records:
+            segments.write(day, (json.dumps(record) + "\n").encode("utf-8"))
+    finally:
+        segments.close()
+
+
+def compact_archive(session_manager, ended_before: datetime, segment_dir: Path) -> int:
+    """Move archived sessions that ended before a cutoff into segments.
+
+    Returns:
+        Number of archived sessions moved
+    """
+    def sink(entries: List[dict]) -> None:
+        records = []
+        for data in entries:
+            end_time = datetime.fromisoformat(data["end_time"])
+            records.append((end_time.date(), data))
+        _write_jsonl_segments(segment_dir, "archive", records)
+
+    return session_manager.take_archived_sessions(ended_before, sink)
+
+
+def prune_claude_session_ids(
+    session_manager,
+    max_ids: int,
+    transcript_exists: Callable[[object, str], bool],
+) -> int:
+    """Cap each agent's claude_session_ids list at ``max_ids``.
+
+    Only IDs whose Claude transcript no longer exists are dropped (oldest
+    first), so stats computed from transcripts are unaffected; the active
+    ID is never dropped. A list may therefore stay above the cap while
+    its transcripts are still on disk.
+
+    Returns:
+        Number of IDs removed across all sessions
+    """
+    if max_ids <= 0:
+        return 0
+    # Transcript checks happen outside the state lock; only the chosen IDs
+    # are removed from each current list, so IDs recorded meanwhile survive
+    removals = {}
+    for session in session_manager.list_sessions():
+        ids = list(session.claude_session_ids or [])
+        excess = len(ids) - max_ids
+        if excess <= 0:
+            continue
+        drop = set()
+        for sid in ids:
+            if len(drop) >= excess:
+                break
+            if sid == session.active_claude_session_id:
+                continue
+            if not transcript_exists(session, sid):
+                drop.add(sid)
+        if drop:
+            removals[session.id] = drop
+    return session_manager.remove_claude_session_ids(removals)
+
+
+def _default_transcript_exists(session, claude_session_id: str) -> bool:
+    from .history_reader import get_session_file_path
+
+    if not session.start_directory:
+        # Unknown location: keep the ID rather than guess
+        return True
+    return get_session_file_path(session.start_directory, claude_session_id).exists()
+
+
+def compact_hook_logs(
+    state_dir: Path,
+    live_names: set,
+    older_than: datetime,
+    segment_dir: Path,
+) -> int:
+    """Roll up hook files of agents that are gone.
+
+    Event logs of live agents are already bounded by hook_handler's own
+    rotation. For names not in ``live_names`` whose files haven't changed
+    since ``older_than``, the event log is moved into the day's
+    ``hook_events`` segment (each record tagged with its agent) and the
+    event log and hook state file are removed.
+
+    Returns:
+        Number of agents whose files were removed
+    """
+    cutoff = older_than.timestamp()
+    files: Dict[str, List[Path]] = {}
+    recent = set()
+    try:
+        entries = list(os.scandir(state_dir))
+    except OSError:
+        return 0
+    for entry in entries:
+        name = hook_agent_name(entry.name)
+        if name is None or name in live_names:
+            continue
+        try:
+            if entry.stat().st_mtime >= cutoff:
+                recent.add(name)
+                continue
+        except OSError:
+            continue
+        files.setdefault(name, []).append(Path(entry.path))
+
+    removed = 0
+    for name, paths in files.items():
+        if name in recent:
+            continue
+        records = []
+        for path in paths:
+            if not path.name.endswith(".jsonl"):
+                continue
+            day = datetime.fromtimestamp(path.stat().st_mtime).date()
+            with open(path, "r", errors="replace") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(record, dict):
+                        records.append((day, {"agent": name, **record}))
+        if records:
+            _write_jsonl_segments(segment_dir, "hook_events", records)
+        for path in paths:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        removed += 1
+    return removed
+
+
+def prune_segments(segment_dir: Path, older_than: datetime) -> int:
+    """Delete segment files whose day is before ``older_than``."""
+    cutoff = older_than.date()
+    removed = 0
+    try:
+        entries = list(os.scandir(segment_dir))
+    except OSError:
+        return 0
+    for entry in entries:
+        if not entry.name.endswith(".gz"):
+            continue
+        # <stem>-YYYY-MM-DD<suffix>.gz
+        base = entry.name[:-3]
+        base = base[:base.rfind(".")] if "." in base else base
+        try:
+            day = date.fromisoformat(base[-10:])
+        except ValueError:
+            continue
+        if day < cutoff:
+            try:
+                os.unlink(entry.path)
+                removed += 1
+            except OSError:
+                pass
+    return removed
+
+
+def _lower_thread_priority() -> None:
+    """Run the calling thread at the lowest CPU priority, where possible.
+
+    On Linux, setpriority() on a thread ID affects only that thread.
+    Elsewhere it would renice the whole daemon, so it's skipped.
+    """
+    if not sys.platform.startswith("linux"):
+        return
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+    except (AttributeError, OSError):
+        pass
+
+
+class CompactionService:
+    """Schedules and runs compaction passes for one monitor daemon."""
+
+    def __init__(
+        self,
+        session_manager,
+        history_path: Path,
+        presence_log_path: Optional[Path] = None,
+        settings: Optional[dict] = None,
+        log: Optional[Callable[[str], None]] = None,
+        initial_delay: float = INITIAL_DELAY_SECONDS,
+    ):
+        """Initialize the service.
+
+        Args:
+            session_manager: SessionManager for archive and claude_session_ids
+            history_path: This daemon's agent_status_history.csv; hook files
+                are looked for in the same directory
+            presence_log_path: presence_log.csv (defaults to PATHS.presence_log)
+            settings: Retention settings (defaults to get_retention_config())
+            log: Optional callable for progress and warnings
+            initial_delay: Seconds after construction before the first pass
+        """
+        self.session_manager = session_manager
+        self.history_path = Path(history_path)
+        if presence_log_path is None:
+            from .settings import PATHS
+            presence_log_path = PATHS.presence_log
+        self.presence_log_path = Path(presence_log_path)
+        self._settings = settings
+        self._log = log or (lambda msg: None)
+        self._next_run = time.monotonic() + initial_delay
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def settings(self) -> dict:
+        if self._settings is not None:
+            return self._settings
+        from .config import get_retention_config
+        return get_retention_config()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def maybe_start(self) -> bool:
+        """Start a background pass if one is due and none is running."""
+        if self.running or time.monotonic() < self._next_run:
+            return False
+        settings = self.settings
+        self._next_run = time.monotonic() + settings["interval_hours"] * 3600
+        self._thread = threading.Thread(
+            target=self._run_in_background, args=(settings,),
+            name="compaction", daemon=True,
+        )
+        self._thread.start()
+        return True
+
+    def _run_in_background(self, settings: dict) -> None:
+        _lower_thread_priority()
+        try:
+            counts = self.run_once(settings=settings)
+        except Exception as e:  # never take the daemon down
+            self._log(f"Compaction failed: {e}")
+            return
+        if any(counts.values()):
+            summary = ", ".join(f"{k}={v}" for k, v in counts.items() if v)
+            self._log(f"Compaction: {summary}")
+
+    def run_once(
+        self,
+        now: Optional[datetime] = None,
+        settings: Optional[dict] = None,
+    ) -> Dict[str, int]:
+        """Run one compaction pass synchronously.
+
+        Each step is independent; one failing doesn't stop the others.
+
+        Returns:
+            Dict of step name -> items moved or removed
+        """
+        now = now or datetime.now()
+        settings = settings or self.settings
+        state_dir = self.history_path.parent
+        session_segments = state_dir / SEGMENTS_DIRNAME
+        global_segments = self.presence_log_path.parent / SEGMENTS_DIRNAME
+        archive_segments = Path(self.session_manager.state_dir) / SEGMENTS_DIRNAME
+
+        steps = {
+            "status_history": lambda: compact_csv_file(
+                self.history_path,
+                now - timedelta(hours=settings["status_history_hours"]),
+                session_segments,
+            ),
+            "presence_log": lambda: compact_csv_file(
+                self.presence_log_path,
+                now - timedelta(hours=settings["presence_log_hours"]),
+                global_segments,
+            ),
+            "archive": lambda: compact_archive(
+                self.session_manager,
+                now - timedelta(days=settings["archive_days"]),
+                archive_segments,
+            ),
+            "claude_session_ids": lambda: prune_claude_session_ids(
+                self.session_manager,
+                settings["claude_session_ids"],
+                _default_transcript_exists,
+            ),
+            "hook_logs": lambda: compact_hook_logs(
+                state_dir,
+                {s.name for s in self.session_manager.list_sessions()},
+                now - timedelta(days=settings["hook_events_days"]),
+                session_segments,
+            ),
+        }
+        if settings["segments_days"] > 0:
+            segment_cutoff = now - timedelta(days=settings["segments_days"])
+            steps["segments"] = lambda: sum(
+                prune_segments(d, segment_cutoff)
+                for d in {session_segments, global_segments, archive_segments}
+            )
+
+        counts = {}
+        for name, step in steps.items():
+            try:
+                counts[name] = step()
+            except (OSError, ValueError, StateWriteError) as e:
+                self._log(f"Compaction step {name} failed: {e}")
+                counts[name] = 0
+        return counts
@@ -332,6 +332,38 @@ def get_web_api_key() -> Optional[str]:
     return _get_config_value("web.api_key") or None
 
 
+def get_web_max_workers() -> int:
+    """Get how many GET requests the web server handles at once.
+
+    Control requests (POST/PUT/DELETE) have slots of their own and never
+    wait for these.
+
+    Config format in ~/.overcode/config.yaml:
+        web:
+          max_workers: 16
+
+    Returns:
+        Configured limit or 8 (default)
+    """
+    return max(1, int(_get_config_value("web.max_workers", 8)))
+
+
+def get_web_request_timeout() -> float:
+    """Get the web server's per-request timeout in seconds.
+
+    Bounds socket reads/writes and how long a request waits for a free
+    worker before getting 503.
+
+    Config format in ~/.overcode/config.yaml:
+        web:
+          request_timeout: 30
+
+    Returns:
+        Configured timeout or 30 (default)
+    """
+    return float(_get_config_value("web.request_timeout", 30))
+
+
 def get_web_allow_control() -> bool:
     """Check if remote control is enabled for the web server.
 
@@ -360,6 +392,30 @@ def get_tmux_toggle_key() -> str | None:
     return _get_config_value("tmux.toggle_key")
 
 
+def get_tmux_control_mode() -> bool:
+    """Whether tmux commands go over a persistent control-mode client.
+
+    When enabled, pane captures, PID lookups and key sends are written to
+    one long-lived ``tmux -C`` connection instead of forking a tmux client
+    per command (see tmux_control.py).
+
+    Config format in ~/.overcode/config.yaml:
+        tmux:
+          control_mode: true
+
+    The OVERCODE_TMUX_CONTROL environment variable ("1"/"0") takes
+    precedence.
+
+    Returns:
+        True if enabled (default False)
+    """
+    import os
+    env = os.environ.get("OVERCODE_TMUX_CONTROL")
+    if env is not None and env.strip():
+        return env.strip().lower() in ("1", "true", "yes", "on")
+    return bool(_get_config_value("tmux.control_mode", False))
+
+
 def set_tmux_toggle_key(key: str) -> None:
     """Save the tmux pane toggle key to config.
 
@@ -524,6 +580,82 @@ def get_jobs_retention_hours() -> float:
     return float(_get_config_value("jobs.retention_hours", 24))
 
 
+def get_retention_config() -> dict:
+    """Get retention settings for the daemon's compaction pass.
+
+    Data older than its retention window is moved out of the live file
+    into gzip-compressed daily segments (see compaction.py).
+
+    Config format in ~/.overcode/config.yaml:
+        retention:
+          status_history_hours: 168   # agent_status_history.csv
+          presence_log_hours: 720     # presence_log.csv
+          archive_days: 90            # archive.json (by end time)
+          hook_events_days: 7         # event logs of agents no longer present
+          claude_session_ids: 50      # max IDs kept per agent
+          segments_days: 0            # delete segments after this (0 = keep)
+          interval_hours: 6           # how often compaction runs
+
+    Returns:
+        Dict with the keys above
+    """
+    retention = _get_config_value("retention", {}) or {}
+    defaults = {
+        "status_history_hours": 168.0,
+        "presence_log_hours": 720.0,
+        "archive_days": 90.0,
+        "hook_events_days": 7.0,
+        "claude_session_ids": 50,
+        "segments_days": 0.0,
+        "interval_hours": 6.0,
+    }
+    result = {}
+    for key, default in defaults.items():
+        try:
+            result[key] = type(default)(retention.get(key, default))
+        except (TypeError, ValueError, AttributeError):
+            result[key] = default
+    return result
+
+
+def get_hook_receiver_enabled() -> bool:
+    """Whether the monitor daemon runs the persistent hook receiver.
+
+    When enabled, `overcode hook-handler` forwards each event to the
+    daemon over a Unix socket instead of processing it itself.
+
+    Config format in ~/.overcode/config.yaml:
+        hooks:
+          receiver: true
+
+    Returns:
+        True if enabled (default False)
+    """
+    return bool(_get_config_value("hooks.receiver", False))
+
+
+STATE_BACKENDS = ("json", "sqlite")
+
+
+def get_state_backend() -> str:
+    """Get the persistence backend for session state.
+
+    Config format in ~/.overcode/config.yaml:
+        state:
+          backend: sqlite   # or json (default)
+
+    The OVERCODE_STATE_BACKEND environment variable takes precedence.
+    Unknown values fall back to "json".
+
+    Returns:
+        "json" or "sqlite"
+    """
+    import os
+    value = os.environ.get("OVERCODE_STATE_BACKEND") or _get_config_value("state.backend", "json")
+    value = str(value).strip().lower()
+    return value if value in STATE_BACKENDS else "json"
+
+
 def get_sisters_config() -> List[dict]:
     """Get sister instance configuration for cross-machine monitoring.
 
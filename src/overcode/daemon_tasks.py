@@ -0,0 +1,173 @@
+"""
+Worker pools for the monitor daemon's slow sync work.
+
+Stats, git, skills, sandbox and process syncs fork subprocesses (git,
+ps, lsof, docker exec) or read large history files. Run inline, one slow
+call stalled the whole tick, including status detection for every other
+agent. TaskPool runs such work on a bounded set of worker threads:
+
+- start() launches a named task without waiting for it. A task whose
+  previous run is still going is not started again, so a hung call
+  occupies at most one worker instead of piling up.
+- map() runs a per-agent call for many agents at once and waits for
+  them up to a timeout; agents that don't answer in time are left
+  running and skipped by later map() calls until they finish.
+- wait() blocks until the started tasks finish or reach their timeout.
+
+Tasks that overrun their timeout are reported once through ``on_slow``;
+exceptions are reported through ``on_error`` rather than lost in a
+future nobody reads.
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait as wait_futures
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+# Phase tasks: one worker per concurrently running sync phase
+PHASE_WORKERS = 6
+# Per-agent subprocess calls (git, docker exec) running at once
+AGENT_WORKERS = 4
+
+# How long a tick waits for a phase before publishing without it
+PHASE_TIMEOUT = 5.0
+# How long a phase waits for one agent's call before moving on
+AGENT_CALL_TIMEOUT = 20.0
+
+
+class _Task:
+    """One submitted call and its deadline."""
+
+    __slots__ = ("future", "deadline", "timeout", "reported")
+
+    def __init__(self, future: Future, deadline: float, timeout: float):
+        self.future = future
+        self.deadline = deadline
+        self.timeout = timeout
+        self.reported = False
+
+
+class TaskPool:
+    """Bounded worker pool with single-flight named tasks and timeouts."""
+
+    def __init__(
+        self,
+        max_workers: int,
+        name: str = "overcode-task",
+        on_slow: Optional[Callable[[str, float], None]] = None,
+        on_error: Optional[Callable[[str, BaseException], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._on_slow = on_slow
+        self._on_error = on_error
+        self._clock = clock
+        self._running: Dict[Hashable, _Task] = {}
+        self._lock = threading.Lock()
+
+    def _submit(self, key: Hashable, fn: Callable, args: tuple, timeout: float) -> Optional[Future]:
+        with self._lock:
+            task = self._running.get(key)
+            if task is None or task.future.done():
+                task = None
+                future = self._executor.submit(self._call, key, fn, args)
+                self._running[key] = _Task(future, self._clock() + timeout, timeout)
+        if task is not None:
+            # Previous run still going: don't pile up another
+            self._mark_slow([key])
+            return None
+        future.add_done_callback(lambda f, k=key: self._finished(k, f))
+        return future
+
+    def _call(self, key: Hashable, fn: Callable, args: tuple) -> Any:
+        try:
+            return fn(*args)
+        except Exception as e:
+            if self._on_error is not None:
+                self._on_error(_label(key), e)
+            raise
+
+    def _finished(self, key: Hashable, future: Future) -> None:
+        with self._lock:
+            task = self._running.get(key)
+            if task is not None and task.future is future:
+                del self._running[key]
+
+    def _mark_slow(self, keys: Iterable[Hashable]) -> None:
+        """Report tasks past their deadline, once per run."""
+        now = self._clock()
+        slow = []
+        with self._lock:
+            for key in keys:
+                task = self._running.get(key)
+                if task is not None and not task.reported and not task.future.done() and task.deadline <= now:
+                    task.reported = True
+                    slow.append((key, task.timeout))
+        if self._on_slow is not None:
+            for key, timeout in slow:
+                self._on_slow(_label(key), timeout)
+
+    def start(self, name: str, fn: Callable, *args, timeout: float = PHASE_TIMEOUT) -> bool:
+        """Run ``fn(*args)`` in the background unless ``name`` is still running.
+
+        Returns:
+            True if the task was started
+        """
+        return self._submit(name, fn, args, timeout) is not None
+
+    def wait(self) -> None:
+        """Wait for running tasks, each until it finishes or hits its timeout."""
+        while True:
+            with self._lock:
+                pending = {k: t for k, t in self._running.items()
+                           if not t.reported and not t.future.done()}
+            if not pending:
+                return
+            now = self._clock()
+            overdue = [k for k, t in pending.items() if t.deadline <= now]
+            if overdue:
+                self._mark_slow(overdue)
+                continue
+            remaining = min(t.deadline for t in pending.values()) - now
+            wait_futures([t.future for t in pending.values()],
+                         timeout=remaining, return_when=FIRST_COMPLETED)
+
+    def map(
+        self,
+        name: str,
+        fn: Callable[[Any], Any],
+        items: Iterable[Any],
+        key: Callable[[Any], Hashable] = lambda item: item,
+        timeout: float = AGENT_CALL_TIMEOUT,
+    ) -> Dict[Hashable, Any]:
+        """Call ``fn(item)`` for every item concurrently.
+
+        Waits up to ``timeout`` and returns the results that arrived, by
+        key. Items whose previous call is still running, that raised or
+        that didn't finish in time are missing from the result.
+        """
+        futures: Dict[Hashable, Future] = {}
+        for item in items:
+            k = key(item)
+            future = self._submit((name, k), fn, (item,), timeout)
+            if future is not None:
+                futures[k] = future
+        if not futures:
+            return {}
+        done, not_done = wait_futures(list(futures.values()), timeout=timeout)
+        if not_done:
+            self._mark_slow([(name, k) for k, f in futures.items() if f in not_done])
+        return {
+            k: f.result() for k, f in futures.items()
+            if f in done and f.exception() is None
+        }
+
+    def shutdown(self) -> None:
+        """Stop accepting work; running tasks are not waited for."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _label(key: Hashable) -> str:
+    if isinstance(key, tuple):
+        return ":".join(str(part) for part in key)
+    return str(key)
@@ -0,0 +1,105 @@
+"""
+Memoized polling detection results.
+
+PollingStatusDetector's phases are a pure function of the cleaned pane
+content and of whether that content changed since the previous capture.
+When a pane is captured again with the same content (an idle agent whose
+tmux metadata moved, a hook-triggered re-detect, the TUI re-detecting a
+row) DetectionMemo returns the previous (status, activity, phase) without
+running the phases again.
+
+Entries are kept in a small LRU per session and in one global LRU that
+bounds the total. Hit/miss counts and the time spent running the phases
+on misses are recorded in ``stats``, which reports the hit rate and
+roughly how much detection time the memo saved.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Optional, Tuple
+
+# Entries kept per session (an agent alternates between few pane states)
+MEMO_PER_SESSION = 8
+# Entries kept across all sessions
+MEMO_MAX_ENTRIES = 512
+
+_Result = Tuple[str, str, Optional[str]]
+
+
+@dataclass
+class MemoStats:
+    """Counters for one DetectionMemo."""
+
+    hits: int = 0
+    misses: int = 0
+    miss_seconds: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def saved_seconds(self) -> float:
+        """Estimated phase time avoided: hits times the mean miss cost."""
+        return self.hits * (self.miss_seconds / self.misses) if self.misses else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.hit_rate:.0%} hit ({self.hits}/{self.hits + self.misses}), "
+            f"saved ~{self.saved_seconds * 1000:.1f}ms"
+        )
+
+
+class DetectionMemo:
+    """Bounded LRU of detection results keyed by (session_id, content key)."""
+
+    def __init__(self, per_session: int = MEMO_PER_SESSION, max_entries: int = MEMO_MAX_ENTRIES):
+        self.per_session = per_session
+        self.max_entries = max_entries
+        self.stats = MemoStats()
+        self._sessions: "Dict[str, OrderedDict[Hashable, _Result]]" = {}
+        self._order: "OrderedDict[Tuple[str, Hashable], None]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str, key: Hashable) -> Optional[_Result]:
+        """The memoized result, counting a hit; None (not counted) on a miss."""
+        with self._lock:
+            entries = self._sessions.get(session_id)
+            result = entries.get(key) if entries is not None else None
+            if result is None:
+                return None
+            entries.move_to_end(key)
+            self._order.move_to_end((session_id, key))
+            self.stats.hits += 1
+            return result
+
+    def put(self, session_id: str, key: Hashable, result: _Result, seconds: float) -> None:
+        """Store a freshly computed result and the time it took."""
+        with self._lock:
+            self.stats.misses += 1
+            self.stats.miss_seconds += seconds
+            entries = self._sessions.setdefault(session_id, OrderedDict())
+            entries[key] = result
+            entries.move_to_end(key)
+            self._order[(session_id, key)] = None
+            self._order.move_to_end((session_id, key))
+            while len(entries) > self.per_session:
+                old_key, _ = entries.popitem(last=False)
+                self._order.pop((session_id, old_key), None)
+            while len(self._order) > self.max_entries:
+                (sid, old_key), _ = self._order.popitem(last=False)
+                session_entries = self._sessions.get(sid)
+                if session_entries is not None:
+                    session_entries.pop(old_key, None)
+                    if not session_entries:
+                        del self._sessions[sid]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sessions.clear()
+            self._order.clear()
+
+    def __len__(self) -> int:
+        return len(self._order)
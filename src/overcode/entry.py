@@ -0,0 +1,31 @@
+"""
+Console-script entry point for ``overcode``.
+
+Claude Code runs ``overcode hook-handler`` for every hook event of every
+agent, so that command is dispatched here before the Typer CLI is
+imported — ``overcode.cli`` pulls in Typer, Rich, libtmux, the launcher
+and every command module, which dwarfs the work the hook actually does.
+Only ``hook_handler`` (and ``time_context`` for UserPromptSubmit) load on
+this path. Every other invocation goes to ``overcode.cli.main``.
+"""
+
+import sys
+
+HOOK_HANDLER_COMMAND = "hook-handler"
+
+
+def main() -> None:
+    """Run the hook handler directly, or hand off to the full CLI."""
+    if sys.argv[1:] == [HOOK_HANDLER_COMMAND]:
+        from .hook_handler import handle_hook_event
+
+        handle_hook_event()
+        return
+
+    from .cli import main as cli_main
+
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
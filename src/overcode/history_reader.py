@@ -19,6 +19,7 @@ Each assistant message in session files has usage data:
 import json
 import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
@@ -526,6 +527,122 @@ def get_session_file_path(
     return projects_path / encoded / f"{session_id}.jsonl"
 
 
+def _empty_usage() -> dict:
+    """Return a zeroed token usage dict (the shape _parse_session_lines returns)."""
+    return {
+        "input_tokens": 0,
+        "output_tokens": 0,
+        "cache_creation_tokens": 0,
+        "cache_read_tokens": 0,
+        "current_context_tokens": 0,
+        "model": None,
+        "provider": None,
+    }
+
+
+class _SessionLineAccumulator:
+    """Running token totals and work times for a stream of session JSONL lines.
+
+    Holds just enough state (totals, last model/provider, last user prompt
+    time) to fold in further lines later, which is what lets
+    SessionFileStatsCache parse only the bytes appended since the last sync.
+    """
+
+    def __init__(self, since: Optional[datetime] = None):
+        self.since = since
+        self.totals = _empty_usage()
+        self.work_times: List[float] = []
+        self.last_prompt_time: Optional[datetime] = None
+
+    def feed(self, lines) -> None:
+        """Fold an iterable of JSONL line strings into the running state."""
+        since = self.since
+        totals = self.totals
+
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                data = json.loads(line)
+                msg_type = data.get("type")
+
+                if msg_type == "assistant":
+                    # Check timestamp if filtering by time
+                    if since:
+                        ts_str = data.get("timestamp")
+                        if ts_str:
+                            try:
+                                msg_time = datetime.fromisoformat(
+                                    ts_str.replace("Z", "+00:00")
+                                ).astimezone().replace(tzinfo=None)
+                                if msg_time < since:
+                                    continue
+                            except (ValueError, TypeError):
+                                pass
+
+                    message = data.get("message", {})
+                    usage = message.get("usage", {})
+                    if usage:
+                        input_tokens = usage.get("input_tokens", 0)
+                        output_tokens = usage.get("output_tokens", 0)
+                        cache_read = usage.get("cache_read_input_tokens", 0)
+                        cache_creation = usage.get(
+                            "cache_creation_input_tokens", 0
+                        )
+                        totals["input_tokens"] += input_tokens
+                        totals["output_tokens"] += output_tokens
+                        totals["cache_creation_tokens"] += cache_creation
+                        totals["cache_read_tokens"] += cache_read
+                        context_size = input_tokens + cache_read
+                        if context_size > 0:
+                            totals["current_context_tokens"] = context_size
+                        # Only track model/provider from messages with actual API
+                        # usage (skips synthetic error messages with zero tokens).
+                        if input_tokens + output_tokens + cache_creation + cache_read > 0:
+                            model = message.get("model")
+                            if model:
+                                totals["model"] = model
+                            detected = provider_from_message_id(message.get("id"))
+                            if detected:
+                                totals["provider"] = detected
+
+                elif msg_type == "user":
+                    # Check if this is an actual user prompt (not a tool result)
+                    message = data.get("message", {})
+                    content = message.get("content", "")
+                    if isinstance(content, list):
+                        if content and content[0].get("type") == "tool_result":
+                            continue
+
+                    ts_str = data.get("timestamp")
+                    if not ts_str:
+                        continue
+
+                    try:
+                        msg_time = datetime.fromisoformat(
+                            ts_str.replace("Z", "+00:00")
+                        ).astimezone().replace(tzinfo=None)
+                        if since and msg_time < since:
+                            continue
+                    except (ValueError, TypeError):
+                        continue
+
+                    # Work time = duration between consecutive prompts
+                    if self.last_prompt_time is not None:
+                        duration = (msg_time - self.last_prompt_time).total_seconds()
+                        if duration > 0:
+                            self.work_times.append(duration)
+                    self.last_prompt_time = msg_time
+
+            except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
+                continue
+
+    def result(self) -> Tuple[dict, List[float]]:
+        """Return copies of (token_usage_dict, work_times_list)."""
+        return dict(self.totals), list(self.work_times)
+
+
 def _parse_session_lines(
     lines,
     since: Optional[datetime] = None,
@@ -542,99 +659,121 @@ def _parse_session_lines(
     Returns:
         (token_usage_dict, work_times_list)
     """
-    totals = {
-        "input_tokens": 0,
-        "output_tokens": 0,
-        "cache_creation_tokens": 0,
-        "cache_read_tokens": 0,
-        "current_context_tokens": 0,
-        "model": None,
-        "provider": None,
-    }
+    acc = _SessionLineAccumulator(since=since)
+    acc.feed(lines)
+    return acc.result()
 
-    user_prompt_times: List[datetime] = []
 
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            data = json.loads(line)
-            msg_type = data.get("type")
+def _is_complete_json(data: bytes) -> bool:
+    """Return True if data decodes to a JSON value (i.e. is not a torn write)."""
+    try:
+        json.loads(data)
+        return True
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return False
 
-            if msg_type == "assistant":
-                # Check timestamp if filtering by time
-                if since:
-                    ts_str = data.get("timestamp")
-                    if ts_str:
-                        try:
-                            msg_time = datetime.fromisoformat(
-                                ts_str.replace("Z", "+00:00")
-                            ).astimezone().replace(tzinfo=None)
-                            if msg_time < since:
-                                continue
-                        except (ValueError, TypeError):
-                            pass
-
-                message = data.get("message", {})
-                usage = message.get("usage", {})
-                if usage:
-                    input_tokens = usage.get("input_tokens", 0)
-                    output_tokens = usage.get("output_tokens", 0)
-                    cache_read = usage.get("cache_read_input_tokens", 0)
-                    cache_creation = usage.get(
-                        "cache_creation_input_tokens", 0
-                    )
-                    totals["input_tokens"] += input_tokens
-                    totals["output_tokens"] += output_tokens
-                    totals["cache_creation_tokens"] += cache_creation
-                    totals["cache_read_tokens"] += cache_read
-                    context_size = input_tokens + cache_read
-                    if context_size > 0:
-                        totals["current_context_tokens"] = context_size
-                    # Only track model/provider from messages with actual API
-                    # usage (skips synthetic error messages with zero tokens).
-                    if input_tokens + output_tokens + cache_creation + cache_read > 0:
-                        model = message.get("model")
-                        if model:
-                            totals["model"] = model
-                        detected = provider_from_message_id(message.get("id"))
-                        if detected:
-                            totals["provider"] = detected
-
-            elif msg_type == "user":
-                # Check if this is an actual user prompt (not a tool result)
-                message = data.get("message", {})
-                content = message.get("content", "")
-                if isinstance(content, list):
-                    if content and content[0].get("type") == "tool_result":
-                        continue
 
-                ts_str = data.get("timestamp")
-                if not ts_str:
-                    continue
+@dataclass
+class _SessionFileState:
+    """Parse progress for one session file (see SessionFileStatsCache)."""
+    inode: int
+    offset: int
+    accumulator: _SessionLineAccumulator
+
+
+class SessionFileStatsCache:
+    """Incremental, offset-tracked reader for Claude session JSONL files.
+
+    Session files are append-only, so instead of re-parsing a (possibly
+    hundreds of MB) transcript from byte zero on every sync, this keeps a
+    running accumulator per file and parses only the bytes appended since
+    the previous call.  Only complete (newline-terminated) lines are
+    consumed; a partially-written trailing line is picked up next time.
+
+    State is keyed by path and invalidated — falling back to a full
+    re-parse — when the inode changes (rotation/replacement), the file
+    shrinks below the stored offset (truncation), or the ``since`` filter
+    differs from the one the accumulator was built with.
 
+    Thread-safe: a lock protects the per-file state so the TUI's
+    ThreadPoolExecutor workers can share one instance.
+    """
+
+    def __init__(self, max_files: int = 1024):
+        self._max_files = max_files
+        self._lock = threading.Lock()
+        self._files: "OrderedDict[Path, _SessionFileState]" = OrderedDict()
+
+    def read_stats(
+        self,
+        session_file: Path,
+        since: Optional[datetime] = None,
+    ) -> Tuple[dict, List[float]]:
+        """Return (token_usage_dict, work_times_list) for a session file.
+
+        Same result as read_session_file_stats, but cost scales with the
+        number of new bytes rather than the size of the transcript.
+        """
+        try:
+            st = session_file.stat()
+        except OSError:
+            with self._lock:
+                self._files.pop(session_file, None)
+            return _empty_usage(), []
+
+        with self._lock:
+            state = self._files.get(session_file)
+            if (
+                state is None
+                or state.inode != st.st_ino
+                or st.st_size < state.offset
+                or state.accumulator.since != since
+            ):
+                state = _SessionFileState(
+                    inode=st.st_ino,
+                    offset=0,
+                    accumulator=_SessionLineAccumulator(since=since),
+                )
+                self._files[session_file] = state
+            self._files.move_to_end(session_file)
+            while len(self._files) > self._max_files:
+                self._files.popitem(last=False)
+
+            if st.st_size > state.offset:
                 try:
-                    msg_time = datetime.fromisoformat(
-                        ts_str.replace("Z", "+00:00")
-                    ).astimezone().replace(tzinfo=None)
-                    if since and msg_time < since:
-                        continue
-                    user_prompt_times.append(msg_time)
-                except (ValueError, TypeError):
-                    continue
+                    with open(session_file, 'rb') as f:
+                        f.seek(state.offset)
+                        chunk = f.read(st.st_size - state.offset)
+                except IOError:
+                    return state.accumulator.result()
+
+                # Leave a partially-written trailing line for the next call.
+                # An unterminated tail that already parses as JSON is a
+                # complete record (e.g. a file written without a final
+                # newline), so consume it rather than wait forever.
+                end = chunk.rfind(b'\n') + 1
+                if end < len(chunk) and _is_complete_json(chunk[end:]):
+                    end = len(chunk)
+                if end:
+                    # Split on '\n' only: str.splitlines() would also break
+                    # on U+2028 etc., which may appear unescaped in content.
+                    state.accumulator.feed(
+                        chunk[:end].decode('utf-8', errors='replace').split('\n')
+                    )
+                    state.offset += end
 
-        except (json.JSONDecodeError, KeyError, TypeError):
-            continue
+            return state.accumulator.result()
+
+    def invalidate(self, session_file: Optional[Path] = None) -> None:
+        """Drop cached state for one file, or for all files if None."""
+        with self._lock:
+            if session_file is None:
+                self._files.clear()
+            else:
+                self._files.pop(session_file, None)
 
-    # Calculate durations between consecutive prompts
-    work_times = []
-    for i in range(1, len(user_prompt_times)):
-        duration = (user_prompt_times[i] - user_prompt_times[i - 1]).total_seconds()
-        if duration > 0:
-            work_times.append(duration)
 
-    return totals, work_times
+_default_stats_cache = SessionFileStatsCache()
 
 
 def read_session_file_stats(
@@ -654,23 +793,13 @@ def read_session_file_stats(
         (token_usage_dict, work_times_list)
     """
     if not session_file.exists():
-        defaults = {
-            "input_tokens": 0, "output_tokens": 0,
-            "cache_creation_tokens": 0, "cache_read_tokens": 0,
-            "current_context_tokens": 0, "model": None, "provider": None,
-        }
-        return defaults, []
+        return _empty_usage(), []
 
     try:
         with open(session_file, 'r') as f:
             return _parse_session_lines(f, since=since)
     except IOError:
-        defaults = {
-            "input_tokens": 0, "output_tokens": 0,
-            "cache_creation_tokens": 0, "cache_read_tokens": 0,
-            "current_context_tokens": 0, "model": None, "provider": None,
-        }
-        return defaults, []
+        return _empty_usage(), []
 
 
 def read_session_stats_from_content(
@@ -691,12 +820,7 @@ def read_session_stats_from_content(
         (token_usage_dict, work_times_list)
     """
     if not content or not content.strip():
-        defaults = {
-            "input_tokens": 0, "output_tokens": 0,
-            "cache_creation_tokens": 0, "cache_read_tokens": 0,
-            "current_context_tokens": 0, "model": None, "provider": None,
-        }
-        return defaults, []
+        return _empty_usage(), []
 
     return _parse_session_lines(content.splitlines(), since=since)
 
@@ -746,6 +870,7 @@ def get_session_stats(
     history_path: Path = CLAUDE_HISTORY_PATH,
     projects_path: Path = CLAUDE_PROJECTS_PATH,
     history_file: Optional["HistoryFile"] = None,
+    stats_cache: Optional[SessionFileStatsCache] = None,
 ) -> Optional[ClaudeSessionStats]:
     """Get comprehensive stats for an overcode session.
 
@@ -764,6 +889,8 @@ def get_session_stats(
         history_path: Path to history.jsonl
         projects_path: Path to Claude projects directory
         history_file: Optional HistoryFile for cached access (avoids re-parsing)
+        stats_cache: Optional SessionFileStatsCache for incremental session
+            file parsing (defaults to the module-level cache)
 
     Returns:
         ClaudeSessionStats if session has start_directory, None otherwise
@@ -787,6 +914,7 @@ def get_session_stats(
         else HistoryFile(history_path)
     )
     interactions = hf.get_interactions_for_session(session)
+    cache = stats_cache or _default_stats_cache
     interaction_count = len(interactions)
 
     # Derive Claude sessionIds and their project paths from interactions.
@@ -830,7 +958,7 @@ def get_session_stats(
                 session_file = get_session_file_path(
                     alt_project, sid, projects_path
                 )
-        usage, work_times = read_session_file_stats(session_file, since=session_start)
+        usage, work_times = cache.read_stats(session_file, since=session_start)
         total_input += usage["input_tokens"]
         total_output += usage["output_tokens"]
         total_cache_creation += usage["cache_creation_tokens"]
@@ -871,7 +999,7 @@ def get_session_stats(
                 subagent_count += 1
                 if now - subagent_file.stat().st_mtime < 30:
                     live_subagent_count += 1
-                sub_usage, _ = read_session_file_stats(
+                sub_usage, _ = cache.read_stats(
                     subagent_file, since=session_start
                 )
                 total_input += sub_usage["input_tokens"]
@@ -15,7 +15,6 @@ Hook registrations (all use the same command):
 import json
 import logging
 import os
-import subprocess
 import sys
 import time
 from pathlib import Path
@@ -47,6 +46,7 @@ def _detect_from_tmux_pane() -> tuple[str | None, str | None]:
     pane_id = os.environ.get("TMUX_PANE")
     if not pane_id:
         return None, None
+    import subprocess
     try:
         window_name = subprocess.run(
             ["tmux", "display-message", "-p", "-t", pane_id, "#{window_name}"],
@@ -104,6 +104,19 @@ def _get_hook_event_log_path(tmux_session: str, session_name: str) -> Path:
     return base / tmux_session / f"hook_events_{session_name}.jsonl"
 
 
+def _get_hook_socket_path(tmux_session: str) -> Path:
+    """Get the Unix socket path of the hook receiver for a tmux session.
+
+    Returns ~/.overcode/sessions/{tmux_session}/hook.sock
+    """
+    state_dir = os.environ.get("OVERCODE_STATE_DIR")
+    if state_dir:
+        base = Path(state_dir)
+    else:
+        base = Path.home() / ".overcode" / "sessions"
+    return base / tmux_session / "hook.sock"
+
+
 # Rotate the event log when it grows past this (roughly). We keep the tail
 # so recent-activity lookups stay cheap.
 _EVENT_LOG_ROTATE_BYTES = 100 * 1024
@@ -173,10 +186,13 @@ def write_hook_state(
     session_name: str,
     tool_name: str | None = None,
     tool_input: dict | None = None,
-) -> None:
+) -> dict:
     """Write hook state JSON for status detection.
 
     Writes to ~/.overcode/sessions/{tmux_session}/hook_state_{session_name}.json
+
+    Returns:
+        The state dict that was written.
     """
     state_path = _get_hook_state_path(tmux_session, session_name)
     state_path.parent.mkdir(parents=True, exist_ok=True)
@@ -207,6 +223,7 @@ def write_hook_state(
         state["loaded_skills"] = prev_skills
 
     state_path.write_text(json.dumps(state))
+    return state
 
 
 def handle_hook_event() -> None:
@@ -242,36 +259,168 @@ def handle_hook_event() -> None:
     if not event:
         return
 
+    # Prefer the monitor daemon's hook receiver when it is listening; it
+    # does the same work below without this process's file round-trips.
+    result = forward_hook_event(data, tmux_session, session_name)
+    if result is None:
+        result = process_hook_event(data, tmux_session, session_name)
+    elif result is OUTCOME_UNKNOWN:
+        # The receiver may have recorded the event but its verdict is
+        # lost: work the response out here (a budget block must still
+        # apply) without recording the event a second time.
+        result = hook_event_response(data, tmux_session, session_name)
+
+    exit_code, stdout, stderr = result
+    if stdout:
+        print(stdout)
+    if stderr:
+        print(stderr, file=sys.stderr)
+    if exit_code:
+        sys.exit(exit_code)
+
+
+def process_hook_event(
+    data: dict,
+    tmux_session: str,
+    session_name: str,
+    on_state=None,
+) -> tuple[int, str, str]:
+    """Record one hook event and compute the hook's response.
+
+    Shared by the per-event ``overcode hook-handler`` process and the
+    persistent hook receiver.
+
+    Args:
+        data: Hook event JSON from Claude Code
+        tmux_session: tmux session the agent runs in
+        session_name: Agent name
+        on_state: Optional callback(session_name, state) invoked with each
+            hook state written, so an in-process consumer can skip re-reading
+            the file
+
+    Returns:
+        (exit_code, stdout, stderr) for the hook process to reproduce.
+    """
+    event = data.get("hook_event_name")
+    if not event:
+        return 0, "", ""
+
     tool_name = data.get("tool_name")
     tool_input = data.get("tool_input")
 
     # Write state file for status detection (snapshot) and append to the
     # event log (#448 — preserves bursts hidden by overwrite).
-    write_hook_state(event, tmux_session, session_name, tool_name=tool_name, tool_input=tool_input)
+    state = write_hook_state(event, tmux_session, session_name, tool_name=tool_name, tool_input=tool_input)
     append_hook_event(event, tmux_session, session_name, tool_name=tool_name, tool_input=tool_input)
+    if on_state is not None:
+        on_state(session_name, state)
 
+    return hook_event_response(data, tmux_session, session_name, on_state=on_state)
+
+
+def hook_event_response(
+    data: dict,
+    tmux_session: str,
+    session_name: str,
+    on_state=None,
+) -> tuple[int, str, str]:
+    """The hook's response to an event already recorded by process_hook_event().
+
+    Returns:
+        (exit_code, stdout, stderr) for the hook process to reproduce.
+    """
     # For UserPromptSubmit, check budget and output enhanced context
-    if event == "UserPromptSubmit":
+    if data.get("hook_event_name") == "UserPromptSubmit":
         from .time_context import _load_daemon_state, _find_session_in_state
 
         # Block prompt if agent has exceeded its cost budget (#246)
-        state = _load_daemon_state(tmux_session)
-        if state:
-            session_data = _find_session_in_state(state, session_name)
+        daemon_state = _load_daemon_state(tmux_session)
+        if daemon_state:
+            session_data = _find_session_in_state(daemon_state, session_name)
             if session_data and session_data.get("budget_exceeded", False):
                 budget = session_data.get("cost_budget_usd", 0)
                 cost = session_data.get("estimated_cost_usd", 0)
                 # Overwrite hook state so status detector shows error, not stuck green (#428)
-                write_hook_state("UserPromptSubmitRejected", tmux_session, session_name)
+                state = write_hook_state("UserPromptSubmitRejected", tmux_session, session_name)
                 append_hook_event("UserPromptSubmitRejected", tmux_session, session_name)
-                print(
-                    f"Budget exceeded (${cost:.2f} / ${budget:.2f}). Prompt blocked.",
-                    file=sys.stderr,
-                )
-                sys.exit(2)
+                if on_state is not None:
+                    on_state(session_name, state)
+                return 2, "", f"Budget exceeded (${cost:.2f} / ${budget:.2f}). Prompt blocked."
 
         from .time_context import generate_enhanced_context
 
         line = generate_enhanced_context(tmux_session, session_name)
         if line:
-            print(line)
+            return 0, line, ""
+
+    return 0, "", ""
+
+
+# Client side of the hook receiver protocol: one JSON request line, one
+# JSON response line. See hook_receiver.HookReceiver for the server.
+_RECEIVER_TIMEOUT_SECONDS = 5.0
+# How long to wait for the reply once the event has been delivered
+_RECEIVER_REPLY_TIMEOUT_SECONDS = 30.0
+
+# forward_hook_event() result: the receiver got the event (and may have
+# recorded it) but its response is unknown
+OUTCOME_UNKNOWN = object()
+
+
+def forward_hook_event(
+    data: dict, tmux_session: str, session_name: str
+) -> tuple[int, str, str] | object | None:
+    """Send a hook event to the hook receiver, if one is listening.
+
+    Returns:
+        (exit_code, stdout, stderr) from the receiver; None when the event
+        wasn't delivered (socket missing, refused, or the send failed) or
+        the receiver declined it, and the caller should process the event
+        itself; or OUTCOME_UNKNOWN when the event was delivered but no
+        usable response came back (lost or malformed reply, or the
+        receiver failed partway). The event may then already be recorded,
+        so the caller must not process it again, nor treat it as allowed.
+    """
+    path = _get_hook_socket_path(tmux_session)
+    if not path.exists():
+        return None
+
+    import socket
+
+    request = json.dumps({
+        "tmux_session": tmux_session,
+        "session_name": session_name,
+        "data": data,
+    }).encode() + b"\n"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.settimeout(_RECEIVER_TIMEOUT_SECONDS)
+            sock.connect(str(path))
+            sock.sendall(request)
+            sock.shutdown(socket.SHUT_WR)
+        except OSError as e:
+            logger.debug("Hook receiver unavailable, handling locally: %s", e)
+            return None
+        try:
+            sock.settimeout(_RECEIVER_REPLY_TIMEOUT_SECONDS)
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            reply = json.loads(b"".join(chunks))
+        except (OSError, ValueError) as e:
+            logger.warning("No reply from hook receiver for %s: %s", session_name, e)
+            return OUTCOME_UNKNOWN
+    if isinstance(reply, dict) and "error" in reply:
+        logger.debug("Hook receiver declined event, handling locally: %s", reply["error"])
+        return None
+    if isinstance(reply, dict) and "unknown" in reply:
+        logger.warning("Hook receiver failed on %s: %s", session_name, reply["unknown"])
+        return OUTCOME_UNKNOWN
+    try:
+        return int(reply["exit_code"]), str(reply.get("stdout", "")), str(reply.get("stderr", ""))
+    except (KeyError, TypeError, ValueError) as e:
+        logger.warning("Malformed reply from hook receiver for %s: %s", session_name, e)
+        return OUTCOME_UNKNOWN
@@ -0,0 +1,266 @@
+"""
+Persistent receiver for Claude Code hook events.
+
+``overcode hook-handler`` runs once per hook event, so a busy fleet pays
+interpreter startup hundreds of times a minute. When the monitor daemon
+runs a HookReceiver, the hook process only forwards its stdin over a Unix
+socket (see ``hook_handler.forward_hook_event``) and relays the reply;
+the event itself is processed here, in the long-lived daemon, by the same
+``hook_handler.process_hook_event`` used on the fallback path. If the
+socket is absent the hook process handles the event itself, as before.
+
+The accept loop only hands connections to a small worker pool, so one
+slow event (UserPromptSubmit builds the enhanced context) doesn't hold
+up other agents' hooks. Each agent's events go through a queue of their
+own, processed one at a time in the order the requests arrived by
+whichever worker found it empty; other workers only enqueue. A burst
+from one agent therefore occupies one worker, not the whole pool.
+
+Protocol (one request per connection):
+    request:  {"tmux_session": str, "session_name": str, "data": {...}}
+    response: {"exit_code": int, "stdout": str, "stderr": str}
+              or {"error": str} when the event was refused unprocessed,
+              in which case the client falls back
+              or {"unknown": str} when processing failed partway, in
+              which case the client works out the response itself
+Both are a single JSON document; the client half-closes after sending.
+"""
+
+import json
+import os
+import socket
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Deque, Dict, Optional, Tuple, Union
+
+from .hook_handler import _get_hook_socket_path, process_hook_event
+
+
+# Largest request accepted; hook payloads (tool_input) are small.
+_MAX_REQUEST_BYTES = 4 * 1024 * 1024
+
+# Connections handled at once
+HANDLER_WORKERS = 4
+
+
+class HookReceiver:
+    """Unix-socket server that processes hook events on a background thread."""
+
+    def __init__(
+        self,
+        tmux_session: str,
+        socket_path: Optional[Path] = None,
+        on_state: Optional[Callable[[str, dict], None]] = None,
+        log: Optional[Callable[[str], None]] = None,
+    ):
+        """Initialize the receiver.
+
+        Args:
+            tmux_session: Only events for this tmux session are accepted
+            socket_path: Override the socket path (for testing)
+            on_state: Called with (session_name, state) for each hook state
+                written, e.g. to feed the status detector directly
+            log: Optional callable for warnings
+        """
+        self.tmux_session = tmux_session
+        self.socket_path = Path(socket_path or _get_hook_socket_path(tmux_session))
+        self.on_state = on_state
+        self._log = log or (lambda msg: None)
+        self._sock: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        # session_name -> events waiting behind the one being processed
+        self._agent_queues: Dict[str, Deque[Callable[[], None]]] = {}
+        self._agent_queues_guard = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> bool:
+        """Bind the socket and start serving. Returns False if binding fails."""
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self._remove_stale_socket()
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.bind(str(self.socket_path))
+            os.chmod(self.socket_path, 0o600)
+            sock.listen(64)
+        except OSError as e:
+            sock.close()
+            self._log(f"Hook receiver disabled: cannot bind {self.socket_path}: {e}")
+            return False
+        # Periodic timeout so stop() is noticed without a wake-up connection
+        sock.settimeout(0.5)
+        self._sock = sock
+        self._stopping.clear()
+        self._pool = ThreadPoolExecutor(max_workers=HANDLER_WORKERS, thread_name_prefix="hook-event")
+        self._thread = threading.Thread(
+            target=self._serve, name="hook-receiver", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def _remove_stale_socket(self) -> None:
+        """Remove a socket file left behind by a dead receiver."""
+        if not self.socket_path.exists():
+            return
+        # If the probe connects, someone is serving and bind() will report it.
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.settimeout(0.5)
+            probe.connect(str(self.socket_path))
+        except OSError:
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
+        finally:
+            probe.close()
+
+    def stop(self) -> None:
+        """Stop serving and remove the socket file."""
+        self._stopping.set()
+        if self._thread is not None:
+            # Wake accept() now rather than at its next timeout.
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as wake:
+                    wake.settimeout(0.5)
+                    wake.connect(str(self.socket_path))
+            except OSError:
+                pass
+            self._thread.join(timeout=2)
+            self._thread = None
+        if self._pool is not None:
+            # Connections already accepted are still answered
+            self._pool.shutdown(wait=False)
+            self._pool = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
+
+    def _serve(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                conn, _ = self._sock.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                if self._stopping.is_set():
+                    return
+                continue
+            if self._stopping.is_set():
+                conn.close()
+                return
+            try:
+                self._pool.submit(self._serve_connection, conn)
+            except RuntimeError:  # pool shut down by stop()
+                conn.close()
+                return
+
+    def _serve_connection(self, conn: socket.socket) -> None:
+        try:
+            raw = self._read_request(conn)
+            parsed = None if raw is None else self._parse_request(raw)
+            if isinstance(parsed, tuple):
+                session_name, data = parsed
+                # The queue's worker replies and closes the connection
+                self._dispatch(session_name, lambda: self._process_and_reply(conn, session_name, data))
+                return
+            reply = {"error": "request too large"} if raw is None else parsed
+            conn.sendall(json.dumps(reply).encode() + b"\n")
+        except OSError as e:
+            self._log(f"Hook receiver connection error: {e}")
+        conn.close()
+
+    def _read_request(self, conn: socket.socket) -> Optional[bytes]:
+        """The request bytes, or None when it exceeds _MAX_REQUEST_BYTES."""
+        conn.settimeout(5.0)
+        chunks = []
+        size = 0
+        while True:
+            chunk = conn.recv(65536)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > _MAX_REQUEST_BYTES:
+                return None
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    def _process_and_reply(self, conn: socket.socket, session_name: str, data: dict) -> None:
+        with conn:
+            reply = self._process(session_name, data)
+            try:
+                conn.sendall(json.dumps(reply).encode() + b"\n")
+            except OSError as e:
+                self._log(f"Hook receiver connection error: {e}")
+
+    def _dispatch(self, session_name: str, job: Callable[[], None]) -> None:
+        """Run ``job`` after the agent's earlier events.
+
+        If the agent has a queue, a worker is already draining it and the
+        job is appended; otherwise this worker drains the new queue.
+        """
+        with self._agent_queues_guard:
+            queue = self._agent_queues.get(session_name)
+            if queue is not None:
+                queue.append(job)
+                return
+            queue = self._agent_queues[session_name] = deque([job])
+        while True:
+            with self._agent_queues_guard:
+                if not queue:
+                    del self._agent_queues[session_name]
+                    return
+                job = queue.popleft()
+            try:
+                job()
+            except Exception as e:  # the queue must keep draining
+                self._log(f"Hook receiver failed on {session_name}: {e}")
+
+    def _parse_request(self, raw: bytes) -> Union[Tuple[str, dict], dict]:
+        """(session_name, data) for a valid request, else the {"error"} reply."""
+        try:
+            request = json.loads(raw)
+            tmux_session = request["tmux_session"]
+            session_name = request["session_name"]
+            data = request["data"]
+        except (ValueError, KeyError, TypeError):
+            return {"error": "malformed request"}
+        if tmux_session != self.tmux_session:
+            return {"error": f"wrong tmux session {tmux_session!r}"}
+        if not isinstance(session_name, str) or not session_name or not isinstance(data, dict):
+            return {"error": "malformed request"}
+        return session_name, data
+
+    def _process(self, session_name: str, data: dict) -> dict:
+        try:
+            exit_code, stdout, stderr = process_hook_event(
+                data, self.tmux_session, session_name, on_state=self.on_state
+            )
+        except Exception as e:  # keep serving whatever one event does
+            # Part of the event may have been written: the client must
+            # not process it again, nor take it as allowed
+            self._log(f"Hook receiver failed on {session_name}: {e}")
+            return {"unknown": str(e)}
+        return {"exit_code": exit_code, "stdout": stdout, "stderr": stderr}
+
+    def handle_request(self, raw: bytes) -> dict:
+        """Process one raw request and return the response dict.
+
+        Requests that are refused before processing starts get
+        {"error": ...}; the client then processes the event itself.
+        """
+        parsed = self._parse_request(raw)
+        if not isinstance(parsed, tuple):
+            return parsed
+        session_name, data = parsed
+        return self._process(session_name, data)
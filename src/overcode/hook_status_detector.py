@@ -16,8 +16,9 @@ import json
 import os
 import subprocess
 import time
+from collections import deque
 from pathlib import Path
-from typing import Dict, Optional, Tuple, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from .status_constants import (
     DEFAULT_CAPTURE_LINES,
@@ -36,8 +37,10 @@ from .status_patterns import (
     extract_sleep_duration,
     strip_ansi,
     is_shell_prompt,
+    PaneSnapshot,
 )
 from .tui_helpers import format_duration
+from .capture_gate import PaneCaptureGate
 
 if TYPE_CHECKING:
     from .interfaces import TmuxInterface
@@ -59,7 +62,13 @@ def _pane_shows_interrupt_prompt(pane_content: str) -> bool:
     """Return True if the pane looks like Claude is showing the interrupt prompt (#431)."""
     if not pane_content:
         return False
-    clean = strip_ansi(pane_content)
+    if type(pane_content) is PaneSnapshot:
+        return pane_content.memo(
+            "interrupt_prompt", lambda: _tail_shows_interrupt_prompt(pane_content.clean))
+    return _tail_shows_interrupt_prompt(strip_ansi(pane_content))
+
+
+def _tail_shows_interrupt_prompt(clean: str) -> bool:
     # Only look at the tail — older interrupt prompts may linger in scrollback
     tail = "\n".join(clean.splitlines()[-40:])
     return any(marker in tail for marker in _INTERRUPT_PROMPT_MARKERS)
@@ -89,6 +98,87 @@ _RECENT_ACTIVITY_WINDOW_SECONDS = 1.5
 # How many log lines to keep in memory per read — plenty for a 1.5s window.
 _RECENT_EVENTS_LIMIT = 50
 
+# Leading bytes remembered per event log to spot in-place rewrites.
+_TAIL_HEAD_BYTES = 64
+
+
+def _parse_event_line(line: bytes) -> Optional[dict]:
+    """Parse one event log line; None if blank, partial, or malformed."""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        entry = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    if not isinstance(entry, dict):
+        return None
+    if "event" not in entry or "timestamp" not in entry:
+        return None
+    try:
+        float(entry["timestamp"])
+    except (TypeError, ValueError):
+        return None
+    return entry
+
+
+class _EventLogTail:
+    """Incrementally-read tail of one hook event log (#448).
+
+    Keeps the byte offset consumed so far and a ring buffer of the most
+    recent parsed events. Each read stats the file and parses only bytes
+    appended since the last read; an unterminated final line is left for
+    the next read. The buffer is rebuilt from scratch when the file is
+    replaced (``_rotate_event_log`` renames a new file into place, so the
+    inode changes), shrinks, or its leading bytes change.
+    """
+
+    def __init__(self, maxlen: int = _RECENT_EVENTS_LIMIT):
+        self.events: deque = deque(maxlen=maxlen)
+        self.inode: Optional[int] = None
+        self.offset = 0
+        self.head = b""
+
+    def _reset(self, inode: Optional[int]) -> None:
+        self.events.clear()
+        self.inode = inode
+        self.offset = 0
+        self.head = b""
+
+    def read(self, path: Path) -> list:
+        """Return buffered events (oldest→newest) after consuming new bytes."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._reset(None)
+            return []
+        if st.st_ino != self.inode or st.st_size < self.offset:
+            self._reset(st.st_ino)
+        if st.st_size == self.offset:
+            return list(self.events)
+
+        try:
+            with open(path, "rb") as f:
+                head = f.read(_TAIL_HEAD_BYTES)
+                if self.offset and not head.startswith(self.head):
+                    self._reset(st.st_ino)
+                f.seek(self.offset)
+                data = f.read()
+        except OSError:
+            return list(self.events)
+
+        end = data.rfind(b"\n")
+        if end < 0:
+            return list(self.events)
+        if not self.head or len(self.head) < _TAIL_HEAD_BYTES:
+            self.head = head[:self.offset + end + 1]
+        self.offset += end + 1
+        for line in data[:end].split(b"\n"):
+            entry = _parse_event_line(line)
+            if entry is not None:
+                self.events.append(entry)
+        return list(self.events)
+
 
 class HookStatusDetector:
     """Detects session status from hook state files.
@@ -131,6 +221,12 @@ class HookStatusDetector:
         self._content_changed: Dict[str, bool] = {}
         # Skills observed via Skill tool_use events, keyed by session name (#252)
         self._loaded_skills: Dict[str, set] = {}
+        # Incremental event-log readers, keyed by session name (#448)
+        self._event_tails: Dict[str, _EventLogTail] = {}
+        # Hook states pushed in-process by the hook receiver, keyed by
+        # session name: (state, mtime_ns of the file it was written to)
+        self._live_states: Dict[str, Tuple[dict, Optional[int]]] = {}
+        self._capture_gate = PaneCaptureGate(tmux_session)
 
         # Resolve state directory — must match hook_handler._get_hook_state_path()
         if state_dir is not None:
@@ -155,33 +251,14 @@ class HookStatusDetector:
 
         Events are oldest→newest. Partial/corrupt tail lines are skipped
         silently — rotation or a mid-write read can leave one such line.
+        Only bytes appended since the previous call are read.
         """
-        path = self._hook_event_log_path(session_name)
-        try:
-            with open(path) as f:
-                lines = f.readlines()
-        except (FileNotFoundError, OSError):
-            return []
-
-        events: list = []
-        for line in lines[-limit:]:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entry = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            if not isinstance(entry, dict):
-                continue
-            if "event" not in entry or "timestamp" not in entry:
-                continue
-            try:
-                float(entry["timestamp"])
-            except (TypeError, ValueError):
-                continue
-            events.append(entry)
-        return events
+        tail = self._event_tails.get(session_name)
+        if tail is None or tail.events.maxlen < limit:
+            tail = _EventLogTail(maxlen=max(limit, _RECENT_EVENTS_LIMIT))
+            self._event_tails[session_name] = tail
+        events = tail.read(self._hook_event_log_path(session_name))
+        return events[-limit:]
 
     def _most_recent_running_event_age(
         self, session_name: str, now: Optional[float] = None
@@ -197,6 +274,18 @@ class HookStatusDetector:
                     return None
         return None
 
+    def record_hook_state(self, session_name: str, state: dict) -> None:
+        """Accept a hook state just written by the in-process hook receiver.
+
+        Later reads use it instead of re-parsing the file for as long as
+        the file's mtime shows nobody else has written it since.
+        """
+        try:
+            mtime_ns = self._hook_state_path(session_name).stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        self._live_states[session_name] = (state, mtime_ns)
+
     def _read_hook_state(self, session_name: str) -> Optional[dict]:
         """Read and parse hook state file.
 
@@ -206,6 +295,17 @@ class HookStatusDetector:
             No staleness check — running hooks are trusted indefinitely.
         """
         path = self._hook_state_path(session_name)
+        live = self._live_states.get(session_name)
+        if live is not None:
+            state, mtime_ns = live
+            try:
+                current = path.stat().st_mtime_ns
+            except OSError:
+                current = None
+            if mtime_ns is not None and current == mtime_ns:
+                return state
+            # Written by someone else (fallback hook process) — reread.
+            self._live_states.pop(session_name, None)
         try:
             with open(path) as f:
                 data = json.load(f)
@@ -245,12 +345,39 @@ class HookStatusDetector:
         except (subprocess.TimeoutExpired, OSError):
             return None
 
-    def detect_status(self, session: "Session", num_lines: int = 0) -> Tuple[str, str, str]:
+    def get_pane_contents(self, windows: list, num_lines: int = 0) -> Dict[str, Optional[str]]:
+        """get_pane_content for several windows, in one call when possible.
+
+        Panes whose tmux fingerprint hasn't changed since the last call are
+        not captured again (see capture_gate). Status still comes from the
+        hook state, so only the capture is skipped.
+        """
+        if self._tmux:
+            return self._capture_gate.capture(
+                self._tmux, windows, num_lines or self.capture_lines
+            )[0]
+        return {window: self.get_pane_content(window, num_lines) for window in windows}
+
+    def _pane_content(self, window: str, num_lines: int, prefetched: Optional[dict]) -> Optional[str]:
+        if prefetched is not None and window in prefetched:
+            return PaneSnapshot.of(prefetched[window])
+        return PaneSnapshot.of(self.get_pane_content(window, num_lines=num_lines))
+
+    def detect_statuses(self, sessions: list, num_lines: int = 0) -> List[Tuple[str, str, str]]:
+        """detect_status for several sessions, capturing all panes in one call."""
+        prefetched = self.get_pane_contents([s.tmux_window for s in sessions], num_lines)
+        return [self.detect_status(s, num_lines, prefetched=prefetched) for s in sessions]
+
+    def detect_status(self, session: "Session", num_lines: int = 0,
+                      prefetched: Optional[Dict[str, Optional[str]]] = None) -> Tuple[str, str, str]:
         """Detect session status using hook state files.
 
         No polling fallback. When no hook state exists, checks if the
         tmux window is alive and returns a sensible default.
 
+        Args:
+            prefetched: Pane contents by window from get_pane_contents()
+
         Returns:
             Tuple of (status, current_activity, pane_content)
         """
@@ -259,7 +386,7 @@ class HookStatusDetector:
         if hook_state is None:
             # No hook state file — agent hasn't triggered a hook yet.
             # Check if the window exists to distinguish fresh-start from terminated.
-            pane_content = self.get_pane_content(session.tmux_window, num_lines=num_lines)
+            pane_content = self._pane_content(session.tmux_window, num_lines, prefetched)
             if pane_content is None:
                 self._last_detect_phase[session.id] = "hook:no_state+no_window"
                 return STATUS_TERMINATED, "Window no longer exists", ""
@@ -281,7 +408,7 @@ class HookStatusDetector:
 
         if event == "SessionEnd":
             self._last_detect_phase[session.id] = "hook:SessionEnd"
-            return self._detect_session_end_status(session, num_lines)
+            return self._detect_session_end_status(session, num_lines, prefetched)
 
         status = _HOOK_STATUS_MAP.get(event, STATUS_WAITING_USER)
 
@@ -290,7 +417,7 @@ class HookStatusDetector:
             status = STATUS_WAITING_OVERSIGHT
 
         # Read pane for activity enrichment and content return value
-        pane_content = self.get_pane_content(session.tmux_window, num_lines=num_lines) or ""
+        pane_content = self._pane_content(session.tmux_window, num_lines, prefetched) or ""
 
         # Check for busy-sleeping: agent is "running" but executing a sleep command (#289)
         sleep_dur = None
@@ -354,7 +481,8 @@ class HookStatusDetector:
 
         return status, activity, pane_content
 
-    def _detect_session_end_status(self, session: "Session", num_lines: int = 0) -> Tuple[str, str, str]:
+    def _detect_session_end_status(self, session: "Session", num_lines: int = 0,
+                                   prefetched: Optional[dict] = None) -> Tuple[str, str, str]:
         """Determine status after a SessionEnd hook event.
 
         SessionEnd fires both on actual exit AND on /clear. We distinguish
@@ -362,7 +490,7 @@ class HookStatusDetector:
         - Shell prompt (user@host path %) → actual exit → TERMINATED
         - Claude's prompt (› or >) → /clear was used → WAITING_USER
         """
-        pane_content = self.get_pane_content(session.tmux_window, num_lines=num_lines) or ""
+        pane_content = self._pane_content(session.tmux_window, num_lines, prefetched) or ""
         clean = strip_ansi(pane_content)
         lines = [l.strip() for l in clean.strip().split('\n') if l.strip()]
 
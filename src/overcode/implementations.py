@@ -139,6 +139,88 @@ class RealTmux:
             self.invalidate_cache(session, window)
             return None
 
+    def capture_panes(self, session: str, windows: List[str], lines: int = 100) -> Dict[str, Optional[str]]:
+        """Capture several panes with a single tmux client process.
+
+        The capture-pane commands are chained with ``;`` in one tmux
+        invocation, each followed by a display-message marker line that
+        splits the output. tmux stops at the first failing command (a
+        window that no longer exists), so the windows after it are
+        captured by another chained call.
+        """
+        from .tmux_utils import tmux_window_target
+        windows = list(windows)
+        if not windows:
+            return {}
+        marker = f"__overcode_pane_end_{os.urandom(8).hex()}__"
+        cmd = ["tmux"]
+        if self._socket_name:
+            cmd += ["-L", self._socket_name]
+        for i, window in enumerate(windows):
+            target = tmux_window_target(session, window)
+            if i:
+                cmd.append(";")
+            cmd += [
+                "capture-pane", "-p", "-e", "-S", f"-{lines}", "-t", target, ";",
+                "display-message", "-p", "-t", target, marker,
+            ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, timeout=5)
+        except (subprocess.SubprocessError, OSError):
+            return {window: self.capture_pane(session, window, lines) for window in windows}
+
+        chunks = result.stdout.decode("utf-8", errors="replace").split(marker + "\n")
+        captured: Dict[str, Optional[str]] = {}
+        for window, chunk in zip(windows, chunks[:-1]):
+            # Match libtmux, which drops trailing empty lines
+            captured[window] = chunk.rstrip("\n")
+        if result.returncode != 0 and len(captured) < len(windows):
+            failed = len(captured)
+            captured[windows[failed]] = None
+            rest = windows[failed + 1:]
+            if b"can't find window" in result.stderr:
+                captured.update(self.capture_panes(session, rest, lines))
+            else:
+                # No server or session: the rest would fail the same way
+                captured.update(dict.fromkeys(rest))
+        return captured
+
+    # list-panes format for pane_fingerprints(): active flag, window name,
+    # then the fingerprint itself
+    PANE_FINGERPRINT_FORMAT = (
+        "#{pane_active}\t#{window_name}\t"
+        "#{pane_id} #{history_size} #{cursor_x},#{cursor_y} #{window_activity}"
+    )
+
+    @staticmethod
+    def _parse_pane_fingerprints(lines: List[str]) -> Dict[str, str]:
+        fingerprints: Dict[str, str] = {}
+        for line in lines:
+            parts = line.split("\t")
+            if len(parts) != 3:
+                continue
+            active, window, fingerprint = parts
+            # Pane calls target the active pane; fall back to any pane
+            if active == "1" or window not in fingerprints:
+                fingerprints[window] = fingerprint
+        return fingerprints
+
+    def pane_fingerprints(self, session: str) -> Dict[str, str]:
+        """Fingerprint every pane of a session with one list-panes call."""
+        cmd = ["tmux"]
+        if self._socket_name:
+            cmd += ["-L", self._socket_name]
+        cmd += ["list-panes", "-s", "-t", f"={session}", "-F", self.PANE_FINGERPRINT_FORMAT]
+        try:
+            result = subprocess.run(cmd, capture_output=True, timeout=5)
+        except (subprocess.SubprocessError, OSError):
+            return {}
+        if result.returncode != 0:
+            return {}
+        return self._parse_pane_fingerprints(
+            result.stdout.decode("utf-8", errors="replace").splitlines()
+        )
+
     def send_keys(self, session: str, window: str, keys: str, enter: bool = True) -> bool:
         try:
             pane = self._get_pane(session, window)
@@ -32,6 +32,16 @@ class MockTmux:
             return '\n'.join(content_lines[-lines:])
         return None
 
+    def capture_panes(self, session: str, windows: List[str], lines: int = 100) -> Dict[str, Optional[str]]:
+        return {window: self.capture_pane(session, window, lines) for window in windows}
+
+    def pane_fingerprints(self, session: str) -> Dict[str, str]:
+        # Content-derived, with an activity time long in the past
+        return {
+            window: f"%{i} {hash(content)} 0,0 0"
+            for i, (window, content) in enumerate(self.sessions.get(session, {}).items())
+        }
+
     def send_keys(self, session: str, window: str, keys: str, enter: bool = True) -> bool:
         self.sent_keys.append((session, window, keys, enter))
         return session in self.sessions
@@ -24,6 +24,7 @@ import os
 import signal
 import subprocess
 import sys
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
@@ -32,8 +33,13 @@ from typing import Dict, List, Optional
 from .daemon_logging import BaseDaemonLogger
 from .daemon_utils import create_daemon_helpers
 from .claude_pid import is_session_id_owned_by_others
-from .history_reader import get_session_stats, get_current_session_id_for_directory
+from .history_reader import (
+    ClaudeSessionStats,
+    get_session_stats,
+    get_current_session_id_for_directory,
+)
 from .monitor_daemon_state import (
+    STATS_SNAPSHOT_VERSION,
     MonitorDaemonState,
     SessionDaemonState,
 )
@@ -53,7 +59,7 @@ from .settings import (
     get_supervisor_stats_path,
     get_tui_heartbeat_path,
 )
-from .config import get_relay_config
+from .config import get_hook_receiver_enabled, get_relay_config
 from .status_constants import (
     STATUS_ASLEEP,
     STATUS_DONE,
@@ -67,7 +73,16 @@ from .status_constants import (
 from .status_detector import StatusDetector
 from .status_patterns import extract_pr_number
 from .status_detector_factory import StatusDetectorDispatcher
-from .status_history import log_agent_status
+from .compaction import CompactionService
+from .pane_store import PaneStoreWriter
+from .agent_scheduler import DAEMON_CADENCES, AgentScheduler
+from .daemon_tasks import AGENT_WORKERS, PHASE_WORKERS, TaskPool
+from .status_history import (
+    StatusHistoryRecorder,
+    convert_history_file,
+    is_legacy_history_file,
+)
+from .state_watcher import create_state_watcher, hook_agent_name, is_hook_file
 from .monitor_daemon_core import (
     calculate_time_accumulation,
     calculate_cost_estimate,
@@ -274,6 +289,7 @@ class MonitorDaemon:
         self.pid_path = get_monitor_daemon_pid_path(tmux_session)
         self.state_path = get_monitor_daemon_state_path(tmux_session)
         self.history_path = get_agent_history_path(tmux_session)
+        self._status_recorder = StatusHistoryRecorder(self.history_path)
 
         # Dependencies (allow injection for testing)
         self.session_manager = session_manager or SessionManager()
@@ -301,6 +317,7 @@ class MonitorDaemon:
             status="starting",
             started_at=datetime.now().isoformat(),
             daemon_version=DAEMON_VERSION,
+            stats_version=STATS_SNAPSHOT_VERSION,
         )
 
         # Per-session tracking
@@ -310,9 +327,23 @@ class MonitorDaemon:
         self._last_hook_phases: Dict[str, str] = {}  # session_id → last logged phase
         self._last_commands: Dict[str, str] = {}  # session_id → last user prompt
 
-        # Stats sync throttling - None forces immediate sync on first loop
+        # Stats sync throttling - None forces immediate sync on first loop.
+        # Session files are parsed incrementally, so this can run far more
+        # often than a full re-parse would allow.
         self._last_stats_sync: Optional[datetime] = None
-        self._stats_sync_interval = 60  # seconds
+        self._stats_sync_interval = 10  # seconds
+
+        # Git diff / untracked counts for the published stats snapshot
+        self._last_git_stats_sync: Optional[datetime] = None
+        self._git_stats_sync_interval = 10  # seconds
+
+        # Stats snapshot published to consumers (TUI, CLI, web) so they
+        # don't re-parse transcripts or fork git themselves.
+        self._claude_stats: Dict[str, ClaudeSessionStats] = {}  # session_id → stats
+        self._git_stats: Dict[str, tuple] = {}  # session_id → (diff_stats, untracked)
+        self._stats_generations: Dict[str, int] = {}  # session_id → generation
+        self._claude_stats_generations: Dict[str, int] = {}  # session_id → generation
+        self._stats_updated: Dict[str, str] = {}  # session_id → ISO timestamp
 
         # Session ID detection runs more frequently than full stats (#116)
         self._last_session_id_sync: Optional[datetime] = None
@@ -349,6 +380,46 @@ class MonitorDaemon:
         # Legacy migration flag — runs once on first tick
         self._legacy_windows_migrated = False
 
+        # Latest pane captures, published for the web API, CLI and TUI so
+        # they don't capture every pane again themselves
+        self._pane_store = PaneStoreWriter(tmux_session)
+
+        # Per-agent detection cadence: idle agents are re-detected less
+        # often than running ones and reuse their last result in between.
+        # Hook events, user activity, heartbeats and pane changes make an
+        # agent due straight away.
+        self._scheduler = AgentScheduler(DAEMON_CADENCES)
+        self._last_detected: Dict[str, tuple] = {}  # session_id → (status, activity, pane_content)
+        self._pane_fingerprints: Dict[str, str] = {}  # tmux window → fingerprint at last detection
+
+        # Slow sync work runs on worker threads so that it can't hold up
+        # status detection: each sync phase keeps its own cadence (the
+        # intervals above) and is never started twice at once, and the
+        # per-agent subprocess calls inside a phase run concurrently up to
+        # AGENT_WORKERS at a time, each with its own timeout.
+        self._phase_tasks = TaskPool(
+            PHASE_WORKERS, "overcode-sync", on_slow=self._log_slow_task, on_error=self._log_task_error)
+        self._agent_tasks = TaskPool(
+            AGENT_WORKERS, "overcode-agent", on_slow=self._log_slow_task, on_error=self._log_task_error)
+        self._stats_lock = threading.Lock()  # stats_generation is bumped from sync threads
+
+        # Hook file watcher (inotify on Linux, mtime polling elsewhere).
+        # Created in run(); None means plain chunked sleeps between ticks.
+        self._watcher = None
+
+        # Optional persistent hook receiver (hooks.receiver in config).
+        # Started in run(); hook processes fall back to writing files
+        # themselves whenever it isn't listening.
+        self._hook_receiver = None
+
+        # Retention: rolls aged history/presence/archive data into
+        # compressed daily segments on a background thread a few times a day
+        self._compaction = CompactionService(
+            self.session_manager,
+            self.history_path,
+            log=lambda msg: self.log.info(msg),
+        )
+
     def _migrate_legacy_window_ids(self, sessions: list) -> None:
         """Migrate legacy digit-string tmux_window values to actual window names."""
         try:
@@ -436,6 +507,10 @@ class MonitorDaemon:
         # Check if this session is running from heartbeat (persistent across loops)
         running_from_heartbeat = session_id in self._sessions_running_from_heartbeat
 
+        # Published stats snapshot (tokens above come from session.stats)
+        claude_stats = self._claude_stats.get(session_id)
+        git_diff, git_untracked = self._git_stats.get(session_id, (None, None))
+
         # Check if this session is waiting for heartbeat to auto-resume
         waiting_for_heartbeat = (
             status == STATUS_WAITING_HEARTBEAT
@@ -510,6 +585,18 @@ class MonitorDaemon:
             # Resource usage (summed over claude process tree)
             cpu_percent=session.cpu_percent,
             rss_bytes=session.rss_bytes,
+            # Stats snapshot
+            stats_generation=self._stats_generations.get(session_id, 0),
+            claude_stats_generation=self._claude_stats_generations.get(session_id, 0),
+            stats_updated=self._stats_updated.get(session_id),
+            claude_median_work_time=claude_stats.median_work_time if claude_stats else 0.0,
+            subagent_count=claude_stats.subagent_count if claude_stats else 0,
+            live_subagent_count=claude_stats.live_subagent_count if claude_stats else 0,
+            background_task_count=claude_stats.background_task_count if claude_stats else 0,
+            git_diff_files=git_diff[0] if git_diff else None,
+            git_diff_insertions=git_diff[1] if git_diff else 0,
+            git_diff_deletions=git_diff[2] if git_diff else 0,
+            git_untracked=git_untracked,
         )
 
     def check_and_send_heartbeats(self, sessions: list) -> set:
@@ -857,6 +944,17 @@ class MonitorDaemon:
             current_context_tokens=current_context,
             last_stats_update=now.isoformat(),
         )
+        self._record_claude_stats(session.id, ClaudeSessionStats(
+            interaction_count=session.stats.interaction_count,
+            input_tokens=total_input,
+            output_tokens=total_output,
+            cache_creation_tokens=total_cache_creation,
+            cache_read_tokens=total_cache_read,
+            work_times=all_work_times,
+            current_context_tokens=current_context,
+            model=detected_model or session.model,
+            provider=detected_provider or session.provider,
+        ))
         return True
 
     def sync_claude_code_stats(self, session) -> None:
@@ -894,6 +992,7 @@ class MonitorDaemon:
             # Cache last command for daemon state publishing
             if stats.last_command:
                 self._last_commands[session.id] = stats.last_command
+            self._record_claude_stats(session.id, stats)
 
             # Estimate cost using per-model pricing (falls back to global config)
             from .settings import get_user_config, get_model_pricing
@@ -925,6 +1024,15 @@ class MonitorDaemon:
         except Exception as e:
             self.log.warn(f"Failed to sync stats for {session.name}: {e}")
 
+    def _record_claude_stats(self, session_id: str, stats: ClaudeSessionStats) -> None:
+        """Stash synced Claude stats for the published snapshot."""
+        self._claude_stats[session_id] = stats
+        with self._stats_lock:
+            generation = self.state.stats_generation + 1
+            self._stats_generations[session_id] = generation
+            self._claude_stats_generations[session_id] = generation
+        self._stats_updated[session_id] = datetime.now().isoformat()
+
     def _calculate_median_work_time(self, operation_times: List[float]) -> float:
         """Calculate median operation time."""
         return calculate_median(operation_times)
@@ -940,7 +1048,16 @@ class MonitorDaemon:
         return INTERVAL_FAST
 
     def _interruptible_sleep(self, total_seconds: int) -> None:
-        """Sleep with activity signal checking."""
+        """Sleep with activity signal checking.
+
+        With a watcher, blocks until a hook file or the activity signal
+        changes; agents whose hook files changed are re-detected straight
+        away and the sleep continues until the next full tick is due.
+        """
+        if self._watcher is not None:
+            self._watch_until(time.monotonic() + total_seconds)
+            return
+
         chunk_size = 1
         elapsed = 0
 
@@ -952,9 +1069,68 @@ class MonitorDaemon:
 
             if check_activity_signal(self.tmux_session):
                 self.log.info("User activity detected → waking up")
+                self._scheduler.bump_all()
+                self.state.current_interval = INTERVAL_FAST
+                self.state.save(self.state_path)
+                return
+
+    def _start_hook_receiver(self) -> None:
+        """Start the hook receiver if enabled in config.
+
+        Hook states it writes are handed to the hook detector directly;
+        the file write still wakes the watcher, which re-detects the agent
+        from that in-memory state.
+        """
+        if not get_hook_receiver_enabled():
+            return
+        from .hook_receiver import HookReceiver
+
+        receiver = HookReceiver(
+            self.tmux_session,
+            on_state=getattr(self.detector.hooks, "record_hook_state", None),
+            log=self.log.warn,
+        )
+        if receiver.start():
+            self._hook_receiver = receiver
+            self.log.info(f"Hook receiver listening on {receiver.socket_path}")
+
+    def _watch_until(self, deadline: float) -> None:
+        """Wait on the state watcher until ``deadline`` (monotonic seconds)."""
+        signal_name = get_activity_signal_path(self.tmux_session).name
+        while not self._shutdown:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            changed = self._watcher.wait(remaining)
+            if signal_name in changed and check_activity_signal(self.tmux_session):
+                self.log.info("User activity detected → waking up")
+                self._scheduler.bump_all()
                 self.state.current_interval = INTERVAL_FAST
                 self.state.save(self.state_path)
                 return
+            names = {hook_agent_name(name) for name in changed} - {None}
+            if names:
+                self._redetect_agents(names, datetime.now())
+
+    def _redetect_agents(self, names: set, now: datetime) -> None:
+        """Re-detect only the named agents and republish state.
+
+        Called between ticks when their hook files change, so a status
+        change reaches the TUI without waiting for the next full tick.
+        The periodic syncs (stats, git, skills, resources) are left to it.
+        """
+        with self.session_manager.transaction():
+            sessions = [s for s in self.session_manager.list_sessions()
+                        if s.tmux_session == self.tmux_session and s.name in names]
+            if not sessions:
+                return
+            self._scheduler.bump(s.id for s in sessions)
+            fresh_states, _ = self._detect_and_enrich(sessions, now)
+        fresh = {s.session_id: s for s in fresh_states}
+        merged = [fresh.pop(s.session_id, s) for s in self.state.sessions]
+        merged.extend(fresh.values())
+        self._compute_subtree_costs(merged)
+        self._publish_state(merged)
 
     def _auto_archive_done_agents(self, sessions: list) -> None:
         """Auto-archive done agents that have been done for over 1 hour (#244).
@@ -1056,6 +1232,9 @@ class MonitorDaemon:
                 pass
 
         self.state.save(self.state_path)
+        self._pane_store.publish(
+            [s.session_id for s in session_states], self.state.current_interval
+        )
 
         # Push to relay if configured and interval elapsed
         self._maybe_push_to_relay()
@@ -1129,20 +1308,75 @@ class MonitorDaemon:
         if self.detector.mode != current_mode:
             self.detector.mode = current_mode
             self.log.info(f"Detection mode changed to: {current_mode}")
-        sessions = [s for s in self.session_manager.list_sessions()
-                    if s.tmux_session == self.tmux_session]
-        if not self._legacy_windows_migrated:
-            self._migrate_legacy_window_ids(sessions)
-            self._legacy_windows_migrated = True
+        # Session writes made while syncing and detecting are coalesced and
+        # flushed once, before state is published for the TUI.
+        with self.session_manager.transaction():
+            sessions = [s for s in self.session_manager.list_sessions()
+                        if s.tmux_session == self.tmux_session]
+            if not self._legacy_windows_migrated:
+                self._migrate_legacy_window_ids(sessions)
+                self._legacy_windows_migrated = True
+            first_sync = self._last_stats_sync is None
+            self._start_syncs(sessions, now)
+            if first_sync:
+                # The first loop publishes with synced stats (#103)
+                self._phase_tasks.wait()
+            self._dispatch_heartbeats(sessions)
+            session_states, all_waiting = self._detect_and_enrich(sessions, now)
+            self._cleanup_stale(sessions)
+        self._publish_and_enforce(sessions, session_states, all_waiting)
+
+    def _start_syncs(self, sessions: list, now: datetime) -> None:
+        """Start the sync phases on worker threads, without waiting for them.
+
+        A phase still running from an earlier tick is left alone; results
+        land in the session registry and stats caches whenever the phase
+        finishes and are published by the next tick.
+        """
+        for name, phase in (
+            ("claude_history", self._sync_claude_history),
+            ("git_stats", self._sync_git_stats),
+            ("git_context", self._sync_git_context),
+            ("skills", self._sync_available_skills),
+            ("sandbox", self._sync_sandbox_state),
+            ("resources", self._sync_process_resources),
+        ):
+            self._phase_tasks.start(name, self._in_transaction, phase, sessions, now)
+
+    def _in_transaction(self, fn, *args):
+        """Run ``fn`` with its session writes coalesced (transactions are per thread)."""
+        with self.session_manager.transaction():
+            return fn(*args)
+
+    def _log_slow_task(self, name: str, timeout: float) -> None:
+        self.log.warn(f"Sync task {name} still running after {timeout:.0f}s")
+
+    def _log_task_error(self, name: str, error: BaseException) -> None:
+        self.log.warn(f"Sync task {name} failed: {error}")
+
+    def _sync_claude_history(self, sessions: list, now: datetime) -> None:
+        """Session IDs, then token/cost stats; both read Claude's history files."""
         self._sync_session_ids(sessions, now)
         self._sync_session_stats(sessions, now)
-        self._sync_available_skills(sessions, now)
-        self._sync_sandbox_state(sessions, now)
-        self._sync_process_resources(sessions, now)
-        self._dispatch_heartbeats(sessions)
-        session_states, all_waiting = self._detect_and_enrich(sessions, now)
-        self._cleanup_stale(sessions)
-        self._publish_and_enforce(sessions, session_states, all_waiting)
+
+    def _sync_git_context(self, sessions: list, now: datetime) -> None:
+        """Refresh each agent's repo and branch, one git call per agent."""
+        self._agent_tasks.map(
+            "git_context",
+            lambda session: self._in_transaction(self._refresh_git_context, session),
+            sessions,
+            key=lambda session: session.id,
+        )
+
+    def _refresh_git_context(self, session) -> None:
+        git_changed = self.session_manager.refresh_git_context(session.id)
+        if git_changed and session.pr_number is not None:
+            # Re-read session to get updated branch
+            refreshed = self.session_manager.get_session(session.id)
+            if refreshed and refreshed.branch is not None:
+                # Clear if pr_branch not set (pre-migration) or branch mismatch
+                if refreshed.pr_branch is None or refreshed.branch != refreshed.pr_branch:
+                    self.session_manager.update_session(session.id, pr_number=None, pr_branch=None)
 
     def _sync_session_ids(self, sessions: list, now: datetime) -> None:
         """Fast session ID detection every 10s (#116).
@@ -1160,9 +1394,51 @@ class MonitorDaemon:
         Ensures the first loop has accurate data (fixes #103).
         """
         if should_sync_stats(self._last_stats_sync, now, self._stats_sync_interval):
-            for session in sessions:
-                self.sync_claude_code_stats(session)
+            # Container agents go through docker exec; one slow container
+            # only holds up its own agent
+            self._agent_tasks.map(
+                "claude_stats",
+                lambda session: self._in_transaction(self.sync_claude_code_stats, session),
+                sessions,
+                key=lambda session: session.id,
+            )
             self._last_stats_sync = now
+            with self._stats_lock:
+                self.state.stats_generation += 1
+
+    def _sync_git_stats(self, sessions: list, now: datetime) -> None:
+        """Sample git diff and untracked-file counts for the stats snapshot.
+
+        Done once here so the TUI, ``overcode list`` and the web API don't
+        each fork two git processes per agent per refresh.
+        """
+        if not should_sync_stats(self._last_git_stats_sync, now, self._git_stats_sync_interval):
+            return
+        from .tui_helpers import (
+            effective_git_directory,
+            get_git_diff_stats,
+            get_git_untracked_count,
+        )
+        git_dirs = []
+        for session in sessions:
+            if getattr(session, "is_remote", False) or session.status == "terminated":
+                continue
+            git_dir = effective_git_directory(session)
+            if git_dir:
+                git_dirs.append((session.id, git_dir))
+        results = self._agent_tasks.map(
+            "git_stats",
+            lambda item: (get_git_diff_stats(item[1]), get_git_untracked_count(item[1])),
+            git_dirs,
+            key=lambda item: item[0],
+        )
+        with self._stats_lock:
+            generation = self.state.stats_generation + 1
+            for session_id, stats in results.items():
+                self._git_stats[session_id] = stats
+                self._stats_generations[session_id] = generation
+            self.state.stats_generation = generation
+        self._last_git_stats_sync = now
 
     def _sync_available_skills(self, sessions: list, now: datetime) -> None:
         """Scan installed skill directories every 60s (#252)."""
@@ -1187,7 +1463,7 @@ class MonitorDaemon:
         ):
             return
         from .doctor import find_claude_process
-        from .implementations import RealTmux
+        from .tmux_control import create_tmux
         from .process_resources import (
             snapshot_processes, build_children_index, aggregate_tree,
         )
@@ -1200,7 +1476,10 @@ class MonitorDaemon:
         # shape doctor expects is derived on the fly.
         children = build_children_index(snapshot)
         argv_by_pid = {pid: info.argv for pid, info in snapshot.items()}
-        tmux = RealTmux()
+        tmux = create_tmux()
+        # Collected and written in one transaction rather than one
+        # state write per agent.
+        updates = {}
         for session in sessions:
             if getattr(session, "is_remote", False):
                 continue
@@ -1211,9 +1490,7 @@ class MonitorDaemon:
             if claude_pid is None:
                 # Reset to 0 so a dead/missing agent doesn't pin a stale reading.
                 if session.cpu_percent or session.rss_bytes:
-                    self.session_manager.update_session(
-                        session.id, cpu_percent=0.0, rss_bytes=0,
-                    )
+                    updates[session.id] = {"cpu_percent": 0.0, "rss_bytes": 0}
                 continue
             cpu, rss = aggregate_tree(claude_pid, snapshot, children)
             # Only write when the value moved meaningfully — avoids a JSON
@@ -1222,9 +1499,8 @@ class MonitorDaemon:
                 abs(cpu - session.cpu_percent) >= 1.0
                 or abs(rss - session.rss_bytes) >= 1024 * 1024  # 1 MiB
             ):
-                self.session_manager.update_session(
-                    session.id, cpu_percent=cpu, rss_bytes=rss,
-                )
+                updates[session.id] = {"cpu_percent": cpu, "rss_bytes": rss}
+        self.session_manager.update_many(updates)
         self._last_resources_sync = now
 
     def _sync_sandbox_state(self, sessions: list, now: datetime) -> None:
@@ -1232,7 +1508,7 @@ class MonitorDaemon:
         if not should_sync_stats(self._last_sandbox_sync, now, self._sandbox_sync_interval):
             return
         from .doctor import _snapshot_process_table, _build_child_index, find_claude_process
-        from .implementations import RealTmux
+        from .tmux_control import create_tmux
         from .sandbox_detect import detect_sandbox_states
 
         rows = _snapshot_process_table()
@@ -1240,7 +1516,7 @@ class MonitorDaemon:
             self._last_sandbox_sync = now
             return
         children, argv_by_pid = _build_child_index(rows)
-        tmux = RealTmux()
+        tmux = create_tmux()
         # Gather all local claude PIDs with one lsof call (#451 optimization).
         session_pids: dict = {}  # session.id -> claude_pid
         for session in sessions:
@@ -1268,6 +1544,7 @@ class MonitorDaemon:
         self._sessions_running_from_heartbeat.update(self._heartbeat_triggered_sessions)
         # Track pending heartbeat starts for timeline marker
         self._heartbeat_start_pending.update(self._heartbeat_triggered_sessions)
+        self._scheduler.bump(self._heartbeat_triggered_sessions)
 
     def _detect_and_enrich(self, sessions: list, now: datetime) -> tuple:
         """Detect status and build SessionDaemonState for each session.
@@ -1278,13 +1555,23 @@ class MonitorDaemon:
         session_states = []
         all_waiting_user = True
 
+        # Detect status - dispatches per-session via dispatcher (#5); the
+        # panes of all due agents are captured in one round-trip, the rest
+        # keep their last result until the scheduler says otherwise
+        live = [s for s in sessions if s.status != "done"]
+        self._bump_changed_panes(live)
+        due = self._scheduler.due(s.id for s in live)
+        to_detect = [s for s in live if s.id in due or s.id not in self._last_detected]
+        if to_detect:
+            self._last_detected.update(zip([s.id for s in to_detect], self.detector.detect_statuses(to_detect)))
+        detected = self._last_detected
+
         for session in sessions:
             pane_content = ""
             if session.status == "done":
                 status, activity = STATUS_DONE, "Completed"
             else:
-                # Detect status - dispatches per-session via dispatcher (#5)
-                status, activity, pane_content = self.detector.detect_status(session)
+                status, activity, pane_content = detected[session.id]
 
                 # Log hook events when they change (diagnostic visibility)
                 self._log_hook_event(session, status, activity)
@@ -1297,6 +1584,9 @@ class MonitorDaemon:
 
                 # Extract PR number from pane content
                 if pane_content:
+                    self._pane_store.record(
+                        session.id, session.tmux_window, pane_content, self.detector.capture_lines
+                    )
                     pr = extract_pr_number(pane_content)
                     if pr is not None and pr != session.pr_number:
                         self.session_manager.update_session(session.id, pr_number=pr, pr_branch=session.branch)
@@ -1306,16 +1596,6 @@ class MonitorDaemon:
                 self._sessions_running_from_heartbeat.discard(session.id)
                 self._heartbeat_start_pending.discard(session.id)
 
-            # Refresh git context (branch may have changed)
-            git_changed = self.session_manager.refresh_git_context(session.id)
-            if git_changed and session.pr_number is not None:
-                # Re-read session to get updated branch
-                refreshed = self.session_manager.get_session(session.id)
-                if refreshed and refreshed.branch is not None:
-                    # Clear if pr_branch not set (pre-migration) or branch mismatch
-                    if refreshed.pr_branch is None or refreshed.branch != refreshed.pr_branch:
-                        self.session_manager.update_session(session.id, pr_number=None, pr_branch=None)
-
             # Update current task in session
             self.session_manager.update_stats(
                 session.id,
@@ -1359,14 +1639,16 @@ class MonitorDaemon:
                     and effective_status != STATUS_TERMINATED):
                 self.session_manager.update_session_status(session.id, "running")
 
+            if session.status != "done":
+                self._scheduler.observe(session.id, effective_status)
+
             session_state = self.track_session_stats(session, effective_status)
             session_state.current_activity = activity
             session_states.append(session_state)
 
-            # Log status history to session-specific file
-            log_agent_status(
+            # Log status transitions (and periodic keyframes) to history
+            self._status_recorder.record(
                 session.name, effective_status, activity,
-                history_file=self.history_path,
                 session_id=session.id,
                 hostname=self._hostname,
             )
@@ -1380,6 +1662,19 @@ class MonitorDaemon:
 
         return session_states, all_waiting_user
 
+    def _bump_changed_panes(self, sessions: list) -> None:
+        """Make agents due whose pane changed since the last tick."""
+        if not sessions:
+            return
+        fingerprints = self.detector.polling.tmux.pane_fingerprints(self.tmux_session)
+        changed = []
+        for session in sessions:
+            fingerprint = fingerprints.get(session.tmux_window)
+            if fingerprint != self._pane_fingerprints.get(session.tmux_window):
+                changed.append(session.id)
+            self._pane_fingerprints[session.tmux_window] = fingerprint
+        self._scheduler.bump(changed)
+
     def _log_hook_event(self, session, status: str, activity: str) -> None:
         """Log hook events to the daemon log when they change.
 
@@ -1427,6 +1722,16 @@ class MonitorDaemon:
         stale_ids = set(self.previous_states.keys()) - current_session_ids
         for stale_id in stale_ids:
             del self.previous_states[stale_id]
+        self._scheduler.forget(current_session_ids)
+        current_windows = {s.tmux_window for s in sessions}
+        for window in set(self._pane_fingerprints) - current_windows:
+            del self._pane_fingerprints[window]
+        for cache in (self._claude_stats, self._git_stats,
+                      self._stats_generations, self._claude_stats_generations,
+                      self._stats_updated,
+                      self._last_detected):
+            for stale_id in set(cache.keys()) - current_session_ids:
+                del cache[stale_id]
 
     def _publish_and_enforce(self, sessions: list, session_states: list, all_waiting_user: bool) -> None:
         """Publish state, enforce policies, and log summary."""
@@ -1453,6 +1758,12 @@ class MonitorDaemon:
         if self.state.loop_count % 60 == 0:
             self._auto_archive_done_agents(sessions)
             self.state.untracked_window_count = self._count_untracked_windows(sessions)
+            memo_stats = self.detector.polling.memo_stats
+            if memo_stats.hits or memo_stats.misses:
+                self.log.info(f"Detection memo: {memo_stats.summary()}")
+
+        # Retention/compaction when due (runs on its own low-priority thread)
+        self._compaction.maybe_start()
 
         # Log summary
         green = sum(1 for s in session_states if s.current_status == STATUS_RUNNING)
@@ -1463,6 +1774,17 @@ class MonitorDaemon:
     # Main loop
     # ------------------------------------------------------------------
 
+    def _upgrade_history_file(self) -> None:
+        """Convert a per-tick status history file to the change-only format."""
+        if not is_legacy_history_file(self.history_path):
+            return
+        try:
+            rows_read, rows_written = convert_history_file(self.history_path)
+        except (OSError, IOError) as e:
+            self.log.warn(f"Could not convert status history: {e}")
+            return
+        self.log.info(f"Converted status history: {rows_read} rows -> {rows_written}")
+
     def run(self, check_interval: int = INTERVAL_FAST):
         """Main daemon loop."""
         # Atomically check if already running and acquire lock
@@ -1492,6 +1814,16 @@ class MonitorDaemon:
         self.state.current_interval = check_interval
         self.state.save(self.state_path)
 
+        self._upgrade_history_file()
+
+        signal_name = get_activity_signal_path(self.tmux_session).name
+        self._watcher = create_state_watcher(
+            ensure_session_dir(self.tmux_session),
+            name_filter=lambda name: name == signal_name or is_hook_file(name),
+        )
+        self.log.info(f"Hook file watcher: {type(self._watcher).__name__}")
+        self._start_hook_receiver()
+
         try:
             while not self._shutdown:
                 self.state.loop_count += 1
@@ -1503,7 +1835,15 @@ class MonitorDaemon:
             raise
         finally:
             self.log.info("Monitor daemon shutting down")
+            self._watcher.close()
+            self._watcher = None
+            if self._hook_receiver is not None:
+                self._hook_receiver.stop()
+                self._hook_receiver = None
             self.presence.stop()
+            self._phase_tasks.shutdown()
+            self._agent_tasks.shutdown()
+            self._pane_store.remove()
             self.state.status = "stopped"
             self.state.save(self.state_path)
             remove_pid_file(self.pid_path)
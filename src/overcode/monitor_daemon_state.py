@@ -19,7 +19,7 @@ import dataclasses
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from .settings import (
     PATHS,
@@ -27,8 +27,17 @@ from .settings import (
     get_monitor_daemon_state_path,
 )
 
+if TYPE_CHECKING:
+    from .history_reader import ClaudeSessionStats
+
 logger = logging.getLogger(__name__)
 
+# Schema version of the per-session stats snapshot (token totals, work
+# times, git diff/untracked counts).  Bump when the meaning of those fields
+# changes so consumers fall back to local computation instead of
+# misreading an older daemon's state file.
+STATS_SNAPSHOT_VERSION = 1
+
 
 @dataclass
 class SessionDaemonState:
@@ -140,6 +149,65 @@ class SessionDaemonState:
     cpu_percent: float = 0.0
     rss_bytes: int = 0
 
+    # Stats snapshot — what the TUI, CLI and web API would otherwise re-derive
+    # by parsing transcripts and forking git themselves.
+    # stats_generation is MonitorDaemonState.stats_generation at the time this
+    # session's snapshot was last refreshed by a Claude or git sync (0 = never
+    # synced); claude_stats_generation only counts Claude stats syncs, which
+    # the token, cost and work-time fields come from.
+    stats_generation: int = 0
+    claude_stats_generation: int = 0
+    stats_updated: Optional[str] = None  # ISO timestamp
+    claude_median_work_time: float = 0.0  # From transcript prompt-to-prompt times
+    subagent_count: int = 0
+    live_subagent_count: int = 0
+    background_task_count: int = 0
+    git_diff_files: Optional[int] = None  # None = not a git repo / not sampled
+    git_diff_insertions: int = 0
+    git_diff_deletions: int = 0
+    git_untracked: Optional[int] = None
+
+    @property
+    def has_stats_snapshot(self) -> bool:
+        """True if the daemon has published Claude stats for this session.
+
+        A git-only sync doesn't count: to_claude_stats() would return zero
+        tokens and cost rather than letting the caller compute them.
+        """
+        return self.claude_stats_generation > 0
+
+    @property
+    def git_diff_stats(self) -> Optional[Tuple[int, int, int]]:
+        """(files, insertions, deletions) as get_git_diff_stats returns it."""
+        if self.git_diff_files is None:
+            return None
+        return (self.git_diff_files, self.git_diff_insertions, self.git_diff_deletions)
+
+    def to_claude_stats(self) -> "ClaudeSessionStats":
+        """Rebuild a ClaudeSessionStats from the published snapshot.
+
+        Work times are collapsed to the median (the only aggregate consumers
+        render), as synthesize_remote_stats does for sister agents.
+        """
+        from .history_reader import ClaudeSessionStats
+
+        mwt = self.claude_median_work_time
+        return ClaudeSessionStats(
+            interaction_count=self.interaction_count,
+            input_tokens=self.input_tokens,
+            output_tokens=self.output_tokens,
+            cache_creation_tokens=self.cache_creation_tokens,
+            cache_read_tokens=self.cache_read_tokens,
+            work_times=[mwt] if mwt > 0 else [],
+            current_context_tokens=self.current_context_tokens,
+            subagent_count=self.subagent_count,
+            live_subagent_count=self.live_subagent_count,
+            background_task_count=self.background_task_count,
+            model=self.model,
+            provider=self.provider,
+            last_command=self.last_command,
+        )
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return dataclasses.asdict(self)
@@ -212,6 +280,12 @@ class MonitorDaemonState:
     # Untracked tmux windows (#344)
     untracked_window_count: int = 0
 
+    # Stats snapshot versioning: stats_version is the schema the daemon wrote
+    # (STATS_SNAPSHOT_VERSION), stats_generation increments every time the
+    # daemon refreshes Claude or git stats for any session.
+    stats_version: int = 0
+    stats_generation: int = 0
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return dataclasses.asdict(self)
@@ -322,6 +396,28 @@ class MonitorDaemonState:
         except (ValueError, TypeError):
             return True
 
+    def has_fresh_stats(self) -> bool:
+        """True if consumers can use the published stats snapshot as-is.
+
+        Requires a live daemon, a matching snapshot schema, and at least one
+        completed stats sync.
+        """
+        return (
+            self.stats_version == STATS_SNAPSHOT_VERSION
+            and self.stats_generation > 0
+            and not self.is_stale()
+        )
+
+    def stats_snapshot(self) -> Dict[str, SessionDaemonState]:
+        """Return session_id → SessionDaemonState for sessions with stats.
+
+        Empty when the snapshot is stale or from an incompatible daemon, so
+        callers can treat a missing entry as "compute locally".
+        """
+        if not self.has_fresh_stats():
+            return {}
+        return {s.session_id: s for s in self.sessions if s.has_stats_snapshot}
+
 
 def get_monitor_daemon_state(session: Optional[str] = None) -> Optional[MonitorDaemonState]:
     """Get the current monitor daemon state from file.
@@ -338,3 +434,17 @@ def get_monitor_daemon_state(session: Optional[str] = None) -> Optional[MonitorD
         session = DAEMON.default_tmux_session
     state_path = get_monitor_daemon_state_path(session)
     return MonitorDaemonState.load(state_path)
+
+
+def get_stats_snapshot(session: Optional[str] = None) -> Dict[str, SessionDaemonState]:
+    """Get the daemon's published per-session stats, keyed by session ID.
+
+    Returns an empty dict when the daemon isn't running, its state is stale,
+    or it predates STATS_SNAPSHOT_VERSION — callers should then fall back to
+    computing stats locally.
+
+    Args:
+        session: tmux session name. If None, uses default from config.
+    """
+    state = get_monitor_daemon_state(session)
+    return state.stats_snapshot() if state else {}
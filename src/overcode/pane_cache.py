@@ -0,0 +1,149 @@
+"""
+Process-wide pane capture cache.
+
+Within one TUI refresh the same pane used to be captured several times:
+by status detection, by the summarizer and by the fullscreen preview.
+PaneCache keeps the last capture of each (tmux session, window) for a
+short freshness window so that these consumers share one capture.
+
+Captures are single-flight per pane: a requester that arrives while the
+same pane is being captured waits for that capture instead of starting
+its own. A request for more lines than the cached capture holds
+triggers a deeper capture, which then serves every later (shallower)
+request too. Cached content may therefore contain more scrollback than
+was asked for; every consumer trims to the lines it wants.
+
+CachingTmux wraps a TmuxInterface so that its capture_pane and
+capture_panes go through the cache; everything else is delegated.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .interfaces import TmuxInterface
+
+
+# How long a capture may be reused (below the TUI's 250ms status tick)
+PANE_CACHE_TTL = 0.2
+
+_Key = Tuple[str, str]
+
+
+class PaneCache:
+    """Short-lived, single-flight cache of pane captures."""
+
+    def __init__(self, ttl: float = PANE_CACHE_TTL, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self._clock = clock
+        # (session, window) -> (captured_at, lines, content)
+        self._entries: Dict[_Key, Tuple[float, int, Optional[str]]] = {}
+        self._key_locks: Dict[_Key, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _key_lock(self, key: _Key) -> threading.Lock:
+        with self._lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
+
+    def _fresh(self, key: _Key, lines: int) -> Tuple[bool, Optional[str]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        captured_at, cached_lines, content = entry
+        if cached_lines < lines or self._clock() - captured_at > self.ttl:
+            return False, None
+        return True, content
+
+    def capture(self, tmux: "TmuxInterface", session: str, window: str, lines: int = 100) -> Optional[str]:
+        """capture_pane, served from a fresh capture of at least ``lines``."""
+        key = (session, window)
+        with self._key_lock(key):
+            hit, content = self._fresh(key, lines)
+            if hit:
+                return content
+            content = tmux.capture_pane(session, window, lines)
+            self._entries[key] = (self._clock(), lines, content)
+            return content
+
+    def capture_many(
+        self, tmux: "TmuxInterface", session: str, windows: List[str], lines: int = 100
+    ) -> Dict[str, Optional[str]]:
+        """capture_panes, capturing only the panes without a fresh entry."""
+        windows = list(windows)
+        keys = sorted({(session, w) for w in windows}, key=lambda k: str(k[1]))
+        # Locks are always taken in the same order, so batches can't deadlock
+        locks = [self._key_lock(key) for key in keys]
+        for lock in locks:
+            lock.acquire()
+        try:
+            result: Dict[str, Optional[str]] = {}
+            missing = []
+            for window in windows:
+                hit, content = self._fresh((session, window), lines)
+                if hit:
+                    result[window] = content
+                elif window not in missing:
+                    missing.append(window)
+            if missing:
+                captured = tmux.capture_panes(session, missing, lines=lines)
+                now = self._clock()
+                for window in missing:
+                    content = captured.get(window)
+                    self._entries[(session, window)] = (now, lines, content)
+                    result[window] = content
+            return result
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def invalidate(self, session: str, window: Optional[str] = None) -> None:
+        """Drop cached captures for one window, or for the whole session."""
+        with self._lock:
+            if window is not None:
+                self._entries.pop((session, window), None)
+                return
+            for key in [k for k in self._entries if k[0] == session]:
+                del self._entries[key]
+
+
+_pane_cache: Optional[PaneCache] = None
+_pane_cache_lock = threading.Lock()
+
+
+def get_pane_cache() -> PaneCache:
+    """The process-wide PaneCache."""
+    global _pane_cache
+    with _pane_cache_lock:
+        if _pane_cache is None:
+            _pane_cache = PaneCache()
+        return _pane_cache
+
+
+class CachingTmux:
+    """TmuxInterface whose pane captures go through a PaneCache."""
+
+    def __init__(self, tmux: "TmuxInterface", cache: Optional[PaneCache] = None):
+        self._tmux = tmux
+        self._cache = cache or get_pane_cache()
+
+    def __getattr__(self, name):
+        return getattr(self._tmux, name)
+
+    def capture_pane(self, session: str, window: str, lines: int = 100) -> Optional[str]:
+        return self._cache.capture(self._tmux, session, window, lines)
+
+    def capture_panes(self, session: str, windows: List[str], lines: int = 100) -> Dict[str, Optional[str]]:
+        return self._cache.capture_many(self._tmux, session, windows, lines)
+
+    def send_keys(self, session: str, window: str, keys: str, enter: bool = True) -> bool:
+        # The pane is about to change; don't serve the old capture
+        self._cache.invalidate(session, window)
+        return self._tmux.send_keys(session, window, keys, enter)
+
+    def kill_window(self, session: str, window: str) -> bool:
+        self._cache.invalidate(session, window)
+        return self._tmux.kill_window(session, window)
@@ -0,0 +1,191 @@
+"""
+Pane captures published by the monitor daemon.
+
+The daemon captures every agent pane on each tick for status detection.
+PaneStoreWriter publishes those captures to one JSON file per tmux
+session (on tmpfs where available, see settings.get_pane_store_path) so
+that the web API, ``overcode show`` and the TUI's non-focused rows can
+read them instead of capturing the panes again.
+
+Each record carries a sequence number that only moves when its content
+changes, and the file as a whole carries one that moves on every
+rewrite. A tick that changes nothing just touches the file, so readers
+can tell a live daemon from a dead one by its mtime: the store is stale
+once it is older than the daemon interval plus STALE_BUFFER_SECONDS.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from .settings import get_pane_store_path
+from .status_constants import STATUS_CAPTURE_LINES
+
+logger = logging.getLogger(__name__)
+
+# Bump when the file layout changes; readers ignore other versions
+PANE_STORE_VERSION = 1
+
+STALE_BUFFER_SECONDS = 5.0
+
+# Lines kept per pane: as deep as readers go (the TUI's STATUS_CAPTURE_LINES,
+# the web API's PANE_CAPTURE_LINES). The daemon captures more for status
+# detection; `overcode show --lines N` beyond this captures the pane itself.
+PUBLISHED_LINES = STATUS_CAPTURE_LINES
+
+
+@dataclass
+class PaneRecord:
+    """The daemon's latest capture of one agent's pane."""
+
+    session_id: str
+    window: str
+    seq: int
+    captured_at: float
+    lines: int
+    content: str
+
+    def tail(self, lines: int) -> str:
+        """The last ``lines`` lines of the capture."""
+        parts = self.content.split("\n")
+        return "\n".join(parts[-lines:]) if len(parts) > lines else self.content
+
+
+class PaneStoreWriter:
+    """Daemon side: collects captures during a tick and publishes them."""
+
+    def __init__(self, tmux_session: str, path: Optional[Path] = None):
+        self.path = path or get_pane_store_path(tmux_session)
+        self._records: Dict[str, PaneRecord] = {}
+        self._seq = 0
+        self._dirty = True
+        self._interval: Optional[float] = None
+
+    def record(self, session_id: str, window: str, content: str, lines: int) -> None:
+        """Note the capture just taken for an agent.
+
+        Only its last PUBLISHED_LINES lines are kept, so changes further up
+        the scrollback don't rewrite the store.
+        """
+        previous = self._records.get(session_id)
+        content = str(content)
+        if lines > PUBLISHED_LINES:
+            parts = content.split("\n")
+            if len(parts) > PUBLISHED_LINES:
+                content = "\n".join(parts[-PUBLISHED_LINES:])
+            lines = PUBLISHED_LINES
+        if previous is not None and previous.content == content and previous.window == window:
+            return
+        self._records[session_id] = PaneRecord(
+            session_id=session_id,
+            window=str(window),
+            seq=(previous.seq + 1) if previous else 1,
+            captured_at=time.time(),
+            lines=lines,
+            content=content,
+        )
+        self._dirty = True
+
+    def publish(self, session_ids: Iterable[str], interval: float) -> None:
+        """Write the store, dropping agents not in ``session_ids``.
+
+        Rewrites the file only when something changed; otherwise touches
+        it so readers keep treating it as fresh.
+        """
+        live = set(session_ids)
+        for stale in [sid for sid in self._records if sid not in live]:
+            del self._records[stale]
+            self._dirty = True
+        if interval != self._interval:
+            self._interval = interval
+            self._dirty = True
+
+        try:
+            if not self._dirty and self.path.exists():
+                os.utime(self.path)
+                return
+            self._seq += 1
+            self._write({
+                "version": PANE_STORE_VERSION,
+                "seq": self._seq,
+                "interval": interval,
+                "pid": os.getpid(),
+                "panes": {sid: r.__dict__ for sid, r in self._records.items()},
+            })
+            self._dirty = False
+        except OSError as e:
+            logger.debug("Failed to publish pane store %s: %s", self.path, e)
+
+    def _write(self, data: dict) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def remove(self) -> None:
+        """Delete the store (daemon shutdown)."""
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+
+
+class PaneStoreReader:
+    """Consumer side: reads the store, reparsing only when it changed."""
+
+    def __init__(self, tmux_session: str, path: Optional[Path] = None):
+        self.path = path or get_pane_store_path(tmux_session)
+        self._key: Optional[Tuple[int, int, int]] = None
+        self._interval = 0.0
+        self._records: Dict[str, PaneRecord] = {}
+
+    def read(self) -> Dict[str, PaneRecord]:
+        """Records by session id; empty when missing or stale."""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return {}
+        key = (st.st_ino, st.st_size, st.st_mtime_ns)
+        if key != self._key:
+            self._load()
+            self._key = key
+        if time.time() - st.st_mtime > self._interval + STALE_BUFFER_SECONDS:
+            return {}
+        return self._records
+
+    def _load(self) -> None:
+        self._records, self._interval = {}, 0.0
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            if data.get("version") != PANE_STORE_VERSION:
+                return
+            self._records = {sid: PaneRecord(**r) for sid, r in data["panes"].items()}
+            self._interval = float(data.get("interval", 0))
+        except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+            self._records, self._interval = {}, 0.0
+
+    def get(self, session_id: str, min_lines: int = 0) -> Optional[PaneRecord]:
+        """The record for an agent if it is fresh and at least ``min_lines`` deep."""
+        record = self.read().get(session_id)
+        if record is None or record.lines < min_lines:
+            return None
+        return record
+
+
+def read_pane_store(tmux_session: str) -> Dict[str, PaneRecord]:
+    """One-shot read of the published pane captures (empty if stale)."""
+    return PaneStoreReader(tmux_session).read()
@@ -38,6 +38,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+from .compaction import append_lock
 from .pid_utils import is_process_running, get_process_pid, write_pid_file, remove_pid_file
 
 # Check for macOS-specific dependencies
@@ -272,60 +273,58 @@ class PresenceLogger:
         # Ensure directory exists
         os.makedirs(os.path.dirname(cfg.log_path), exist_ok=True)
 
-        # Open in append mode; keep file handle for the process lifetime
-        with open(cfg.log_path, "a", newline="") as f:
-            writer = csv.writer(f)
+        while not self._stop_event.is_set():
+            now = dt.datetime.now()
+            slept = infer_sleep(last_ts, now, cfg.sample_interval)
+            idle = get_idle_seconds()
+            locked = is_screen_locked()
+            state = classify_state(
+                locked=locked,
+                idle_seconds=idle,
+                slept=slept,
+                idle_threshold=cfg.idle_threshold,
+                tui_active=self._is_tui_active(),
+            )
+
+            self._last_state = state
 
-            # Add header if file is empty
+            # Reopen for each sample rather than holding the handle: the
+            # daemon's compaction pass may atomically replace the file, and
+            # holds append_lock off while it does.
             try:
-                if f.tell() == 0:
+                with append_lock(Path(cfg.log_path)), open(cfg.log_path, "a", newline="") as f:
+                    writer = csv.writer(f)
+                    # Add header if file is empty
+                    if f.tell() == 0:
+                        writer.writerow(
+                            [
+                                "timestamp",
+                                "state",
+                                "idle_seconds",
+                                "locked",
+                                "inferred_sleep",
+                            ]
+                        )
                     writer.writerow(
                         [
-                            "timestamp",
-                            "state",
-                            "idle_seconds",
-                            "locked",
-                            "inferred_sleep",
+                            now.isoformat(),
+                            state,
+                            f"{idle:.1f}",
+                            int(locked),
+                            int(slept),
                         ]
                     )
-                    f.flush()
             except (OSError, IOError):
-                # File write failed - header is not critical, continue
+                # Skip this sample; try again next interval
                 pass
-
-            while not self._stop_event.is_set():
-                now = dt.datetime.now()
-                slept = infer_sleep(last_ts, now, cfg.sample_interval)
-                idle = get_idle_seconds()
-                locked = is_screen_locked()
-                state = classify_state(
-                    locked=locked,
-                    idle_seconds=idle,
-                    slept=slept,
-                    idle_threshold=cfg.idle_threshold,
-                    tui_active=self._is_tui_active(),
-                )
-
-                self._last_state = state
-
-                writer.writerow(
-                    [
-                        now.isoformat(),
-                        state,
-                        f"{idle:.1f}",
-                        int(locked),
-                        int(slept),
-                    ]
-                )
-                f.flush()
-                last_ts = now
-
-                # Sleep in small chunks so stop() is responsive
-                remaining = cfg.sample_interval
-                while remaining > 0 and not self._stop_event.is_set():
-                    step = min(1.0, remaining)
-                    time.sleep(step)
-                    remaining -= step
+            last_ts = now
+
+            # Sleep in small chunks so stop() is responsive
+            remaining = cfg.sample_interval
+            while remaining > 0 and not self._stop_event.is_set():
+                step = min(1.0, remaining)
+                time.sleep(step)
+                remaining -= step
 
 
 # ---- simple singleton helper for "just start it" ---------------------------
@@ -30,6 +30,30 @@ class TmuxInterface(Protocol):
         """
         ...
 
+    def capture_panes(self, session: str, windows: List[str], lines: int = 100) -> Dict[str, Optional[str]]:
+        """Capture several panes of a session in one round-trip.
+
+        Args:
+            session: tmux session name
+            windows: window names
+            lines: number of lines to capture from scrollback, per pane
+
+        Returns:
+            Dict mapping each window to its content as capture_pane would
+            return it (None for a window that doesn't exist)
+        """
+        ...
+
+    def pane_fingerprints(self, session: str) -> Dict[str, str]:
+        """Cheap change indicators for every window of a session, in one call.
+
+        Returns:
+            Dict mapping window name to "<pane_id> <history_size>
+            <cursor_x>,<cursor_y> <window_activity>" for the window's active
+            pane; the last field is a Unix timestamp. Empty on failure.
+        """
+        ...
+
     def send_keys(self, session: str, window: str, keys: str, enter: bool = True) -> bool:
         """Send keys to a tmux pane.
 
@@ -141,6 +165,14 @@ class StatusDetectorProtocol(Protocol):
         """
         ...
 
+    def detect_statuses(self, sessions: List["Session"], num_lines: int = 0) -> List[Tuple[str, str, str]]:
+        """detect_status for several sessions, capturing their panes in one call.
+
+        Returns:
+            One (status, current_activity, pane_content) tuple per session
+        """
+        ...
+
     def get_pane_content(self, window: str, num_lines: int = 0) -> Optional[str]:
         """Get the last N meaningful lines from a tmux pane."""
         ...
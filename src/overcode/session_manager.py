@@ -2,12 +2,14 @@
 Session state management for Overcode.
 """
 
+import copy
 import json
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from contextlib import contextmanager
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional
 from dataclasses import MISSING, dataclass, asdict, field, fields
 import uuid
 import time
@@ -249,12 +251,19 @@ class SessionManager:
     For testing, pass a custom state_dir (temp directory) and skip_git_detection=True.
     """
 
-    def __init__(self, state_dir: Optional[Path] = None, skip_git_detection: bool = False):
+    def __init__(
+        self,
+        state_dir: Optional[Path] = None,
+        skip_git_detection: bool = False,
+        backend: Optional[str] = None,
+    ):
         """Initialize the session manager.
 
         Args:
             state_dir: Directory for state files (defaults to ~/.overcode/sessions)
             skip_git_detection: If True, skip git repo/branch detection (for testing)
+            backend: "json" (sessions.json) or "sqlite" (sessions.db);
+                defaults to the configured state backend
         """
         if state_dir is None:
             # Support OVERCODE_STATE_DIR env var for testing
@@ -268,12 +277,28 @@ class SessionManager:
         self.state_file = self.state_dir / "sessions.json"
         self.archive_file = self.state_dir / "archive.json"
         self._skip_git_detection = skip_git_detection
+        # Per-thread deferred-write state for transaction()
+        self._tx = threading.local()
+
+        if backend is None:
+            from .config import get_state_backend
+            backend = get_state_backend()
+        self.backend = backend
+        self._store = None
+        if backend == "sqlite":
+            from .session_store import SqliteSessionStore
+            self._store = SqliteSessionStore(
+                self.state_dir / "sessions.db", json_path=self.state_file
+            )
 
     def _load_state(self) -> Dict[str, dict]:
         """Load all sessions from state file with file locking.
 
         On JSON corruption, attempts to restore from backup automatically.
         """
+        if self._store is not None:
+            return self._store.load_all()
+
         if not self.state_file.exists():
             return {}
 
@@ -352,7 +377,13 @@ class SessionManager:
 
     def _save_state(self, state: Dict[str, dict]):
         """Save all sessions to state file with file locking and atomic writes"""
-        import threading
+        self._invalidate_snapshot()
+        if self._store is not None:
+            with self._store.transaction() as current:
+                current.clear()
+                current.update(state)
+            return
+
         max_retries = 5
         retry_delay = 0.1
 
@@ -396,10 +427,28 @@ class SessionManager:
     def _locked_state(self):
         """Load state under file lock, yield it, save on exit.
 
+        Inside a transaction() any pending deferred updates are applied to
+        the yielded state first, so they land in the same write.
+        """
+        pending = self._take_pending()
+        with self._locked_backend_state() as state:
+            self._apply_updates(state, pending)
+            yield state
+        self._invalidate_snapshot()
+
+    @contextmanager
+    def _locked_backend_state(self):
+        """Load state under file lock, yield it, save on exit.
+
         Holds an exclusive lock for the entire read-modify-write cycle,
         preventing TOCTOU race conditions. The yielded dict is written
         back to the state file when the context manager exits normally.
         """
+        if self._store is not None:
+            with self._store.transaction() as state:
+                yield state
+            return
+
         if not HAS_FCNTL:
             # No locking on Windows - fall back to read/modify/write
             state = self._load_state()
@@ -446,6 +495,144 @@ class SessionManager:
             fcntl.flock(f.fileno(), fcntl.LOCK_UN)
             f.close()
 
+    @contextmanager
+    def _locked_sessions(self, session_ids: List[str]):
+        """Like _locked_state, but only the given sessions need to be present.
+
+        The SQLite backend loads and rewrites just those rows; the JSON
+        backend has to rewrite the whole file anyway and yields all sessions.
+        Callers must check membership before touching an entry.
+        """
+        if self._store is None:
+            with self._locked_state() as state:
+                yield state
+            return
+
+        pending = self._take_pending()
+        with self._store.transaction(list(session_ids) + list(pending)) as state:
+            self._apply_updates(state, pending)
+            yield state
+        self._invalidate_snapshot()
+
+    # -------------------------------------------------------------------------
+    # Deferred writes (transaction)
+    # -------------------------------------------------------------------------
+
+    @contextmanager
+    def transaction(self):
+        """Defer update_session/update_stats/update_session_status/update_many.
+
+        Mutations made in the block (on this thread) are coalesced per
+        session and written once on exit; values equal to what is already
+        stored are dropped. Reads through get_session, get_session_by_name
+        and list_sessions see the pending values, and are served from one
+        snapshot loaded on first use instead of re-reading the state file.
+
+        Any other write made inside the block (create_session, add_tags,
+        ...) goes straight to disk and carries the pending updates with it.
+        Nested calls join the outer transaction. If the block raises, the
+        updates queued so far are still written, as they would have been
+        without the transaction.
+        """
+        tx = self._tx
+        if getattr(tx, 'pending', None) is not None:
+            yield self
+            return
+
+        tx.pending = {}
+        tx.snapshot = None
+        try:
+            yield self
+        finally:
+            try:
+                self._flush_pending()
+            finally:
+                tx.pending = None
+                tx.snapshot = None
+
+    def _flush_pending(self) -> None:
+        """Write any pending deferred updates in a single locked write."""
+        if self._tx.pending:
+            with self._locked_sessions([]):
+                pass
+
+    def _take_pending(self) -> Dict[str, dict]:
+        """Hand over (and clear) the pending updates of the active transaction."""
+        pending = getattr(self._tx, 'pending', None)
+        if not pending:
+            return {}
+        self._tx.pending = {}
+        return pending
+
+    def _invalidate_snapshot(self) -> None:
+        if getattr(self._tx, 'pending', None) is not None:
+            self._tx.snapshot = None
+
+    def _read_state(self) -> Dict[str, dict]:
+        """State for read methods: the transaction view if one is active.
+
+        Returns dicts the caller may mutate (Session.from_dict does).
+        """
+        tx = self._tx
+        pending = getattr(tx, 'pending', None)
+        if pending is None:
+            return self._load_state()
+        if tx.snapshot is None:
+            tx.snapshot = self._load_state()
+        state = copy.deepcopy(tx.snapshot)
+        self._apply_updates(state, pending)
+        return state
+
+    def _read_session(self, session_id: str) -> Optional[dict]:
+        """Single-session form of _read_state (transaction must be active)."""
+        tx = self._tx
+        if tx.snapshot is None:
+            tx.snapshot = self._load_state()
+        data = tx.snapshot.get(session_id)
+        if data is None:
+            return None
+        state = {session_id: copy.deepcopy(data)}
+        self._apply_updates(state, {session_id: tx.pending.get(session_id, {})})
+        return state[session_id]
+
+    def _defer(self, session_id: str, fields: dict) -> bool:
+        """Queue an update in the active transaction.
+
+        Returns False (caller writes immediately) if no transaction is active.
+        """
+        pending = getattr(self._tx, 'pending', None)
+        if pending is None:
+            return False
+        current = self._read_session(session_id)
+        if current is None:
+            return True  # unknown session: a direct write would be a no-op too
+        current_stats = current.get('stats') or {}
+        entry = pending.setdefault(session_id, {})
+        for key, value in fields.items():
+            if key == 'stats':
+                for stat_key, stat_value in value.items():
+                    if current_stats.get(stat_key, MISSING) != stat_value:
+                        entry.setdefault('stats', {})[stat_key] = stat_value
+            elif current.get(key, MISSING) != value:
+                entry[key] = value
+        if not entry:
+            del pending[session_id]
+        return True
+
+    @staticmethod
+    def _apply_updates(state: Dict[str, dict], updates: Dict[str, dict]) -> None:
+        """Apply update_many-style updates to a loaded state dict in place."""
+        for session_id, fields in updates.items():
+            if session_id not in state:
+                continue
+            fields = dict(fields)
+            stats = fields.pop('stats', None)
+            state[session_id].update(fields)
+            if stats:
+                if 'stats' not in state[session_id]:
+                    state[session_id]['stats'] = SessionStats().to_dict()
+                state[session_id]['stats'].update(stats)
+
     def _atomic_update(self, update_fn: Callable[[Dict[str, dict]], Dict[str, dict]]) -> None:
         """Atomically read, modify, and write state with exclusive lock held throughout.
 
@@ -643,6 +830,12 @@ class SessionManager:
 
     def get_session(self, session_id: str) -> Optional[Session]:
         """Get a session by ID"""
+        if getattr(self._tx, 'pending', None) is not None:
+            data = self._read_session(session_id)
+            return Session.from_dict(data) if data is not None else None
+        if self._store is not None:
+            data = self._store.load_one(session_id)
+            return Session.from_dict(data) if data is not None else None
         state = self._load_state()
         if session_id in state:
             return Session.from_dict(state[session_id])
@@ -650,7 +843,7 @@ class SessionManager:
 
     def get_session_by_name(self, name: str) -> Optional[Session]:
         """Get a session by name"""
-        state = self._load_state()
+        state = self._read_state()
         for session_data in state.values():
             if session_data['name'] == name:
                 return Session.from_dict(session_data)
@@ -658,14 +851,16 @@ class SessionManager:
 
     def list_sessions(self) -> List[Session]:
         """List all sessions (skips corrupted entries)"""
-        state = self._load_state()
+        state = self._read_state()
         sessions = [Session.from_dict(data) for data in state.values()]
         # Filter out None (corrupted sessions)
         return [s for s in sessions if s is not None]
 
     def update_session_status(self, session_id: str, status: str):
         """Update session status"""
-        with self._locked_state() as state:
+        if self._defer(session_id, {'status': status}):
+            return
+        with self._locked_sessions([session_id]) as state:
             if session_id in state:
                 state[session_id]['status'] = status
 
@@ -710,7 +905,6 @@ class SessionManager:
 
     def _save_archive(self, archive: Dict[str, dict]):
         """Save archived sessions."""
-        import threading
         if HAS_FCNTL:
             temp_suffix = f'.tmp.{os.getpid()}.{threading.get_ident()}'
             temp_file = self.archive_file.with_suffix(temp_suffix)
@@ -731,11 +925,30 @@ class SessionManager:
             with open(self.archive_file, 'w') as f:
                 json.dump(archive, f, indent=2)
 
+    @contextmanager
+    def _archive_lock(self):
+        """Exclusive lock for a read-modify-write of archive.json.
+
+        archive.json is replaced by rename on save, so the lock is taken on
+        a sidecar file that outlives it.
+        """
+        if not HAS_FCNTL:
+            yield
+            return
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.archive_file.with_name(self.archive_file.name + '.lock'), 'a') as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
     def _archive_session(self, session_data: dict):
         """Add a session to the archive."""
-        archive = self._load_archive()
-        archive[session_data['id']] = session_data
-        self._save_archive(archive)
+        with self._archive_lock():
+            archive = self._load_archive()
+            archive[session_data['id']] = session_data
+            self._save_archive(archive)
 
     def list_archived_sessions(self) -> List[Session]:
         """List all archived sessions (skips corrupted entries)."""
@@ -769,20 +982,77 @@ class SessionManager:
             return session
         return None
 
+    def take_archived_sessions(
+        self,
+        ended_before: datetime,
+        sink: Callable[[List[dict]], None],
+    ) -> int:
+        """Remove archived sessions that ended before a cutoff.
+
+        The raw archive entries are passed to ``sink`` first (e.g. to write
+        them to a compressed segment); they are only removed from
+        archive.json if ``sink`` returns without raising. Entries without
+        a parseable end_time are kept.
+
+        Returns:
+            Number of sessions removed
+        """
+        # Locked through the sink so a session archived meanwhile isn't lost
+        # when the trimmed archive is saved
+        with self._archive_lock():
+            archive = self._load_archive()
+            aged = []
+            for session_id, data in archive.items():
+                try:
+                    end_time = datetime.fromisoformat(data.get('end_time') or '')
+                except (AttributeError, TypeError, ValueError):
+                    continue
+                if end_time < ended_before:
+                    aged.append(session_id)
+            if not aged:
+                return 0
+
+            sink([archive[session_id] for session_id in aged])
+            for session_id in aged:
+                del archive[session_id]
+            self._save_archive(archive)
+        return len(aged)
+
     def update_session(self, session_id: str, **kwargs):
         """Update session fields"""
-        with self._locked_state() as state:
+        if self._defer(session_id, kwargs):
+            return
+        with self._locked_sessions([session_id]) as state:
             if session_id in state:
                 state[session_id].update(kwargs)
 
     def update_stats(self, session_id: str, **stats_kwargs):
         """Update session statistics"""
-        with self._locked_state() as state:
+        if self._defer(session_id, {'stats': stats_kwargs}):
+            return
+        with self._locked_sessions([session_id]) as state:
             if session_id in state:
                 if 'stats' not in state[session_id]:
                     state[session_id]['stats'] = SessionStats().to_dict()
                 state[session_id]['stats'].update(stats_kwargs)
 
+    def update_many(self, updates: Dict[str, dict]) -> None:
+        """Apply field updates to several sessions in a single write.
+
+        Args:
+            updates: session_id -> fields, as for update_session. A "stats"
+                entry is merged into the session's stats like update_stats
+                rather than replacing them. Unknown session IDs are ignored.
+        """
+        if not updates:
+            return
+        if getattr(self._tx, 'pending', None) is not None:
+            for session_id, fields in updates.items():
+                self._defer(session_id, fields)
+            return
+        with self._locked_sessions(list(updates)) as state:
+            self._apply_updates(state, updates)
+
     def set_standing_instructions(
         self,
         session_id: str,
@@ -859,6 +1129,35 @@ class SessionManager:
                     state[session_id]['claude_session_ids'] = ids
         return True
 
+    def remove_claude_session_ids(self, removals: Dict[str, Iterable[str]]) -> int:
+        """Remove Claude sessionIds from sessions' owned lists in one write.
+
+        Filters each session's current list under the state lock, so IDs
+        added since the caller read the sessions are kept. The active
+        Claude sessionId is never removed.
+
+        Args:
+            removals: overcode session ID -> Claude sessionIds to remove
+
+        Returns:
+            Number of IDs removed
+        """
+        if not removals:
+            return 0
+        removed = 0
+        with self._locked_sessions(list(removals)) as state:
+            for session_id, drop in removals.items():
+                if session_id not in state:
+                    continue
+                data = state[session_id]
+                drop = set(drop) - {data.get('active_claude_session_id')}
+                ids = data.get('claude_session_ids') or []
+                kept = [sid for sid in ids if sid not in drop]
+                if len(kept) != len(ids):
+                    data['claude_session_ids'] = kept
+                    removed += len(ids) - len(kept)
+        return removed
+
     def set_active_claude_session_id(self, session_id: str, claude_session_id: str):
         """Set the active Claude session ID for context tracking (#116).
 
@@ -0,0 +1,228 @@
+"""
+SQLite-backed storage for session state.
+
+An alternative to the single sessions.json file used by SessionManager.
+Each session is one row (id -> JSON document), so updating one agent
+rewrites one row instead of serializing every session. The database runs
+in WAL mode: readers never block the writer, and a transaction costs a
+single WAL append + fsync regardless of how many rows it touches.
+
+Enable with ``state.backend: sqlite`` in ~/.overcode/config.yaml or
+``OVERCODE_STATE_BACKEND=sqlite``. On first open an existing sessions.json
+is imported; the JSON file itself is left untouched.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional
+
+from .exceptions import StateWriteError
+
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS sessions (id TEXT PRIMARY KEY, data TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)",
+)
+
+# Compact separators keep rows small; dumps() of an unmodified dict
+# reproduces the stored text exactly, which is how no-op writes are skipped.
+_SEPARATORS = (",", ":")
+
+
+def _dumps(data: dict) -> str:
+    return json.dumps(data, separators=_SEPARATORS)
+
+
+class SqliteSessionStore:
+    """Row-per-session store with WAL journaling.
+
+    Safe to share between threads (a lock serializes use of the single
+    connection) and between processes (SQLite's own locking, with
+    ``BEGIN IMMEDIATE`` for read-modify-write cycles).
+    """
+
+    def __init__(self, db_path: Path, json_path: Optional[Path] = None, busy_timeout: float = 5.0):
+        """Initialize the store.
+
+        Args:
+            db_path: Path of the SQLite database file (created if missing)
+            json_path: Legacy sessions.json to import on first open
+            busy_timeout: Seconds to wait for another process's write lock
+        """
+        self.db_path = Path(db_path)
+        self.json_path = Path(json_path) if json_path else None
+        self.busy_timeout = busy_timeout
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the open connection, opening (and migrating) on first use.
+
+        Connections are not carried across fork(); a child process opens
+        its own.
+        """
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=self.busy_timeout,
+            isolation_level=None,  # explicit BEGIN/COMMIT below
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        # FULL keeps the durability of the JSON backend's fsync-per-write;
+        # in WAL mode that is one fsync per committed transaction.
+        conn.execute("PRAGMA synchronous=FULL")
+        for statement in _SCHEMA:
+            conn.execute(statement)
+        self._conn = conn
+        self._pid = os.getpid()
+        self._migrate_from_json(conn)
+        return conn
+
+    def _migrate_from_json(self, conn: sqlite3.Connection) -> None:
+        """Import sessions.json into an empty database, once."""
+        if self.json_path is None:
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            done = conn.execute(
+                "SELECT value FROM meta WHERE key = 'migrated_from_json'"
+            ).fetchone()
+            has_rows = conn.execute("SELECT 1 FROM sessions LIMIT 1").fetchone()
+            if done is None and has_rows is None and self.json_path.exists():
+                try:
+                    with open(self.json_path) as f:
+                        legacy = json.load(f)
+                except (OSError, json.JSONDecodeError) as e:
+                    print(f"Warning: Could not import {self.json_path}: {e}")
+                    legacy = {}
+                if isinstance(legacy, dict):
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO sessions (id, data) VALUES (?, ?)",
+                        [(sid, _dumps(data)) for sid, data in legacy.items()
+                         if isinstance(data, dict)],
+                    )
+            if done is None:
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated_from_json', ?)",
+                    (str(self.json_path),),
+                )
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def _decode_rows(rows: Iterable[tuple]) -> Dict[str, tuple]:
+        """Map id -> (raw text, parsed dict), skipping corrupt rows."""
+        result = {}
+        for session_id, text in rows:
+            try:
+                data = json.loads(text)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(data, dict):
+                result[session_id] = (text, data)
+        return result
+
+    def _select(self, conn: sqlite3.Connection, session_ids: Optional[list]) -> Dict[str, tuple]:
+        if session_ids is None:
+            rows = conn.execute("SELECT id, data FROM sessions ORDER BY rowid").fetchall()
+        else:
+            placeholders = ",".join("?" * len(session_ids))
+            rows = conn.execute(
+                f"SELECT id, data FROM sessions WHERE id IN ({placeholders})",
+                list(session_ids),
+            ).fetchall()
+        return self._decode_rows(rows)
+
+    def load_all(self) -> Dict[str, dict]:
+        """Load every session. Returns {} if the database can't be read."""
+        with self._lock:
+            try:
+                rows = self._select(self._connect(), None)
+            except sqlite3.Error as e:
+                print(f"Warning: Could not load session database: {e}")
+                return {}
+        return {sid: data for sid, (_, data) in rows.items()}
+
+    def load_one(self, session_id: str) -> Optional[dict]:
+        """Load a single session by ID, or None if absent."""
+        with self._lock:
+            try:
+                rows = self._select(self._connect(), [session_id])
+            except sqlite3.Error as e:
+                print(f"Warning: Could not load session database: {e}")
+                return None
+        entry = rows.get(session_id)
+        return entry[1] if entry else None
+
+    @contextmanager
+    def transaction(self, session_ids: Optional[Iterable[str]] = None) -> Iterator[Dict[str, dict]]:
+        """Read-modify-write under the database write lock.
+
+        Yields a dict of id -> session data. With ``session_ids`` only those
+        rows are loaded (missing ids are simply absent); otherwise all rows.
+        On normal exit, rows whose content changed or that were added are
+        upserted and rows that were removed from the dict are deleted, all
+        in one commit. Unchanged rows are not written.
+
+        Raises:
+            StateWriteError: If the transaction can't be started or committed
+        """
+        ids = None if session_ids is None else list(dict.fromkeys(session_ids))
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute("BEGIN IMMEDIATE")
+            except sqlite3.Error as e:
+                raise StateWriteError(f"Failed to open session database: {e}")
+            try:
+                original = self._select(conn, ids) if ids != [] else {}
+                state = {sid: data for sid, (_, data) in original.items()}
+                yield state
+
+                upserts = []
+                for sid, data in state.items():
+                    text = _dumps(data)
+                    if sid not in original or original[sid][0] != text:
+                        upserts.append((sid, text))
+                deletes = [(sid,) for sid in original if sid not in state]
+                if upserts:
+                    conn.executemany(
+                        "INSERT INTO sessions (id, data) VALUES (?, ?) "
+                        "ON CONFLICT(id) DO UPDATE SET data = excluded.data",
+                        upserts,
+                    )
+                if deletes:
+                    conn.executemany("DELETE FROM sessions WHERE id = ?", deletes)
+                conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                self._rollback(conn)
+                raise StateWriteError(f"Failed to save session database: {e}")
+            except BaseException:
+                self._rollback(conn)
+                raise
+
+    @staticmethod
+    def _rollback(conn: sqlite3.Connection) -> None:
+        try:
+            conn.execute("ROLLBACK")
+        except sqlite3.Error:
+            pass
+
+    def close(self) -> None:
+        """Close the connection (reopened lazily on next use)."""
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+            self._pid = None
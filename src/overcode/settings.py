@@ -466,6 +466,47 @@ def get_status_changes_path(session: str) -> Path:
     return get_diagnostics_dir(session) / "status_changes.csv"
 
 
+def _private_dir(path: Path) -> bool:
+    """Create ``path`` as a 0700 directory if missing; True if it is safe to use.
+
+    Safe means a real directory (not a symlink) owned by the current user
+    that nobody else can write to. A predictable name in a shared
+    directory like /dev/shm could otherwise be pre-created by another
+    local user.
+    """
+    import stat
+
+    try:
+        path.mkdir(mode=0o700, exist_ok=True)
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(st.st_mode)
+        and st.st_uid == os.getuid()
+        and not st.st_mode & 0o022
+    )
+
+
+def get_pane_store_path(session: str) -> Path:
+    """Get the daemon's published pane captures path for a specific session.
+
+    Kept on tmpfs (/dev/shm) when available since it is rewritten every
+    daemon tick; the directory name includes a hash of the state dir so
+    separate overcode installs don't collide. Falls back to the session
+    directory, which is also used whenever OVERCODE_STATE_DIR is set or
+    the /dev/shm directory isn't a private one owned by this user.
+    """
+    shm = Path("/dev/shm")
+    if not os.environ.get("OVERCODE_STATE_DIR") and shm.is_dir() and os.access(shm, os.W_OK):
+        import hashlib
+        tag = hashlib.sha1(str(get_state_dir()).encode()).hexdigest()[:8]
+        private = shm / f"overcode-{os.getuid()}-{tag}"
+        if _private_dir(private):
+            return private / session / "panes.json"
+    return get_session_dir(session) / "panes.json"
+
+
 def ensure_session_dir(session: str) -> Path:
     """Ensure session directory exists and return it."""
     session_dir = get_session_dir(session)
@@ -4,18 +4,30 @@ Sister integration — polls remote overcode instances for agent status.
 Each sister is another machine running `overcode serve`. We poll their
 /api/status endpoint and convert the agent data into virtual Session
 objects that can be merged into the local TUI's session list.
+
+After the first poll each sister is asked only for what changed since
+the document we hold (If-None-Match / ?since=, see web_status_feed), so
+an idle sister answers with a 304 or a small delta.
+
+subscribe() instead follows each sister's /api/stream, applying pushed
+deltas as they arrive; while a sister's stream is up, polls read the
+streamed document without a request.
 """
 
+import gzip
 import json
 import socket
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-from urllib.error import URLError
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 
 from .config import get_hostname, get_sisters_config
 from .session_manager import Session, SessionStats
+from .web_status_feed import apply_status_delta, read_events
 
 
 @dataclass
@@ -36,6 +48,34 @@ class SisterState:
     green_agents: int = 0
     total_agents: int = 0
     total_cost: float = 0.0
+    # Last /api/status document, for conditional/delta polls
+    status_document: Optional[Dict[str, Any]] = None
+    streaming: bool = False  # /api/stream connected and delivering
+
+
+# Agent fields read by _agent_to_session and _apply_status_document; sisters
+# are asked for only these (keep in sync when mapping a new field)
+SISTER_AGENT_FIELDS = (
+    "name", "status", "activity", "cost_usd", "tokens_raw",
+    "green_time_raw", "non_green_time_raw", "sleep_time_raw",
+    "robot_steers", "human_interactions", "time_in_state_raw", "start_time",
+    "tmux_window", "repo", "branch", "permissiveness_mode",
+    "standing_orders", "standing_orders_complete", "cost_budget_usd",
+    "enhanced_context_enabled", "time_context_enabled", "human_annotation",
+    "heartbeat_enabled", "heartbeat_frequency_seconds", "heartbeat_paused",
+    "last_heartbeat_time", "model", "provider", "available_skills",
+    "loaded_skills", "tags", "focal_repo_subdir", "wrapper", "sandbox_enabled",
+    "cpu_percent", "rss_bytes", "pane_content", "git_diff_files",
+    "git_diff_insertions", "git_diff_deletions", "git_untracked",
+    "median_work_time_raw", "activity_summary", "activity_summary_context",
+    "daemon_state", "parent_name",
+)
+_FIELDS_QUERY = {"fields": ",".join(SISTER_AGENT_FIELDS)}
+
+# Seconds before reconnecting a dropped /api/stream
+STREAM_RETRY_SECONDS = 30.0
+# A stream silent this long (the server sends keepalives every 15s) is dead
+STREAM_READ_TIMEOUT = 40.0
 
 
 def _reset_sister_state(sister: SisterState, error: str) -> List[Session]:
@@ -50,6 +90,14 @@ def _reset_sister_state(sister: SisterState, error: str) -> List[Session]:
     return list(sister.sessions)
 
 
+def _read_json(resp) -> Any:
+    """Parse a JSON response body, gunzipping it if the server compressed it."""
+    body = resp.read()
+    if resp.headers.get("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+    return json.loads(body.decode("utf-8"))
+
+
 class SisterPoller:
     """Polls sister overcode instances and converts their agents to Sessions."""
 
@@ -66,11 +114,69 @@ class SisterPoller:
             for s in sisters_config
         ]
         self.local_hostname: str = get_hostname()
+        self._stop = threading.Event()
 
     @property
     def has_sisters(self) -> bool:
         return len(self._sisters) > 0
 
+    def subscribe(self, on_change: Callable[[], None]) -> None:
+        """Follow every sister's /api/stream on background threads.
+
+        ``on_change`` is called (from the stream thread) after each pushed
+        update; poll_all() then returns the streamed state. Sisters whose
+        server has no stream endpoint keep being polled.
+        """
+        for sister in self._sisters:
+            threading.Thread(
+                target=self._follow_stream, args=(sister, on_change),
+                name=f"sister-stream-{sister.name}", daemon=True,
+            ).start()
+
+    def close(self) -> None:
+        """Stop following streams (they end at their next event or timeout)."""
+        self._stop.set()
+
+    def is_streaming(self, source_url: str) -> bool:
+        """True if the sister at ``source_url`` is pushing updates."""
+        return any(s.streaming for s in self._sisters if s.url == source_url)
+
+    def _follow_stream(self, sister: SisterState, on_change: Callable[[], None]) -> None:
+        while not self._stop.is_set():
+            try:
+                self._read_stream(sister, on_change)
+            except HTTPError as e:
+                sister.streaming = False
+                if e.code == 404:
+                    return  # Older server without /api/stream: keep polling
+            except (URLError, socket.timeout, OSError, ValueError, KeyError):
+                pass
+            sister.streaming = False
+            self._stop.wait(STREAM_RETRY_SECONDS)
+
+    def _read_stream(self, sister: SisterState, on_change: Callable[[], None]) -> None:
+        """Apply a sister's stream events until it closes or goes silent."""
+        req = Request(f"{sister.url}/api/stream?{urlencode(_FIELDS_QUERY)}", method="GET")
+        if sister.api_key:
+            req.add_header("X-API-Key", sister.api_key)
+        generation = (sister.status_document or {}).get("generation")
+        if generation:
+            req.add_header("Last-Event-ID", generation)
+
+        with urlopen(req, timeout=STREAM_READ_TIMEOUT) as resp:
+            for event, _, data in read_events(resp):
+                if self._stop.is_set():
+                    return
+                if event == "snapshot":
+                    document = data
+                elif event == "delta" and sister.status_document is not None:
+                    document = apply_status_delta(sister.status_document, data)
+                else:
+                    continue
+                sister.status_document = document
+                sister.streaming = True
+                on_change()
+
     def poll_all(self) -> List[Session]:
         """Fetch all sisters sequentially, return combined virtual Sessions."""
         all_sessions: List[Session] = []
@@ -144,13 +250,13 @@ class SisterPoller:
         Returns {} on network failure or 404 (old server version).
         """
         url = f"{sister.url}/api/timeline/raw?hours={hours}"
-        req = Request(url, method="GET")
+        req = Request(url, method="GET", headers={"Accept-Encoding": "gzip"})
         if sister.api_key:
             req.add_header("X-API-Key", sister.api_key)
 
         try:
             with urlopen(req, timeout=5) as resp:
-                data = json.loads(resp.read().decode("utf-8"))
+                data = _read_json(resp)
         except (URLError, socket.timeout, json.JSONDecodeError, OSError):
             return {}
 
@@ -171,17 +277,47 @@ class SisterPoller:
 
     def _poll_sister(self, sister: SisterState) -> List[Session]:
         """Fetch /api/status from a single sister, update its state."""
-        url = f"{sister.url}/api/status"
-        req = Request(url, method="GET")
+        document = sister.status_document
+        if sister.streaming and document is not None:
+            return self._apply_status_document(sister, document)
+
+        query = dict(_FIELDS_QUERY)
+        generation = (document or {}).get("generation")
+        if generation:
+            query["since"] = generation
+        req = Request(
+            f"{sister.url}/api/status?{urlencode(query)}", method="GET",
+            headers={"Accept-Encoding": "gzip"},
+        )
         if sister.api_key:
             req.add_header("X-API-Key", sister.api_key)
+        if generation:
+            # The ETag is the generation
+            req.add_header("If-None-Match", f'"{generation}"')
 
         try:
             with urlopen(req, timeout=5) as resp:
-                data = json.loads(resp.read().decode("utf-8"))
+                data = _read_json(resp)
+        except HTTPError as e:
+            if e.code != 304:
+                return _reset_sister_state(sister, str(e))
+            # Unchanged since our last fetch
+            sister.reachable = True
+            sister.last_fetch = datetime.now().isoformat()
+            sister.last_error = ""
+            return list(sister.sessions)
         except (URLError, socket.timeout, json.JSONDecodeError, OSError) as e:
             return _reset_sister_state(sister, str(e))
 
+        if data.get("delta"):
+            if document is None:
+                return _reset_sister_state(sister, "delta without a base document")
+            data = apply_status_delta(document, data)
+        sister.status_document = data
+        return self._apply_status_document(sister, data)
+
+    def _apply_status_document(self, sister: SisterState, data: dict) -> List[Session]:
+        """Update a sister's state from a status document; its sessions."""
         sister.reachable = True
         sister.daemon_running = data.get("daemon", {}).get("running", False)
         sister.last_fetch = datetime.now().isoformat()
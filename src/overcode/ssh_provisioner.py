@@ -104,7 +104,8 @@ def _check_version_local(sister_url: str, api_key: str = "") -> str:
     from urllib.error import URLError
     import socket as _socket
 
-    url = f"{sister_url.rstrip('/')}/api/status"
+    # Only the version is needed: skip agents' pane content
+    url = f"{sister_url.rstrip('/')}/api/status?fields=name"
     try:
         req = Request(url, method="GET")
         if api_key:
@@ -0,0 +1,189 @@
+"""
+Change notification for a per-tmux-session state directory.
+
+The monitor daemon uses this to react to hook activity as it happens
+instead of discovering it on the next poll. ``hook_handler`` rewrites
+``hook_state_{name}.json`` and appends to ``hook_events_{name}.jsonl`` on
+every Claude Code hook; a watcher reports those file names so only the
+affected agents need re-detecting.
+
+Linux gets an inotify watcher (via ctypes — no extra dependency), which
+blocks in the kernel until something changes. Everywhere else, or if
+inotify can't be set up, a polling watcher compares file mtimes/sizes.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Set, Tuple
+
+
+# (prefix, suffix) of the per-agent files written by hook_handler
+_HOOK_FILE_PATTERNS = (
+    ("hook_state_", ".json"),
+    ("hook_events_", ".jsonl"),
+)
+
+# inotify(7) constants
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+def hook_agent_name(filename: str) -> Optional[str]:
+    """Return the agent name for a hook state/event file name, else None."""
+    for prefix, suffix in _HOOK_FILE_PATTERNS:
+        if filename.startswith(prefix) and filename.endswith(suffix):
+            name = filename[len(prefix):-len(suffix)]
+            return name or None
+    return None
+
+
+def is_hook_file(filename: str) -> bool:
+    """True for hook_state_*.json / hook_events_*.jsonl file names."""
+    return hook_agent_name(filename) is not None
+
+
+class PollingWatcher:
+    """Fallback watcher: rescans the directory every ``poll_interval`` seconds."""
+
+    def __init__(
+        self,
+        directory: Path,
+        name_filter: Callable[[str], bool] = is_hook_file,
+        poll_interval: float = 1.0,
+    ):
+        self.directory = Path(directory)
+        self.name_filter = name_filter
+        self.poll_interval = poll_interval
+        self._seen = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        result = {}
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if not self.name_filter(entry.name):
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    result[entry.name] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            pass
+        return result
+
+    def wait(self, timeout: float) -> Set[str]:
+        """Block up to ``timeout`` seconds; return names of changed files."""
+        deadline = time.monotonic() + max(timeout, 0)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return set()
+            time.sleep(min(self.poll_interval, remaining))
+            current = self._scan()
+            changed = {
+                name for name, sig in current.items() if self._seen.get(name) != sig
+            }
+            self._seen = current
+            if changed:
+                return changed
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Linux watcher: one inotify watch on the directory, filtered by name."""
+
+    def __init__(
+        self,
+        directory: Path,
+        name_filter: Callable[[str], bool] = is_hook_file,
+    ):
+        self.directory = Path(directory)
+        self.name_filter = name_filter
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        # IN_CLOSE_WRITE covers write_text() and O_APPEND writers; IN_MOVED_TO
+        # covers os.replace() (event-log rotation, atomic writers); IN_MODIFY
+        # catches writers that keep the file open.
+        mask = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_MODIFY
+        wd = libc.inotify_add_watch(fd, os.fsencode(str(self.directory)), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(err, f"inotify_add_watch failed for {self.directory}")
+        self._fd = fd
+
+    def _drain(self) -> Set[str]:
+        names: Set[str] = set()
+        while True:
+            try:
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not buf:
+                break
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(buf):
+                _wd, _mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+                offset += _EVENT_HEADER.size
+                raw = buf[offset:offset + length].rstrip(b"\0")
+                offset += length
+                if raw:
+                    name = os.fsdecode(raw)
+                    if self.name_filter(name):
+                        names.add(name)
+        return names
+
+    def wait(self, timeout: float) -> Set[str]:
+        """Block up to ``timeout`` seconds; return names of changed files."""
+        deadline = time.monotonic() + max(timeout, 0)
+        while self._fd is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return set()
+            try:
+                ready, _, _ = select.select([self._fd], [], [], remaining)
+            except InterruptedError:
+                continue
+            if not ready:
+                return set()
+            names = self._drain()
+            if names:
+                return names
+        return set()
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def create_state_watcher(
+    directory: Path,
+    name_filter: Callable[[str], bool] = is_hook_file,
+    poll_interval: float = 1.0,
+):
+    """Return an InotifyWatcher where supported, else a PollingWatcher."""
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(directory, name_filter=name_filter)
+        except (OSError, AttributeError):
+            # AttributeError: libc without inotify symbols
+            pass
+    return PollingWatcher(directory, name_filter=name_filter, poll_interval=poll_interval)
@@ -2,7 +2,8 @@
 Status detection for Claude sessions in tmux.
 """
 
-from typing import Optional, Tuple, TYPE_CHECKING
+import time
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from .status_constants import (
     DEFAULT_CAPTURE_LINES,
@@ -16,19 +17,20 @@ from .status_constants import (
 )
 from .status_patterns import (
     get_patterns,
-    matches_any,
     find_matching_line,
     line_starts_with_any,
     is_status_bar_line,
     count_command_menu_lines,
     clean_line,
-    strip_ansi,
     is_sleep_command,
     extract_sleep_duration,
     is_shell_prompt as _is_shell_prompt_line,
+    PaneSnapshot,
     StatusPatterns,
 )
 from .tui_helpers import format_duration
+from .capture_gate import PaneCaptureGate
+from .detection_memo import DetectionMemo, MemoStats
 
 if TYPE_CHECKING:
     from .interfaces import TmuxInterface
@@ -51,7 +53,7 @@ class PollingStatusDetector:
 
         Args:
             tmux_session: Name of the tmux session to monitor
-            tmux: TmuxInterface implementation (defaults to RealTmux for production)
+            tmux: TmuxInterface implementation (defaults to create_tmux() for production)
             patterns: StatusPatterns to use for detection (defaults to DEFAULT_PATTERNS)
         """
         self.tmux_session = tmux_session
@@ -59,8 +61,8 @@ class PollingStatusDetector:
 
         # Dependency injection for testability
         if tmux is None:
-            from .interfaces import RealTmux
-            tmux = RealTmux()
+            from .tmux_control import create_tmux
+            tmux = create_tmux()
         self.tmux = tmux
 
         # Use provided patterns or default
@@ -71,6 +73,13 @@ class PollingStatusDetector:
         self._content_changed: dict[int, bool] = {}  # window -> changed flag
         # Diagnostic: which phase produced the last status per session
         self._last_detect_phase: dict[str, str] = {}  # session_id -> phase name
+        # Results of the content phases, keyed by content and change flag
+        self._memo = DetectionMemo()
+
+        # Batch captures skip panes whose tmux fingerprint is unchanged
+        self._capture_gate = PaneCaptureGate(tmux_session)
+        # Last detect_statuses result per session: session_id -> (num_lines, result)
+        self._last_batch_result: dict[str, tuple] = {}
 
         # Pre-compile approval and error patterns (called in hot path)
         self._compiled_approval_patterns = [
@@ -80,6 +89,11 @@ class PollingStatusDetector:
             _re.compile(p, _re.IGNORECASE) for p in self.patterns.error_patterns
         ]
 
+    @property
+    def memo_stats(self) -> MemoStats:
+        """Hit/miss counts and timings of the detection memo."""
+        return self._memo.stats
+
     def get_pane_content(self, window: str, num_lines: int = 0) -> Optional[str]:
         """Get the last N meaningful lines from a tmux pane.
 
@@ -91,6 +105,27 @@ class PollingStatusDetector:
         """
         effective_lines = num_lines or self.capture_lines
         content = self.tmux.capture_pane(self.tmux_session, window, lines=effective_lines + 50)
+        return self._trim_content(content, effective_lines)
+
+    def get_pane_contents(self, windows: list, num_lines: int = 0) -> Dict[str, Optional[str]]:
+        """get_pane_content for several windows with one capture_panes call.
+
+        Panes whose tmux fingerprint hasn't changed since the last call are
+        not captured again (see capture_gate).
+        """
+        return self._get_pane_contents_gated(windows, num_lines)[0]
+
+    def _get_pane_contents_gated(self, windows: list, num_lines: int) -> Tuple[Dict[str, Optional[str]], set]:
+        effective_lines = num_lines or self.capture_lines
+        captured, unchanged = self._capture_gate.capture(self.tmux, windows, effective_lines + 50)
+        contents = {
+            window: self._trim_content(captured.get(window), effective_lines)
+            for window in windows
+        }
+        return contents, unchanged
+
+    @staticmethod
+    def _trim_content(content: Optional[str], effective_lines: int) -> Optional[str]:
         if content is None:
             return None
 
@@ -99,7 +134,38 @@ class PollingStatusDetector:
         meaningful_lines = lines[-effective_lines:] if len(lines) > effective_lines else lines
         return '\n'.join(meaningful_lines)
 
-    def detect_status(self, session, num_lines: int = 0) -> Tuple[str, str, str]:
+    def detect_statuses(self, sessions: list, num_lines: int = 0) -> List[Tuple[str, str, str]]:
+        """detect_status for several sessions, capturing all panes in one call.
+
+        Returns:
+            One (status, current_activity, pane_content) tuple per session,
+            in the order given
+        """
+        prefetched, unchanged = self._get_pane_contents_gated(
+            [s.tmux_window for s in sessions], num_lines
+        )
+        results = []
+        last_results = {}
+        for s in sessions:
+            # Detection is a function of the content and whether it changed,
+            # so a settled, unchanged pane gets the same answer as last time
+            previous = self._last_batch_result.get(s.id)
+            if (
+                s.tmux_window in unchanged
+                and previous is not None
+                and previous[0] == num_lines
+                and self._content_changed.get(s.id) is False
+            ):
+                result = previous[1]
+            else:
+                result = self.detect_status(s, num_lines, prefetched=prefetched)
+            last_results[s.id] = (num_lines, result)
+            results.append(result)
+        self._last_batch_result = last_results
+        return results
+
+    def detect_status(self, session, num_lines: int = 0,
+                      prefetched: Optional[Dict[str, Optional[str]]] = None) -> Tuple[str, str, str]:
         """
         Detect session status and current activity.
 
@@ -124,6 +190,8 @@ class PollingStatusDetector:
             num_lines: Lines to capture. 0 (default) uses self.capture_lines.
                 Use STATUS_CAPTURE_LINES for non-focused agents to reduce
                 tmux subprocess overhead.
+            prefetched: Pane contents by window from get_pane_contents();
+                the pane is only captured if its window is missing here.
 
         Returns:
             Tuple of (status, current_activity, pane_content)
@@ -132,29 +200,55 @@ class PollingStatusDetector:
             - pane_content: the raw pane content (to avoid duplicate tmux calls)
         """
         # Phase 1: Check if window exists
-        terminated, content = self._detect_terminated(session, num_lines)
+        terminated, content = self._detect_terminated(session, num_lines, prefetched)
         if terminated is not None:
             return terminated
 
-        # Strip ANSI escape sequences for pattern matching
-        clean_content = strip_ansi(content)
+        # One snapshot per capture: ANSI stripping and line splitting are
+        # shared with every later consumer of the returned content
+        content = PaneSnapshot.of(content)
+        clean_content = content.clean
 
         # Content change detection
         content_changed = self._update_content_hash(session.id, clean_content)
 
-        lines = clean_content.strip().split('\n')
-        last_lines = [l.strip() for l in lines[-10:] if l.strip()]
+        # The remaining phases depend only on the content and whether it
+        # changed, so a pane seen before gets its memoized answer
+        key = (hash(clean_content), content_changed, id(self.patterns))
+        cached = self._memo.get(session.id, key)
+        if cached is not None:
+            status, activity, phase = cached
+            if phase is not None:
+                self._last_detect_phase[session.id] = phase
+            return status, activity, content
+
+        previous_phase = self._last_detect_phase.pop(session.id, None)
+        started = time.perf_counter()
+        status, activity, _ = self._detect_from_content(session, content, content_changed)
+        phase = self._last_detect_phase.get(session.id)
+        if phase is None and previous_phase is not None:
+            self._last_detect_phase[session.id] = previous_phase
+        self._memo.put(session.id, key, (status, activity, phase), time.perf_counter() - started)
+        return status, activity, content
+
+    def _detect_from_content(self, session, content: PaneSnapshot,
+                             content_changed: bool) -> Tuple[str, str, str]:
+        """Phases 2-14 of detect_status, on a pane known to have content."""
+        lines = content.lines
+        last_lines = content.tail_lines
 
         if not last_lines:
             return STATUS_WAITING_USER, "No output", content
 
-        # Phase 2: Spawn failure (before shell prompt — error appears first)
-        spawn_error = self._detect_spawn_failure(lines)
+        # Phase 2: Spawn failure (before shell prompt — error appears first).
+        # Phases 2 and 3 depend only on the content and are memoized on it.
+        spawn_error = content.memo(
+            ("spawn_failure", id(self.patterns)), lambda: self._detect_spawn_failure(lines))
         if spawn_error:
             return STATUS_WAITING_USER, spawn_error, content
 
         # Phase 3: Shell prompt (Claude exited)
-        if self._is_shell_prompt(last_lines):
+        if content.memo(("shell_prompt", id(self.patterns)), lambda: self._is_shell_prompt(last_lines)):
             return STATUS_TERMINATED, "Claude exited - shell prompt", content
 
         # Prepare filtered lines for remaining phases
@@ -234,7 +328,7 @@ class PollingStatusDetector:
             return result
 
         # Phase 13: Waiting patterns
-        if matches_any(last_few, self.patterns.waiting_patterns):
+        if self.patterns.matcher("waiting_patterns").search(last_few):
             self._last_detect_phase[session.id] = "P13:waiting"
             return STATUS_WAITING_USER, self._extract_question(last_lines), content
 
@@ -242,14 +336,17 @@ class PollingStatusDetector:
         self._last_detect_phase[session.id] = "P14:default"
         return self._detect_default(session, last_lines, content)
 
-    def _detect_terminated(self, session, num_lines: int):
+    def _detect_terminated(self, session, num_lines: int, prefetched: Optional[dict] = None):
         """Check if tmux window is gone or empty.
 
         Returns:
             (status_tuple, None) on terminal condition, or
             (None, content) when the window has content for further analysis.
         """
-        content = self.get_pane_content(session.tmux_window, num_lines=num_lines)
+        if prefetched is not None and session.tmux_window in prefetched:
+            content = prefetched[session.tmux_window]
+        else:
+            content = self.get_pane_content(session.tmux_window, num_lines=num_lines)
 
         if content is None:
             return (STATUS_TERMINATED, "Window no longer exists", ""), None
@@ -284,7 +381,7 @@ class PollingStatusDetector:
         Must come before active indicator checks because permission dialogs
         can contain tool names that would falsely match active indicators.
         """
-        if matches_any(last_few, self.patterns.permission_patterns):
+        if self.patterns.matcher("permission_patterns").search(last_few):
             request_text = self._extract_permission_request(last_lines)
             return STATUS_WAITING_USER, f"Permission: {request_text}", content
         return None
@@ -324,9 +421,9 @@ class PollingStatusDetector:
 
     def _detect_active_work(self, last_lines: list, last_few: str, content: str) -> Optional[Tuple[str, str, str]]:
         """Check for active work indicators (busy even if prompt is visible)."""
-        if matches_any(last_few, self.patterns.active_indicators):
+        if self.patterns.matcher("active_indicators").search(last_few):
             matching_line = find_matching_line(
-                last_lines, self.patterns.active_indicators, reverse=True
+                last_lines, self.patterns.matcher("active_indicators"), reverse=True
             )
             if matching_line:
                 return STATUS_RUNNING, clean_line(matching_line, self.patterns), content
@@ -340,7 +437,7 @@ class PollingStatusDetector:
         occurrences like 'Running the tests revealed...' (#359).
         """
         matching_line = line_starts_with_any(
-            last_lines, self.patterns.execution_indicators, case_sensitive=True, reverse=True
+            last_lines, self.patterns.matcher("execution_indicators", case_sensitive=True), reverse=True
         )
         if matching_line:
             # Check if the executing tool is a sleep command (#289)
@@ -377,7 +474,7 @@ class PollingStatusDetector:
             stripped = line.strip()
             if stripped in self.patterns.prompt_chars:
                 return STATUS_WAITING_USER, "Waiting for user input", content
-            if any(stripped.startswith(c) for c in self.patterns.prompt_chars):
+            if stripped.startswith(tuple(self.patterns.prompt_chars)):
                 if '↵' in stripped and 'send' in stripped.lower():
                     return STATUS_WAITING_USER, "Waiting for user input", content
 
@@ -529,11 +626,10 @@ class PollingStatusDetector:
         recent_lines = lines[-20:] if len(lines) > 20 else lines
         recent_text = ' '.join(recent_lines).lower()
 
-        if matches_any(recent_text, self.patterns.spawn_failure_patterns):
+        if self.patterns.matcher("spawn_failure_patterns").search(recent_text):
             # Find the specific error line for a better message
             for line in reversed(recent_lines):
-                line_lower = line.lower()
-                if any(p.lower() in line_lower for p in self.patterns.spawn_failure_patterns):
+                if self.patterns.matcher("spawn_failure_patterns").search(line):
                     # Extract just the error part, clean it up
                     error_msg = line.strip()
                     if len(error_msg) > 80:
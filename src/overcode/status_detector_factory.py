@@ -6,7 +6,7 @@ types and switches globally between hooks and polling mode. The mode is
 set once at startup and toggled via the K hotkey — no per-agent dispatch.
 """
 
-from typing import Optional, Tuple, TYPE_CHECKING
+from typing import List, Optional, Tuple, TYPE_CHECKING
 
 from .protocols import StatusDetectorProtocol
 
@@ -90,6 +90,11 @@ class StatusDetectorDispatcher:
         detector = self.hooks if self._mode == "hooks" else self.polling
         return detector.detect_status(session, num_lines=num_lines)
 
+    def detect_statuses(self, sessions: list, num_lines: int = 0) -> List[Tuple[str, str, str]]:
+        """Detect status for several sessions, capturing their panes in one call."""
+        detector = self.hooks if self._mode == "hooks" else self.polling
+        return detector.detect_statuses(sessions, num_lines=num_lines)
+
     def get_pane_content(self, window: str, num_lines: int = 0) -> Optional[str]:
         """Get pane content (delegates to active detector)."""
         if self._mode == "hooks":
@@ -2,17 +2,54 @@
 Agent status history tracking.
 
 Provides functions to log and read agent status history for timeline visualization.
+
+File format
+-----------
+agent_status_history.csv is run-length encoded: a row marks the *start* of
+an interval during which the agent held that status, and the interval runs
+until the agent's next row. Rows carry a ``kind`` column:
+
+- ``t`` (transition): the status changed
+- ``k`` (keyframe): the status is unchanged; re-stated every
+  KEYFRAME_INTERVAL_SECONDS so a reader starting mid-file can recover each
+  agent's state, and so a silent agent (daemon stopped) can be told apart
+  from a steady one
+
+Older files have no ``kind`` column and one row per daemon tick. Every
+reader here accepts both; ``convert_history_file`` rewrites an old file
+into the new format.
 """
 
 import csv
+import os
+import tempfile
 import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
+from .compaction import append_lock
 from .settings import PATHS
 
 
+HISTORY_HEADER = ['timestamp', 'agent', 'status', 'activity', 'session_id', 'hostname', 'kind']
+
+KIND_TRANSITION = "t"
+KIND_KEYFRAME = "k"
+
+# How often an unchanged status is re-stated
+KEYFRAME_INTERVAL_SECONDS = 300
+
+# An interval with no following row for this long is treated as ended
+# (daemon stopped, agent removed) rather than extended indefinitely.
+MAX_INTERVAL_GAP_SECONDS = 2 * KEYFRAME_INTERVAL_SECONDS
+
+# Rows this far before a read window are kept so the interval in progress
+# at the window start can be recovered (each live agent has a keyframe
+# at least this often).
+_LOOKBACK = timedelta(seconds=KEYFRAME_INTERVAL_SECONDS)
+
+
 def log_agent_status(
     agent_name: str,
     status: str,
@@ -20,11 +57,13 @@ def log_agent_status(
     history_file: Optional[Path] = None,
     session_id: str = "",
     hostname: str = "",
+    kind: str = KIND_TRANSITION,
+    timestamp: Optional[datetime] = None,
 ) -> None:
-    """Log agent status to history CSV file.
+    """Append one row to the history CSV file.
 
-    Called by daemon each loop to track agent status over time.
-    Used by TUI for timeline visualization.
+    Appends unconditionally; the daemon goes through StatusHistoryRecorder,
+    which only calls this on transitions and keyframes.
 
     Args:
         agent_name: Name of the agent
@@ -33,30 +72,96 @@ def log_agent_status(
         history_file: Optional path override (for testing)
         session_id: Unique session ID (UUID) for disambiguation
         hostname: Machine hostname for multi-host disambiguation
+        kind: KIND_TRANSITION or KIND_KEYFRAME
+        timestamp: Row timestamp (defaults to now)
     """
     path = history_file or PATHS.agent_history
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Check if file exists (to write header)
-    write_header = not path.exists()
-
-    with open(path, 'a', newline='') as f:
+    # Held off while compaction replaces the file (see compaction.append_lock)
+    with append_lock(path), open(path, 'a', newline='') as f:
         writer = csv.writer(f)
-        if write_header:
-            writer.writerow(['timestamp', 'agent', 'status', 'activity', 'session_id', 'hostname'])
+        if f.tell() == 0:
+            writer.writerow(HISTORY_HEADER)
         writer.writerow([
-            datetime.now().isoformat(),
+            (timestamp or datetime.now()).isoformat(),
             agent_name,
             status,
             activity[:100] if activity else "",
             session_id,
             hostname,
+            kind,
         ])
 
 
+class StatusHistoryRecorder:
+    """Writes change-only status history for the monitor daemon.
+
+    ``record()`` is called for every agent on every tick but only appends
+    a row when the agent's status changes, or as a keyframe once
+    ``keyframe_interval`` seconds have passed since its last row. Activity
+    text alone does not start a new interval; the latest activity is
+    written with the next transition or keyframe.
+    """
+
+    def __init__(
+        self,
+        history_file: Optional[Path] = None,
+        keyframe_interval: float = KEYFRAME_INTERVAL_SECONDS,
+    ):
+        self.history_file = history_file
+        self.keyframe_interval = keyframe_interval
+        # (agent_name, session_id) -> (status, time of last row)
+        self._last: Dict[Tuple[str, str], Tuple[str, datetime]] = {}
+
+    def record(
+        self,
+        agent_name: str,
+        status: str,
+        activity: str = "",
+        session_id: str = "",
+        hostname: str = "",
+        now: Optional[datetime] = None,
+    ) -> Optional[str]:
+        """Record the agent's current status.
+
+        Returns:
+            The kind of row written, or None if nothing was written
+        """
+        now = now or datetime.now()
+        key = (agent_name, session_id)
+        last = self._last.get(key)
+        if last is None or last[0] != status:
+            kind = KIND_TRANSITION
+        elif (now - last[1]).total_seconds() >= self.keyframe_interval:
+            kind = KIND_KEYFRAME
+        else:
+            return None
+        log_agent_status(
+            agent_name, status, activity,
+            history_file=self.history_file,
+            session_id=session_id,
+            hostname=hostname,
+            kind=kind,
+            timestamp=now,
+        )
+        self._last[key] = (status, now)
+        return kind
+
+    def forget(self, agent_name: str, session_id: str = "") -> None:
+        """Drop tracking for an agent, so its next record() is a transition."""
+        self._last.pop((agent_name, session_id), None)
+
+
 class StatusHistoryFile:
     """Cached incremental reader for agent_status_history.csv.
 
+    Reads both the run-length encoded format and legacy per-tick rows.
+    For run-length encoded agents, the interval in progress at the start
+    of the window is reported as a row at the window start, so callers
+    that forward-fill (build_timeline_slots) see the state the agent was
+    already in rather than a gap until its next row.
+
     Optimizations over naive full-file parsing:
     - Binary seek for initial read (skip old rows by byte offset)
     - Incremental tail reads (only parse newly appended bytes)
@@ -69,7 +174,10 @@ class StatusHistoryFile:
         self._lock = threading.Lock()
         self._cached_mtime: float = 0.0
         self._cached_size: int = 0
-        self._cached_entries: List[Tuple[datetime, str, str, str, str, str]] = []
+        self._cached_ino: int = 0
+        # (timestamp, agent, status, activity, session_id, hostname, kind),
+        # kind '' for legacy rows; includes a lookback margin before the window
+        self._cached_entries: List[Tuple[datetime, str, str, str, str, str, str]] = []
         self._cached_hours: float = 0.0
         self._read_offset: int = 0
 
@@ -88,6 +196,7 @@ class StatusHistoryFile:
             file_changed = (
                 stat.st_mtime != self._cached_mtime
                 or stat.st_size != self._cached_size
+                or stat.st_ino != self._cached_ino
             )
             hours_expanded = hours > self._cached_hours and self._cached_hours > 0
 
@@ -95,10 +204,12 @@ class StatusHistoryFile:
             if not file_changed and not hours_expanded:
                 return self._filter(self._cached_entries, hours, agent_name)
 
-            # Incremental: file grew, hours didn't expand, have previous offset
+            # Incremental: file grew in place (not replaced by compaction),
+            # hours didn't expand, have previous offset
             if (
                 file_changed
                 and not hours_expanded
+                and stat.st_ino == self._cached_ino
                 and stat.st_size > self._cached_size
                 and self._read_offset > 0
             ):
@@ -108,7 +219,7 @@ class StatusHistoryFile:
             return self._full_read(stat, hours, agent_name)
 
     def _full_read(self, stat, hours, agent_name):
-        cutoff = datetime.now() - timedelta(hours=hours)
+        cutoff = datetime.now() - timedelta(hours=hours) - _LOOKBACK
         try:
             with open(self._path, 'rb') as f:
                 start = self._seek_to_cutoff(f, cutoff, stat.st_size)
@@ -119,6 +230,7 @@ class StatusHistoryFile:
         self._cached_entries = entries
         self._cached_mtime = stat.st_mtime
         self._cached_size = stat.st_size
+        self._cached_ino = stat.st_ino
         self._cached_hours = hours
         self._read_offset = stat.st_size
         return self._filter(entries, hours, agent_name)
@@ -131,7 +243,7 @@ class StatusHistoryFile:
             new_entries = []
 
         # Trim entries that have aged out of the cached window
-        cutoff = datetime.now() - timedelta(hours=self._cached_hours)
+        cutoff = datetime.now() - timedelta(hours=self._cached_hours) - _LOOKBACK
         self._cached_entries = [e for e in self._cached_entries if e[0] >= cutoff]
         self._cached_entries.extend(new_entries)
         self._cached_mtime = stat.st_mtime
@@ -183,36 +295,54 @@ class StatusHistoryFile:
         return lo
 
     @staticmethod
-    def _parse_rows(f, start_offset: int) -> List[Tuple[datetime, str, str, str, str, str]]:
+    def _parse_rows(f, start_offset: int) -> List[Tuple[datetime, str, str, str, str, str, str]]:
         """Parse CSV rows from start_offset to end of file."""
         f.seek(start_offset)
         data = f.read().decode('utf-8', errors='replace')
-        entries: List[Tuple[datetime, str, str, str, str, str]] = []
-        for row in csv.reader(data.splitlines()):
-            if len(row) < 3:
-                continue
-            if row[0] == 'timestamp':
-                continue
-            try:
-                ts = datetime.fromisoformat(row[0])
-                entries.append((
-                    ts,
-                    row[1],                             # agent
-                    row[2],                             # status
-                    row[3] if len(row) > 3 else '',     # activity
-                    row[4] if len(row) > 4 else '',     # session_id
-                    row[5] if len(row) > 5 else '',     # hostname
-                ))
-            except (ValueError, IndexError):
-                continue
-        return entries
+        return list(_parse_history_rows(csv.reader(data.splitlines())))
 
     @staticmethod
     def _filter(entries, hours, agent_name):
         cutoff = datetime.now() - timedelta(hours=hours)
-        if agent_name is None:
-            return [e for e in entries if e[0] >= cutoff]
-        return [e for e in entries if e[0] >= cutoff and e[1] == agent_name]
+        carried: Dict[str, tuple] = {}
+        result = []
+        for e in entries:
+            if agent_name is not None and e[1] != agent_name:
+                continue
+            if e[0] < cutoff:
+                # Only run-length encoded rows describe an ongoing interval
+                if e[6]:
+                    carried[e[1]] = e
+                else:
+                    carried.pop(e[1], None)
+                continue
+            result.append(e[:6])
+        if carried:
+            result[:0] = [(cutoff,) + e[1:6] for e in carried.values()]
+        return result
+
+
+
+def _parse_history_rows(rows) -> Iterator[Tuple[datetime, str, str, str, str, str, str]]:
+    """Parse CSV rows into 7-tuples, skipping the header and malformed rows."""
+    for row in rows:
+        if len(row) < 3:
+            continue
+        if row[0] == 'timestamp':
+            continue
+        try:
+            ts = datetime.fromisoformat(row[0])
+        except ValueError:
+            continue
+        yield (
+            ts,
+            row[1],                             # agent
+            row[2],                             # status
+            row[3] if len(row) > 3 else '',     # activity
+            row[4] if len(row) > 4 else '',     # session_id
+            row[5] if len(row) > 5 else '',     # hostname
+            row[6] if len(row) > 6 else '',     # kind ('' = legacy sample)
+        )
 
 
 # ── Module-level reader cache ────────────────────────────────────────
@@ -271,53 +401,183 @@ def get_agent_timeline(
     return [(ts, status) for ts, _, status, _, _, _ in history]
 
 
+def history_intervals(
+    history: list,
+    now: Optional[datetime] = None,
+    max_gap_seconds: float = MAX_INTERVAL_GAP_SECONDS,
+) -> List[Tuple[datetime, datetime, str, str, str]]:
+    """Turn history rows into per-agent status intervals.
+
+    Each row starts an interval that ends at the agent's next row, or at
+    ``now`` for its last row. No interval runs longer than
+    ``max_gap_seconds``: a longer silence means nothing was being recorded.
+    Works the same for run-length encoded and legacy per-tick rows.
+
+    Args:
+        history: (timestamp, agent, status, activity, ...) tuples, oldest first
+        now: End of the last interval (defaults to datetime.now())
+        max_gap_seconds: Longest an interval may extend without a new row
+
+    Returns:
+        List of (start, end, agent, status, activity) tuples, ordered by start
+    """
+    if now is None:
+        now = datetime.now()
+    max_gap = timedelta(seconds=max_gap_seconds)
+    open_rows: Dict[str, tuple] = {}
+    intervals = []
+
+    def close(row, end):
+        start = row[0]
+        end = min(end, start + max_gap)
+        if end > start:
+            intervals.append((start, end, row[1], row[2], row[3]))
+
+    for row in history:
+        previous = open_rows.get(row[1])
+        if previous is not None:
+            close(previous, row[0])
+        open_rows[row[1]] = row
+    for row in open_rows.values():
+        close(row, now)
+
+    intervals.sort(key=lambda i: i[0])
+    return intervals
+
+
+def expand_status_history(
+    history: list,
+    step_seconds: float = 10.0,
+    now: Optional[datetime] = None,
+    max_gap_seconds: float = MAX_INTERVAL_GAP_SECONDS,
+) -> List[Tuple[datetime, str, str, str]]:
+    """Resample history into evenly spaced (timestamp, agent, status, activity) samples.
+
+    For callers that weigh time by counting samples, e.g.
+    calculate_mean_spin_from_history(). Every interval contributes one
+    sample per ``step_seconds`` of its duration (at least one), so legacy
+    per-tick files come out close to their original rows and run-length
+    encoded files are weighted by time rather than by row count.
+    """
+    step = timedelta(seconds=step_seconds)
+    samples = []
+    for start, end, agent, status, activity in history_intervals(history, now, max_gap_seconds):
+        ts = start
+        while True:
+            samples.append((ts, agent, status, activity))
+            ts += step
+            if ts >= end:
+                break
+    samples.sort(key=lambda s: s[0])
+    return samples
+
+
+def is_legacy_history_file(history_file: Optional[Path] = None) -> bool:
+    """True if the file exists and was written in the per-tick format."""
+    path = history_file or PATHS.agent_history
+    try:
+        with open(path, 'r', newline='') as f:
+            header = next(csv.reader(f), None)
+    except (OSError, IOError):
+        return False
+    return bool(header) and header[0] == 'timestamp' and 'kind' not in header
+
+
+def convert_history_file(
+    history_file: Optional[Path] = None,
+    keyframe_interval: float = KEYFRAME_INTERVAL_SECONDS,
+    max_gap_seconds: float = MAX_INTERVAL_GAP_SECONDS,
+) -> Tuple[int, int]:
+    """Rewrite a per-tick history file in the run-length encoded format.
+
+    Streams the file row by row into a temporary file in the same
+    directory, then renames it over the original, so a crash part-way
+    leaves the old file intact. Rows already in the new format are copied
+    as-is, so converting twice is harmless.
+
+    A legacy sample is kept when the agent's status changed, when
+    ``keyframe_interval`` has passed since the agent's last kept row, or
+    after a silence longer than ``max_gap_seconds`` (so the gap survives
+    conversion instead of being bridged by one long interval).
+
+    Args:
+        history_file: Optional path override (for testing)
+        keyframe_interval: Seconds between keyframes for unchanged status
+        max_gap_seconds: Silence after which a sample starts a new interval
+
+    Returns:
+        (rows_read, rows_written)
+    """
+    path = history_file or PATHS.agent_history
+    if not path.exists():
+        return (0, 0)
+
+    # (agent, session_id) -> (status, last kept row time, last seen row time)
+    last: Dict[Tuple[str, str], Tuple[str, datetime, datetime]] = {}
+    rows_read = rows_written = 0
+    fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=path.name, suffix='.tmp')
+    try:
+        with open(path, 'r', newline='') as src, os.fdopen(fd, 'w', newline='') as dst:
+            writer = csv.writer(dst)
+            writer.writerow(HISTORY_HEADER)
+            for ts, agent, status, activity, session_id, hostname, kind in \
+                    _parse_history_rows(csv.reader(src)):
+                rows_read += 1
+                key = (agent, session_id)
+                previous = last.get(key)
+                if not kind:
+                    if previous is None or previous[0] != status:
+                        kind = KIND_TRANSITION
+                    elif (ts - previous[2]).total_seconds() > max_gap_seconds:
+                        kind = KIND_TRANSITION
+                    elif (ts - previous[1]).total_seconds() >= keyframe_interval:
+                        kind = KIND_KEYFRAME
+                    else:
+                        last[key] = (previous[0], previous[1], ts)
+                        continue
+                last[key] = (status, ts, ts)
+                writer.writerow([
+                    ts.isoformat(), agent, status, activity, session_id, hostname, kind,
+                ])
+                rows_written += 1
+            dst.flush()
+            os.fsync(dst.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+    return (rows_read, rows_written)
+
+
 def clear_old_history(
     max_age_hours: float = 24.0,
-    history_file: Optional[Path] = None
+    history_file: Optional[Path] = None,
+    segment_dir: Optional[Path] = None,
 ) -> int:
     """Remove old entries from history file.
 
+    Streams the file through a temporary copy (see
+    compaction.compact_csv_file); rows are time-ordered, so only the aged
+    prefix is parsed.
+
     Args:
         max_age_hours: Remove entries older than this (default 24 hours)
         history_file: Optional path override (for testing)
+        segment_dir: If given, removed rows are appended to compressed
+            daily segments there instead of being discarded
 
     Returns:
         Number of entries removed
     """
-    path = history_file or PATHS.agent_history
-
-    if not path.exists():
-        return 0
+    from .compaction import compact_csv_file
 
+    path = history_file or PATHS.agent_history
     cutoff = datetime.now() - timedelta(hours=max_age_hours)
-    kept_entries: List[List[str]] = []
-    removed_count = 0
-
     try:
-        with open(path, 'r', newline='') as f:
-            reader = csv.reader(f)
-            header = next(reader, None)
-            if header:
-                kept_entries.append(header)
-
-            for row in reader:
-                try:
-                    ts = datetime.fromisoformat(row[0])
-                    if ts >= cutoff:
-                        kept_entries.append(row)
-                    else:
-                        removed_count += 1
-                except (ValueError, IndexError):
-                    # Keep malformed entries
-                    kept_entries.append(row)
-
-        # Only rewrite if we removed entries
-        if removed_count > 0:
-            with open(path, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerows(kept_entries)
-
+        return compact_csv_file(path, cutoff, segment_dir)
     except (OSError, IOError):
-        pass
-
-    return removed_count
+        return 0
@@ -12,7 +12,8 @@ Each pattern set includes documentation about when it's used and what it matches
 
 import re
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from functools import cached_property
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 # Regex to match ANSI escape sequences (colors, cursor movement, etc.)
 ANSI_ESCAPE_PATTERN = re.compile(r'\x1b\[[0-9;]*[a-zA-Z]')
@@ -54,6 +55,8 @@ def strip_ansi(text: str) -> str:
     Returns:
         Text with all ANSI escape sequences removed
     """
+    if type(text) is PaneSnapshot:
+        return text.clean
     return ANSI_ESCAPE_PATTERN.sub('', text)
 
 
@@ -233,6 +236,30 @@ class StatusPatterns:
         r"Retrying in.*seconds.*attempt",  # Retry indicator (any format)
     ])
 
+    # (list name, case_sensitive) -> (list, its length, PatternMatcher)
+    _matchers: Dict[Tuple[str, bool], Tuple[List[str], int, "PatternMatcher"]] = field(
+        default_factory=dict, init=False, repr=False, compare=False,
+    )
+
+    def matcher(self, name: str, case_sensitive: bool = False) -> "PatternMatcher":
+        """The compiled matcher for one of the pattern lists, e.g. "waiting_patterns".
+
+        Built once per instance, and rebuilt when the list is replaced or
+        entries are added or removed. After changing an entry in place,
+        call invalidate_matchers().
+        """
+        patterns = getattr(self, name)
+        key = (name, case_sensitive)
+        cached = self._matchers.get(key)
+        if cached is None or cached[0] is not patterns or cached[1] != len(patterns):
+            cached = (patterns, len(patterns), compile_patterns(patterns, case_sensitive))
+            self._matchers[key] = cached
+        return cached[2]
+
+    def invalidate_matchers(self) -> None:
+        """Drop compiled matchers so they are rebuilt from the current lists."""
+        self._matchers.clear()
+
 
 # Default patterns instance
 DEFAULT_PATTERNS = StatusPatterns()
@@ -250,26 +277,78 @@ def get_patterns() -> StatusPatterns:
     return DEFAULT_PATTERNS
 
 
-def matches_any(text: str, patterns: List[str], case_sensitive: bool = False) -> bool:
+class PatternMatcher:
+    """A pattern list compiled for repeated matching.
+
+    Patterns are lowered once up front instead of on every call, and prefix
+    checks go through a single str.startswith(tuple) call. A regex
+    alternation was measured and is slower than per-pattern substring
+    search for lists of this size, since ``in`` is a C-level fast search.
+
+    Detection code gets these from StatusPatterns.matcher(), which builds
+    each one once; compile_patterns() builds one for an arbitrary list.
+    """
+
+    __slots__ = ("patterns", "case_sensitive")
+
+    def __init__(self, patterns: Tuple[str, ...], case_sensitive: bool = False):
+        self.case_sensitive = case_sensitive
+        self.patterns = patterns if case_sensitive else tuple(p.lower() for p in patterns)
+
+    def search(self, text: str) -> bool:
+        """True if any pattern occurs in text."""
+        if not self.case_sensitive:
+            text = text.lower()
+        for p in self.patterns:
+            if p in text:
+                return True
+        return False
+
+    def startswith(self, text: str) -> bool:
+        """True if text starts with any pattern."""
+        if not self.case_sensitive:
+            text = text.lower()
+        return text.startswith(self.patterns)
+
+
+def compile_patterns(patterns: List[str], case_sensitive: bool = False) -> PatternMatcher:
+    """Compile a pattern list for repeated matching.
+
+    Args:
+        patterns: List of patterns
+        case_sensitive: Whether matching is case-sensitive
+
+    Returns:
+        PatternMatcher for the patterns
+    """
+    return PatternMatcher(tuple(patterns), case_sensitive)
+
+
+def _as_matcher(patterns, case_sensitive: bool) -> PatternMatcher:
+    if isinstance(patterns, PatternMatcher):
+        return patterns
+    return compile_patterns(patterns, case_sensitive)
+
+
+def matches_any(
+    text: str, patterns: Union[List[str], PatternMatcher], case_sensitive: bool = False
+) -> bool:
     """Check if text matches any of the patterns.
 
     Args:
         text: Text to search in
-        patterns: List of patterns to match
-        case_sensitive: Whether matching is case-sensitive
+        patterns: List of patterns to match, or a compiled matcher
+        case_sensitive: Whether matching is case-sensitive (for a list)
 
     Returns:
         True if any pattern is found in text
     """
-    if not case_sensitive:
-        text = text.lower()
-        return any(p.lower() in text for p in patterns)
-    return any(p in text for p in patterns)
+    return _as_matcher(patterns, case_sensitive).search(text)
 
 
 def find_matching_line(
     lines: List[str],
-    patterns: List[str],
+    patterns: Union[List[str], PatternMatcher],
     case_sensitive: bool = False,
     reverse: bool = True
 ) -> str | None:
@@ -277,23 +356,24 @@ def find_matching_line(
 
     Args:
         lines: Lines to search
-        patterns: Patterns to match
-        case_sensitive: Whether matching is case-sensitive
+        patterns: Patterns to match, or a compiled matcher
+        case_sensitive: Whether matching is case-sensitive (for a list)
         reverse: Search from end to beginning
 
     Returns:
         The matching line, or None if no match
     """
+    matcher = _as_matcher(patterns, case_sensitive)
     search_lines = reversed(lines) if reverse else lines
     for line in search_lines:
-        if matches_any(line, patterns, case_sensitive):
+        if matcher.search(line):
             return line
     return None
 
 
 def line_starts_with_any(
     lines: List[str],
-    patterns: List[str],
+    patterns: Union[List[str], PatternMatcher],
     case_sensitive: bool = False,
     reverse: bool = True
 ) -> str | None:
@@ -310,8 +390,8 @@ def line_starts_with_any(
 
     Args:
         lines: Lines to search
-        patterns: Patterns to match
-        case_sensitive: Whether matching is case-sensitive
+        patterns: Patterns to match, or a compiled matcher
+        case_sensitive: Whether matching is case-sensitive (for a list)
         reverse: Search from end to beginning
 
     Returns:
@@ -320,6 +400,7 @@ def line_starts_with_any(
     # Prefixes that indicate definite Claude Code tool output
     _tool_prefixes = ("⏺ ", "⏺  ")
 
+    matcher = _as_matcher(patterns, case_sensitive)
     search_lines = reversed(lines) if reverse else lines
     for line in search_lines:
         stripped = line.strip()
@@ -333,12 +414,7 @@ def line_starts_with_any(
                 has_tool_prefix = True
                 break
 
-        if not case_sensitive:
-            starts = any(check_str.lower().startswith(p.lower()) for p in patterns)
-        else:
-            starts = any(check_str.startswith(p) for p in patterns)
-
-        if not starts:
+        if not matcher.startswith(check_str):
             continue
 
         if has_tool_prefix:
@@ -400,8 +476,7 @@ def is_status_bar_line(line: str, patterns: StatusPatterns = None) -> bool:
         True if line is status bar chrome
     """
     patterns = patterns or DEFAULT_PATTERNS
-    stripped = line.strip()
-    return any(stripped.startswith(prefix) for prefix in patterns.status_bar_prefixes)
+    return patterns.matcher("status_bar_prefixes", case_sensitive=True).startswith(line.strip())
 
 
 _COMMAND_MENU_RE = re.compile(r"^\s*/[\w-]+\s{2,}\S")
@@ -460,10 +535,11 @@ def _find_status_bar_line(content: str, patterns: StatusPatterns = None, *, clea
     # Use pre-stripped content if available, otherwise strip per-line
     # Search from bottom up — old status bar lines persist in scrollback,
     # but the current one is always at the bottom of the pane.
+    prefixes = tuple(patterns.status_bar_prefixes)
     text = clean_content if clean_content is not None else content
     for line in reversed(text.split('\n')):
         stripped = line.strip() if clean_content is not None else strip_ansi(line).strip()
-        if any(stripped.startswith(prefix) for prefix in patterns.status_bar_prefixes):
+        if stripped.startswith(prefixes):
             return stripped
 
     return None
@@ -673,6 +749,8 @@ def extract_pr_number(content: str, *, clean_content: str = None) -> int | None:
     Returns:
         PR number as int, or None if no PR reference found
     """
+    if clean_content is None and type(content) is PaneSnapshot:
+        return content.extraction.pr_number
     cleaned = clean_content if clean_content is not None else strip_ansi(content)
     # GitHub PR URLs: https://github.com/owner/repo/pull/123
     matches = re.findall(r'github\.com/[^/]+/[^/]+/pull/(\d+)', cleaned)
@@ -741,12 +819,21 @@ def extract_from_pane(content: str) -> PaneExtraction:
     Strips ANSI once and passes the clean version to all sub-extractors,
     avoiding redundant regex strip operations.
 
+    A PaneSnapshot is only analysed once; later calls return the same
+    PaneExtraction.
+
     Args:
         content: Raw pane content (may include ANSI codes)
 
     Returns:
         PaneExtraction with all extracted values
     """
+    if type(content) is PaneSnapshot:
+        return content.extraction
+    return _extract_from_pane(content)
+
+
+def _extract_from_pane(content: str) -> PaneExtraction:
     clean = strip_ansi(content)
     bash_count, bash_ambiguous = _extract_bash_count_and_ambiguity(content, clean_content=clean)
     return PaneExtraction(
@@ -757,3 +844,65 @@ def extract_from_pane(content: str) -> PaneExtraction:
         bash_count_ambiguous=bash_ambiguous,
         auto_accept_mode=extract_auto_accept_mode(content, clean_content=clean),
     )
+
+
+class PaneSnapshot(str):
+    """One pane capture, analysed at most once.
+
+    A str subclass, so it travels through every layer that passes pane
+    content around (detect_status return values, daemon enrichment, the
+    TUI summary widget, the CLI) without changing their signatures. The
+    derived views are computed on first use and cached on the snapshot:
+    strip_ansi(), extract_from_pane() and extract_pr_number() recognise a
+    snapshot and return its cached results instead of re-scanning.
+
+    Slicing or concatenating a snapshot yields a plain str.
+    """
+
+    @classmethod
+    def of(cls, content: Optional[str]) -> Optional["PaneSnapshot"]:
+        """Wrap captured content, reusing it if it is already a snapshot."""
+        if content is None or type(content) is cls:
+            return content
+        return cls(content)
+
+    @property
+    def raw(self) -> str:
+        """The captured text, as a plain str."""
+        return str.__str__(self)
+
+    @cached_property
+    def clean(self) -> str:
+        """Content with ANSI escape sequences removed."""
+        return ANSI_ESCAPE_PATTERN.sub('', self)
+
+    @cached_property
+    def lines(self) -> List[str]:
+        """Clean content split into lines, surrounding blank space trimmed."""
+        return self.clean.strip().split('\n')
+
+    @cached_property
+    def tail_lines(self) -> List[str]:
+        """Stripped, non-empty lines among the last 10 (the detector's view)."""
+        return [l.strip() for l in self.lines[-10:] if l.strip()]
+
+    @cached_property
+    def extraction(self) -> PaneExtraction:
+        """All extract_from_pane() values."""
+        return _extract_from_pane(self)
+
+    def memo(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """Cache a derived value that depends only on this content.
+
+        Args:
+            key: Hashable name of the value (include anything besides the
+                content that the value depends on)
+            compute: Called once to produce the value
+
+        Returns:
+            The cached or freshly computed value
+        """
+        cache: Dict[Any, Any] = self.__dict__.setdefault("_memo", {})
+        if key not in cache:
+            cache[key] = compute()
+        return cache[key]
@@ -0,0 +1,558 @@
+"""
+tmux control-mode transport.
+
+RealTmux goes through libtmux, which forks a ``tmux`` client process for
+every command. The TUI captures every agent's pane four times a second,
+so that is the dominant cost of an idle dashboard. ControlModeTmux keeps
+one persistent ``tmux -C`` client per tmux server instead and writes
+commands to it as lines of text.
+
+Protocol (see CONTROL MODE in tmux(1)):
+    Each command's output arrives framed as
+        %begin <time> <number> <flags>
+        ...output lines...
+        %end <time> <number> <flags>      (or %error on failure)
+    Blocks come back in the order the commands were written, so pending
+    requests are a FIFO; <number> ties each %end to its %begin. Blocks
+    with flags 0 were not sent by us (the initial attach). Lines starting
+    with ``%`` outside a block are notifications (%window-add,
+    %window-close, %output, ...), delivered to listeners.
+
+The client attaches with ``-f no-output,ignore-size``: it never resizes
+windows and receives no %output traffic unless a caller asks for it.
+When the connection is unavailable (no server, server restarted, attach
+failed) ControlModeTmux falls back to the libtmux implementation and
+reconnects on a later call.
+"""
+
+import subprocess
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .exceptions import TmuxError
+from .implementations import RealTmux
+from .tmux_utils import tmux_window_target
+
+
+# Seconds to wait for a command's %end before declaring the client wedged
+_COMMAND_TIMEOUT = 5.0
+# Seconds to wait for the initial attach to complete
+_CONNECT_TIMEOUT = 3.0
+# Minimum seconds between connection attempts after a failure, so a dead
+# server doesn't turn every call into a fork/exec plus a failed attach
+_RECONNECT_INTERVAL = 5.0
+
+# (ok, output lines) for one command
+CommandResult = Tuple[bool, List[str]]
+
+
+class TmuxControlModeError(TmuxError):
+    """The control-mode connection cannot serve the request."""
+
+    pass
+
+
+def quote_arg(arg: str) -> str:
+    """Quote one argument for tmux's command parser.
+
+    Double quotes with backslash escapes, so the result is always a single
+    word on a single line whatever the argument contains.
+    """
+    out = ['"']
+    for ch in arg:
+        if ch in '"\\$':
+            out.append("\\" + ch)
+        elif ch == "\n":
+            out.append("\\n")
+        elif ch == "\r":
+            out.append("\\r")
+        elif ch == "\t":
+            out.append("\\t")
+        elif ord(ch) < 0x20 or ord(ch) == 0x7F:
+            out.append("\\%03o" % ord(ch))
+        else:
+            out.append(ch)
+    out.append('"')
+    return "".join(out)
+
+
+def decode_output(value: str) -> str:
+    """Decode the octal escapes tmux applies to %output data."""
+    if "\\" not in value:
+        return value
+    raw = bytearray()
+    i = 0
+    n = len(value)
+    while i < n:
+        ch = value[i]
+        if ch == "\\" and i + 4 <= n and value[i + 1:i + 4].isdigit():
+            raw.append(int(value[i + 1:i + 4], 8) & 0xFF)
+            i += 4
+        else:
+            raw.extend(ch.encode("utf-8"))
+            i += 1
+    return raw.decode("utf-8", errors="replace")
+
+
+class _Pending:
+    """A command written to the client, waiting for its block."""
+
+    __slots__ = ("done", "ok", "lines", "failed")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.ok = False
+        self.lines: List[str] = []
+        # Set when the connection died before the block completed
+        self.failed = False
+
+
+class TmuxControlClient:
+    """One persistent ``tmux -C`` connection to a tmux server.
+
+    Thread-safe: commands from any thread are pipelined on the one
+    connection and each caller waits only for its own block.
+    """
+
+    def __init__(
+        self,
+        socket_name: Optional[str] = None,
+        log: Optional[Callable[[str], None]] = None,
+    ):
+        self.socket_name = socket_name
+        self._log = log or (lambda msg: None)
+        self._proc: Optional[subprocess.Popen] = None
+        self._reader: Optional[threading.Thread] = None
+        # Guards _proc, _pending and the write side of the pipe, so the
+        # FIFO order matches the order commands reach tmux
+        self._lock = threading.Lock()
+        self._pending: deque = deque()
+        self._connected = threading.Event()
+        self._last_attempt = 0.0
+        self._output_enabled = False
+        self._listeners: List[Callable[[str, str], None]] = []
+
+    @property
+    def connected(self) -> bool:
+        proc = self._proc
+        return proc is not None and proc.poll() is None and self._connected.is_set()
+
+    def add_listener(self, callback: Callable[[str, str], None]) -> None:
+        """Register callback(name, args) for notifications.
+
+        ``name`` is the notification without its ``%`` (e.g. "window-add"),
+        ``args`` the rest of the line. "exit" is also delivered when the
+        connection is lost. Callbacks run on the reader thread.
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[str, str], None]) -> None:
+        try:
+            self._listeners.remove(callback)
+        except ValueError:
+            pass
+
+    def set_output(self, enabled: bool) -> None:
+        """Turn %output notifications on or off (off by default)."""
+        self._output_enabled = enabled
+        if self.connected:
+            try:
+                self.command("refresh-client", "-f", "!no-output" if enabled else "no-output")
+            except TmuxControlModeError:
+                pass
+
+    # -- connection -------------------------------------------------------
+
+    def connect(self, session: str) -> bool:
+        """Attach to ``session`` unless already connected.
+
+        Returns True if connected. After a failed attempt, further
+        attempts are skipped for _RECONNECT_INTERVAL seconds.
+        """
+        if self.connected:
+            return True
+        with self._lock:
+            if self.connected:
+                return True
+            now = time.monotonic()
+            if self._last_attempt and now - self._last_attempt < _RECONNECT_INTERVAL:
+                return False
+            self._last_attempt = now
+            self._close_locked()
+            cmd = ["tmux"]
+            if self.socket_name:
+                cmd += ["-L", self.socket_name]
+            flags = "ignore-size" if self._output_enabled else "no-output,ignore-size"
+            cmd += ["-C", "attach-session", "-f", flags, "-t", f"={session}"]
+            try:
+                proc = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                )
+            except OSError as e:
+                self._log(f"tmux control mode unavailable: {e}")
+                return False
+            self._proc = proc
+            self._connected.clear()
+            # Set by the reader once attached or once it gives up
+            settled = threading.Event()
+            self._reader = threading.Thread(
+                target=self._read_loop, args=(proc, settled),
+                name="tmux-control-reader", daemon=True,
+            )
+            self._reader.start()
+        settled.wait(_CONNECT_TIMEOUT)
+        if self._connected.is_set() and proc.poll() is None:
+            self._last_attempt = 0.0
+            return True
+        self.close()
+        return False
+
+    def close(self) -> None:
+        """Close the connection; pending commands fail."""
+        with self._lock:
+            self._close_locked()
+
+    def _close_locked(self) -> None:
+        proc = self._proc
+        self._proc = None
+        self._connected.clear()
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.terminate()
+            proc.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+        self._fail_pending()
+
+    def _fail_pending(self) -> None:
+        while self._pending:
+            pending = self._pending.popleft()
+            pending.failed = True
+            pending.done.set()
+
+    # -- commands ---------------------------------------------------------
+
+    def command(self, *args: str, timeout: float = _COMMAND_TIMEOUT) -> CommandResult:
+        """Run one tmux command, e.g. ``command("has-session", "-t", "=s")``.
+
+        Returns (ok, output lines); ok is False when tmux reported %error.
+
+        Raises:
+            TmuxControlModeError: Not connected, or the connection failed or
+                timed out before the command completed
+        """
+        return self.commands([args], timeout=timeout)[0]
+
+    def commands(
+        self, commands: Sequence[Sequence[str]], timeout: float = _COMMAND_TIMEOUT
+    ) -> List[CommandResult]:
+        """Pipeline several commands in one write and wait for all of them.
+
+        Raises:
+            TmuxControlModeError: as for command()
+        """
+        payload = "".join(
+            " ".join(quote_arg(str(a)) if i else str(a) for i, a in enumerate(cmd)) + "\n"
+            for cmd in commands
+        ).encode("utf-8")
+        batch = [_Pending() for _ in commands]
+        with self._lock:
+            proc = self._proc
+            if proc is None or not self._connected.is_set():
+                raise TmuxControlModeError("tmux control client is not connected")
+            self._pending.extend(batch)
+            try:
+                proc.stdin.write(payload)
+                proc.stdin.flush()
+            except (OSError, ValueError) as e:
+                self._close_locked()
+                raise TmuxControlModeError(f"tmux control client write failed: {e}")
+
+        deadline = time.monotonic() + timeout
+        for pending in batch:
+            if not pending.done.wait(max(0.0, deadline - time.monotonic())):
+                # The FIFO can't be resynchronised after a lost block
+                self._log("tmux control client timed out; reconnecting")
+                self.close()
+                raise TmuxControlModeError("tmux control command timed out")
+            if pending.failed:
+                raise TmuxControlModeError("tmux control connection lost")
+        return [(p.ok, p.lines) for p in batch]
+
+    # -- reader -----------------------------------------------------------
+
+    def _read_loop(self, proc: subprocess.Popen, settled: threading.Event) -> None:
+        current: Optional[_Pending] = None
+        current_number: Optional[str] = None
+        for raw in proc.stdout:
+            line = raw.decode("utf-8", errors="replace").rstrip("\n")
+            if current_number is not None:
+                if line.startswith(("%end ", "%error ")):
+                    parts = line.split(" ")
+                    if len(parts) >= 3 and parts[2] == current_number:
+                        ok = parts[0] == "%end"
+                        if current is not None:
+                            current.ok = ok
+                            current.done.set()
+                        elif not self._connected.is_set():
+                            # Initial attach block: %error means no such session
+                            if not ok:
+                                break
+                            self._connected.set()
+                            settled.set()
+                        current = None
+                        current_number = None
+                        continue
+                if current is not None:
+                    current.lines.append(line)
+                continue
+            if line.startswith("%begin "):
+                parts = line.split(" ")
+                current_number = parts[2] if len(parts) >= 3 else ""
+                flags = parts[3] if len(parts) >= 4 else "0"
+                current = None
+                if flags.isdigit() and int(flags) & 1:
+                    with self._lock:
+                        if self._proc is proc and self._pending:
+                            current = self._pending.popleft()
+                continue
+            if line.startswith("%"):
+                name, _, args = line[1:].partition(" ")
+                if name == "exit":
+                    break
+                self._notify(name, args)
+
+        with self._lock:
+            if self._proc is proc:
+                self._proc = None
+                self._connected.clear()
+                self._fail_pending()
+        settled.set()  # a connect() still waiting fails now
+        if current is not None and not current.done.is_set():
+            current.failed = True
+            current.done.set()
+        try:
+            proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+        self._notify("exit", "")
+
+    def _notify(self, name: str, args: str) -> None:
+        for callback in list(self._listeners):
+            try:
+                callback(name, args)
+            except Exception as e:
+                self._log(f"tmux control listener failed: {e}")
+
+
+_clients: Dict[Optional[str], TmuxControlClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_control_client(socket_name: Optional[str] = None) -> TmuxControlClient:
+    """Get the process-wide control client for a tmux server."""
+    with _clients_lock:
+        client = _clients.get(socket_name)
+        if client is None:
+            client = TmuxControlClient(socket_name)
+            _clients[socket_name] = client
+        return client
+
+
+class _ControlPane:
+    """Just enough of libtmux.Pane for tmux_utils.send_keys_to_pane."""
+
+    def __init__(self, client: TmuxControlClient, target: str):
+        self._client = client
+        self._target = target
+
+    def send_keys(self, cmd: str, enter: bool = True, literal: bool = False) -> None:
+        commands = []
+        if cmd or not enter:
+            args = ["send-keys", "-t", self._target]
+            if literal:
+                args.append("-l")
+            commands.append(args + [cmd])
+        if enter:
+            commands.append(["send-keys", "-t", self._target, "Enter"])
+        for ok, lines in self._client.commands(commands):
+            if not ok:
+                raise TmuxError("; ".join(lines) or "send-keys failed")
+
+
+class ControlModeTmux(RealTmux):
+    """TmuxInterface over a persistent tmux control-mode connection.
+
+    The hot-path calls (capture_pane, capture_panes, pane_fingerprints,
+    get_pane_pid, list_windows, has_session, send_keys, select_window,
+    kill_window) go over the shared control client. Everything else, and any call made while the
+    connection is down, uses the inherited libtmux implementation.
+
+    Pane calls target the window's active pane; agent windows have one.
+    """
+
+    def __init__(self, socket_name: Optional[str] = None, client: Optional[TmuxControlClient] = None):
+        super().__init__(socket_name)
+        self._client = client or get_control_client(self._socket_name)
+
+    @property
+    def client(self) -> TmuxControlClient:
+        return self._client
+
+    def _run(self, session: str, *args: str) -> CommandResult:
+        """Run a command over control mode, connecting via ``session``.
+
+        Raises:
+            TmuxControlModeError: The caller should fall back to libtmux
+        """
+        if not self._client.connect(session):
+            raise TmuxControlModeError("tmux control client is not connected")
+        return self._client.command(*args)
+
+    def capture_pane(self, session: str, window: str, lines: int = 100) -> Optional[str]:
+        try:
+            ok, output = self._run(
+                session, "capture-pane", "-p", "-e", "-S", f"-{lines}",
+                "-t", tmux_window_target(session, window),
+            )
+        except TmuxControlModeError:
+            return super().capture_pane(session, window, lines)
+        if not ok:
+            return None
+        # Match libtmux, which drops trailing empty lines
+        while output and output[-1] == "":
+            output.pop()
+        return "\n".join(output)
+
+    def capture_panes(self, session: str, windows: List[str], lines: int = 100) -> Dict[str, Optional[str]]:
+        windows = list(windows)
+        if not windows:
+            return {}
+        try:
+            if not self._client.connect(session):
+                raise TmuxControlModeError("tmux control client is not connected")
+            results = self._client.commands([
+                ["capture-pane", "-p", "-e", "-S", f"-{lines}",
+                 "-t", tmux_window_target(session, window)]
+                for window in windows
+            ])
+        except TmuxControlModeError:
+            return super().capture_panes(session, windows, lines)
+        captured: Dict[str, Optional[str]] = {}
+        for window, (ok, output) in zip(windows, results):
+            if not ok:
+                captured[window] = None
+                continue
+            while output and output[-1] == "":
+                output.pop()
+            captured[window] = "\n".join(output)
+        return captured
+
+    def pane_fingerprints(self, session: str) -> Dict[str, str]:
+        try:
+            ok, output = self._run(
+                session, "list-panes", "-s", "-t", f"={session}",
+                "-F", self.PANE_FINGERPRINT_FORMAT,
+            )
+        except TmuxControlModeError:
+            return super().pane_fingerprints(session)
+        return self._parse_pane_fingerprints(output) if ok else {}
+
+    def get_pane_pid(self, session: str, window: str) -> Optional[int]:
+        try:
+            ok, output = self._run(
+                session, "display-message", "-p",
+                "-t", tmux_window_target(session, window), "#{pane_pid}",
+            )
+        except TmuxControlModeError:
+            return super().get_pane_pid(session, window)
+        if not ok or not output:
+            return None
+        try:
+            return int(output[0])
+        except ValueError:
+            return None
+
+    def list_windows(self, session: str) -> List[Dict[str, Any]]:
+        try:
+            ok, output = self._run(
+                session, "list-windows", "-t", f"={session}",
+                "-F", "#{window_index}\t#{window_active}\t#{window_name}",
+            )
+        except TmuxControlModeError:
+            return super().list_windows(session)
+        if not ok:
+            return []
+        windows = []
+        for line in output:
+            parts = line.split("\t", 2)
+            if len(parts) != 3 or not parts[0].isdigit():
+                continue
+            windows.append({
+                'index': int(parts[0]),
+                'name': parts[2],
+                'active': parts[1] == '1',
+            })
+        return windows
+
+    def has_session(self, session: str) -> bool:
+        if not self._client.connected:
+            # Don't attach just to learn that a session is missing
+            return super().has_session(session)
+        try:
+            ok, _ = self._client.command("has-session", "-t", f"={session}")
+        except TmuxControlModeError:
+            return super().has_session(session)
+        return ok
+
+    def send_keys(self, session: str, window: str, keys: str, enter: bool = True) -> bool:
+        if not self._client.connect(session):
+            return super().send_keys(session, window, keys, enter)
+        from .tmux_utils import send_keys_to_pane
+        pane = _ControlPane(self._client, tmux_window_target(session, window))
+        try:
+            send_keys_to_pane(pane, keys, enter=enter)
+            return True
+        except TmuxControlModeError:
+            # Some keys may already have been delivered; don't resend
+            return False
+        except TmuxError:
+            return False
+
+    def select_window(self, session: str, window: str) -> bool:
+        try:
+            ok, _ = self._run(session, "select-window", "-t", tmux_window_target(session, window))
+        except TmuxControlModeError:
+            return super().select_window(session, window)
+        return ok
+
+    def kill_window(self, session: str, window: str) -> bool:
+        try:
+            ok, _ = self._run(session, "kill-window", "-t", tmux_window_target(session, window))
+        except TmuxControlModeError:
+            return super().kill_window(session, window)
+        self.invalidate_cache(session, window)
+        return ok
+
+
+def create_tmux(socket_name: Optional[str] = None) -> RealTmux:
+    """Create the TmuxInterface for production use.
+
+    ControlModeTmux when ``tmux.control_mode`` is enabled (see
+    config.get_tmux_control_mode), otherwise RealTmux.
+    """
+    from .config import get_tmux_control_mode
+    if get_tmux_control_mode():
+        return ControlModeTmux(socket_name)
+    return RealTmux(socket_name)
@@ -31,7 +31,7 @@ from .status_detector_factory import StatusDetectorDispatcher
 from .status_constants import DEFAULT_CAPTURE_LINES, STATUS_CAPTURE_LINES, STATUS_RUNNING, STATUS_RUNNING_HEARTBEAT, STATUS_TERMINATED, STATUS_WAITING_HEARTBEAT, STATUS_WAITING_OVERSIGHT, STATUS_WAITING_USER, is_green_status
 from .history_reader import get_session_stats, ClaudeSessionStats, HistoryFile, synthesize_remote_stats
 from .settings import signal_activity, write_tui_heartbeat, get_event_loop_timing_path, get_status_changes_path, TUIPreferences  # Activity signaling to daemon
-from .monitor_daemon_state import get_monitor_daemon_state
+from .monitor_daemon_state import get_monitor_daemon_state, get_stats_snapshot
 from .monitor_daemon import (
     is_monitor_daemon_running,
 )
@@ -43,7 +43,10 @@ from .summarizer_component import (
 )
 from .sister_poller import SisterPoller, SisterState
 from .usage_monitor import UsageMonitor
-from .implementations import RealTmux
+from .tmux_control import create_tmux
+from .pane_cache import CachingTmux
+from .pane_store import PaneRecord, PaneStoreReader
+from .status_patterns import PaneSnapshot
 from .tmux_utils import get_pane_base_index
 from .tui_helpers import (
     format_duration,
@@ -280,7 +283,14 @@ class SupervisorTUI(
         self.launcher = ClaudeLauncher(tmux_session)
         from .settings import resolve_detection_mode
         detection_mode = resolve_detection_mode(tmux_session)
-        self.detector = StatusDetectorDispatcher(tmux_session, mode=detection_mode)
+        # Pane captures are shared by detection, summaries and previews
+        self._pane_tmux = CachingTmux(create_tmux())
+        # Daemon-published captures for non-focused rows: session_id -> (seq, snapshot)
+        self._pane_store_reader = PaneStoreReader(tmux_session)
+        self._published_snapshots: dict[str, tuple[int, PaneSnapshot]] = {}
+        self.detector = StatusDetectorDispatcher(
+            tmux_session, tmux=self._pane_tmux, mode=detection_mode
+        )
         # Track collapsed parents in tree view (#244)
         self.collapsed_parents: set[str] = set()
         # Max repo/branch/name widths for alignment in full detail mode
@@ -334,7 +344,7 @@ class SupervisorTUI(
         # Pending double-press confirmations: action_key -> (session_name | None, timestamp)
         self._pending_confirmations: dict[str, tuple[str | None, float]] = {}
         # Tmux interface for sync operations
-        self._tmux = RealTmux()
+        self._tmux = create_tmux()
         # Optional: target a linked session for sync (set by `overcode split`)
         self.tmux_sync_target: str | None = None
         # SSH proxy windows for remote agents: session_id -> tmux window name
@@ -385,6 +395,7 @@ class SupervisorTUI(
         _sum_cfg = _get_sum_cfg()
         self._summarizer = SummarizerComponent(
             tmux_session=tmux_session,
+            tmux=self._pane_tmux,
             config=SummarizerConfig(enabled=False, cost_cap=_sum_cfg.get("cost_cap", 100.0)),
         )
         self._summaries: dict[str, AgentSummary] = {}
@@ -584,6 +595,9 @@ class SupervisorTUI(
             if self.has_sisters:
                 self.set_interval(10, self._poll_sisters)
                 self._poll_sisters()  # Initial fetch
+                # Push updates from sisters that stream them; the polls
+                # above then read the streamed state
+                self._sister_poller.subscribe(self._on_sister_stream_update)
                 # Fast poll for the focused remote agent (1.5s)
                 self.set_interval(1.5, self._poll_focused_sister)
             # Refresh jobs list every 5 seconds
@@ -1216,6 +1230,15 @@ class SupervisorTUI(
         # Slow path
         self._update_stats_async()
 
+    def _published_pane_snapshot(self, record: PaneRecord) -> PaneSnapshot:
+        """Snapshot of a published capture, reused until its seq moves."""
+        cached = self._published_snapshots.get(record.session_id)
+        if cached is not None and cached[0] == record.seq:
+            return cached[1]
+        snapshot = PaneSnapshot(record.tail(STATUS_CAPTURE_LINES))
+        self._published_snapshots[record.session_id] = (record.seq, snapshot)
+        return snapshot
+
     @work(thread=True, exclusive=True, group="fast_status")
     def _fetch_statuses_async(self, widgets: list) -> None:
         """Fast path: fetch detect_status (capture_pane) only, every 250ms.
@@ -1239,7 +1262,46 @@ class SupervisorTUI(
             focused_w = self._get_focused_widget()
             focused_session_id = focused_w.session.id if focused_w else None
 
+            daemon_state = get_monitor_daemon_state(self.tmux_session)
+            daemon_fresh = bool(
+                daemon_state and daemon_state.sessions
+                and not daemon_state.is_stale(buffer_seconds=5.0)
+            )
+
+            # Live non-focused agents: while the daemon is fresh, their
+            # status comes from it (see below) and their pane from its
+            # published captures, so they need no tmux call at all. The
+            # rest share one capture_panes round-trip; the focused agent
+            # (full capture) and terminated/done agents are still fetched
+            # one by one below.
+            non_focused = [
+                s for _, s in sessions_to_check
+                if not s.is_remote
+                and s.status not in ("terminated", "done")
+                and s.id != focused_session_id
+            ]
+            batch_results = {}
+            if daemon_fresh:
+                daemon_by_id = {s.session_id: s for s in daemon_state.sessions}
+                published = self._pane_store_reader.read()
+                for s in non_focused:
+                    ds, record = daemon_by_id.get(s.id), published.get(s.id)
+                    if ds is not None and record is not None:
+                        content = self._published_pane_snapshot(record)
+                        batch_results[s.id] = (ds.current_status, ds.current_activity, content)
+            batched = [s for s in non_focused if s.id not in batch_results]
+            if batched:
+                try:
+                    batch_results.update(zip(
+                        [s.id for s in batched],
+                        self.detector.detect_statuses(batched, num_lines=STATUS_CAPTURE_LINES),
+                    ))
+                except Exception:
+                    pass
+
             def fetch_status(session):
+                if session.id in batch_results:
+                    return batch_results[session.id]
                 try:
                     if session.is_remote:
                         return (session.stats.current_state or "running", session.stats.current_task, session.pane_content or "")
@@ -1282,9 +1344,7 @@ class SupervisorTUI(
             # focused (no daemon override) for enrichment.
             focused_id = focused_session_id
             status_sources = {sid: "detect" for sid in status_results} if _diag else {}
-            daemon_state = get_monitor_daemon_state(self.tmux_session)
-            if daemon_state and daemon_state.sessions and not daemon_state.is_stale(buffer_seconds=5.0):
-                daemon_by_id = {s.session_id: s for s in daemon_state.sessions}
+            if daemon_fresh:
                 for session_id in list(status_results):
                     if session_id == focused_id:
                         # Focused agent: still enrich with heartbeat/oversight
@@ -1313,7 +1373,7 @@ class SupervisorTUI(
 
             # Extract subtree costs from daemon state (local agents)
             subtree_costs = {}
-            if daemon_state and daemon_state.sessions and not daemon_state.is_stale(buffer_seconds=5.0):
+            if daemon_fresh:
                 for ds in daemon_state.sessions:
                     if ds.subtree_cost_usd > 0:
                         subtree_costs[ds.session_id] = ds.subtree_cost_usd
@@ -1358,7 +1418,9 @@ class SupervisorTUI(
         git diff subprocess) and don't need 250ms updates. Runs independently
         from the fast status path so it never blocks preview pane updates.
 
-        Uses a shared HistoryFile so history.jsonl is parsed at most once
+        Prefers the Monitor Daemon's published stats snapshot; sessions are
+        only computed locally when the daemon is stale or hasn't synced them
+        yet. Uses a shared HistoryFile so history.jsonl is parsed at most once
         per cycle, regardless of how many sessions are checked.
         """
         if self._stats_update_in_progress:
@@ -1376,6 +1438,9 @@ class SupervisorTUI(
                 session = fresh_sessions.get(widget.session.id, widget.session)
                 sessions_to_check.append((widget.session.id, session))
 
+            # Daemon-published stats (empty if the daemon is stale)
+            snapshot = get_stats_snapshot(self.tmux_session)
+
             # Single HistoryFile shared across all sessions — parse once, reuse N times
             history_file = HistoryFile()
 
@@ -1387,6 +1452,9 @@ class SupervisorTUI(
                             session.remote_git_diff,
                             session.remote_git_untracked,
                         )
+                    ds = snapshot.get(session.id)
+                    if ds is not None:
+                        return (ds.to_claude_stats(), ds.git_diff_stats, ds.git_untracked)
                     claude_stats = get_session_stats(session, history_file=history_file)
                     git_diff = None
                     git_untracked = None
@@ -1432,6 +1500,13 @@ class SupervisorTUI(
         remote = self._sister_poller.poll_all()
         self.call_from_thread(self._apply_remote_sessions, remote)
 
+    def _on_sister_stream_update(self) -> None:
+        """Called on a sister stream thread when that sister pushes a change."""
+        try:
+            self.call_from_thread(self._poll_sisters)
+        except RuntimeError:
+            pass  # App not running (shutting down)
+
     def _visible_remote_sessions(self) -> List[Session]:
         """Return remote sessions excluding disabled sisters (#323)."""
         disabled = self._prefs.disabled_sisters
@@ -1464,6 +1539,8 @@ class SupervisorTUI(
         session = focused.session
         if not session.source_url or not session.name:
             return
+        if self._sister_poller.is_streaming(session.source_url):
+            return  # Its stream already delivers every change
         self._poll_focused_sister_async(
             session.source_url, session.source_api_key, session.name, session.id
         )
@@ -4047,6 +4124,8 @@ class SupervisorTUI(
         self._cleanup_ssh_proxies()
         # Stop the summarizer (release API client resources)
         self._summarizer.stop()
+        # Stop following sister streams
+        self._sister_poller.close()
 
         # Flush remaining diagnostic data
         self._flush_heartbeat()
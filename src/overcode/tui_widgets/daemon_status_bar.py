@@ -15,7 +15,7 @@ from ..supervisor_daemon import is_supervisor_daemon_running
 from ..summarizer_client import SummarizerClient
 from ..web_server import is_web_server_running, get_web_server_url
 from ..settings import DAEMON_VERSION, get_agent_history_path
-from ..status_history import read_agent_status_history
+from ..status_history import expand_status_history, read_agent_status_history
 from ..tui_logic import calculate_mean_spin_from_history
 from ..tui_helpers import (
     format_interval,
@@ -73,8 +73,9 @@ class DaemonStatusBar(Static):
                 hours=baseline_minutes / 60.0 + 0.1,  # slight buffer
                 history_file=get_agent_history_path(self.tmux_session)
             )
+            # History rows are intervals; resample so each counts by duration
             self._mean_spin, self._spin_sample_count = calculate_mean_spin_from_history(
-                history, active_session_names, baseline_minutes
+                expand_status_history(history), active_session_names, baseline_minutes
             )
         else:
             self._mean_spin = 0.0
@@ -17,6 +17,7 @@ from ..protocols import StatusDetectorProtocol
 from ..status_constants import get_status_color
 from ..status_patterns import extract_from_pane, extract_sleep_duration
 from ..history_reader import get_session_stats, ClaudeSessionStats
+from ..monitor_daemon_state import get_stats_snapshot
 from ..tui_helpers import (
     calculate_uptime,
     get_current_state_times,
@@ -155,21 +156,31 @@ class SessionSummary(Static, can_focus=True):
         """Apply pre-fetched status data to this widget.
 
         Used by parallel status updates to apply data fetched in background threads.
-        Note: This still fetches claude_stats synchronously - used for single widget updates.
+        Note: When the daemon's stats snapshot is unavailable this still fetches
+        claude_stats synchronously - used for single widget updates.
         """
-        # Fetch claude stats (only for standalone update_status calls)
-        claude_stats = get_session_stats(self.session)
-        # Fetch git diff stats — remote agents already have this from the sister API
         git_diff = None
         git_untracked = None
-        if self.session.is_remote:
-            git_diff = self.session.remote_git_diff
-            git_untracked = self.session.remote_git_untracked
+        ds = None
+        if not self.session.is_remote:
+            ds = get_stats_snapshot(self.session.tmux_session).get(self.session.id)
+        if ds is not None:
+            # The Monitor Daemon already computed these — no parse, no git fork
+            claude_stats = ds.to_claude_stats()
+            git_diff = ds.git_diff_stats
+            git_untracked = ds.git_untracked
         else:
-            _gdir = effective_git_directory(self.session)
-            if _gdir:
-                git_diff = get_git_diff_stats(_gdir)
-                git_untracked = get_git_untracked_count(_gdir)
+            # Fetch claude stats (only for standalone update_status calls)
+            claude_stats = get_session_stats(self.session)
+            # Fetch git diff stats — remote agents already have this from the sister API
+            if self.session.is_remote:
+                git_diff = self.session.remote_git_diff
+                git_untracked = self.session.remote_git_untracked
+            else:
+                _gdir = effective_git_directory(self.session)
+                if _gdir:
+                    git_diff = get_git_diff_stats(_gdir)
+                    git_untracked = get_git_untracked_count(_gdir)
         self.apply_status_no_refresh(
             status, activity, content, claude_stats, git_diff, git_untracked
         )
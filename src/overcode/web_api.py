@@ -4,11 +4,12 @@ API data handlers for web server.
 Reuses existing helpers from tui_helpers.py and reads from Monitor Daemon state.
 """
 
+import functools
 import importlib.metadata
 import logging
 import subprocess
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Collection, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +29,7 @@ from .tui_helpers import (
     get_git_untracked_count,
 )
 from .config import get_hostname
+from .pane_store import PaneRecord, read_pane_store
 from .status_constants import (
     get_status_emoji,
     get_status_color,
@@ -35,6 +37,8 @@ from .status_constants import (
     AGENT_TIMELINE_CHARS,
 )
 
+# Pane lines included per agent (sister preview sync)
+PANE_CAPTURE_LINES = 100
 
 # CSS color values for web (Rich/Textual colors -> CSS hex)
 WEB_COLORS = {
@@ -52,8 +56,12 @@ def get_web_color(status_color: str) -> str:
     return WEB_COLORS.get(status_color, "#6b7280")
 
 
+@functools.lru_cache(maxsize=1)
 def _get_version() -> str:
-    """Get the installed overcode version with git info."""
+    """Get the installed overcode version with git info.
+
+    Cached: it forks ``git describe`` and can't change under a running server.
+    """
     # Try pyproject.toml first (for editable installs), matching __init__.py logic
     try:
         from pathlib import Path
@@ -89,40 +97,72 @@ def _get_version() -> str:
     return base_version
 
 
-def _capture_agent_pane(tmux_session: str, window_id: int) -> str:
+def _capture_agent_pane(tmux_session: str, window_id: int, lines: int = PANE_CAPTURE_LINES) -> str:
     """Capture pane content for a single agent window.
 
     Returns the captured text, or empty string on failure.
     """
     try:
-        from .implementations import RealTmux
-        tmux = RealTmux()
-        content = tmux.capture_pane(tmux_session, window_id, lines=100)
+        from .tmux_control import create_tmux
+        content = create_tmux().capture_pane(tmux_session, window_id, lines=lines)
         return content or ""
     except (subprocess.SubprocessError, ImportError, OSError) as e:
         logger.debug("Failed to capture pane for window %s: %s", window_id, e)
         return ""
 
 
-def get_status_data(tmux_session: str) -> Dict[str, Any]:
+def _capture_agent_panes(
+    tmux_session: str, windows: List[str], lines: int = PANE_CAPTURE_LINES,
+) -> Dict[str, str]:
+    """Capture pane content for several agent windows in one round-trip.
+
+    Returns a dict of window -> captured text; windows that could not be
+    captured are left out.
+    """
+    try:
+        from .tmux_control import create_tmux
+        captured = create_tmux().capture_panes(tmux_session, windows, lines=lines)
+    except (subprocess.SubprocessError, ImportError, OSError) as e:
+        logger.debug("Failed to capture panes for %s: %s", tmux_session, e)
+        return {}
+    return {window: content for window, content in captured.items() if content}
+
+
+def get_status_data(
+    tmux_session: str,
+    include_pane: bool = True,
+    pane_lines: int = PANE_CAPTURE_LINES,
+    agents: Optional[Collection[str]] = None,
+) -> Dict[str, Any]:
     """Get current status data for all agents.
 
     Args:
         tmux_session: tmux session name to monitor
+        include_pane: include each agent's pane content; when False no pane
+            is read or captured and agents have no ``pane_content`` key
+        pane_lines: pane lines per agent (at most PANE_CAPTURE_LINES)
+        agents: names of the agents to include (default: all)
 
     Returns:
         Dictionary with daemon info, summary, and per-agent data
     """
     state = get_monitor_daemon_state(tmux_session)
     now = datetime.now()
-
-    # Capture pane content for each agent (for sister preview sync)
-    pane_contents: Dict[int, str] = {}
-    if state and state.sessions:
-        for s in state.sessions:
-            content = _capture_agent_pane(tmux_session, s.tmux_window)
-            if content:
-                pane_contents[s.tmux_window] = content
+    pane_lines = min(pane_lines, PANE_CAPTURE_LINES)
+    sessions = state.sessions if state else []
+    if agents is not None:
+        wanted = set(agents)
+        sessions = [s for s in sessions if s.name in wanted]
+
+    # Pane content for each agent (for sister preview sync): the daemon's
+    # published captures, capturing only the panes it didn't publish
+    published: Dict[str, PaneRecord] = {}
+    pane_contents: Dict[str, str] = {}
+    if include_pane and sessions:
+        published = read_pane_store(tmux_session)
+        missing = [s.tmux_window for s in sessions if s.session_id not in published]
+        if missing:
+            pane_contents = _capture_agent_panes(tmux_session, missing, pane_lines)
 
     result = {
         "timestamp": now.isoformat(),
@@ -135,19 +175,33 @@ def get_status_data(tmux_session: str) -> Dict[str, Any]:
     }
 
     if state:
-        for s in state.sessions:
-            pane_content = pane_contents.get(s.tmux_window, "")
-            result["agents"].append(_build_agent_info(s, now, pane_content))
+        stats_fresh = state.has_fresh_stats()
+        for s in sessions:
+            record = published.get(s.session_id)
+            if not include_pane:
+                pane_content = None
+            elif record is not None:
+                pane_content = record.tail(pane_lines)
+            else:
+                pane_content = pane_contents.get(s.tmux_window, "")
+            result["agents"].append(_build_agent_info(s, now, pane_content, stats_fresh))
 
     return result
 
 
-def get_single_agent_status(tmux_session: str, agent_name: str) -> Optional[Dict[str, Any]]:
+def get_single_agent_status(
+    tmux_session: str,
+    agent_name: str,
+    include_pane: bool = True,
+    pane_lines: int = PANE_CAPTURE_LINES,
+) -> Optional[Dict[str, Any]]:
     """Get status data for a single agent (lightweight — only captures one pane).
 
     Args:
         tmux_session: tmux session name to monitor
         agent_name: Name of the agent to fetch
+        include_pane: include the agent's pane content (see get_status_data)
+        pane_lines: pane lines to include (at most PANE_CAPTURE_LINES)
 
     Returns:
         Agent info dict, or None if not found
@@ -168,8 +222,15 @@ def get_single_agent_status(tmux_session: str, agent_name: str) -> Optional[Dict
     if target is None:
         return None
 
-    pane_content = _capture_agent_pane(tmux_session, target.tmux_window)
-    return _build_agent_info(target, now, pane_content)
+    pane_lines = min(pane_lines, PANE_CAPTURE_LINES)
+    pane_content: Optional[str] = None
+    if include_pane:
+        record = read_pane_store(tmux_session).get(target.session_id)
+        if record is not None:
+            pane_content = record.tail(pane_lines)
+        else:
+            pane_content = _capture_agent_pane(tmux_session, target.tmux_window, pane_lines)
+    return _build_agent_info(target, now, pane_content, state.has_fresh_stats())
 
 
 def _build_daemon_info(state: Optional[MonitorDaemonState]) -> Dict[str, Any]:
@@ -233,16 +294,24 @@ def _build_summary(state: Optional[MonitorDaemonState]) -> Dict[str, Any]:
     }
 
 
-def _build_status_info(s: SessionDaemonState) -> Dict[str, Any]:
-    """Build status and identity fields for an agent."""
+def _build_status_info(s: SessionDaemonState, stats_fresh: bool = False) -> Dict[str, Any]:
+    """Build status and identity fields for an agent.
+
+    Git stats come from the daemon's snapshot when ``stats_fresh`` is set and
+    the session has one; otherwise they are sampled here.
+    """
     status_color = get_status_color(s.current_status)
     from .status_constants import PERMISSIVENESS_EMOJIS
     perm_emoji = PERMISSIVENESS_EMOJIS.get(s.permissiveness_mode, "👮")
 
-    from .tui_helpers import effective_git_directory
-    _gdir = effective_git_directory(s)
-    git_diff = get_git_diff_stats(_gdir) if _gdir else None
-    git_untracked = get_git_untracked_count(_gdir) if _gdir else None
+    if stats_fresh and s.has_stats_snapshot:
+        git_diff = s.git_diff_stats
+        git_untracked = s.git_untracked
+    else:
+        from .tui_helpers import effective_git_directory
+        _gdir = effective_git_directory(s)
+        git_diff = get_git_diff_stats(_gdir) if _gdir else None
+        git_untracked = get_git_untracked_count(_gdir) if _gdir else None
 
     return {
         "name": s.name,
@@ -346,13 +415,19 @@ def _build_cost_info(s: SessionDaemonState) -> Dict[str, Any]:
     }
 
 
-def _build_agent_info(s: SessionDaemonState, now: datetime, pane_content: str = "") -> Dict[str, Any]:
-    """Build agent info dict from SessionDaemonState."""
+def _build_agent_info(
+    s: SessionDaemonState,
+    now: datetime,
+    pane_content: Optional[str] = "",
+    stats_fresh: bool = False,
+) -> Dict[str, Any]:
+    """Build agent info dict from SessionDaemonState (no pane_content if None)."""
     info: Dict[str, Any] = {}
-    info.update(_build_status_info(s))
+    info.update(_build_status_info(s, stats_fresh))
     info.update(_build_time_info(s, now))
     info.update(_build_cost_info(s))
-    info["pane_content"] = pane_content
+    if pane_content is not None:
+        info["pane_content"] = pane_content
     # Raw daemon state — sisters can forward any field without manual mapping.
     info["daemon_state"] = s.to_dict()
     return info
@@ -481,7 +556,8 @@ def get_analytics_sessions(
     # Get active sessions
     for s in sessions_mgr.list_sessions():
         record = _session_to_analytics_record(s, is_archived=False)
-        # Get detailed stats from Claude Code history
+        # Get detailed stats from Claude Code history (full work-time
+        # distribution, which the daemon's snapshot collapses to a median)
         stats = get_session_stats(s)
         if stats:
             record["work_times"] = stats.work_times
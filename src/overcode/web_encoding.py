@@ -0,0 +1,109 @@
+"""
+Response encoding for the web server.
+
+Serializes JSON compactly (indented only on request) and compresses
+response bodies for clients that accept it. A status document with pane
+content for many agents is tens to hundreds of KB of highly repetitive
+text, polled every few seconds by every dashboard and sister.
+
+orjson is used for serialization and zstandard for zstd when installed
+(``pip install overcode[web]``); otherwise the stdlib json and gzip
+modules are used.
+"""
+
+import functools
+import gzip
+import json
+import time
+from typing import Any, Optional, Tuple
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    zstandard = None
+    HAS_ZSTD = False
+
+# Bodies smaller than this are sent as-is (compression wouldn't pay off)
+MIN_COMPRESS_BYTES = 1024
+# Fast levels: these bodies are built per request
+GZIP_LEVEL = 5
+ZSTD_LEVEL = 3
+
+
+def dumps_json(data: Any, pretty: bool = False) -> Tuple[bytes, float]:
+    """Serialize ``data`` as UTF-8 JSON.
+
+    Compact unless ``pretty``. Values JSON can't represent are converted
+    with str(), as before.
+
+    Returns:
+        (body, seconds spent serializing)
+    """
+    started = time.perf_counter()
+    body = None
+    if HAS_ORJSON:
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            body = orjson.dumps(data, default=str, option=option)
+        except TypeError:
+            body = None  # e.g. integers beyond 64 bits: let json handle it
+    if body is None:
+        if pretty:
+            text = json.dumps(data, indent=2, default=str, ensure_ascii=False)
+        else:
+            text = json.dumps(data, separators=(",", ":"), default=str, ensure_ascii=False)
+        body = text.encode("utf-8")
+    return body, time.perf_counter() - started
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """The content coding to use for a request's Accept-Encoding, or None.
+
+    Prefers zstd (when available) over gzip; codings with q=0 are refused.
+    """
+    if not accept_encoding:
+        return None
+    accepted = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding.strip().lower()] = q
+    wildcard = accepted.get("*", 0.0)
+    if HAS_ZSTD and accepted.get("zstd", 0.0) > 0:
+        return "zstd"
+    if accepted.get("gzip", wildcard) > 0:
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """``body`` in the given content coding ("gzip" or "zstd")."""
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(body)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+@functools.lru_cache(maxsize=16)
+def compress_static(body: bytes, encoding: str) -> bytes:
+    """compress() for bodies that repeat across requests (pages, scripts)."""
+    return compress(body, encoding)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Load-test harness for the web server.
+
+Runs N concurrent pollers against a running server (as dashboards and
+sister TUIs do) for a fixed duration and reports request latency
+percentiles. With --post, a control request is sent once a second
+alongside the pollers and its latency is reported separately, to check
+that control calls don't queue behind the polls.
+
+    python -m overcode.web_loadtest --url http://localhost:8080 --pollers 20
+"""
+
+import argparse
+import math
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class LatencyStats:
+    """Latencies (seconds) and error count for one kind of request."""
+
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+
+    def percentile(self, pct: float) -> float:
+        """Nearest-rank percentile of the recorded latencies (0 if none)."""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        rank = max(1, math.ceil(pct / 100 * len(ordered)))
+        return ordered[min(rank, len(ordered)) - 1]
+
+    def summary(self, label: str, duration: float) -> str:
+        count = len(self.latencies)
+        return (
+            f"{label}: {count} ok, {self.errors} errors, {count / duration:.1f} req/s, "
+            f"p50 {self.percentile(50) * 1000:.1f}ms, p99 {self.percentile(99) * 1000:.1f}ms, "
+            f"max {max(self.latencies, default=0) * 1000:.1f}ms"
+        )
+
+
+def _timed_request(request: urllib.request.Request, timeout: float, stats: LatencyStats,
+                   lock: threading.Lock) -> None:
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+        ok = True
+    except urllib.error.HTTPError as e:
+        # An HTTP error still measures how long the server took to answer,
+        # except when it says it was too busy to
+        e.read()
+        ok = e.code != 503
+    except (urllib.error.URLError, OSError):
+        ok = False
+    elapsed = time.perf_counter() - started
+    with lock:
+        if ok:
+            stats.latencies.append(elapsed)
+        else:
+            stats.errors += 1
+
+
+def run_load_test(
+    url: str,
+    pollers: int = 10,
+    duration: float = 10.0,
+    path: str = "/api/status",
+    post_path: Optional[str] = None,
+    api_key: Optional[str] = None,
+    timeout: float = 30.0,
+):
+    """Poll ``url + path`` from ``pollers`` threads for ``duration`` seconds.
+
+    Returns:
+        (poll_stats, post_stats); post_stats is None without ``post_path``
+    """
+    headers = {"X-API-Key": api_key} if api_key else {}
+    base = url.rstrip("/")
+    lock = threading.Lock()
+    poll_stats = LatencyStats()
+    post_stats = LatencyStats() if post_path else None
+    deadline = time.monotonic() + duration
+
+    def poll() -> None:
+        while time.monotonic() < deadline:
+            request = urllib.request.Request(base + path, headers=headers)
+            _timed_request(request, timeout, poll_stats, lock)
+
+    def post() -> None:
+        while time.monotonic() < deadline:
+            request = urllib.request.Request(
+                base + post_path, data=b"{}", method="POST",
+                headers={**headers, "Content-Type": "application/json"},
+            )
+            _timed_request(request, timeout, post_stats, lock)
+            time.sleep(1.0)
+
+    threads = [threading.Thread(target=poll, daemon=True) for _ in range(pollers)]
+    if post_path:
+        threads.append(threading.Thread(target=post, daemon=True))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return poll_stats, post_stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load-test the Overcode web server")
+    parser.add_argument("--url", default="http://localhost:8080", help="Server base URL")
+    parser.add_argument("--pollers", "-n", type=int, default=10, help="Concurrent pollers")
+    parser.add_argument("--duration", "-d", type=float, default=10.0, help="Seconds to run")
+    parser.add_argument("--path", default="/api/status", help="Path each poller requests")
+    parser.add_argument("--post", dest="post_path", help="Control path to POST once a second")
+    parser.add_argument("--api-key", help="X-API-Key header value")
+    args = parser.parse_args()
+
+    print(f"{args.pollers} pollers -> {args.url}{args.path} for {args.duration:.0f}s")
+    poll_stats, post_stats = run_load_test(
+        args.url, args.pollers, args.duration, args.path, args.post_path, args.api_key,
+    )
+    print(poll_stats.summary(f"GET {args.path}", args.duration))
+    if post_stats is not None:
+        print(post_stats.summary(f"POST {args.post_path}", args.duration))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,13 +4,21 @@ Web server for Overcode dashboard and control API.
 Provides a mobile-optimized dashboard for monitoring agents (GET)
 and a control API for remote agent management (POST/PUT/DELETE).
 Uses Python stdlib http.server - no additional dependencies required.
+
+Requests are served concurrently (see OvercodeHTTPServer): one slow
+status or analytics request no longer holds up other dashboards, sister
+TUIs or control calls.
 """
 
 import json
+import math
 import sys
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from typing import Optional, Tuple
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Iterator, Optional, Tuple
 from urllib.parse import urlparse, parse_qs
 
 from .settings import (
@@ -18,11 +26,16 @@ from .settings import (
     get_web_server_port_path,
     ensure_session_dir,
 )
-from .config import get_web_api_key, get_web_allow_control
+from .config import (
+    get_web_api_key,
+    get_web_allow_control,
+    get_web_max_workers,
+    get_web_request_timeout,
+)
 from .pid_utils import is_process_running, stop_process
 from .web_templates import get_dashboard_html, get_analytics_html
 from .web_api import (
-    get_status_data,
+    PANE_CAPTURE_LINES,
     get_single_agent_status,
     get_timeline_data,
     get_raw_timeline_data,
@@ -34,6 +47,8 @@ from .web_api import (
     get_analytics_daily,
     get_time_presets,
 )
+from .web_status_feed import StatusProjection, format_event, get_status_feed
+from .web_encoding import MIN_COMPRESS_BYTES, choose_encoding, compress, compress_static, dumps_json
 
 
 # Route table: path -> method name on OvercodeHandler
@@ -53,6 +68,11 @@ _GET_ROUTES = {
     "/health": "_serve_health",
 }
 
+# Routes that hold their connection open; served outside the read slots
+_STREAM_ROUTES = {
+    "/api/stream": "_serve_stream",
+}
+
 # Control API route tables (POST/PUT/DELETE).
 # Fixed routes: (method, path) -> handler(api, ts, body)
 _FIXED_CONTROL_ROUTES = {
@@ -123,6 +143,188 @@ _AGENT_CONTROL_ROUTES = {
 }
 
 
+# Control requests handled at once; separate from the GET slots so that
+# a burst of status polls can't queue a control call
+CONTROL_WORKERS = 4
+
+# Open /api/stream connections at once (each holds a thread)
+STREAM_CLIENTS = 16
+# Seconds between keepalive comments on an idle stream
+STREAM_KEEPALIVE = 15.0
+# Long-polls (/api/status?wait=) held at once (each holds a thread)
+WAIT_CLIENTS = 16
+
+# Responses this large or this slow to serialize are logged even when
+# they are routine API polls
+EXPENSIVE_BODY_BYTES = 512 * 1024
+EXPENSIVE_ENCODE_SECONDS = 0.05
+_EXPENSIVE_MARK = "(expensive)"
+
+# Read and control requests holding their slot longer than this are
+# logged. Handlers aren't interrupted: a hung one keeps its slot until it
+# returns, so these lines are how a shrinking lane shows up.
+SLOW_HANDLER_SECONDS = 10.0
+
+
+class OvercodeHTTPServer(ThreadingHTTPServer):
+    """Thread-per-request HTTP server with bounded read and control lanes.
+
+    GET requests share ``max_workers`` slots; POST/PUT/DELETE have
+    CONTROL_WORKERS slots of their own, /api/stream connections
+    STREAM_CLIENTS and /api/status long-polls, while they wait for a
+    change, WAIT_CLIENTS. A request that can't get a slot
+    within ``request_timeout`` is answered with 503. The same timeout
+    bounds every socket read and write, so a stalled client can't hold
+    a slot indefinitely.
+
+    Handlers themselves have no time limit: one stuck in a call keeps
+    its slot until the call returns. Requests held past
+    SLOW_HANDLER_SECONDS are logged when they finish, and a 503 logs the
+    requests occupying its lane, oldest first.
+    """
+
+    daemon_threads = True
+    request_queue_size = 64
+
+    def __init__(
+        self,
+        server_address,
+        handler_class,
+        max_workers: Optional[int] = None,
+        request_timeout: Optional[float] = None,
+    ):
+        self.request_timeout = request_timeout if request_timeout is not None else get_web_request_timeout()
+        self.read_slots = threading.BoundedSemaphore(max_workers or get_web_max_workers())
+        self.control_slots = threading.BoundedSemaphore(CONTROL_WORKERS)
+        self.stream_slots = threading.BoundedSemaphore(STREAM_CLIENTS)
+        self.wait_slots = threading.BoundedSemaphore(WAIT_CLIENTS)
+        # id(handler) -> (lane, request line, monotonic start) of slot holders
+        self.slot_holders: dict = {}
+        self.slot_holders_lock = threading.Lock()
+        super().__init__(server_address, handler_class)
+
+
+def _parse_etags(header: Optional[str]) -> list:
+    """Entity tags listed in an If-None-Match header, unquoted (weak or strong)."""
+    if not header:
+        return []
+    tags = []
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        tags.append(tag.strip('"'))
+    return tags
+
+
+def _query_flag(handler, name: str) -> bool:
+    """Whether the request's query string sets ``name`` (e.g. ?pretty=1)."""
+    path = getattr(handler, "path", "")
+    if not isinstance(path, str):
+        return False
+    values = parse_qs(urlparse(path).query).get(name)
+    return bool(values) and values[-1].lower() not in ("0", "false", "no", "")
+
+
+def _write_body(
+    handler,
+    body: bytes,
+    content_type: str,
+    headers: dict,
+    status: int = 200,
+    encode_seconds: Optional[float] = None,
+    static: bool = False,
+) -> None:
+    """Send a complete response, compressed if the client accepts it.
+
+    Bodies under MIN_COMPRESS_BYTES go out as-is. ``static`` bodies (pages,
+    scripts) have their compressed form cached. The request is logged once
+    the body is written, with its size and ``encode_seconds``; API polls,
+    otherwise not logged, are when they were expensive to send.
+    """
+    encoding = None
+    if len(body) >= MIN_COMPRESS_BYTES:
+        encoding = choose_encoding(handler.headers.get("Accept-Encoding"))
+    sent = body
+    if encoding:
+        sent = (compress_static if static else compress)(body, encoding)
+
+    handler._body_pending = True
+    try:
+        handler.send_response(status)
+    finally:
+        handler._body_pending = False
+    handler.send_header("Content-Type", content_type)
+    handler.send_header("Content-Length", str(len(sent)))
+    if encoding:
+        handler.send_header("Content-Encoding", encoding)
+    if len(body) >= MIN_COMPRESS_BYTES:
+        handler.send_header("Vary", "Accept-Encoding")
+    for name, value in headers.items():
+        handler.send_header(name, value)
+    handler.end_headers()
+    handler.wfile.write(sent)
+
+    detail = f"{len(sent)}B"
+    if encoding:
+        detail += f" ({encoding}, {len(body)}B raw)"
+    if encode_seconds is not None:
+        detail += f" json {encode_seconds * 1000:.1f}ms"
+    if len(body) >= EXPENSIVE_BODY_BYTES or (encode_seconds or 0) >= EXPENSIVE_ENCODE_SECONDS:
+        detail += f" {_EXPENSIVE_MARK}"
+    handler.log_request(status, detail)
+
+
+def _log_slot_holders(server, lane: str) -> None:
+    """Log the requests occupying ``lane``, oldest first (after a 503)."""
+    holders = getattr(server, "slot_holders", None)
+    if holders is None:
+        return
+    now = time.monotonic()
+    with server.slot_holders_lock:
+        held = sorted(
+            (started, request) for held_lane, request, started in holders.values()
+            if held_lane == lane
+        )
+    for started, request in held:
+        sys.stderr.write(f"[web] {lane} slot held {now - started:.1f}s by {request}\n")
+
+
+@contextmanager
+def _request_slot(handler, lane: str) -> Iterator[bool]:
+    """Hold one of the server's ``lane`` ("read", "control", "stream" or "wait") slots.
+
+    Yields False when none came free within the request timeout. Servers
+    without lanes (a plain HTTPServer) always yield True. Read and control
+    slots held longer than SLOW_HANDLER_SECONDS are logged on release.
+    """
+    server = getattr(handler, "server", None)
+    slots = getattr(server, f"{lane}_slots", None)
+    if slots is None:
+        yield True
+        return
+    if not slots.acquire(timeout=getattr(server, "request_timeout", None)):
+        _log_slot_holders(server, lane)
+        yield False
+        return
+    request = getattr(handler, "requestline", "") or getattr(handler, "path", "")
+    started = time.monotonic()
+    holders = getattr(server, "slot_holders", None)
+    if holders is not None:
+        with server.slot_holders_lock:
+            holders[id(handler)] = (lane, request, started)
+    try:
+        yield True
+    finally:
+        if holders is not None:
+            with server.slot_holders_lock:
+                holders.pop(id(handler), None)
+        held = time.monotonic() - started
+        if lane in ("read", "control") and held >= SLOW_HANDLER_SECONDS:
+            sys.stderr.write(f"[web] slow {lane} handler: {request} held its slot {held:.1f}s\n")
+        slots.release()
+
+
 class OvercodeHandler(BaseHTTPRequestHandler):
     """HTTP request handler for overcode dashboard.
 
@@ -132,6 +334,11 @@ class OvercodeHandler(BaseHTTPRequestHandler):
     # Set by run_server before starting
     tmux_session: str = "agents"
 
+    def setup(self) -> None:
+        # Socket timeout for this request (StreamRequestHandler applies it)
+        self.timeout = getattr(self.server, "request_timeout", None)
+        super().setup()
+
     def do_GET(self) -> None:
         """Handle GET requests."""
         api_key = get_web_api_key()
@@ -145,20 +352,53 @@ class OvercodeHandler(BaseHTTPRequestHandler):
         path = parsed.path
         query = parse_qs(parsed.query)
 
-        handler_name = _GET_ROUTES.get(path)
-        if handler_name:
-            getattr(self, handler_name)(query)
+        stream_name = _STREAM_ROUTES.get(path)
+        if stream_name:
+            with _request_slot(self, "stream") as acquired:
+                if not acquired:
+                    self.send_error(503, "Too many streams, try again")
+                    return
+                getattr(self, stream_name)(query)
             return
 
-        # Dynamic route: /api/agents/{name}/status
-        if path.startswith("/api/agents/") and path.endswith("/status"):
-            name = path.split("/")[3]
-            agent_data = get_single_agent_status(self.tmux_session, name)
-            if agent_data is not None:
-                self._serve_json(agent_data)
-            else:
-                self.send_error(404, f"Agent '{name}' not found")
-            return
+        # Long-polls wait for the next status generation in a lane of
+        # their own before taking a read slot, so held connections don't
+        # starve other requests
+        if path == "/api/status" and "wait" in query:
+            with _request_slot(self, "wait") as acquired:
+                if not acquired:
+                    self.send_error(503, "Too many long-polls, try again")
+                    return
+                if not self._wait_for_status_change(query):
+                    return
+
+        with _request_slot(self, "read") as acquired:
+            if not acquired:
+                self.send_error(503, "Server busy, try again")
+                return
+
+            handler_name = _GET_ROUTES.get(path)
+            if handler_name:
+                getattr(self, handler_name)(query)
+                return
+
+            # Dynamic route: /api/agents/{name}/status
+            if path.startswith("/api/agents/") and path.endswith("/status"):
+                name = path.split("/")[3]
+                try:
+                    projection = StatusProjection.from_query(query)
+                except ValueError as e:
+                    self.send_error(400, f"Bad query: {e}")
+                    return
+                agent_data = get_single_agent_status(
+                    self.tmux_session, name, include_pane=projection.include_pane,
+                    pane_lines=projection.pane_lines or PANE_CAPTURE_LINES,
+                )
+                if agent_data is not None:
+                    self._serve_json(projection.project_agent(agent_data))
+                else:
+                    self.send_error(404, f"Agent '{name}' not found")
+                return
 
         self.send_error(404, "Not Found")
 
@@ -185,13 +425,7 @@ class OvercodeHandler(BaseHTTPRequestHandler):
     def _serve_content(self, content: str, content_type: str = "text/html; charset=utf-8", cache_control: str = "no-cache") -> None:
         """Serve string content with given content type and cache headers."""
         try:
-            content_bytes = content.encode("utf-8")
-            self.send_response(200)
-            self.send_header("Content-Type", content_type)
-            self.send_header("Content-Length", str(len(content_bytes)))
-            self.send_header("Cache-Control", cache_control)
-            self.end_headers()
-            self.wfile.write(content_bytes)
+            _write_body(self, content.encode("utf-8"), content_type, {"Cache-Control": cache_control}, static=True)
         except Exception as e:
             self.send_error(500, f"Internal error: {e}")
 
@@ -208,8 +442,97 @@ class OvercodeHandler(BaseHTTPRequestHandler):
         from .web_chartjs import CHARTJS_JS
         self._serve_content(CHARTJS_JS, "application/javascript", "public, max-age=31536000")
 
+    def _wait_for_status_change(self, query) -> bool:
+        """Long-poll: hold the request until the status document changes.
+
+        Waits on the generation the client already has (?since= or
+        If-None-Match); without one there is nothing to wait for.
+
+        Returns:
+            False if the request was answered with 400 (``wait`` not a
+            finite, non-negative number of seconds)
+        """
+        try:
+            wait = float(query["wait"][0])
+        except (ValueError, IndexError):
+            wait = math.nan
+        if not math.isfinite(wait) or wait < 0:
+            self.send_error(400, "Bad query: wait must be a non-negative number of seconds")
+            return False
+        tags = _parse_etags(self.headers.get("If-None-Match"))
+        generation = query.get("since", [None])[0] or (tags[0] if tags else None)
+        if generation is None:
+            return True
+        try:
+            projection = StatusProjection.from_query(query)
+        except ValueError:
+            return True  # _serve_api_status reports it
+        get_status_feed(self.tmux_session, projection.include_pane).wait_for_change(generation, wait)
+        return True
+
     def _serve_api_status(self, query) -> None:
-        self._serve_json(get_status_data(self.tmux_session))
+        """Serve the (projected) status document, or a 304 / delta against a
+        known generation."""
+        try:
+            projection = StatusProjection.from_query(query)
+        except ValueError as e:
+            self.send_error(400, f"Bad query: {e}")
+            return
+        feed = get_status_feed(self.tmux_session, projection.include_pane)
+        snapshot = feed.current()
+        if snapshot.generation in _parse_etags(self.headers.get("If-None-Match")):
+            self._send_not_modified(snapshot.etag)
+            return
+        since = query.get("since", [None])[0]
+        previous = feed.get(since) if since else None
+        if previous is not None:
+            data = feed.delta(previous, snapshot, projection)
+        else:
+            data = dict(projection.apply(snapshot.document), generation=snapshot.generation)
+        self._serve_json(data, headers={"ETag": snapshot.etag})
+
+    def _serve_stream(self, query) -> None:
+        """Push status changes as Server-Sent Events until the client goes away.
+
+        Sends a ``snapshot`` event with the full document (or, when the
+        client resumes with Last-Event-ID / ?since= naming a retained
+        generation, a ``delta`` from it), then a ``delta`` event per new
+        generation. Each event's id is its generation. Takes the same
+        projection parameters as /api/status.
+        """
+        try:
+            projection = StatusProjection.from_query(query)
+        except ValueError as e:
+            self.send_error(400, f"Bad query: {e}")
+            return
+        feed = get_status_feed(self.tmux_session, projection.include_pane)
+        last_id = self.headers.get("Last-Event-ID") or query.get("since", [None])[0]
+        previous = feed.get(last_id) if last_id else None
+        snapshot = feed.current()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        try:
+            if previous is None:
+                document = dict(projection.apply(snapshot.document), generation=snapshot.generation)
+                self.wfile.write(format_event("snapshot", document, snapshot.generation))
+            elif previous.generation != snapshot.generation:
+                self.wfile.write(format_event("delta", feed.delta(previous, snapshot, projection), snapshot.generation))
+            self.wfile.flush()
+            while True:
+                latest = feed.wait_for_change(snapshot.generation, STREAM_KEEPALIVE)
+                if latest.generation == snapshot.generation:
+                    self.wfile.write(b": keepalive\n\n")
+                else:
+                    self.wfile.write(format_event("delta", feed.delta(snapshot, latest, projection), latest.generation))
+                    snapshot = latest
+                self.wfile.flush()
+        except OSError:
+            # Client disconnected (or stopped reading past the socket timeout)
+            return
 
     def _serve_analytics_sessions(self, query) -> None:
         start, end = self._parse_time_range(query)
@@ -242,21 +565,26 @@ class OvercodeHandler(BaseHTTPRequestHandler):
     def _serve_health(self, query) -> None:
         self._serve_json(get_health_data())
 
-    def _serve_json(self, data) -> None:
-        """Serve JSON data."""
+    def _serve_json(self, data, headers: Optional[dict] = None) -> None:
+        """Serve JSON data (indented with ?pretty=1), with any extra response headers."""
         try:
-            body = json.dumps(data, indent=2, default=str)
-            body_bytes = body.encode("utf-8")
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.send_header("Content-Length", str(len(body_bytes)))
-            self.send_header("Access-Control-Allow-Origin", "*")
-            self.send_header("Cache-Control", "no-cache")
-            self.end_headers()
-            self.wfile.write(body_bytes)
+            body, encode_seconds = dumps_json(data, pretty=_query_flag(self, "pretty"))
+            _write_body(
+                self, body, "application/json",
+                {"Access-Control-Allow-Origin": "*", "Cache-Control": "no-cache", **(headers or {})},
+                encode_seconds=encode_seconds,
+            )
         except Exception as e:
             self.send_error(500, f"Internal error: {e}")
 
+    def _send_not_modified(self, etag: str) -> None:
+        """304: the client's copy (identified by ``etag``) is current."""
+        self.send_response(304)
+        self.send_header("ETag", etag)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+
     # -----------------------------------------------------------------
     # Control API (POST / PUT / DELETE)
     # -----------------------------------------------------------------
@@ -292,13 +620,11 @@ class OvercodeHandler(BaseHTTPRequestHandler):
 
     def _send_json_response(self, data: dict, status: int = 200) -> None:
         """Send a JSON response with the given status code."""
-        body = json.dumps(data, default=str).encode("utf-8")
-        self.send_response(status)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(body)))
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.end_headers()
-        self.wfile.write(body)
+        body, encode_seconds = dumps_json(data)
+        _write_body(
+            self, body, "application/json", {"Access-Control-Allow-Origin": "*"},
+            status=status, encode_seconds=encode_seconds,
+        )
 
     def _send_json_error(self, status: int, message: str) -> None:
         """Send a JSON error response."""
@@ -320,13 +646,17 @@ class OvercodeHandler(BaseHTTPRequestHandler):
         if body is None:
             return  # Error already sent
 
-        try:
-            result = self._dispatch_control(method, path, body)
-            self._send_json_response(result)
-        except ControlError as e:
-            self._send_json_error(e.status, str(e))
-        except Exception as e:
-            self._send_json_error(500, f"Internal error: {e}")
+        with _request_slot(self, "control") as acquired:
+            if not acquired:
+                self._send_json_error(503, "Server busy, try again")
+                return
+            try:
+                result = self._dispatch_control(method, path, body)
+                self._send_json_response(result)
+            except ControlError as e:
+                self._send_json_error(e.status, str(e))
+            except Exception as e:
+                self._send_json_error(500, f"Internal error: {e}")
 
     def _dispatch_control(self, method: str, path: str, body: dict) -> dict:
         """Dispatch a control request to the appropriate handler."""
@@ -357,7 +687,8 @@ class OvercodeHandler(BaseHTTPRequestHandler):
         self.send_response(204)
         self.send_header("Access-Control-Allow-Origin", "*")
         self.send_header("Access-Control-Allow-Methods", "GET, POST, PUT, DELETE, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type, X-API-Key")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type, X-API-Key, If-None-Match")
+        self.send_header("Access-Control-Expose-Headers", "ETag")
         self.send_header("Access-Control-Max-Age", "86400")
         self.end_headers()
 
@@ -373,15 +704,28 @@ class OvercodeHandler(BaseHTTPRequestHandler):
         """Handle DELETE requests (control API)."""
         self._route_control("DELETE")
 
+    def log_request(self, code="-", size="-") -> None:
+        """Log the request; responses with a body are logged by _write_body once sent."""
+        if getattr(self, "_body_pending", False):
+            return
+        super().log_request(code, size)
+
     def log_message(self, format: str, *args) -> None:
         """Custom log format - less verbose than default."""
         # Only log errors and important requests, not every poll
         if args and len(args) >= 2:
             status = str(args[1])
             path = str(args[0])
-            # Don't log successful API polls
-            if status.startswith("2") and "/api/" in path:
+            detail = str(args[2]) if len(args) >= 3 else ""
+            # Don't log successful or unchanged API polls, unless they were
+            # expensive to send
+            if (status.startswith("2") or status == "304") and "/api/" in path \
+                    and not detail.endswith(_EXPENSIVE_MARK):
                 return
+            if detail in ("", "-"):
+                args = args[:2]
+            sys.stderr.write(f"[web] {' '.join(str(arg) for arg in args)}\n")
+            return
         sys.stderr.write(f"[web] {args[0] if args else format}\n")
 
 
@@ -414,7 +758,7 @@ def run_server(
     server_address = (host, port)
 
     try:
-        server = HTTPServer(server_address, OvercodeHandler)
+        server = OvercodeHTTPServer(server_address, OvercodeHandler)
     except OSError as e:
         if "Address already in use" in str(e):
             print(f"Error: Port {port} is already in use. Try a different port with --port")
@@ -575,7 +919,6 @@ def start_web_server(session: str, port: int | None = None, host: str | None = N
         return False, f"Failed to start: {e}"
 
     # Wait briefly for the server to start
-    import time
     for i in range(10):
         time.sleep(0.1)
         if is_web_server_running(session):
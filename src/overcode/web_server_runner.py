@@ -12,7 +12,6 @@ import signal
 import sys
 import traceback
 from datetime import datetime
-from http.server import HTTPServer
 from pathlib import Path
 
 
@@ -75,13 +74,13 @@ def main():
         signal.signal(signal.SIGINT, cleanup)
 
         # Import here to avoid circular imports
-        from .web_server import OvercodeHandler
+        from .web_server import OvercodeHandler, OvercodeHTTPServer
 
         OvercodeHandler.tmux_session = session
 
         server_address = (host, port)
         log(session, f"Creating HTTP server at {server_address}")
-        server = HTTPServer(server_address, OvercodeHandler)
+        server = OvercodeHTTPServer(server_address, OvercodeHandler)
         log(session, "Server created, starting serve_forever()")
 
         # Redirect stdout/stderr AFTER setup is complete
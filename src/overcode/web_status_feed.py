@@ -0,0 +1,456 @@
+"""
+Generation-tracked /api/status documents.
+
+Dashboards, sister TUIs and the relay used to get a freshly built status
+document on every poll: the daemon state reparsed, git sampled for agents
+without a stats snapshot, and up to PANE_CAPTURE_LINES of pane text per
+agent sent again even when nothing had changed.
+
+StatusFeed builds the document once per change to the daemon's published
+files (its state file and pane store) and numbers each distinct document
+with a generation. The web server uses the generation as the ETag (a poll
+with a matching If-None-Match gets 304), to answer ``?since=<generation>``
+with only what changed (see status_delta / apply_status_delta), and to
+hold long-polls until the next generation. /api/stream pushes the same
+deltas as Server-Sent Events (format_event / read_events) as each
+generation appears.
+
+Callers that need less than the full document describe it with a
+StatusProjection (``fields=``, ``agents=``, ``include_pane=``,
+``pane_lines=``). Projections without pane content are served from a
+separate feed whose builds skip reading and capturing panes altogether.
+
+A document is also rebuilt once it is STATUS_MAX_AGE old, so a stopped
+daemon is still reported as such; a rebuild that produces the same
+document keeps its generation.
+"""
+
+import json
+import math
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, Optional, Tuple
+
+from .settings import get_monitor_daemon_state_path, get_pane_store_path
+
+# Rebuild a document at least this often (seconds), matching the daemon tick
+STATUS_MAX_AGE = 10.0
+# Previous documents kept for ?since= deltas
+STATUS_HISTORY = 12
+# How often a long-poll checks for a new generation (seconds)
+WAIT_POLL_INTERVAL = 0.25
+# Longest a long-poll is held (seconds)
+MAX_WAIT = 25.0
+
+# Top-level keys that change on every build and don't make a new generation
+_VOLATILE_KEYS = ("timestamp",)
+
+_StatKey = Tuple[Optional[Tuple[int, int, int]], ...]
+
+
+@dataclass(frozen=True)
+class StatusSnapshot:
+    """One generation of the status document."""
+
+    generation: str
+    document: Dict[str, Any]
+    built_at: float
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.generation}"'
+
+
+def _stat_key(path) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _build_status(tmux_session: str, include_pane: bool = True) -> Dict[str, Any]:
+    from .web_api import get_status_data
+    return get_status_data(tmux_session, include_pane=include_pane)
+
+
+_FALSE_VALUES = ("0", "false", "no", "off")
+
+
+def _query_list(query: Dict[str, list], name: str) -> Optional[FrozenSet[str]]:
+    """Comma-separated (or repeated) query values; None if the parameter is absent."""
+    if name not in query:
+        return None
+    return frozenset(v.strip() for value in query[name] for v in value.split(",") if v.strip())
+
+
+@dataclass(frozen=True)
+class StatusProjection:
+    """The part of a status document a caller asked for.
+
+    ``fields`` limits each agent to those keys (``name`` is always kept),
+    ``agents`` limits the agents by name, and ``pane_lines`` trims pane
+    content to its last lines. The default projection is the full document.
+    """
+
+    fields: Optional[FrozenSet[str]] = None
+    agents: Optional[FrozenSet[str]] = None
+    include_pane: bool = True
+    pane_lines: Optional[int] = None
+
+    @classmethod
+    def from_query(cls, query: Dict[str, list]) -> "StatusProjection":
+        """Parse ``fields=``, ``agents=``, ``include_pane=`` and ``pane_lines=``.
+
+        Raises:
+            ValueError: if pane_lines isn't a non-negative integer
+        """
+        fields = _query_list(query, "fields")
+        include_pane = query.get("include_pane", ["1"])[0].lower() not in _FALSE_VALUES
+        pane_lines = None
+        if "pane_lines" in query:
+            pane_lines = int(query["pane_lines"][0])
+            if pane_lines < 0:
+                raise ValueError("pane_lines must be >= 0")
+            if pane_lines == 0:
+                include_pane = False
+        if fields is not None:
+            if "pane_content" not in fields:
+                include_pane = False
+            elif not include_pane:
+                fields = fields - {"pane_content"}
+            fields = fields | {"name"}
+        return cls(fields, _query_list(query, "agents"), include_pane,
+                   pane_lines if include_pane else None)
+
+    @property
+    def is_full(self) -> bool:
+        return self == StatusProjection()
+
+    def project_agent(self, agent: Dict[str, Any]) -> Dict[str, Any]:
+        if self.fields is not None:
+            agent = {k: v for k, v in agent.items() if k in self.fields}
+        elif not self.include_pane and "pane_content" in agent:
+            agent = {k: v for k, v in agent.items() if k != "pane_content"}
+        if self.pane_lines is not None and isinstance(agent.get("pane_content"), str):
+            lines = agent["pane_content"].split("\n")
+            if len(lines) > self.pane_lines:
+                agent = dict(agent, pane_content="\n".join(lines[-self.pane_lines:]))
+        return agent
+
+    def apply(self, document: Dict[str, Any]) -> Dict[str, Any]:
+        """The projected copy of a status document (the input is not modified)."""
+        if self.is_full:
+            return document
+        agents = document.get("agents", [])
+        if self.agents is not None:
+            agents = [a for a in agents if a.get("name") in self.agents]
+        return dict(document, agents=[self.project_agent(a) for a in agents])
+
+
+def _comparable(document: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in document.items() if k not in _VOLATILE_KEYS}
+
+
+class StatusFeed:
+    """Status documents for one tmux session, rebuilt only on change."""
+
+    def __init__(
+        self,
+        tmux_session: str,
+        build: Optional[Callable[[str], Dict[str, Any]]] = None,
+        include_pane: bool = True,
+        max_age: float = STATUS_MAX_AGE,
+        history: int = STATUS_HISTORY,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.tmux_session = tmux_session
+        self.include_pane = include_pane
+        self._build = build or (lambda ts: _build_status(ts, include_pane))
+        self._max_age = max_age
+        self._history_size = history
+        self._clock = clock
+        self._paths = (
+            get_monitor_daemon_state_path(tmux_session),
+            get_pane_store_path(tmux_session),
+        )
+        # Distinguishes generations of this process from an earlier server's
+        self._epoch = uuid.uuid4().hex[:8]
+        self._counter = 0
+        self._source: Optional[_StatKey] = None
+        self._current: Optional[StatusSnapshot] = None
+        self._history: "OrderedDict[str, StatusSnapshot]" = OrderedDict()
+        self._deltas: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _source_key(self) -> _StatKey:
+        return tuple(_stat_key(path) for path in self._paths)
+
+    def current(self) -> StatusSnapshot:
+        """The latest document, rebuilding it if the daemon published since."""
+        source = self._source_key()
+        with self._lock:
+            current = self._current
+            if (
+                current is not None
+                and source == self._source
+                and self._clock() - current.built_at < self._max_age
+            ):
+                return current
+            document = self._build(self.tmux_session)
+            self._source = source
+            if current is not None and _comparable(document) == _comparable(current.document):
+                # Same content: keep the generation, refresh the build time
+                snapshot = StatusSnapshot(current.generation, current.document, self._clock())
+            else:
+                self._counter += 1
+                snapshot = StatusSnapshot(f"{self._epoch}-{self._counter}", document, self._clock())
+            self._current = snapshot
+            self._history[snapshot.generation] = snapshot
+            self._history.move_to_end(snapshot.generation)
+            while len(self._history) > self._history_size:
+                self._history.popitem(last=False)
+            return snapshot
+
+    def get(self, generation: str) -> Optional[StatusSnapshot]:
+        """A retained earlier generation, or None if unknown or evicted."""
+        with self._lock:
+            return self._history.get(generation)
+
+    def delta(
+        self,
+        old: StatusSnapshot,
+        new: StatusSnapshot,
+        projection: Optional[StatusProjection] = None,
+    ) -> Dict[str, Any]:
+        """status_delta(old, new) of the projected documents, computed once
+        for all clients asking for it."""
+        projection = projection or StatusProjection()
+        key = (old.generation, new.generation, projection)
+        with self._lock:
+            cached = self._deltas.get(key)
+        if cached is not None:
+            return cached
+        if not projection.is_full:
+            old = StatusSnapshot(old.generation, projection.apply(old.document), old.built_at)
+            new = StatusSnapshot(new.generation, projection.apply(new.document), new.built_at)
+        delta = status_delta(old, new)
+        with self._lock:
+            self._deltas[key] = delta
+            while len(self._deltas) > self._history_size:
+                self._deltas.popitem(last=False)
+        return delta
+
+    def wait_for_change(self, generation: Optional[str], timeout: float) -> StatusSnapshot:
+        """Block until the generation differs from ``generation`` or ``timeout`` passes.
+
+        Returns the latest snapshot either way. A timeout that isn't a
+        finite number waits MAX_WAIT.
+        """
+        if not math.isfinite(timeout):
+            timeout = MAX_WAIT
+        deadline = self._clock() + min(timeout, MAX_WAIT)
+        while True:
+            snapshot = self.current()
+            remaining = deadline - self._clock()
+            if snapshot.generation != generation or remaining <= 0:
+                return snapshot
+            time.sleep(min(WAIT_POLL_INTERVAL, remaining))
+
+
+def _diff(old: Any, new: Any) -> Any:
+    """Changed parts of ``new`` relative to ``old`` (dicts are diffed by key).
+
+    Keys missing from ``new`` are reported as None.
+    """
+    changed = {}
+    for key, value in new.items():
+        previous = old.get(key)
+        if isinstance(value, dict) and isinstance(previous, dict):
+            nested = _diff(previous, value)
+            if nested:
+                changed[key] = nested
+        elif key not in old or previous != value:
+            changed[key] = value
+    for key in old:
+        if key not in new:
+            changed[key] = None
+    return changed
+
+
+def _merge(old: Dict[str, Any], changes: Dict[str, Any]) -> Dict[str, Any]:
+    merged = dict(old)
+    for key, value in changes.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def pane_diff(old: str, new: str) -> Optional[Dict[str, Any]]:
+    """Encode ``new`` pane text as an edit of ``old``, or None if that isn't shorter.
+
+    Pane tails mostly scroll: lines leave the top, new output arrives above
+    a footer (prompt, status bar) that stays put. The edit is
+    ``new = old[drop:drop + keep] + lines + old[len(old) - tail:]``, with
+    ``drop`` chosen to maximise ``keep``.
+    """
+    old_lines, new_lines = old.split("\n"), new.split("\n")
+    best_drop, best_keep = 0, 0
+    for drop in range(len(old_lines)):
+        if old_lines[drop] != new_lines[0]:
+            continue
+        keep = 0
+        limit = min(len(old_lines) - drop, len(new_lines))
+        while keep < limit and old_lines[drop + keep] == new_lines[keep]:
+            keep += 1
+        if keep > best_keep:
+            best_drop, best_keep = drop, keep
+    rest_old = old_lines[best_drop + best_keep:]
+    rest_new = new_lines[best_keep:]
+    tail = 0
+    while (
+        tail < min(len(rest_old), len(rest_new))
+        and rest_old[len(rest_old) - 1 - tail] == rest_new[len(rest_new) - 1 - tail]
+    ):
+        tail += 1
+    lines = rest_new[:len(rest_new) - tail]
+    if best_keep + tail == 0:
+        return None
+    return {"drop": best_drop, "keep": best_keep, "lines": lines, "tail": tail}
+
+
+def apply_pane_diff(old: str, diff: Dict[str, Any]) -> str:
+    """Rebuild the pane text encoded by pane_diff()."""
+    old_lines = old.split("\n")
+    drop, keep, tail = diff["drop"], diff["keep"], diff["tail"]
+    kept_tail = old_lines[len(old_lines) - tail:] if tail else []
+    return "\n".join(old_lines[drop:drop + keep] + list(diff["lines"]) + kept_tail)
+
+
+def _agent_delta(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    changed = _diff(old, new)
+    if isinstance(changed.get("pane_content"), str) and isinstance(old.get("pane_content"), str):
+        diff = pane_diff(old["pane_content"], changed["pane_content"])
+        if diff is not None:
+            del changed["pane_content"]
+            changed["pane_diff"] = diff
+    return changed
+
+
+def status_delta(old: StatusSnapshot, new: StatusSnapshot) -> Dict[str, Any]:
+    """What changed between two status documents.
+
+    Agents are matched by name. The result carries the changed top-level
+    fields, the changed fields of each agent (pane text as a pane_diff()
+    under ``pane_diff``), each agent's status transition, the agents that
+    went away and the current agent order.
+    """
+    old_doc, new_doc = old.document, new.document
+    old_agents = {a.get("name"): a for a in old_doc.get("agents", [])}
+    new_agents = {a.get("name"): a for a in new_doc.get("agents", [])}
+
+    agents = {}
+    transitions = []
+    for name, agent in new_agents.items():
+        previous = old_agents.get(name)
+        changed = _agent_delta(previous, agent) if previous is not None else agent
+        if changed:
+            agents[name] = changed
+        if "status" in changed:
+            transitions.append({
+                "name": name,
+                "from": previous.get("status") if previous is not None else None,
+                "to": agent.get("status"),
+            })
+
+    return {
+        "delta": True,
+        "since": old.generation,
+        "generation": new.generation,
+        "changed": _diff(
+            {k: v for k, v in old_doc.items() if k != "agents"},
+            {k: v for k, v in new_doc.items() if k != "agents"},
+        ),
+        "agents": agents,
+        "transitions": transitions,
+        "removed": [name for name in old_agents if name not in new_agents],
+        "order": list(new_agents),
+    }
+
+
+def apply_status_delta(document: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply a status_delta() result to the document it was taken against."""
+    result = _merge({k: v for k, v in document.items() if k != "agents"}, delta.get("changed", {}))
+    agents = {a.get("name"): a for a in document.get("agents", [])}
+    for name in delta.get("removed", []):
+        agents.pop(name, None)
+    for name, changes in delta.get("agents", {}).items():
+        if name not in agents:
+            agents[name] = changes
+            continue
+        if "pane_diff" in changes:
+            changes = dict(changes)
+            diff = changes.pop("pane_diff")
+            changes["pane_content"] = apply_pane_diff(agents[name].get("pane_content", ""), diff)
+        agents[name] = _merge(agents[name], changes)
+    result["agents"] = [agents[name] for name in delta.get("order", agents) if name in agents]
+    result["generation"] = delta.get("generation")
+    return result
+
+
+def format_event(event: str, data: Dict[str, Any], event_id: Optional[str] = None) -> bytes:
+    """One Server-Sent Events message."""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, separators=(',', ':'), default=str)}")
+    return ("\n".join(lines) + "\n\n").encode("utf-8")
+
+
+def read_events(stream: Iterable[bytes]) -> Iterator[Tuple[str, Optional[str], Dict[str, Any]]]:
+    """Parse a Server-Sent Events byte stream into (event, id, data) tuples.
+
+    Comments (keepalives) and events whose data isn't JSON are skipped.
+    """
+    event, event_id, data = "message", None, []
+    for raw in stream:
+        line = raw.decode("utf-8").rstrip("\r\n")
+        if not line:
+            if data:
+                try:
+                    yield event, event_id, json.loads("\n".join(data))
+                except json.JSONDecodeError:
+                    pass
+            event, event_id, data = "message", None, []
+        elif line.startswith(":"):
+            continue
+        else:
+            name, _, value = line.partition(":")
+            value = value[1:] if value.startswith(" ") else value
+            if name == "event":
+                event = value
+            elif name == "id":
+                event_id = value
+            elif name == "data":
+                data.append(value)
+
+
+_feeds: Dict[Tuple[str, bool], StatusFeed] = {}
+_feeds_lock = threading.Lock()
+
+
+def get_status_feed(tmux_session: str, include_pane: bool = True) -> StatusFeed:
+    """The process-wide StatusFeed for a tmux session, with or without panes."""
+    key = (tmux_session, include_pane)
+    with _feeds_lock:
+        feed = _feeds.get(key)
+        if feed is None:
+            feed = _feeds[key] = StatusFeed(tmux_session, include_pane=include_pane)
+        return feed
@@ -67,3 +67,12 @@ def isolated_state_dir(request):
             os.environ.pop("OVERCODE_STATE_DIR", None)
         else:
             os.environ["OVERCODE_STATE_DIR"] = orig_state_dir
+
+
+@pytest.fixture(autouse=True)
+def isolated_pane_store(tmp_path, monkeypatch):
+    """Keep the daemon's published pane store out of /dev/shm during tests."""
+    monkeypatch.setattr(
+        "overcode.pane_store.get_pane_store_path",
+        lambda session: tmp_path / "pane_store" / session / "panes.json",
+    )
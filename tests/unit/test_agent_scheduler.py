@@ -0,0 +1,94 @@
+"""Tests for per-agent detection scheduling."""
+
+from overcode.agent_scheduler import DAEMON_CADENCES, AgentScheduler
+from overcode.status_constants import (
+    STATUS_ASLEEP,
+    STATUS_RUNNING,
+    STATUS_WAITING_USER,
+)
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_scheduler():
+    clock = FakeClock()
+    return AgentScheduler(DAEMON_CADENCES, clock=clock), clock
+
+
+class TestAgentScheduler:
+
+    def test_unknown_agents_are_due(self):
+        scheduler, _ = make_scheduler()
+        assert scheduler.due(["a", "b"]) == {"a", "b"}
+
+    def test_cadence_follows_status(self):
+        scheduler, clock = make_scheduler()
+        scheduler.observe("run", STATUS_RUNNING)
+        scheduler.observe("wait", STATUS_WAITING_USER)
+        scheduler.observe("sleep", STATUS_ASLEEP)
+        ids = ["run", "wait", "sleep"]
+
+        assert scheduler.due(ids) == {"run"}
+        scheduler.observe("run", STATUS_RUNNING)
+
+        clock.now += DAEMON_CADENCES[STATUS_WAITING_USER]
+        assert scheduler.due(ids) == {"run", "wait"}
+
+        clock.now += DAEMON_CADENCES[STATUS_ASLEEP]
+        assert scheduler.due(ids) == {"run", "wait", "sleep"}
+
+    def test_due_agents_stay_due_until_observed(self):
+        scheduler, clock = make_scheduler()
+        scheduler.observe("a", STATUS_WAITING_USER)
+        clock.now += 60
+        assert scheduler.due(["a"]) == {"a"}
+        assert scheduler.due(["a"]) == {"a"}
+        scheduler.observe("a", STATUS_WAITING_USER)
+        assert scheduler.due(["a"]) == set()
+
+    def test_bump(self):
+        scheduler, _ = make_scheduler()
+        for sid in ("a", "b", "c"):
+            scheduler.observe(sid, STATUS_ASLEEP)
+
+        scheduler.bump(["a"])
+        assert scheduler.due(["a", "b", "c"]) == {"a"}
+        scheduler.bump_all()
+        assert scheduler.due(["a", "b", "c"]) == {"a", "b", "c"}
+
+    def test_bumped_entry_is_not_resurrected_by_old_heap_entry(self):
+        scheduler, clock = make_scheduler()
+        scheduler.observe("a", STATUS_WAITING_USER)
+        scheduler.bump(["a"])
+        assert scheduler.due(["a"]) == {"a"}
+        scheduler.observe("a", STATUS_ASLEEP)
+
+        # The superseded 30s entry surfaces but doesn't make "a" due
+        clock.now += 31
+        assert scheduler.due(["a"]) == set()
+
+    def test_status_change_without_detection_makes_due(self):
+        scheduler, _ = make_scheduler()
+        scheduler.observe("a", STATUS_WAITING_USER)
+        scheduler.observe("a", STATUS_WAITING_USER)
+        assert scheduler.due(["a"]) == set()
+
+        scheduler.observe("a", STATUS_ASLEEP)
+        assert scheduler.due(["a"]) == {"a"}
+
+    def test_forget(self):
+        scheduler, clock = make_scheduler()
+        scheduler.observe("a", STATUS_WAITING_USER)
+        scheduler.observe("b", STATUS_WAITING_USER)
+        scheduler.forget(["b"])
+
+        assert scheduler.due(["a", "b"]) == {"a"}
+        clock.now += 60
+        assert scheduler.due(["b"]) == {"b"}
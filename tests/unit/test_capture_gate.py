@@ -0,0 +1,115 @@
+"""Tests for activity-gated pane capture."""
+
+import time
+from unittest.mock import patch
+
+from overcode.capture_gate import PaneCaptureGate
+from overcode.interfaces import MockTmux
+from overcode.status_detector import PollingStatusDetector
+from tests.fixtures import create_mock_session
+
+
+class CountingTmux(MockTmux):
+    """MockTmux that records capture_panes calls and fakes fingerprints."""
+
+    def __init__(self):
+        super().__init__()
+        self.captured: list = []
+        self.fingerprints: dict = {}
+
+    def capture_panes(self, session, windows, lines=100):
+        self.captured.append(list(windows))
+        return super().capture_panes(session, windows, lines)
+
+    def pane_fingerprints(self, session):
+        return dict(self.fingerprints)
+
+
+def _tmux(**panes):
+    tmux = CountingTmux()
+    tmux.new_session("agents")
+    for window, content in panes.items():
+        tmux.set_pane_content("agents", window, content)
+        tmux.fingerprints[window] = f"%{window} 10 0,5 {int(time.time()) - 60}"
+    return tmux
+
+
+class TestPaneCaptureGate:
+
+    def test_unchanged_panes_are_not_recaptured(self):
+        tmux = _tmux(w1="one", w2="two")
+        gate = PaneCaptureGate("agents")
+
+        contents, unchanged = gate.capture(tmux, ["w1", "w2"], 50)
+        assert contents == {"w1": "one", "w2": "two"}
+        assert unchanged == set()
+
+        tmux.fingerprints["w2"] = f"%w2 11 0,6 {int(time.time()) - 30}"
+        tmux.set_pane_content("agents", "w2", "two more")
+        contents, unchanged = gate.capture(tmux, ["w1", "w2"], 50)
+        assert contents == {"w1": "one", "w2": "two more"}
+        assert unchanged == {"w1"}
+        assert tmux.captured == [["w1", "w2"], ["w2"]]
+
+    def test_recent_activity_is_not_trusted(self):
+        tmux = _tmux(w1="one")
+        tmux.fingerprints["w1"] = f"%w1 10 0,5 {int(time.time())}"
+        gate = PaneCaptureGate("agents")
+
+        gate.capture(tmux, ["w1"], 50)
+        _, unchanged = gate.capture(tmux, ["w1"], 50)
+
+        assert unchanged == set()
+        assert len(tmux.captured) == 2
+
+    def test_different_depth_is_recaptured(self):
+        tmux = _tmux(w1="one")
+        gate = PaneCaptureGate("agents")
+
+        gate.capture(tmux, ["w1"], 50)
+        _, unchanged = gate.capture(tmux, ["w1"], 200)
+
+        assert unchanged == set()
+
+    def test_missing_window_and_no_fingerprints(self):
+        tmux = _tmux(w1="one")
+        gate = PaneCaptureGate("agents")
+
+        contents, _ = gate.capture(tmux, ["w1", "gone"], 50)
+        assert contents["gone"] is None
+
+        # Fingerprint query failed: everything is captured
+        tmux.fingerprints = {}
+        _, unchanged = gate.capture(tmux, ["w1"], 50)
+        assert unchanged == set()
+
+
+class TestPollingDetectorGating:
+
+    def test_settled_pane_reuses_detection(self):
+        tmux = _tmux(w1="⏺ Done.\n\n>\n  ? for shortcuts")
+        detector = PollingStatusDetector("agents", tmux=tmux)
+        session = create_mock_session(tmux_window="w1")
+
+        first = detector.detect_statuses([session])
+        second = detector.detect_statuses([session])
+        with patch.object(detector, "detect_status") as detect:
+            third = detector.detect_statuses([session])
+
+        detect.assert_not_called()
+        assert first == second == third
+        assert tmux.captured == [["w1"]]
+
+    def test_changed_pane_is_detected_again(self):
+        tmux = _tmux(w1="⏺ Done.\n\n>\n  ? for shortcuts")
+        detector = PollingStatusDetector("agents", tmux=tmux)
+        session = create_mock_session(tmux_window="w1")
+        detector.detect_statuses([session])
+        detector.detect_statuses([session])
+
+        tmux.set_pane_content("agents", "w1", "⏺ Reading files\n✻ Thinking… (esc to interrupt)")
+        tmux.fingerprints["w1"] = f"%w1 12 0,7 {int(time.time()) - 10}"
+        status, _, content = detector.detect_statuses([session])[0]
+
+        assert "Reading files" in content
+        assert status == "running"
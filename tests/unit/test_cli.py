@@ -1404,6 +1404,7 @@ class TestShowExtended:
 
             mock_daemon_state = MagicMock()
             mock_daemon_state.is_stale.return_value = False
+            mock_daemon_state.stats_snapshot.return_value = {}
             mock_daemon_session = MagicMock()
             mock_daemon_session.current_status = "running"
             mock_daemon_session.current_activity = "Coding tests"
@@ -2804,6 +2805,7 @@ class TestListExtended:
 
         mock_daemon_state = MagicMock()
         mock_daemon_state.is_stale.return_value = False
+        mock_daemon_state.stats_snapshot.return_value = {}
         mock_daemon_state.untracked_window_count = 0
         mock_ds = MagicMock()
         mock_ds.current_status = "running"
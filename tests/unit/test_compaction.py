@@ -0,0 +1,380 @@
+"""
+Tests for retention and compaction of growing data files.
+"""
+
+import gzip
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from overcode.compaction import (
+    CompactionService,
+    compact_archive,
+    compact_csv_file,
+    compact_hook_logs,
+    prune_claude_session_ids,
+    prune_segments,
+)
+from overcode.session_manager import SessionManager
+
+
+def _write_rows(path, start, count, step_minutes=60):
+    lines = ["timestamp,state\n"]
+    for i in range(count):
+        lines.append(f"{(start + timedelta(minutes=step_minutes * i)).isoformat()},{i}\n")
+    path.write_text("".join(lines))
+
+
+def _settings(**overrides):
+    settings = {
+        "status_history_hours": 24.0,
+        "presence_log_hours": 24.0,
+        "archive_days": 30.0,
+        "hook_events_days": 7.0,
+        "claude_session_ids": 50,
+        "segments_days": 0.0,
+        "interval_hours": 6.0,
+    }
+    settings.update(overrides)
+    return settings
+
+
+class TestCompactCsvFile:
+    """Tests for streaming CSV compaction."""
+
+    def test_moves_aged_rows_into_daily_segments(self, tmp_path):
+        path = tmp_path / "presence_log.csv"
+        start = datetime(2026, 1, 1, 0, 0)
+        _write_rows(path, start, 72)  # three days, hourly
+        segments = tmp_path / "segments"
+
+        moved = compact_csv_file(path, start + timedelta(days=2), segments)
+
+        assert moved == 48
+        live = path.read_text().splitlines()
+        assert live[0] == "timestamp,state"
+        assert len(live) == 1 + 24
+        assert live[1].startswith("2026-01-03T00:00:00")
+        day1 = gzip.open(segments / "presence_log-2026-01-01.csv.gz", "rt").read().splitlines()
+        assert day1[0] == "timestamp,state"
+        assert len(day1) == 1 + 24
+
+    def test_repeated_runs_append_to_segment(self, tmp_path):
+        path = tmp_path / "log.csv"
+        start = datetime(2026, 1, 1, 0, 0)
+        _write_rows(path, start, 10)
+        segments = tmp_path / "segments"
+
+        compact_csv_file(path, start + timedelta(hours=3), segments)
+        compact_csv_file(path, start + timedelta(hours=6), segments)
+
+        rows = gzip.open(segments / "log-2026-01-01.csv.gz", "rt").read().splitlines()
+        assert rows[0] == "timestamp,state"
+        assert [r.split(",")[1] for r in rows[1:]] == ["0", "1", "2", "3", "4", "5"]
+        assert len(path.read_text().splitlines()) == 1 + 4
+
+    def test_untouched_when_nothing_aged(self, tmp_path):
+        path = tmp_path / "log.csv"
+        start = datetime(2026, 1, 1, 0, 0)
+        _write_rows(path, start, 5)
+        inode = path.stat().st_ino
+
+        assert compact_csv_file(path, start, tmp_path / "segments") == 0
+
+        assert path.stat().st_ino == inode
+        assert not (tmp_path / "segments").exists()
+        assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
+
+    def test_discards_without_segment_dir(self, tmp_path):
+        path = tmp_path / "log.csv"
+        start = datetime(2026, 1, 1, 0, 0)
+        _write_rows(path, start, 5)
+
+        assert compact_csv_file(path, start + timedelta(hours=2)) == 2
+
+        assert len(path.read_text().splitlines()) == 1 + 3
+
+    def test_missing_file(self, tmp_path):
+        assert compact_csv_file(tmp_path / "missing.csv", datetime.now()) == 0
+
+    def test_rows_appended_during_compaction_are_kept(self, tmp_path):
+        from overcode.status_history import log_agent_status
+
+        path = tmp_path / "agent_status_history.csv"
+        start = datetime(2026, 1, 1, 0, 0)
+        _write_rows(path, start, 50000, step_minutes=1)
+        appended = []
+        done = threading.Event()
+
+        def append():
+            while not done.is_set() or len(appended) < 20:
+                log_agent_status(f"agent-{len(appended)}", "running", history_file=path)
+                appended.append(1)
+
+        writer = threading.Thread(target=append)
+        writer.start()
+        try:
+            moved = compact_csv_file(path, datetime(2026, 3, 1), tmp_path / "segments")
+        finally:
+            done.set()
+            writer.join()
+
+        assert moved == 50000
+        names = [line.split(",")[1] for line in path.read_text().splitlines()[1:]]
+        assert names == [f"agent-{i}" for i in range(len(appended))]
+
+    def test_malformed_rows_kept_and_scan_continues(self, tmp_path):
+        path = tmp_path / "log.csv"
+        start = datetime(2026, 1, 1, 0, 0)
+        _write_rows(path, start, 6)
+        lines = path.read_text().splitlines(keepends=True)
+        path.write_text("".join(lines[:3] + ["garbage,row\n"] + lines[3:]))
+
+        assert compact_csv_file(path, start + timedelta(hours=4), tmp_path / "segments") == 4
+
+        live = path.read_text().splitlines()
+        assert live == ["timestamp,state", "garbage,row", lines[5].strip(), lines[6].strip()]
+
+    def test_failed_pass_does_not_move_rows_twice(self, tmp_path):
+        path = tmp_path / "log.csv"
+        start = datetime(2026, 1, 1, 0, 0)
+        _write_rows(path, start, 10)
+        segments = tmp_path / "segments"
+        original = path.read_text()
+        real_replace = os.replace
+
+        def fail_live_replace(src, dst):
+            if os.fspath(dst) == os.fspath(path):
+                raise OSError("disk full")
+            real_replace(src, dst)
+
+        with patch("overcode.compaction.os.replace", side_effect=fail_live_replace):
+            with pytest.raises(OSError):
+                compact_csv_file(path, start + timedelta(hours=3), segments)
+        assert path.read_text() == original
+        assert [p.name for p in segments.iterdir()] == []
+
+        assert compact_csv_file(path, start + timedelta(hours=3), segments) == 3
+        rows = gzip.open(segments / "log-2026-01-01.csv.gz", "rt").read().splitlines()
+        assert [r.split(",")[1] for r in rows[1:]] == ["0", "1", "2"]
+
+
+class TestCompactArchive:
+    """Tests for rolling archive.json into segments."""
+
+    def test_moves_sessions_ended_before_cutoff(self, tmp_path):
+        manager = SessionManager(state_dir=tmp_path, skip_git_detection=True)
+        old = manager.create_session(name="old", tmux_session="agents", tmux_window=1, command=["claude"])
+        new = manager.create_session(name="new", tmux_session="agents", tmux_window=2, command=["claude"])
+        manager.delete_session(old.id)
+        manager.delete_session(new.id)
+        archive = json.loads(manager.archive_file.read_text())
+        archive[old.id]["end_time"] = "2026-01-01T10:00:00"
+        manager.archive_file.write_text(json.dumps(archive))
+
+        moved = compact_archive(manager, datetime(2026, 2, 1), tmp_path / "segments")
+
+        assert moved == 1
+        assert [s.id for s in manager.list_archived_sessions()] == [new.id]
+        with gzip.open(tmp_path / "segments" / "archive-2026-01-01.jsonl.gz", "rt") as f:
+            records = [json.loads(line) for line in f]
+        assert [r["id"] for r in records] == [old.id]
+
+    def test_archive_kept_if_segment_write_fails(self, tmp_path):
+        manager = SessionManager(state_dir=tmp_path, skip_git_detection=True)
+        session = manager.create_session(name="old", tmux_session="agents", tmux_window=1, command=["claude"])
+        manager.delete_session(session.id)
+
+        def failing_sink(entries):
+            raise OSError("disk full")
+
+        try:
+            manager.take_archived_sessions(datetime.now() + timedelta(days=1), failing_sink)
+        except OSError:
+            pass
+
+        assert len(manager.list_archived_sessions()) == 1
+
+    def test_session_archived_during_take_is_kept(self, tmp_path):
+        manager = SessionManager(state_dir=tmp_path, skip_git_detection=True)
+        old = manager.create_session(name="old", tmux_session="agents", tmux_window=1, command=["claude"])
+        other = manager.create_session(name="other", tmux_session="agents", tmux_window=2, command=["claude"])
+        manager.delete_session(old.id)
+        threads = []
+
+        def sink(entries):
+            # Another thread archives a session while the aged ones are written
+            thread = threading.Thread(target=manager.delete_session, args=(other.id,))
+            thread.start()
+            threads.append(thread)
+            time.sleep(0.1)
+
+        moved = manager.take_archived_sessions(datetime.now() + timedelta(days=1), sink)
+        threads[0].join()
+
+        assert moved == 1
+        assert [s.id for s in manager.list_archived_sessions()] == [other.id]
+
+
+class TestPruneClaudeSessionIds:
+    """Tests for capping claude_session_ids."""
+
+    def test_drops_oldest_ids_without_transcripts(self, tmp_path):
+        manager = SessionManager(state_dir=tmp_path, skip_git_detection=True)
+        session = manager.create_session(name="a", tmux_session="agents", tmux_window=1, command=["claude"])
+        ids = [f"id{i}" for i in range(6)]
+        manager.update_session(session.id, claude_session_ids=ids, active_claude_session_id="id0")
+        live_transcripts = {"id1"}
+
+        removed = prune_claude_session_ids(
+            manager, 3, lambda s, sid: sid in live_transcripts,
+        )
+
+        # id0 is active and id1 still has a transcript; id2..id4 are oldest prunable
+        assert removed == 3
+        assert manager.get_session(session.id).claude_session_ids == ["id0", "id1", "id5"]
+
+    def test_ids_recorded_during_prune_are_kept(self, tmp_path):
+        manager = SessionManager(state_dir=tmp_path, skip_git_detection=True)
+        session = manager.create_session(name="a", tmux_session="agents", tmux_window=1, command=["claude"])
+        manager.update_session(session.id, claude_session_ids=["id0", "id1", "id2"])
+
+        def transcript_exists(s, sid):
+            # The daemon's session-ID sync records a new ID mid-pass
+            manager.add_claude_session_id(session.id, "new")
+            return False
+
+        assert prune_claude_session_ids(manager, 2, transcript_exists) == 1
+        assert manager.get_session(session.id).claude_session_ids == ["id1", "id2", "new"]
+
+    def test_under_cap_untouched(self, tmp_path):
+        manager = SessionManager(state_dir=tmp_path, skip_git_detection=True)
+        session = manager.create_session(name="a", tmux_session="agents", tmux_window=1, command=["claude"])
+        manager.update_session(session.id, claude_session_ids=["x", "y"])
+
+        assert prune_claude_session_ids(manager, 3, lambda s, sid: False) == 0
+        assert manager.get_session(session.id).claude_session_ids == ["x", "y"]
+
+
+class TestCompactHookLogs:
+    """Tests for rolling up hook files of departed agents."""
+
+    def _age(self, path, days):
+        past = time.time() - days * 86400
+        os.utime(path, (past, past))
+
+    def test_rolls_up_stale_departed_agent(self, tmp_path):
+        events = tmp_path / "hook_events_gone.jsonl"
+        events.write_text(json.dumps({"event": "Stop", "timestamp": 1.0}) + "\n")
+        state = tmp_path / "hook_state_gone.json"
+        state.write_text("{}")
+        self._age(events, 10)
+        self._age(state, 10)
+        segments = tmp_path / "segments"
+
+        removed = compact_hook_logs(tmp_path, set(), datetime.now() - timedelta(days=7), segments)
+
+        assert removed == 1
+        assert not events.exists() and not state.exists()
+        [segment] = list(segments.iterdir())
+        record = json.loads(gzip.open(segment, "rt").read())
+        assert record == {"agent": "gone", "event": "Stop", "timestamp": 1.0}
+
+    def test_keeps_live_and_recent_agents(self, tmp_path):
+        live = tmp_path / "hook_events_live.jsonl"
+        live.write_text("{}\n")
+        self._age(live, 10)
+        recent_state = tmp_path / "hook_state_recent.json"
+        recent_state.write_text("{}")
+        recent_events = tmp_path / "hook_events_recent.jsonl"
+        recent_events.write_text("{}\n")
+        self._age(recent_events, 10)
+
+        removed = compact_hook_logs(
+            tmp_path, {"live"}, datetime.now() - timedelta(days=7), tmp_path / "segments",
+        )
+
+        assert removed == 0
+        assert live.exists() and recent_events.exists() and recent_state.exists()
+
+
+class TestPruneSegments:
+    def test_deletes_segments_older_than_cutoff(self, tmp_path):
+        for name in ("log-2026-01-01.csv.gz", "log-2026-03-01.csv.gz", "notes.txt"):
+            (tmp_path / name).write_bytes(b"")
+
+        assert prune_segments(tmp_path, datetime(2026, 2, 1)) == 1
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["log-2026-03-01.csv.gz", "notes.txt"]
+
+
+class TestCompactionService:
+    """Tests for the daemon-facing scheduler."""
+
+    def test_run_once_compacts_history_and_presence(self, tmp_path):
+        manager = SessionManager(state_dir=tmp_path / "state", skip_git_detection=True)
+        session_dir = tmp_path / "sessions" / "agents"
+        session_dir.mkdir(parents=True)
+        history = session_dir / "agent_status_history.csv"
+        presence = tmp_path / "presence_log.csv"
+        now = datetime(2026, 1, 10, 12, 0)
+        _write_rows(history, now - timedelta(hours=48), 48)
+        _write_rows(presence, now - timedelta(hours=48), 48)
+        service = CompactionService(
+            manager, history, presence_log_path=presence, settings=_settings(),
+        )
+
+        counts = service.run_once(now=now)
+
+        assert counts["status_history"] == 24
+        assert counts["presence_log"] == 24
+        assert (session_dir / "segments").is_dir()
+        assert (tmp_path / "segments").is_dir()
+
+    def test_step_failure_does_not_stop_others(self, tmp_path, monkeypatch):
+        manager = SessionManager(state_dir=tmp_path / "state", skip_git_detection=True)
+        history = tmp_path / "agent_status_history.csv"
+        presence = tmp_path / "presence_log.csv"
+        now = datetime(2026, 1, 10, 12, 0)
+        _write_rows(presence, now - timedelta(hours=48), 48)
+        messages = []
+
+        def broken(*args, **kwargs):
+            raise OSError("boom")
+
+        monkeypatch.setattr("overcode.compaction.compact_archive", broken)
+        service = CompactionService(
+            manager, history, presence_log_path=presence,
+            settings=_settings(), log=messages.append,
+        )
+
+        counts = service.run_once(now=now)
+
+        assert counts["archive"] == 0
+        assert counts["presence_log"] == 24
+        assert any("archive" in m for m in messages)
+
+    def test_maybe_start_waits_for_initial_delay(self, tmp_path):
+        manager = SessionManager(state_dir=tmp_path, skip_git_detection=True)
+        service = CompactionService(
+            manager, tmp_path / "h.csv", presence_log_path=tmp_path / "p.csv",
+            settings=_settings(), initial_delay=3600,
+        )
+        assert service.maybe_start() is False
+
+    def test_maybe_start_runs_in_background_once(self, tmp_path):
+        manager = SessionManager(state_dir=tmp_path, skip_git_detection=True)
+        service = CompactionService(
+            manager, tmp_path / "h.csv", presence_log_path=tmp_path / "p.csv",
+            settings=_settings(), initial_delay=0,
+        )
+
+        assert service.maybe_start() is True
+        service._thread.join(timeout=5)
+        # Next run is interval_hours away
+        assert service.maybe_start() is False
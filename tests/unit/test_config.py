@@ -646,6 +646,28 @@ class TestGetWebApiKey:
         assert config.get_web_api_key() is None
 
 
+class TestGetWebServerLimits:
+    """Test web max_workers / request_timeout configuration."""
+
+    def test_defaults(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(config, "CONFIG_PATH", tmp_path / "nonexistent.yaml")
+        assert config.get_web_max_workers() == 8
+        assert config.get_web_request_timeout() == 30.0
+
+    def test_configured_values(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("web:\n  max_workers: 16\n  request_timeout: 5\n")
+        monkeypatch.setattr(config, "CONFIG_PATH", config_file)
+        assert config.get_web_max_workers() == 16
+        assert config.get_web_request_timeout() == 5.0
+
+    def test_max_workers_at_least_one(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("web:\n  max_workers: 0\n")
+        monkeypatch.setattr(config, "CONFIG_PATH", config_file)
+        assert config.get_web_max_workers() == 1
+
+
 class TestGetWebAllowControl:
     """Test web allow_control configuration."""
 
@@ -819,6 +841,92 @@ class TestGetSyncBranch:
         assert config.get_sync_branch() == "develop"
 
 
+class TestGetRetentionConfig:
+    """Tests for compaction retention settings."""
+
+    def test_defaults(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(config, "CONFIG_PATH", tmp_path / "nonexistent.yaml")
+        result = config.get_retention_config()
+        assert result["status_history_hours"] == 168.0
+        assert result["claude_session_ids"] == 50
+        assert result["segments_days"] == 0.0
+
+    def test_overrides_and_bad_values(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "retention:\n  presence_log_hours: 48\n  archive_days: soon\n"
+        )
+        monkeypatch.setattr(config, "CONFIG_PATH", config_file)
+        result = config.get_retention_config()
+        assert result["presence_log_hours"] == 48.0
+        assert result["archive_days"] == 90.0
+
+
+class TestGetHookReceiverEnabled:
+    """Tests for the persistent hook receiver toggle."""
+
+    def test_disabled_by_default(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(config, "CONFIG_PATH", tmp_path / "nonexistent.yaml")
+        assert config.get_hook_receiver_enabled() is False
+
+    def test_enabled_in_config(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("hooks:\n  receiver: true\n")
+        monkeypatch.setattr(config, "CONFIG_PATH", config_file)
+        assert config.get_hook_receiver_enabled() is True
+
+
+class TestGetStateBackend:
+    """Tests for the session state backend selection."""
+
+    def test_defaults_to_json(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("OVERCODE_STATE_BACKEND", raising=False)
+        monkeypatch.setattr(config, "CONFIG_PATH", tmp_path / "nonexistent.yaml")
+        assert config.get_state_backend() == "json"
+
+    def test_uses_configured_backend(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("OVERCODE_STATE_BACKEND", raising=False)
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("state:\n  backend: SQLite\n")
+        monkeypatch.setattr(config, "CONFIG_PATH", config_file)
+        assert config.get_state_backend() == "sqlite"
+
+    def test_env_overrides_config(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("state:\n  backend: sqlite\n")
+        monkeypatch.setattr(config, "CONFIG_PATH", config_file)
+        monkeypatch.setenv("OVERCODE_STATE_BACKEND", "json")
+        assert config.get_state_backend() == "json"
+
+    def test_unknown_value_falls_back_to_json(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("OVERCODE_STATE_BACKEND", "postgres")
+        monkeypatch.setattr(config, "CONFIG_PATH", tmp_path / "nonexistent.yaml")
+        assert config.get_state_backend() == "json"
+
+
+class TestGetTmuxControlMode:
+    """Tests for the tmux control-mode transport switch."""
+
+    def test_disabled_by_default(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("OVERCODE_TMUX_CONTROL", raising=False)
+        monkeypatch.setattr(config, "CONFIG_PATH", tmp_path / "nonexistent.yaml")
+        assert config.get_tmux_control_mode() is False
+
+    def test_enabled_in_config(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("OVERCODE_TMUX_CONTROL", raising=False)
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("tmux:\n  control_mode: true\n")
+        monkeypatch.setattr(config, "CONFIG_PATH", config_file)
+        assert config.get_tmux_control_mode() is True
+
+    def test_env_overrides_config(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("tmux:\n  control_mode: true\n")
+        monkeypatch.setattr(config, "CONFIG_PATH", config_file)
+        monkeypatch.setenv("OVERCODE_TMUX_CONTROL", "0")
+        assert config.get_tmux_control_mode() is False
+
+
 class TestPassthruKeys:
     """Tests for configurable passthru keys (#446)."""
 
@@ -0,0 +1,102 @@
+"""Tests for the monitor daemon's worker pools."""
+
+import threading
+import time
+
+from overcode.daemon_tasks import TaskPool
+
+
+class TestStart:
+
+    def test_runs_in_background_and_wait_collects(self):
+        pool = TaskPool(2)
+        done = []
+        assert pool.start("a", done.append, 1, timeout=5)
+        pool.wait()
+        assert done == [1]
+
+    def test_single_flight_while_running(self):
+        slow = []
+        pool = TaskPool(2, on_slow=lambda name, timeout: slow.append(name))
+        release = threading.Event()
+        try:
+            assert pool.start("a", release.wait, 5, timeout=0.01) is True
+            time.sleep(0.02)
+            assert pool.start("a", release.wait, 5, timeout=0.01) is False
+            assert slow == ["a"]
+        finally:
+            release.set()
+        # Once the first run has finished the task can start again
+        deadline = time.monotonic() + 2
+        while not pool.start("a", lambda: None) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert time.monotonic() < deadline
+
+    def test_wait_gives_up_at_timeout(self):
+        slow = []
+        pool = TaskPool(2, on_slow=lambda name, timeout: slow.append((name, timeout)))
+        release = threading.Event()
+        try:
+            pool.start("hung", release.wait, 5, timeout=0.05)
+            started = time.monotonic()
+            pool.wait()
+            assert time.monotonic() - started < 1
+            assert slow == [("hung", 0.05)]
+            # Already reported: later waits don't block on it again
+            started = time.monotonic()
+            pool.wait()
+            assert time.monotonic() - started < 0.05
+        finally:
+            release.set()
+
+    def test_errors_are_reported(self):
+        errors = []
+        pool = TaskPool(1, on_error=lambda name, e: errors.append((name, str(e))))
+
+        def boom():
+            raise RuntimeError("nope")
+
+        pool.start("boom", boom)
+        pool.wait()
+        assert errors == [("boom", "nope")]
+
+
+class TestMap:
+
+    def test_returns_results_by_key(self):
+        pool = TaskPool(4)
+        result = pool.map("square", lambda n: n * n, [1, 2, 3], key=lambda n: f"n{n}")
+        assert result == {"n1": 1, "n2": 4, "n3": 9}
+
+    def test_slow_item_does_not_hold_up_others(self):
+        slow = []
+        pool = TaskPool(4, on_slow=lambda name, timeout: slow.append(name))
+        release = threading.Event()
+
+        def call(n):
+            if n == 2:
+                release.wait(5)
+            return n
+
+        try:
+            started = time.monotonic()
+            result = pool.map("agents", call, [1, 2, 3], timeout=0.1)
+            assert time.monotonic() - started < 1
+            assert result == {1: 1, 3: 3}
+            assert slow == ["agents:2"]
+
+            # The hung call isn't started again while it's still running
+            result = pool.map("agents", call, [1, 2, 3], timeout=0.1)
+            assert result == {1: 1, 3: 3}
+        finally:
+            release.set()
+
+    def test_failed_items_are_missing(self):
+        pool = TaskPool(2)
+
+        def call(n):
+            if n == 2:
+                raise ValueError(n)
+            return n
+
+        assert pool.map("agents", call, [1, 2]) == {1: 1}
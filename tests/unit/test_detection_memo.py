@@ -0,0 +1,49 @@
+"""Tests for the bounded detection result memo."""
+
+from overcode.detection_memo import DetectionMemo, MemoStats
+
+
+class TestDetectionMemo:
+
+    def test_hit_and_miss(self):
+        memo = DetectionMemo()
+        assert memo.get("a", 1) is None
+        memo.put("a", 1, ("running", "Working", "P9"), 0.002)
+
+        assert memo.get("a", 1) == ("running", "Working", "P9")
+        assert memo.get("b", 1) is None
+        assert (memo.stats.hits, memo.stats.misses) == (1, 1)
+
+    def test_per_session_limit_evicts_least_recent(self):
+        memo = DetectionMemo(per_session=2, max_entries=10)
+        memo.put("a", 1, ("s", "1", None), 0)
+        memo.put("a", 2, ("s", "2", None), 0)
+        memo.get("a", 1)
+        memo.put("a", 3, ("s", "3", None), 0)
+
+        assert memo.get("a", 2) is None
+        assert memo.get("a", 1) is not None
+        assert memo.get("a", 3) is not None
+        assert len(memo) == 2
+
+    def test_global_limit_spans_sessions(self):
+        memo = DetectionMemo(per_session=4, max_entries=3)
+        for sid in ("a", "b", "c", "d"):
+            memo.put(sid, 1, ("s", sid, None), 0)
+
+        assert memo.get("a", 1) is None
+        assert [memo.get(sid, 1)[1] for sid in ("b", "c", "d")] == ["b", "c", "d"]
+        assert len(memo) == 3
+
+
+class TestMemoStats:
+
+    def test_summary(self):
+        stats = MemoStats(hits=3, misses=1, miss_seconds=0.004)
+        assert stats.hit_rate == 0.75
+        assert abs(stats.saved_seconds - 0.012) < 1e-9
+        assert stats.summary() == "75% hit (3/4), saved ~12.0ms"
+
+    def test_empty(self):
+        assert MemoStats().hit_rate == 0.0
+        assert MemoStats().saved_seconds == 0.0
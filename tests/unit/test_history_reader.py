@@ -1503,5 +1503,151 @@ class TestSynthesizeRemoteStats:
         assert stats.cache_read_tokens == 0
 
 
+class TestSessionFileStatsCache:
+    """Incremental offset-tracked parsing of session JSONL files."""
+
+    @staticmethod
+    def _user(ts, text="hi"):
+        return json.dumps({"type": "user", "timestamp": ts,
+                           "message": {"role": "user", "content": text}}) + "\n"
+
+    @staticmethod
+    def _assistant(ts, tokens, model="claude-sonnet-4-6"):
+        return json.dumps({"type": "assistant", "timestamp": ts,
+                           "message": {"id": "msg_abc", "model": model,
+                                       "usage": {"input_tokens": tokens,
+                                                 "output_tokens": tokens * 2,
+                                                 "cache_creation_input_tokens": 0,
+                                                 "cache_read_input_tokens": 0}}}) + "\n"
+
+    def test_matches_full_parse_across_appends(self, tmp_path):
+        from overcode.history_reader import SessionFileStatsCache, read_session_file_stats
+
+        f = tmp_path / "s.jsonl"
+        cache = SessionFileStatsCache()
+        f.write_text(self._user("2026-01-02T10:00:00Z") + self._assistant("2026-01-02T10:00:05Z", 100))
+        cache.read_stats(f)
+        with open(f, "a") as fh:
+            fh.write(self._user("2026-01-02T10:01:00Z"))
+            fh.write(self._assistant("2026-01-02T10:01:05Z", 50, model="claude-opus-4-7"))
+
+        assert cache.read_stats(f) == read_session_file_stats(f)
+        usage, work_times = cache.read_stats(f)
+        assert usage["input_tokens"] == 150
+        assert usage["model"] == "claude-opus-4-7"
+        assert work_times == [60.0]
+
+    def test_only_appended_bytes_are_parsed(self, tmp_path):
+        from overcode.history_reader import SessionFileStatsCache
+
+        f = tmp_path / "s.jsonl"
+        f.write_text(self._assistant("2026-01-02T10:00:05Z", 100))
+        cache = SessionFileStatsCache()
+        cache.read_stats(f)
+
+        state = cache._files[f]
+        offset = state.offset
+        assert offset == f.stat().st_size
+        with open(f, "a") as fh:
+            fh.write(self._assistant("2026-01-02T10:00:10Z", 7))
+        fed = []
+        orig_feed = state.accumulator.feed
+
+        def recording_feed(lines):
+            fed.extend(lines)
+            orig_feed(lines)
+
+        state.accumulator.feed = recording_feed
+        usage, _ = cache.read_stats(f)
+        assert usage["input_tokens"] == 107
+        assert len([line for line in fed if line.strip()]) == 1
+
+    def test_partial_trailing_line_deferred(self, tmp_path):
+        from overcode.history_reader import SessionFileStatsCache
+
+        f = tmp_path / "s.jsonl"
+        line = self._assistant("2026-01-02T10:00:05Z", 100)
+        f.write_text(line + line[:20])
+        cache = SessionFileStatsCache()
+        assert cache.read_stats(f)[0]["input_tokens"] == 100
+
+        with open(f, "a") as fh:
+            fh.write(line[20:])
+        assert cache.read_stats(f)[0]["input_tokens"] == 200
+
+    def test_unterminated_complete_line_is_counted(self, tmp_path):
+        from overcode.history_reader import SessionFileStatsCache
+
+        f = tmp_path / "s.jsonl"
+        f.write_text(self._assistant("2026-01-02T10:00:05Z", 100).rstrip("\n"))
+        assert SessionFileStatsCache().read_stats(f)[0]["input_tokens"] == 100
+
+    def test_truncation_triggers_full_reparse(self, tmp_path):
+        from overcode.history_reader import SessionFileStatsCache
+
+        f = tmp_path / "s.jsonl"
+        f.write_text(self._assistant("2026-01-02T10:00:05Z", 100) * 3)
+        cache = SessionFileStatsCache()
+        assert cache.read_stats(f)[0]["input_tokens"] == 300
+
+        with open(f, "w") as fh:
+            fh.write(self._assistant("2026-01-02T10:00:05Z", 9))
+        assert cache.read_stats(f)[0]["input_tokens"] == 9
+
+    def test_rotation_by_inode_triggers_full_reparse(self, tmp_path):
+        from overcode.history_reader import SessionFileStatsCache
+
+        f = tmp_path / "s.jsonl"
+        f.write_text(self._assistant("2026-01-02T10:00:05Z", 100))
+        cache = SessionFileStatsCache()
+        cache.read_stats(f)
+
+        replacement = tmp_path / "new.jsonl"
+        replacement.write_text(self._assistant("2026-01-02T10:00:05Z", 1) * 5)
+        replacement.replace(f)
+        assert cache.read_stats(f)[0]["input_tokens"] == 5
+
+    def test_since_change_resets(self, tmp_path):
+        from overcode.history_reader import SessionFileStatsCache
+
+        f = tmp_path / "s.jsonl"
+        f.write_text(self._assistant("2026-01-02T10:00:05Z", 100)
+                     + self._assistant("2026-01-05T10:00:05Z", 1))
+        cache = SessionFileStatsCache()
+        assert cache.read_stats(f)[0]["input_tokens"] == 101
+        assert cache.read_stats(f, since=datetime(2026, 1, 3))[0]["input_tokens"] == 1
+
+    def test_missing_file_returns_defaults(self, tmp_path):
+        from overcode.history_reader import SessionFileStatsCache
+
+        usage, work_times = SessionFileStatsCache().read_stats(tmp_path / "nope.jsonl")
+        assert usage["input_tokens"] == 0
+        assert usage["model"] is None
+        assert work_times == []
+
+    def test_returned_values_are_copies(self, tmp_path):
+        from overcode.history_reader import SessionFileStatsCache
+
+        f = tmp_path / "s.jsonl"
+        f.write_text(self._user("2026-01-02T10:00:00Z") + self._user("2026-01-02T10:00:30Z"))
+        cache = SessionFileStatsCache()
+        usage, work_times = cache.read_stats(f)
+        usage["input_tokens"] = 999
+        work_times.append(1.0)
+        assert cache.read_stats(f) == ({**usage, "input_tokens": 0}, [30.0])
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        from overcode.history_reader import SessionFileStatsCache
+
+        cache = SessionFileStatsCache(max_files=2)
+        files = []
+        for i in range(3):
+            f = tmp_path / f"s{i}.jsonl"
+            f.write_text(self._assistant("2026-01-02T10:00:05Z", 1))
+            files.append(f)
+            cache.read_stats(f)
+        assert list(cache._files) == files[1:]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -403,3 +403,96 @@ class TestAppendHookEvent:
         monkeypatch.setenv("OVERCODE_STATE_DIR", str(tmp_path / "custom"))
         path = _get_hook_event_log_path("agents", "a1")
         assert path == tmp_path / "custom" / "agents" / "hook_events_a1.jsonl"
+
+
+class TestFastPathEntry:
+    """`overcode hook-handler` must not pay for the full Typer CLI import."""
+
+    # Generous compared with the ~40ms the fast path measures locally, but
+    # far below the full CLI (several hundred ms). Only checked with
+    # `pytest -m benchmark`; the default run relies on HEAVY_MODULES.
+    IMPORT_BUDGET_MS = 150
+
+    HEAVY_MODULES = (
+        "typer", "rich", "libtmux", "textual", "yaml",
+        "overcode.cli", "overcode.launcher", "overcode.session_manager",
+    )
+
+    def _run(self, code, tmp_path, *args):
+        import subprocess
+        import sys
+        import overcode
+
+        env = {
+            k: v for k, v in os.environ.items()
+            if not k.startswith("OVERCODE_") and k != "TMUX_PANE"
+        }
+        env["PYTHONPATH"] = str(Path(overcode.__file__).resolve().parent.parent)
+        env["OVERCODE_STATE_DIR"] = str(tmp_path)
+        return subprocess.run(
+            [sys.executable, *args, "-c", code],
+            capture_output=True, text=True, env=env, input="", timeout=60,
+        )
+
+    def test_hook_handler_skips_cli_imports(self, tmp_path):
+        code = (
+            "import sys, json\n"
+            "sys.argv = ['overcode', 'hook-handler']\n"
+            "from overcode.entry import main\n"
+            "main()\n"
+            "print(json.dumps(sorted(sys.modules)))\n"
+        )
+        result = self._run(code, tmp_path)
+        assert result.returncode == 0, result.stderr
+        loaded = set(json.loads(result.stdout.strip().splitlines()[-1]))
+        assert "overcode.hook_handler" in loaded
+        assert not [m for m in self.HEAVY_MODULES if m in loaded]
+
+    def test_plain_import_skips_heavy_modules(self, tmp_path):
+        code = (
+            "import sys, json\n"
+            "import overcode.entry, overcode.hook_handler\n"
+            "print(json.dumps(sorted(sys.modules)))\n"
+        )
+        result = self._run(code, tmp_path)
+        assert result.returncode == 0, result.stderr
+        loaded = set(json.loads(result.stdout.strip().splitlines()[-1]))
+        assert not [m for m in self.HEAVY_MODULES if m in loaded]
+
+    def test_full_version_in_fresh_interpreter(self, tmp_path):
+        result = self._run(
+            "import overcode\nprint(overcode.get_full_version())\n", tmp_path
+        )
+        assert result.returncode == 0, result.stderr
+        import overcode
+        assert result.stdout.strip().startswith(overcode.__version__)
+
+    @pytest.mark.benchmark
+    def test_cold_start_import_budget(self, tmp_path):
+        result = self._run("import overcode.entry, overcode.hook_handler", tmp_path, "-X", "importtime")
+        assert result.returncode == 0, result.stderr
+        total_us = 0
+        for line in result.stderr.splitlines():
+            # "import time: self [us] | cumulative | imported package"
+            parts = [p.strip() for p in line.split("|")]
+            if len(parts) == 3 and parts[2] in ("overcode.entry", "overcode.hook_handler"):
+                total_us += int(parts[1])
+        assert 0 < total_us / 1000 < self.IMPORT_BUDGET_MS
+
+    def test_other_commands_use_full_cli(self, monkeypatch):
+        from overcode import entry
+
+        monkeypatch.setattr("sys.argv", ["overcode", "list"])
+        with patch("overcode.cli.main") as cli_main, \
+                patch("overcode.hook_handler.handle_hook_event") as handler:
+            entry.main()
+        cli_main.assert_called_once()
+        handler.assert_not_called()
+
+    def test_hook_handler_dispatch(self, monkeypatch):
+        from overcode import entry
+
+        monkeypatch.setattr("sys.argv", ["overcode", "hook-handler"])
+        with patch("overcode.hook_handler.handle_hook_event") as handler:
+            entry.main()
+        handler.assert_called_once()
@@ -0,0 +1,245 @@
+"""Tests for the persistent hook receiver and its hook-handler client."""
+
+import json
+import socket
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from overcode.hook_handler import (
+    OUTCOME_UNKNOWN,
+    _get_hook_socket_path,
+    forward_hook_event,
+    handle_hook_event,
+)
+from overcode.hook_receiver import HANDLER_WORKERS, HookReceiver
+
+
+@pytest.fixture
+def receiver(monkeypatch, tmp_path):
+    monkeypatch.setenv("OVERCODE_STATE_DIR", str(tmp_path))
+    states = []
+    r = HookReceiver("agents", on_state=lambda name, state: states.append((name, state)))
+    assert r.start()
+    r.states = states
+    yield r
+    r.stop()
+
+
+class TestHookReceiver:
+
+    def test_forwarded_event_writes_state(self, receiver, tmp_path):
+        result = forward_hook_event(
+            {"hook_event_name": "PreToolUse", "tool_name": "Read"}, "agents", "a1"
+        )
+        assert result == (0, "", "")
+        state = json.loads((tmp_path / "agents" / "hook_state_a1.json").read_text())
+        assert state["event"] == "PreToolUse"
+        assert (tmp_path / "agents" / "hook_events_a1.jsonl").exists()
+        assert receiver.states[0][0] == "a1"
+        assert receiver.states[0][1]["tool_name"] == "Read"
+
+    def test_user_prompt_context_returned(self, receiver):
+        with patch("overcode.time_context.generate_enhanced_context", return_value="Clock: 10:00"):
+            result = forward_hook_event({"hook_event_name": "UserPromptSubmit"}, "agents", "a1")
+        assert result == (0, "Clock: 10:00", "")
+
+    def test_budget_verdict_returned(self, receiver):
+        daemon_state = {"sessions": [{"name": "a1", "budget_exceeded": True,
+                                      "cost_budget_usd": 1.0, "estimated_cost_usd": 2.5}]}
+        with patch("overcode.time_context._load_daemon_state", return_value=daemon_state), \
+                patch("overcode.time_context._find_session_in_state",
+                      return_value=daemon_state["sessions"][0]):
+            exit_code, stdout, stderr = forward_hook_event(
+                {"hook_event_name": "UserPromptSubmit"}, "agents", "a1"
+            )
+        assert exit_code == 2
+        assert "Budget exceeded ($2.50 / $1.00)" in stderr
+        assert receiver.states[-1][1]["event"] == "UserPromptSubmitRejected"
+
+    def test_wrong_session_falls_back(self, receiver, tmp_path):
+        # Socket for "other" is this receiver's socket, but it only serves "agents".
+        (tmp_path / "other").mkdir()
+        (tmp_path / "other" / "hook.sock").symlink_to(receiver.socket_path)
+        assert forward_hook_event({"hook_event_name": "Stop"}, "other", "a1") is None
+
+    def test_stop_removes_socket(self, receiver):
+        path = receiver.socket_path
+        assert path.exists()
+        receiver.stop()
+        assert not path.exists()
+        assert not receiver.running
+
+    def test_stale_socket_replaced(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("OVERCODE_STATE_DIR", str(tmp_path))
+        path = _get_hook_socket_path("agents")
+        path.parent.mkdir(parents=True)
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(path))
+        stale.close()  # file remains, nobody listening
+
+        r = HookReceiver("agents")
+        try:
+            assert r.start()
+            assert forward_hook_event({"hook_event_name": "Stop"}, "agents", "a1") == (0, "", "")
+        finally:
+            r.stop()
+
+    def test_slow_event_does_not_block_other_agents(self, receiver):
+        release = threading.Event()
+
+        def slow_context(tmux_session, session_name):
+            release.wait(5)
+            return ""
+
+        results = []
+        with patch("overcode.time_context.generate_enhanced_context", side_effect=slow_context):
+            slow = threading.Thread(target=lambda: results.append(
+                forward_hook_event({"hook_event_name": "UserPromptSubmit"}, "agents", "slow")))
+            slow.start()
+            try:
+                time.sleep(0.1)
+                started = time.monotonic()
+                assert forward_hook_event({"hook_event_name": "Stop"}, "agents", "a2") == (0, "", "")
+                assert time.monotonic() - started < 2
+            finally:
+                release.set()
+                slow.join()
+        assert results == [(0, "", "")]
+
+    def test_burst_from_one_agent_does_not_starve_others(self, receiver):
+        release = threading.Event()
+
+        def slow_context(tmux_session, session_name):
+            release.wait(5)
+            return ""
+
+        burst = [
+            threading.Thread(target=forward_hook_event,
+                             args=({"hook_event_name": "UserPromptSubmit"}, "agents", "slow"))
+            for _ in range(HANDLER_WORKERS + 2)
+        ]
+        with patch("overcode.time_context.generate_enhanced_context", side_effect=slow_context):
+            for thread in burst:
+                thread.start()
+            try:
+                time.sleep(0.2)
+                started = time.monotonic()
+                assert forward_hook_event({"hook_event_name": "Stop"}, "agents", "a2") == (0, "", "")
+                assert time.monotonic() - started < 2
+            finally:
+                release.set()
+                for thread in burst:
+                    thread.join()
+
+    def test_agent_events_processed_in_arrival_order(self, receiver):
+        release = threading.Event()
+        threads = []
+
+        def send(event):
+            thread = threading.Thread(target=forward_hook_event, args=(event, "agents", "a1"))
+            thread.start()
+            threads.append(thread)
+
+        with patch("overcode.time_context.generate_enhanced_context",
+                   side_effect=lambda *args: release.wait(5) and ""):
+            send({"hook_event_name": "UserPromptSubmit"})
+            try:
+                for i in range(6):
+                    send({"hook_event_name": "PreToolUse", "tool_name": f"T{i}"})
+                    deadline = time.monotonic() + 2
+                    while len(receiver._agent_queues.get("a1", ())) < i + 1:
+                        assert time.monotonic() < deadline
+                        time.sleep(0.01)
+            finally:
+                release.set()
+                for thread in threads:
+                    thread.join()
+        tools = [state.get("tool_name") for _, state in receiver.states[1:]]
+        assert tools == [f"T{i}" for i in range(6)]
+        assert receiver._agent_queues == {}
+
+    def test_failed_event_is_not_reported_as_handled(self):
+        r = HookReceiver("agents", socket_path="/nonexistent/hook.sock")
+        request = json.dumps({"tmux_session": "agents", "session_name": "a1", "data": {}}).encode()
+        with patch("overcode.hook_receiver.process_hook_event", side_effect=RuntimeError("boom")):
+            assert r.handle_request(request) == {"unknown": "boom"}
+
+    def test_failed_event_outcome_is_unknown_to_client(self, receiver):
+        with patch("overcode.hook_receiver.process_hook_event", side_effect=RuntimeError("boom")):
+            assert forward_hook_event({"hook_event_name": "Stop"}, "agents", "a1") is OUTCOME_UNKNOWN
+
+    def test_malformed_request(self):
+        r = HookReceiver("agents", socket_path="/nonexistent/hook.sock")
+        assert "error" in r.handle_request(b"not json")
+        assert "error" in r.handle_request(json.dumps(
+            {"tmux_session": "agents", "session_name": "", "data": {}}).encode())
+
+
+class TestHookHandlerClient:
+
+    def test_no_socket_returns_none(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("OVERCODE_STATE_DIR", str(tmp_path))
+        assert forward_hook_event({"hook_event_name": "Stop"}, "agents", "a1") is None
+
+    def test_delivered_event_without_reply_is_not_processed_again(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("OVERCODE_STATE_DIR", str(tmp_path))
+        path = _get_hook_socket_path("agents")
+        path.parent.mkdir(parents=True)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(path))
+        server.listen(1)
+
+        def accept_and_hang_up():
+            conn, _ = server.accept()
+            with conn:
+                while conn.recv(65536):
+                    pass
+
+        thread = threading.Thread(target=accept_and_hang_up)
+        thread.start()
+        try:
+            assert forward_hook_event({"hook_event_name": "Stop"}, "agents", "a1") is OUTCOME_UNKNOWN
+        finally:
+            thread.join()
+            server.close()
+
+    def test_unknown_outcome_still_applies_budget_block(self, monkeypatch, capsys):
+        monkeypatch.setenv("OVERCODE_SESSION_NAME", "a1")
+        monkeypatch.setenv("OVERCODE_TMUX_SESSION", "agents")
+        with patch("sys.stdin") as mock_stdin, \
+                patch("overcode.hook_handler.forward_hook_event", return_value=OUTCOME_UNKNOWN), \
+                patch("overcode.hook_handler.process_hook_event") as record, \
+                patch("overcode.hook_handler.hook_event_response",
+                      return_value=(2, "", "blocked")) as respond:
+            mock_stdin.read.return_value = json.dumps({"hook_event_name": "UserPromptSubmit"})
+            with pytest.raises(SystemExit) as exc:
+                handle_hook_event()
+        assert exc.value.code == 2
+        record.assert_not_called()
+        respond.assert_called_once()
+        assert capsys.readouterr().err == "blocked\n"
+
+    def test_handle_hook_event_uses_receiver(self, receiver, monkeypatch, capsys):
+        monkeypatch.setenv("OVERCODE_SESSION_NAME", "a1")
+        monkeypatch.setenv("OVERCODE_TMUX_SESSION", "agents")
+        with patch("sys.stdin") as mock_stdin, \
+                patch("overcode.hook_handler.process_hook_event") as local, \
+                patch("overcode.time_context.generate_enhanced_context", return_value="ctx"):
+            mock_stdin.read.return_value = json.dumps({"hook_event_name": "UserPromptSubmit"})
+            handle_hook_event()
+        local.assert_not_called()
+        assert capsys.readouterr().out == "ctx\n"
+
+    def test_handle_hook_event_exits_with_receiver_code(self, monkeypatch, tmp_path, capsys):
+        monkeypatch.setenv("OVERCODE_SESSION_NAME", "a1")
+        monkeypatch.setenv("OVERCODE_TMUX_SESSION", "agents")
+        with patch("sys.stdin") as mock_stdin, \
+                patch("overcode.hook_handler.forward_hook_event", return_value=(2, "", "blocked")):
+            mock_stdin.read.return_value = json.dumps({"hook_event_name": "UserPromptSubmit"})
+            with pytest.raises(SystemExit) as exc:
+                handle_hook_event()
+        assert exc.value.code == 2
+        assert capsys.readouterr().err == "blocked\n"
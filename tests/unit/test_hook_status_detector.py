@@ -823,3 +823,97 @@ class TestStickyGreen:
         # Only the one complete JSON line should survive parsing.
         assert len(events) == 1
         assert events[0]["event"] == "PreToolUse"
+
+
+class TestEventLogTail:
+    """Event log is read incrementally with a bounded buffer (#448)."""
+
+    def _detector(self, tmp_path):
+        state_dir = tmp_path / "sessions" / "agents"
+        state_dir.mkdir(parents=True)
+        return HookStatusDetector("agents", state_dir=state_dir), state_dir / "hook_events_a.jsonl"
+
+    @staticmethod
+    def _line(name, ts):
+        return json.dumps({"event": name, "timestamp": ts}) + "\n"
+
+    def test_reads_only_appended_bytes(self, tmp_path):
+        detector, path = self._detector(tmp_path)
+        path.write_text(self._line("UserPromptSubmit", 1.0))
+        assert [e["event"] for e in detector._read_recent_events("a")] == ["UserPromptSubmit"]
+        offset = detector._event_tails["a"].offset
+
+        with open(path, "a") as f:
+            f.write(self._line("PreToolUse", 2.0))
+        events = detector._read_recent_events("a")
+
+        assert [e["event"] for e in events] == ["UserPromptSubmit", "PreToolUse"]
+        assert detector._event_tails["a"].offset == offset + len(self._line("PreToolUse", 2.0))
+
+    def test_partial_line_completed_later(self, tmp_path):
+        detector, path = self._detector(tmp_path)
+        full = self._line("Stop", 3.0)
+        path.write_text(full[:10])
+        assert detector._read_recent_events("a") == []
+        with open(path, "a") as f:
+            f.write(full[10:])
+        assert [e["event"] for e in detector._read_recent_events("a")] == ["Stop"]
+
+    def test_buffer_is_bounded(self, tmp_path):
+        from overcode.hook_status_detector import _RECENT_EVENTS_LIMIT
+        detector, path = self._detector(tmp_path)
+        path.write_text("".join(self._line("PreToolUse", float(i)) for i in range(200)))
+        events = detector._read_recent_events("a")
+        assert len(events) == _RECENT_EVENTS_LIMIT
+        assert events[-1]["timestamp"] == 199.0
+        assert len(detector._read_recent_events("a", limit=5)) == 5
+
+    def test_rotation_by_replace_resets(self, tmp_path):
+        import os
+        detector, path = self._detector(tmp_path)
+        path.write_text("".join(self._line("PreToolUse", float(i)) for i in range(10)))
+        detector._read_recent_events("a")
+
+        tmp = path.with_suffix(".jsonl.tmp")
+        tmp.write_text(self._line("Stop", 99.0))
+        os.replace(tmp, path)
+
+        assert [e["timestamp"] for e in detector._read_recent_events("a")] == [99.0]
+
+    def test_in_place_rewrite_resets(self, tmp_path):
+        detector, path = self._detector(tmp_path)
+        path.write_text(self._line("PreToolUse", 1.0))
+        detector._read_recent_events("a")
+        path.write_text(self._line("Stop", 2.0) + self._line("Stop", 3.0))
+        assert [e["timestamp"] for e in detector._read_recent_events("a")] == [2.0, 3.0]
+
+    def test_deleted_log_clears_buffer(self, tmp_path):
+        detector, path = self._detector(tmp_path)
+        path.write_text(self._line("PreToolUse", 1.0))
+        detector._read_recent_events("a")
+        path.unlink()
+        assert detector._read_recent_events("a") == []
+
+
+class TestLiveHookState:
+    """States pushed by the hook receiver are used without re-reading."""
+
+    def test_live_state_used_until_file_rewritten(self, tmp_path):
+        import os
+        from unittest.mock import patch
+        state_dir = tmp_path / "sessions" / "agents"
+        _write_hook_state(state_dir, "test-agent", "PreToolUse")
+        detector = HookStatusDetector("agents", state_dir=state_dir)
+
+        live = {"event": "Stop", "timestamp": time.time()}
+        detector.record_hook_state("test-agent", live)
+        with patch("builtins.open", side_effect=AssertionError("file re-read")):
+            assert detector._read_hook_state("test-agent") is live
+
+        # A fallback hook process rewrites the file → live state is dropped.
+        path = state_dir / "hook_state_test-agent.json"
+        path.write_text(json.dumps({"event": "PostToolUse", "timestamp": time.time()}))
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert detector._read_hook_state("test-agent")["event"] == "PostToolUse"
+        assert "test-agent" not in detector._live_states
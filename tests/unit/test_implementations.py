@@ -413,6 +413,52 @@ class TestRealTmux:
 
             assert result is None
 
+    def test_capture_panes_single_process(self):
+        """Should capture every pane with one chained tmux invocation."""
+        tmux = RealTmux(socket_name="test")
+        with patch('overcode.implementations.os.urandom', return_value=b"\x00" * 8), \
+                patch('overcode.implementations.subprocess.run') as mock_run:
+            marker = "__overcode_pane_end_0000000000000000__"
+            mock_run.return_value = MagicMock(
+                returncode=0,
+                stdout=f"a1\na2\n\n{marker}\n{marker}\nb1\n{marker}\n".encode(),
+                stderr=b"",
+            )
+            result = tmux.capture_panes("agents", ["w1", "w2", "w3"], lines=10)
+
+        assert result == {"w1": "a1\na2", "w2": "", "w3": "b1"}
+        assert mock_run.call_count == 1
+        cmd = mock_run.call_args[0][0]
+        assert cmd[:3] == ["tmux", "-L", "test"]
+        assert cmd.count("capture-pane") == 3
+
+    def test_capture_panes_missing_window(self):
+        """A missing window is None and the windows after it are still captured."""
+        tmux = RealTmux()
+        with patch('overcode.implementations.os.urandom', return_value=b"\x00" * 8), \
+                patch('overcode.implementations.subprocess.run') as mock_run:
+            marker = "__overcode_pane_end_0000000000000000__"
+            mock_run.side_effect = [
+                MagicMock(returncode=1, stdout=f"a\n{marker}\n".encode(),
+                          stderr=b"can't find window: w2\n"),
+                MagicMock(returncode=0, stdout=f"c\n{marker}\n".encode(), stderr=b""),
+            ]
+            result = tmux.capture_panes("agents", ["w1", "w2", "w3"])
+
+        assert result == {"w1": "a", "w2": None, "w3": "c"}
+
+    def test_capture_panes_no_server(self):
+        """Without a server every window is None after a single attempt."""
+        tmux = RealTmux()
+        with patch('overcode.implementations.subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(
+                returncode=1, stdout=b"", stderr=b"no server running on /tmp/x\n",
+            )
+            result = tmux.capture_panes("agents", ["w1", "w2"])
+
+        assert result == {"w1": None, "w2": None}
+        assert mock_run.call_count == 1
+
     def test_send_keys_success(self):
         """Should send keys to pane."""
         with patch('overcode.implementations.libtmux.Server') as mock_server_class:
@@ -6,6 +6,7 @@ without running the actual daemon loop.
 """
 
 import json
+import threading
 import pytest
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -310,6 +311,418 @@ class TestMonitorDaemonState:
         assert state.is_stale() is False
 
 
+class TestStatsSnapshot:
+    """Test the versioned per-session stats snapshot on MonitorDaemonState."""
+
+    def _state(self, **kwargs):
+        from overcode.monitor_daemon_state import (
+            MonitorDaemonState, SessionDaemonState, STATS_SNAPSHOT_VERSION,
+        )
+        defaults = dict(
+            pid=1,
+            status="active",
+            last_loop_time=datetime.now().isoformat(),
+            stats_version=STATS_SNAPSHOT_VERSION,
+            stats_generation=3,
+            sessions=[
+                SessionDaemonState(session_id="a", name="a", stats_generation=3,
+                                   claude_stats_generation=3, input_tokens=10, claude_median_work_time=4.0,
+                                   git_diff_files=2, git_diff_insertions=5,
+                                   git_diff_deletions=1, git_untracked=7),
+                SessionDaemonState(session_id="b", name="b"),
+            ],
+        )
+        defaults.update(kwargs)
+        return MonitorDaemonState(**defaults)
+
+    def test_snapshot_includes_only_synced_sessions(self):
+        snapshot = self._state().stats_snapshot()
+        assert list(snapshot) == ["a"]
+
+    def test_snapshot_empty_when_stale(self):
+        old = (datetime.now() - timedelta(seconds=600)).isoformat()
+        assert self._state(last_loop_time=old).stats_snapshot() == {}
+
+    def test_snapshot_empty_on_version_mismatch(self):
+        assert self._state(stats_version=0).stats_snapshot() == {}
+
+    def test_snapshot_empty_before_first_sync(self):
+        assert self._state(stats_generation=0).stats_snapshot() == {}
+
+    def test_git_only_sync_is_not_a_claude_snapshot(self):
+        from overcode.monitor_daemon_state import SessionDaemonState
+        git_only = SessionDaemonState(session_id="g", name="g", stats_generation=3,
+                                      git_diff_files=1)
+        assert git_only.has_stats_snapshot is False
+        assert "g" not in self._state(sessions=[git_only]).stats_snapshot()
+
+    def test_to_claude_stats_and_git_fields(self):
+        ds = self._state().stats_snapshot()["a"]
+        stats = ds.to_claude_stats()
+        assert stats.input_tokens == 10
+        assert stats.median_work_time == 4.0
+        assert ds.git_diff_stats == (2, 5, 1)
+        assert ds.git_untracked == 7
+
+    def test_git_diff_stats_none_when_unsampled(self):
+        from overcode.monitor_daemon_state import SessionDaemonState
+        assert SessionDaemonState().git_diff_stats is None
+
+    def test_round_trips_through_file(self, tmp_path):
+        from overcode.monitor_daemon_state import MonitorDaemonState
+        path = tmp_path / "state.json"
+        self._state().save(path)
+        loaded = MonitorDaemonState.load(path)
+        assert loaded.stats_snapshot()["a"].git_diff_stats == (2, 5, 1)
+
+
+class TestDaemonStatsSnapshotPublishing:
+    """The daemon records Claude and git stats for consumers."""
+
+    def _make_daemon(self, tmp_path, monkeypatch):
+        from overcode.monitor_daemon import MonitorDaemon
+
+        monkeypatch.setattr('overcode.monitor_daemon.ensure_session_dir', lambda x: tmp_path)
+        monkeypatch.setattr(
+            'overcode.monitor_daemon.get_monitor_daemon_pid_path',
+            lambda x: tmp_path / "pid"
+        )
+        monkeypatch.setattr(
+            'overcode.monitor_daemon.get_monitor_daemon_state_path',
+            lambda x: tmp_path / "state.json"
+        )
+        monkeypatch.setattr(
+            'overcode.monitor_daemon.get_agent_history_path',
+            lambda x: tmp_path / "history.csv"
+        )
+        with patch('overcode.monitor_daemon.SessionManager') as mock_sm_cls:
+            with patch('overcode.monitor_daemon.StatusDetector'):
+                daemon = MonitorDaemon(tmux_session="test")
+                daemon.session_manager = mock_sm_cls.return_value
+        return daemon
+
+    def test_state_carries_snapshot_version(self, tmp_path, monkeypatch):
+        from overcode.monitor_daemon_state import STATS_SNAPSHOT_VERSION
+        daemon = self._make_daemon(tmp_path, monkeypatch)
+        assert daemon.state.stats_version == STATS_SNAPSHOT_VERSION
+
+    def test_stats_sync_bumps_generation(self, tmp_path, monkeypatch):
+        from overcode.history_reader import ClaudeSessionStats
+        daemon = self._make_daemon(tmp_path, monkeypatch)
+        session = Mock(id="s1")
+        stats = ClaudeSessionStats(
+            interaction_count=1, input_tokens=1, output_tokens=1,
+            cache_creation_tokens=0, cache_read_tokens=0, work_times=[5.0, 15.0],
+            live_subagent_count=2,
+        )
+        monkeypatch.setattr(
+            daemon, 'sync_claude_code_stats',
+            lambda s: daemon._record_claude_stats(s.id, stats),
+        )
+
+        daemon._sync_session_stats([session], datetime.now())
+
+        assert daemon.state.stats_generation == 1
+        assert daemon._stats_generations["s1"] == 1
+        assert daemon._claude_stats_generations["s1"] == 1
+        assert daemon._claude_stats["s1"] is stats
+
+    def test_git_sync_samples_each_local_session(self, tmp_path, monkeypatch):
+        daemon = self._make_daemon(tmp_path, monkeypatch)
+        session = Mock(id="s1", is_remote=False, status="running",
+                       start_directory=str(tmp_path), focal_repo_subdir=None)
+        remote = Mock(id="r1", is_remote=True, status="running")
+        monkeypatch.setattr('overcode.tui_helpers.get_git_diff_stats', lambda d: (1, 2, 3))
+        monkeypatch.setattr('overcode.tui_helpers.get_git_untracked_count', lambda d: 4)
+
+        daemon._sync_git_stats([session, remote], datetime.now())
+
+        assert daemon._git_stats == {"s1": ((1, 2, 3), 4)}
+        assert daemon.state.stats_generation == 1
+        # Only git has been sampled: consumers must still compute Claude stats
+        assert "s1" not in daemon._claude_stats_generations
+
+    def test_git_sync_throttled(self, tmp_path, monkeypatch):
+        daemon = self._make_daemon(tmp_path, monkeypatch)
+        now = datetime.now()
+        daemon._last_git_stats_sync = now
+        calls = []
+        monkeypatch.setattr('overcode.tui_helpers.get_git_diff_stats', lambda d: calls.append(d))
+        session = Mock(id="s1", is_remote=False, status="running",
+                       start_directory=str(tmp_path), focal_repo_subdir=None)
+        daemon._sync_git_stats([session], now + timedelta(seconds=1))
+        assert calls == []
+
+    def test_cleanup_drops_snapshot_for_removed_sessions(self, tmp_path, monkeypatch):
+        daemon = self._make_daemon(tmp_path, monkeypatch)
+        daemon._git_stats["gone"] = (None, None)
+        daemon._stats_generations["gone"] = 1
+        daemon._cleanup_stale([])
+        assert "gone" not in daemon._git_stats
+        assert "gone" not in daemon._stats_generations
+
+
+class TestTickBatchesSessionWrites:
+    """_tick coalesces its writes in one transaction; sync phases run on workers."""
+
+    def _daemon(self, tmp_path, monkeypatch, events):
+        daemon = TestDaemonStatsSnapshotPublishing()._make_daemon(tmp_path, monkeypatch)
+
+        class _Tx:
+            def __enter__(self):
+                events.append(("begin", threading.current_thread().name))
+
+            def __exit__(self, *exc):
+                events.append(("flush", threading.current_thread().name))
+                return False
+
+        daemon.session_manager.transaction.side_effect = lambda: _Tx()
+        daemon.session_manager.list_sessions.return_value = []
+        daemon._legacy_windows_migrated = True
+        monkeypatch.setattr('overcode.settings.resolve_detection_mode', lambda s: daemon.detector.mode)
+        monkeypatch.setattr(daemon, "_cleanup_stale", lambda s: None)
+        monkeypatch.setattr(daemon, "_dispatch_heartbeats", lambda s: None)
+        monkeypatch.setattr(daemon, "_detect_and_enrich",
+                            lambda s, n: events.append(("detect", None)) or ([], True))
+        monkeypatch.setattr(daemon, "_publish_and_enforce", lambda *a: events.append(("publish", None)))
+        return daemon
+
+    def test_writes_flushed_before_publish(self, tmp_path, monkeypatch):
+        events = []
+        daemon = self._daemon(tmp_path, monkeypatch, events)
+        for phase in ("_sync_session_ids", "_sync_session_stats", "_sync_git_stats",
+                      "_sync_git_context", "_sync_available_skills", "_sync_sandbox_state",
+                      "_sync_process_resources"):
+            monkeypatch.setattr(daemon, phase, lambda *a, _p=phase: events.append((_p, None)))
+
+        daemon._tick(datetime.now())
+
+        tick_thread = threading.current_thread().name
+        tick_events = [e for e, thread in events if thread in (tick_thread, None)]
+        assert tick_events[0] == "begin"
+        assert tick_events[-3:] == ["detect", "flush", "publish"]
+        # The first tick waits for the syncs so it publishes synced stats
+        assert "_sync_process_resources" in tick_events[:tick_events.index("detect")]
+        # Each sync phase coalesces its own writes on its worker thread
+        worker_flushes = [t for e, t in events if e == "flush" and t != tick_thread]
+        assert len(worker_flushes) == 6
+
+    def test_slow_sync_does_not_hold_up_detection(self, tmp_path, monkeypatch):
+        events = []
+        daemon = self._daemon(tmp_path, monkeypatch, events)
+        daemon._last_stats_sync = datetime.now()  # not the first tick
+        release = threading.Event()
+        monkeypatch.setattr(daemon, "_sync_git_stats", lambda *a: release.wait(5))
+        for phase in ("_sync_claude_history", "_sync_git_context", "_sync_available_skills",
+                      "_sync_sandbox_state", "_sync_process_resources"):
+            monkeypatch.setattr(daemon, phase, lambda *a: None)
+
+        try:
+            daemon._tick(datetime.now())
+            daemon._tick(datetime.now())
+            assert [e for e, _ in events if e in ("detect", "publish")] == ["detect", "publish"] * 2
+        finally:
+            release.set()
+
+
+class TestEventDrivenRedetect:
+    """Hook file changes between ticks re-detect only the affected agents."""
+
+    def _daemon(self, tmp_path, monkeypatch):
+        daemon = TestDaemonStatsSnapshotPublishing()._make_daemon(tmp_path, monkeypatch)
+        daemon.session_manager.transaction.return_value.__enter__.return_value = None
+        return daemon
+
+    def test_redetect_merges_into_published_state(self, tmp_path, monkeypatch):
+        from overcode.monitor_daemon_state import SessionDaemonState
+        daemon = self._daemon(tmp_path, monkeypatch)
+        daemon.state.sessions = [
+            SessionDaemonState(session_id="a", name="alpha", current_status="running"),
+            SessionDaemonState(session_id="b", name="beta", current_status="running"),
+        ]
+        alpha = Mock(id="a", tmux_session="test")
+        alpha.name = "alpha"
+        beta = Mock(id="b", tmux_session="test")
+        beta.name = "beta"
+        daemon.session_manager.list_sessions.return_value = [alpha, beta]
+        detected = []
+
+        def fake_detect(sessions, now):
+            detected.extend(s.name for s in sessions)
+            return [SessionDaemonState(session_id="a", name="alpha",
+                                       current_status="waiting_user")], False
+
+        published = []
+        monkeypatch.setattr(daemon, "_detect_and_enrich", fake_detect)
+        monkeypatch.setattr(daemon, "_publish_state", published.append)
+
+        daemon._redetect_agents({"alpha"}, datetime.now())
+
+        assert detected == ["alpha"]
+        assert [(s.name, s.current_status) for s in published[0]] == [
+            ("alpha", "waiting_user"), ("beta", "running"),
+        ]
+
+    def test_unknown_agent_publishes_nothing(self, tmp_path, monkeypatch):
+        daemon = self._daemon(tmp_path, monkeypatch)
+        daemon.session_manager.list_sessions.return_value = []
+        publish = Mock()
+        monkeypatch.setattr(daemon, "_publish_state", publish)
+        daemon._redetect_agents({"ghost"}, datetime.now())
+        publish.assert_not_called()
+
+    def test_watch_until_dispatches_hook_changes(self, tmp_path, monkeypatch):
+        daemon = self._daemon(tmp_path, monkeypatch)
+        batches = [{"hook_state_alpha.json", "hook_events_beta.jsonl"}, set()]
+
+        class FakeWatcher:
+            def wait(self, timeout):
+                return batches.pop(0) if batches else set()
+
+        daemon._watcher = FakeWatcher()
+        redetected = []
+        monkeypatch.setattr(daemon, "_redetect_agents", lambda names, now: redetected.append(names))
+        fake_time = Mock()
+        fake_time.monotonic.side_effect = [0.5, 5.0]
+        monkeypatch.setattr('overcode.monitor_daemon.time', fake_time)
+
+        daemon._watch_until(2.0)
+
+        assert redetected == [{"alpha", "beta"}]
+
+    def test_watch_until_returns_on_activity_signal(self, tmp_path, monkeypatch):
+        daemon = self._daemon(tmp_path, monkeypatch)
+        monkeypatch.setattr(
+            'overcode.monitor_daemon.get_activity_signal_path',
+            lambda s: tmp_path / "activity_signal",
+        )
+        monkeypatch.setattr('overcode.monitor_daemon.check_activity_signal', lambda s: True)
+
+        class FakeWatcher:
+            def wait(self, timeout):
+                return {"activity_signal"}
+
+        daemon._watcher = FakeWatcher()
+        daemon.state.current_interval = 300
+        daemon._watch_until(10 ** 9)
+        from overcode.monitor_daemon import INTERVAL_FAST
+        assert daemon.state.current_interval == INTERVAL_FAST
+
+
+class TestAdaptiveDetection:
+    """Idle agents reuse their last detection until due or bumped."""
+
+    def _daemon(self, tmp_path, monkeypatch, statuses):
+        from overcode.monitor_daemon_state import SessionDaemonState
+        daemon = TestDaemonStatsSnapshotPublishing()._make_daemon(tmp_path, monkeypatch)
+        sessions = []
+        for sid, status in statuses.items():
+            session = Mock(id=sid, tmux_session="test", tmux_window=f"w-{sid}", status="running",
+                           is_asleep=False, heartbeat_enabled=False, pr_number=None, loaded_skills=[])
+            session.name = sid
+            sessions.append(session)
+        by_id = {s.id: s for s in sessions}
+        daemon.session_manager.get_session.side_effect = by_id.get
+        daemon.session_manager.refresh_git_context.return_value = False
+        monkeypatch.setattr(daemon, "track_session_stats",
+                            lambda s, status: SessionDaemonState(session_id=s.id, name=s.name,
+                                                                 current_status=status))
+        monkeypatch.setattr(daemon._status_recorder, "record", lambda *a, **k: None)
+        self.detected = []
+
+        def detect_statuses(batch):
+            self.detected.append(sorted(s.id for s in batch))
+            return [(statuses[s.id], "", "") for s in batch]
+
+        daemon.detector = Mock()
+        daemon.detector.detect_statuses.side_effect = detect_statuses
+        daemon.detector.get_loaded_skills.return_value = []
+        daemon.detector.polling.tmux.pane_fingerprints.return_value = {}
+        monkeypatch.setattr(daemon, "_log_hook_event", lambda *a: None)
+        return daemon, sessions
+
+    def test_only_due_agents_are_detected(self, tmp_path, monkeypatch):
+        daemon, sessions = self._daemon(tmp_path, monkeypatch,
+                                        {"run": "running", "idle": "waiting_user"})
+
+        first, _ = daemon._detect_and_enrich(sessions, datetime.now())
+        second, _ = daemon._detect_and_enrich(sessions, datetime.now())
+
+        assert self.detected == [["idle", "run"], ["run"]]
+        assert [s.current_status for s in second] == ["running", "waiting_user"]
+
+    def test_pane_change_and_heartbeat_bump(self, tmp_path, monkeypatch):
+        daemon, sessions = self._daemon(tmp_path, monkeypatch,
+                                        {"a": "waiting_user", "b": "waiting_user"})
+        fingerprints = daemon.detector.polling.tmux.pane_fingerprints
+        fingerprints.return_value = {"w-a": "1", "w-b": "1"}
+        daemon._detect_and_enrich(sessions, datetime.now())
+
+        fingerprints.return_value = {"w-a": "2", "w-b": "1"}
+        daemon._detect_and_enrich(sessions, datetime.now())
+        monkeypatch.setattr(daemon, "check_and_send_heartbeats", lambda s: {"b"})
+        daemon._dispatch_heartbeats(sessions)
+        daemon._detect_and_enrich(sessions, datetime.now())
+
+        assert self.detected == [["a", "b"], ["a"], ["b"]]
+
+    def test_activity_signal_bumps_everyone(self, tmp_path, monkeypatch):
+        daemon, sessions = self._daemon(tmp_path, monkeypatch,
+                                        {"a": "waiting_user", "b": "asleep"})
+        daemon._detect_and_enrich(sessions, datetime.now())
+        monkeypatch.setattr('overcode.monitor_daemon.check_activity_signal', lambda s: True)
+        monkeypatch.setattr('overcode.monitor_daemon.time.sleep', lambda s: None)
+
+        daemon._interruptible_sleep(10)
+        daemon._detect_and_enrich(sessions, datetime.now())
+
+        assert self.detected == [["a", "b"], ["a", "b"]]
+
+
+class TestHookReceiverStartup:
+    """The daemon starts the hook receiver only when enabled in config."""
+
+    def test_disabled_by_default(self, tmp_path, monkeypatch):
+        daemon = TestDaemonStatsSnapshotPublishing()._make_daemon(tmp_path, monkeypatch)
+        monkeypatch.setattr('overcode.monitor_daemon.get_hook_receiver_enabled', lambda: False)
+        daemon._start_hook_receiver()
+        assert daemon._hook_receiver is None
+
+    def test_started_and_feeds_detector(self, tmp_path, monkeypatch):
+        daemon = TestDaemonStatsSnapshotPublishing()._make_daemon(tmp_path, monkeypatch)
+        monkeypatch.setattr('overcode.monitor_daemon.get_hook_receiver_enabled', lambda: True)
+        with patch('overcode.hook_receiver.HookReceiver') as receiver_cls:
+            receiver_cls.return_value.start.return_value = True
+            daemon._start_hook_receiver()
+        assert daemon._hook_receiver is receiver_cls.return_value
+        assert receiver_cls.call_args.kwargs["on_state"] == daemon.detector.hooks.record_hook_state
+
+
+class TestStatusHistoryUpgrade:
+    """The daemon converts a per-tick history file to the change-only format."""
+
+    def test_converts_legacy_file(self, tmp_path, monkeypatch):
+        daemon = TestDaemonStatsSnapshotPublishing()._make_daemon(tmp_path, monkeypatch)
+        daemon.history_path = tmp_path / "agent_status_history.csv"
+        daemon.history_path.write_text(
+            "timestamp,agent,status,activity,session_id,hostname\n"
+            "2026-01-01T12:00:00,a1,running,,s1,h\n"
+            "2026-01-01T12:00:02,a1,running,,s1,h\n"
+        )
+
+        daemon._upgrade_history_file()
+
+        lines = daemon.history_path.read_text().splitlines()
+        assert lines[0].endswith(",kind")
+        assert len(lines) == 2
+
+    def test_missing_file_is_noop(self, tmp_path, monkeypatch):
+        daemon = TestDaemonStatsSnapshotPublishing()._make_daemon(tmp_path, monkeypatch)
+        daemon.history_path = tmp_path / "missing.csv"
+        daemon._upgrade_history_file()
+        assert not daemon.history_path.exists()
+
+
 class TestCreateMonitorLogger:
     """Test _create_monitor_logger factory function."""
 
@@ -970,6 +1383,19 @@ class TestPublishState:
         assert data["sessions"][0]["current_status"] == "running"
         assert data["last_loop_time"] is not None
 
+    def test_publishes_pane_captures(self, tmp_path, monkeypatch):
+        """Captures recorded during detection are published with the state."""
+        from overcode.monitor_daemon import SessionDaemonState
+        from overcode.pane_store import PaneStoreReader
+
+        daemon = self._make_daemon(tmp_path, monkeypatch)
+        daemon._pane_store.record("sess-1", "agent-1", "pane text", 500)
+        daemon._publish_state([SessionDaemonState(session_id="sess-1", name="agent-1")])
+
+        record = PaneStoreReader("test", path=daemon._pane_store.path).get("sess-1")
+        assert record.content == "pane text"
+        assert record.window == "agent-1"
+
     def test_reads_supervisor_stats_when_available(self, tmp_path, monkeypatch):
         """Should read supervisor stats from file when it exists."""
         daemon = self._make_daemon(tmp_path, monkeypatch)
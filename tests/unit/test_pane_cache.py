@@ -0,0 +1,127 @@
+"""Tests for the process-wide pane capture cache."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from overcode.interfaces import MockTmux
+from overcode.pane_cache import CachingTmux, PaneCache, get_pane_cache
+
+
+class CountingTmux(MockTmux):
+    """MockTmux that records every capture it performs."""
+
+    def __init__(self, delay: float = 0.0):
+        super().__init__()
+        self.delay = delay
+        self.captures: list = []
+        self.new_session("agents")
+        self.set_pane_content("agents", "w1", "one")
+        self.set_pane_content("agents", "w2", "two")
+
+    def capture_pane(self, session, window, lines=100):
+        self.captures.append((window, lines))
+        time.sleep(self.delay)
+        return super().capture_pane(session, window, lines)
+
+    def capture_panes(self, session, windows, lines=100):
+        self.captures.append((tuple(windows), lines))
+        return {w: MockTmux.capture_pane(self, session, w, lines) for w in windows}
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestPaneCache:
+
+    def test_fresh_capture_is_shared(self):
+        tmux, clock = CountingTmux(), FakeClock()
+        cache = PaneCache(ttl=0.2, clock=clock)
+
+        assert cache.capture(tmux, "agents", "w1", 50) == "one"
+        assert cache.capture(tmux, "agents", "w1", 50) == "one"
+        assert tmux.captures == [("w1", 50)]
+
+        clock.now += 0.3
+        cache.capture(tmux, "agents", "w1", 50)
+        assert len(tmux.captures) == 2
+
+    def test_deeper_request_recaptures_and_serves_shallower(self):
+        tmux = CountingTmux()
+        cache = PaneCache(ttl=10)
+
+        cache.capture(tmux, "agents", "w1", 50)
+        cache.capture(tmux, "agents", "w1", 1000)
+        cache.capture(tmux, "agents", "w1", 100)
+
+        assert tmux.captures == [("w1", 50), ("w1", 1000)]
+
+    def test_capture_many_only_captures_missing(self):
+        tmux = CountingTmux()
+        cache = PaneCache(ttl=10)
+
+        cache.capture(tmux, "agents", "w1", 50)
+        result = cache.capture_many(tmux, "agents", ["w1", "w2", "gone"], 50)
+
+        assert result == {"w1": "one", "w2": "two", "gone": None}
+        assert tmux.captures == [("w1", 50), (("w2", "gone"), 50)]
+        assert cache.capture(tmux, "agents", "w2", 50) == "two"
+        assert len(tmux.captures) == 2
+
+    def test_concurrent_requests_share_one_capture(self):
+        tmux = CountingTmux(delay=0.05)
+        cache = PaneCache(ttl=10)
+        start = threading.Barrier(4)
+
+        def request(_):
+            start.wait()
+            return cache.capture(tmux, "agents", "w1", 50)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(request, range(4)))
+
+        assert results == ["one"] * 4
+        assert tmux.captures == [("w1", 50)]
+
+    def test_invalidate(self):
+        tmux = CountingTmux()
+        cache = PaneCache(ttl=10)
+        cache.capture_many(tmux, "agents", ["w1", "w2"], 50)
+
+        cache.invalidate("agents", "w1")
+        cache.capture_many(tmux, "agents", ["w1", "w2"], 50)
+        cache.invalidate("agents")
+        cache.capture(tmux, "agents", "w2", 50)
+
+        assert tmux.captures[1:] == [(("w1",), 50), ("w2", 50)]
+
+    def test_process_wide_instance(self):
+        assert get_pane_cache() is get_pane_cache()
+
+
+class TestCachingTmux:
+
+    def test_captures_go_through_cache_and_rest_delegates(self):
+        inner = CountingTmux()
+        tmux = CachingTmux(inner, PaneCache(ttl=10))
+
+        assert tmux.capture_pane("agents", "w1", lines=50) == "one"
+        assert tmux.capture_panes("agents", ["w1"], lines=50) == {"w1": "one"}
+        assert tmux.has_session("agents") is True
+        assert inner.captures == [("w1", 50)]
+
+    def test_send_keys_invalidates(self):
+        inner = CountingTmux()
+        tmux = CachingTmux(inner, PaneCache(ttl=10))
+
+        tmux.capture_pane("agents", "w1", lines=50)
+        tmux.send_keys("agents", "w1", "hello")
+        tmux.capture_pane("agents", "w1", lines=50)
+
+        assert len(inner.captures) == 2
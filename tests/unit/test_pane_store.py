@@ -0,0 +1,96 @@
+"""Tests for the daemon-published pane store."""
+
+import json
+import os
+import time
+
+from overcode.pane_store import PANE_STORE_VERSION, PUBLISHED_LINES, PaneStoreReader, PaneStoreWriter
+
+
+def _writer_and_reader(tmp_path):
+    path = tmp_path / "panes.json"
+    return PaneStoreWriter("agents", path=path), PaneStoreReader("agents", path=path)
+
+
+class TestPaneStore:
+
+    def test_round_trip(self, tmp_path):
+        writer, reader = _writer_and_reader(tmp_path)
+        writer.record("id1", "w1", "line1\nline2\nline3", 500)
+        writer.publish(["id1"], interval=10)
+
+        record = reader.get("id1")
+        assert record.window == "w1"
+        assert record.content == "line1\nline2\nline3"
+        assert record.tail(2) == "line2\nline3"
+        assert reader.get("id1", min_lines=PUBLISHED_LINES + 1) is None
+        assert reader.get("missing") is None
+
+    def test_publishes_only_the_tail_readers_use(self, tmp_path):
+        from overcode.web_api import PANE_CAPTURE_LINES
+
+        assert PANE_CAPTURE_LINES <= PUBLISHED_LINES
+        writer, reader = _writer_and_reader(tmp_path)
+        lines = [f"line{i}" for i in range(500)]
+        writer.record("id1", "w1", "\n".join(lines), 500)
+        writer.publish(["id1"], interval=10)
+
+        record = reader.get("id1", min_lines=PANE_CAPTURE_LINES)
+        assert record.lines == PUBLISHED_LINES
+        assert record.content == "\n".join(lines[-PUBLISHED_LINES:])
+        assert reader.get("id1", min_lines=PUBLISHED_LINES + 1) is None
+
+        # Scrollback changes above the published tail don't rewrite the store
+        seq = json.loads(writer.path.read_text())["seq"]
+        writer.record("id1", "w1", "\n".join(["changed"] + lines[1:]), 500)
+        writer.publish(["id1"], interval=10)
+        assert json.loads(writer.path.read_text())["seq"] == seq
+
+    def test_seq_moves_only_on_change(self, tmp_path):
+        writer, reader = _writer_and_reader(tmp_path)
+        writer.record("id1", "w1", "a", 500)
+        writer.publish(["id1"], interval=10)
+        first = json.loads(writer.path.read_text())
+
+        writer.record("id1", "w1", "a", 500)
+        writer.publish(["id1"], interval=10)
+        assert json.loads(writer.path.read_text()) == first
+
+        writer.record("id1", "w1", "b", 500)
+        writer.publish(["id1"], interval=10)
+        data = json.loads(writer.path.read_text())
+        assert data["seq"] == first["seq"] + 1
+        assert data["panes"]["id1"]["seq"] == 2
+        assert reader.get("id1").content == "b"
+
+    def test_unchanged_tick_keeps_store_fresh(self, tmp_path):
+        writer, reader = _writer_and_reader(tmp_path)
+        writer.record("id1", "w1", "a", 500)
+        writer.publish(["id1"], interval=10)
+        old = time.time() - 60
+        os.utime(writer.path, (old, old))
+        assert reader.read() == {}
+
+        writer.publish(["id1"], interval=10)
+        assert reader.get("id1").content == "a"
+
+    def test_agents_dropped_and_store_removed(self, tmp_path):
+        writer, reader = _writer_and_reader(tmp_path)
+        writer.record("id1", "w1", "a", 500)
+        writer.record("id2", "w2", "b", 500)
+        writer.publish(["id1", "id2"], interval=10)
+        writer.publish(["id2"], interval=10)
+        assert set(reader.read()) == {"id2"}
+
+        writer.remove()
+        assert reader.read() == {}
+
+    def test_other_versions_ignored(self, tmp_path):
+        _, reader = _writer_and_reader(tmp_path)
+        reader.path.write_text(json.dumps({
+            "version": PANE_STORE_VERSION + 1, "interval": 10,
+            "panes": {"id1": {"session_id": "id1"}},
+        }))
+        assert reader.read() == {}
+        reader.path.write_text("not json")
+        assert reader.read() == {}
@@ -1427,6 +1427,263 @@ class TestSessionHierarchy:
         assert session.parent_session_id is None
 
 
+# =============================================================================
+# Batched updates and SQLite backend
+# =============================================================================
+
+
+class TestUpdateMany:
+    """update_many applies several sessions' updates in one write."""
+
+    def test_updates_fields_and_merges_stats(self, tmp_path):
+        manager = SessionManager(state_dir=tmp_path, skip_git_detection=True, backend="json")
+        a = manager.create_session(name="a", tmux_session="agents", tmux_window=1, command=["claude"])
+        b = manager.create_session(name="b", tmux_session="agents", tmux_window=2, command=["claude"])
+        manager.update_stats(a.id, interaction_count=3)
+
+        manager.update_many({
+            a.id: {"cpu_percent": 12.5, "stats": {"current_task": "building"}},
+            b.id: {"rss_bytes": 2048},
+            "missing": {"cpu_percent": 1.0},
+        })
+
+        a2 = manager.get_session(a.id)
+        assert a2.cpu_percent == 12.5
+        assert a2.stats.current_task == "building"
+        assert a2.stats.interaction_count == 3  # merged, not replaced
+        assert manager.get_session(b.id).rss_bytes == 2048
+        assert manager.get_session("missing") is None
+
+    def test_empty_updates_do_not_write(self, tmp_path):
+        manager = SessionManager(state_dir=tmp_path, skip_git_detection=True, backend="json")
+        manager.update_many({})
+        assert not (tmp_path / "sessions.json").exists()
+
+
+class TestSqliteBackend:
+    """SessionManager with backend="sqlite" behaves like the JSON backend."""
+
+    def _manager(self, tmp_path):
+        return SessionManager(state_dir=tmp_path, skip_git_detection=True, backend="sqlite")
+
+    def test_crud_round_trip(self, tmp_path):
+        manager = self._manager(tmp_path)
+        session = manager.create_session(
+            name="lite", tmux_session="agents", tmux_window=1, command=["claude"]
+        )
+        manager.update_session(session.id, cpu_percent=5.0)
+        manager.update_stats(session.id, interaction_count=7)
+        manager.update_session_status(session.id, "waiting")
+        manager.add_tags(session.id, ["Backend"])
+
+        reloaded = self._manager(tmp_path).get_session(session.id)
+        assert reloaded.name == "lite"
+        assert reloaded.cpu_percent == 5.0
+        assert reloaded.stats.interaction_count == 7
+        assert reloaded.status == "waiting"
+        assert reloaded.tags == ["backend"]
+        assert (tmp_path / "sessions.db").exists()
+        assert not (tmp_path / "sessions.json").exists()
+
+    def test_delete_archives_session(self, tmp_path):
+        manager = self._manager(tmp_path)
+        session = manager.create_session(
+            name="gone", tmux_session="agents", tmux_window=1, command=["claude"]
+        )
+        manager.delete_session(session.id)
+        assert manager.get_session(session.id) is None
+        assert [s.name for s in manager.list_archived_sessions()] == ["gone"]
+
+    def test_migrates_existing_json(self, tmp_path):
+        json_manager = SessionManager(state_dir=tmp_path, skip_git_detection=True, backend="json")
+        session = json_manager.create_session(
+            name="legacy", tmux_session="agents", tmux_window=1, command=["claude"]
+        )
+
+        manager = self._manager(tmp_path)
+        assert manager.get_session(session.id).name == "legacy"
+
+        # The import happens once; later deletions are not undone by re-importing.
+        manager.delete_session(session.id, archive=False)
+        assert self._manager(tmp_path).list_sessions() == []
+        # The JSON file is left in place for rollback.
+        assert session.id in json.loads((tmp_path / "sessions.json").read_text())
+
+    def test_update_many_single_transaction(self, tmp_path):
+        manager = self._manager(tmp_path)
+        ids = [
+            manager.create_session(name=f"s{i}", tmux_session="agents", tmux_window=i, command=["claude"]).id
+            for i in range(3)
+        ]
+        calls = []
+        original = manager._store.transaction
+
+        def counting(session_ids=None):
+            calls.append(session_ids)
+            return original(session_ids)
+
+        manager._store.transaction = counting
+        manager.update_many({sid: {"stats": {"current_task": sid}} for sid in ids})
+
+        assert len(calls) == 1
+        for sid in ids:
+            assert manager.get_session(sid).stats.current_task == sid
+
+    def test_unchanged_rows_not_rewritten(self, tmp_path):
+        manager = self._manager(tmp_path)
+        session = manager.create_session(
+            name="same", tmux_session="agents", tmux_window=1, command=["claude"]
+        )
+        conn = manager._store._connect()
+        before = conn.total_changes
+        manager.update_session(session.id, status="running")  # already running
+        assert conn.total_changes == before
+        manager.update_session(session.id, status="waiting")
+        assert conn.total_changes == before + 1
+
+    def test_exception_rolls_back(self, tmp_path):
+        manager = self._manager(tmp_path)
+        session = manager.create_session(
+            name="safe", tmux_session="agents", tmux_window=1, command=["claude"]
+        )
+        with pytest.raises(RuntimeError):
+            with manager._locked_sessions([session.id]) as state:
+                state[session.id]["name"] = "changed"
+                raise RuntimeError("boom")
+        assert manager.get_session(session.id).name == "safe"
+
+    def test_concurrent_updates_across_managers(self, tmp_path):
+        manager = self._manager(tmp_path)
+        session = manager.create_session(
+            name="busy", tmux_session="agents", tmux_window=1, command=["claude"]
+        )
+
+        def bump(n):
+            m = self._manager(tmp_path)
+            for i in range(10):
+                m.update_stats(session.id, **{f"k{n}": i})
+
+        threads = [threading.Thread(target=bump, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = manager._load_state()[session.id]["stats"]
+        assert all(stats[f"k{n}"] == 9 for n in range(4))
+
+
+class TestSessionTransaction:
+    """transaction() defers and coalesces field updates into one write."""
+
+    @pytest.fixture(params=["json", "sqlite"])
+    def manager(self, request, tmp_path):
+        return SessionManager(state_dir=tmp_path, skip_git_detection=True, backend=request.param)
+
+    def _create(self, manager, name="agent", window=1):
+        return manager.create_session(
+            name=name, tmux_session="agents", tmux_window=window, command=["claude"]
+        )
+
+    def _count_writes(self, manager):
+        calls = []
+        original = manager._locked_sessions
+
+        def counting(session_ids):
+            calls.append(list(session_ids))
+            return original(session_ids)
+
+        manager._locked_sessions = counting
+        return calls
+
+    def test_reads_see_pending_writes(self, manager, tmp_path):
+        session = self._create(manager)
+        other = SessionManager(state_dir=tmp_path, skip_git_detection=True, backend=manager.backend)
+
+        with manager.transaction():
+            manager.update_stats(session.id, current_task="reading")
+            manager.update_session(session.id, pr_number=12)
+            assert manager.get_session(session.id).stats.current_task == "reading"
+            assert manager.list_sessions()[0].pr_number == 12
+            assert manager.get_session_by_name("agent").pr_number == 12
+            # Not on disk yet
+            assert other.get_session(session.id).pr_number is None
+
+        persisted = other.get_session(session.id)
+        assert persisted.stats.current_task == "reading"
+        assert persisted.pr_number == 12
+
+    def test_flushes_once_for_many_sessions(self, manager):
+        ids = [self._create(manager, f"a{i}", i).id for i in range(3)]
+        writes = self._count_writes(manager)
+
+        with manager.transaction():
+            for sid in ids:
+                manager.update_stats(sid, current_task="x")
+                manager.update_session(sid, cpu_percent=3.0)
+                manager.update_session_status(sid, "waiting")
+
+        assert len(writes) == 1
+        for sid in ids:
+            s = manager.get_session(sid)
+            assert (s.stats.current_task, s.cpu_percent, s.status) == ("x", 3.0, "waiting")
+
+    def test_no_op_updates_skip_write(self, manager):
+        session = self._create(manager)
+        writes = self._count_writes(manager)
+
+        with manager.transaction():
+            manager.update_session_status(session.id, "running")
+            manager.update_session(session.id, name="agent")
+            manager.update_stats(session.id, interaction_count=0)
+            manager.update_session("missing", name="ghost")
+
+        assert writes == []
+
+    def test_later_values_win(self, manager):
+        session = self._create(manager)
+        with manager.transaction():
+            manager.update_stats(session.id, current_task="one")
+            manager.update_stats(session.id, current_task="two")
+        assert manager.get_session(session.id).stats.current_task == "two"
+
+    def test_direct_write_carries_pending(self, manager):
+        session = self._create(manager)
+        with manager.transaction():
+            manager.update_session(session.id, pr_number=7)
+            manager.add_tags(session.id, ["urgent"])
+            assert manager._tx.pending == {}
+            assert manager.get_session(session.id).tags == ["urgent"]
+        loaded = manager.get_session(session.id)
+        assert loaded.pr_number == 7
+        assert loaded.tags == ["urgent"]
+
+    def test_nested_transactions_join_outer(self, manager):
+        session = self._create(manager)
+        writes = self._count_writes(manager)
+        with manager.transaction():
+            with manager.transaction():
+                manager.update_session(session.id, pr_number=1)
+            assert writes == []
+        assert len(writes) == 1
+
+    def test_exception_still_flushes_queued_updates(self, manager):
+        session = self._create(manager)
+        with pytest.raises(RuntimeError):
+            with manager.transaction():
+                manager.update_session(session.id, pr_number=3)
+                raise RuntimeError("tick failed")
+        assert manager.get_session(session.id).pr_number == 3
+        assert manager._tx.pending is None
+
+    def test_returned_sessions_do_not_alias_snapshot(self, manager):
+        session = self._create(manager)
+        with manager.transaction():
+            first = manager.get_session(session.id)
+            first.claude_session_ids.append("mutated")
+            assert manager.get_session(session.id).claude_session_ids == []
+
+
 # =============================================================================
 # Run tests directly
 # =============================================================================
@@ -55,6 +55,42 @@ class TestSessionPaths:
             assert result == expected
 
 
+class TestPaneStorePath:
+    """The /dev/shm pane store directory must be private to this user."""
+
+    def test_private_dir_created_0700(self, tmp_path):
+        from overcode.settings import _private_dir
+
+        path = tmp_path / "overcode-shm"
+        assert _private_dir(path) is True
+        assert path.stat().st_mode & 0o777 == 0o700
+
+    def test_symlink_rejected(self, tmp_path):
+        from overcode.settings import _private_dir
+
+        target = tmp_path / "elsewhere"
+        target.mkdir(mode=0o700)
+        link = tmp_path / "overcode-shm"
+        link.symlink_to(target)
+        assert _private_dir(link) is False
+
+    def test_writable_by_others_rejected(self, tmp_path):
+        from overcode.settings import _private_dir
+
+        path = tmp_path / "overcode-shm"
+        path.mkdir()
+        path.chmod(0o777)
+        assert _private_dir(path) is False
+
+    def test_falls_back_to_session_dir_when_not_private(self, tmp_path):
+        from overcode.settings import get_pane_store_path, get_session_dir
+
+        with patch.dict(os.environ, {}, clear=False), \
+                patch("overcode.settings._private_dir", return_value=False):
+            os.environ.pop("OVERCODE_STATE_DIR", None)
+            assert get_pane_store_path("agents") == get_session_dir("agents") / "panes.json"
+
+
 class TestDaemonIsolation:
     """Test that daemons are properly isolated per session."""
 
@@ -4,12 +4,16 @@ Unit tests for sister_poller module.
 Tests agent-to-session conversion, unreachable handling, and ID generation.
 """
 
+import gzip
 import json
+import threading
+import time
 import pytest
 from datetime import datetime
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import HTTPServer, BaseHTTPRequestHandler, ThreadingHTTPServer
 from threading import Thread
 from unittest.mock import patch, MagicMock
+from urllib.parse import parse_qs, urlparse
 
 from overcode.sister_poller import SisterPoller, SisterState, _agent_to_session
 from overcode.session_manager import Session
@@ -153,6 +157,28 @@ class TestAgentToSession:
         assert session.stats.current_state == "waiting_approval"
 
 
+class TestSisterAgentFields:
+
+    def test_agent_to_session_reads_only_requested_fields(self):
+        """Sisters are asked for SISTER_AGENT_FIELDS; nothing else may be read."""
+        from overcode.sister_poller import SISTER_AGENT_FIELDS
+
+        class Recording(dict):
+            read = set()
+
+            def get(self, key, default=None):
+                self.read.add(key)
+                return super().get(key, default)
+
+            def __getitem__(self, key):
+                self.read.add(key)
+                return super().__getitem__(key)
+
+        agent = Recording(name="a", status="running", time_in_state_raw=5)
+        _agent_to_session(agent, "host")
+        assert Recording.read <= set(SISTER_AGENT_FIELDS)
+
+
 class TestSisterPollerInit:
     """Test SisterPoller initialization."""
 
@@ -307,6 +333,159 @@ class TestSisterPollerWithServer:
             key_server.shutdown()
 
 
+class TestSisterPollerConditional:
+    """Conditional (ETag) and delta (?since=) polling against a real server."""
+
+    @pytest.fixture(autouse=True)
+    def setup_server(self):
+        from overcode.web_status_feed import StatusSnapshot, status_delta
+
+        self.documents = {
+            "g1": {"hostname": "h", "summary": {"total_agents": 1},
+                   "agents": [{"name": "a", "status": "running"}]},
+        }
+        self.current = "g1"
+        self.requests = []
+        self.gzip = False
+        outer = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                outer.requests.append((self.path, self.headers.get("If-None-Match")))
+                current = outer.current
+                if self.headers.get("If-None-Match") == f'"{current}"':
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                since = parse_qs(urlparse(self.path).query).get("since", [""])[0]
+                new = StatusSnapshot(current, outer.documents[current], 0.0)
+                if since in outer.documents:
+                    old = StatusSnapshot(since, outer.documents[since], 0.0)
+                    data = status_delta(old, new)
+                else:
+                    data = dict(new.document, generation=current)
+                body = json.dumps(data).encode()
+                self.send_response(200)
+                self.send_header("ETag", f'"{current}"')
+                if outer.gzip and "gzip" in self.headers.get("Accept-Encoding", ""):
+                    body = gzip.compress(body)
+                    self.send_header("Content-Encoding", "gzip")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = HTTPServer(("127.0.0.1", 0), Handler)
+        Thread(target=self.server.serve_forever, daemon=True).start()
+        with patch("overcode.sister_poller.get_hostname", return_value="local"), \
+             patch("overcode.sister_poller.get_sisters_config", return_value=[
+                 {"name": "s", "url": f"http://127.0.0.1:{self.server.server_address[1]}"},
+             ]):
+            self.poller = SisterPoller()
+        yield
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_unchanged_sister_answers_304(self):
+        first = self.poller.poll_all()
+        second = self.poller.poll_all()
+
+        assert [s.name for s in second] == [s.name for s in first] == ["a"]
+        path, if_none_match = self.requests[1]
+        query = parse_qs(urlparse(path).query)
+        assert query["since"] == ["g1"] and if_none_match == '"g1"'
+        assert "pane_content" in query["fields"][0].split(",")
+        assert self.poller.get_sister_states()[0].reachable is True
+
+    def test_gzipped_response_is_decompressed(self):
+        self.gzip = True
+
+        sessions = self.poller.poll_all()
+
+        assert [(s.name, s.status) for s in sessions] == [("a", "running")]
+
+    def test_delta_is_applied(self):
+        self.poller.poll_all()
+        self.documents["g2"] = {
+            "hostname": "h", "summary": {"total_agents": 2},
+            "agents": [{"name": "a", "status": "waiting_user"}, {"name": "b", "status": "running"}],
+        }
+        self.current = "g2"
+
+        sessions = self.poller.poll_all()
+
+        assert [(s.name, s.status) for s in sessions] == [("a", "waiting_user"), ("b", "running")]
+        state = self.poller.get_sister_states()[0]
+        assert state.total_agents == 2
+        assert state.status_document["generation"] == "g2"
+
+
+class TestSisterPollerStream:
+    """subscribe() following a sister's /api/stream."""
+
+    @pytest.fixture(autouse=True)
+    def setup_server(self):
+        from overcode.web_status_feed import format_event
+
+        self.release = threading.Event()
+        self.paths = []
+        outer = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                outer.paths.append(self.path)
+                if urlparse(self.path).path != "/api/stream":
+                    self.send_error(500)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.end_headers()
+                self.wfile.write(format_event("snapshot", {
+                    "hostname": "h", "generation": "g1",
+                    "agents": [{"name": "a", "status": "running"}],
+                }, "g1"))
+                self.wfile.write(format_event("delta", {
+                    "delta": True, "since": "g1", "generation": "g2",
+                    "changed": {}, "agents": {"a": {"status": "waiting_user"}},
+                    "removed": [], "order": ["a"],
+                }, "g2"))
+                self.wfile.flush()
+                outer.release.wait(5)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        with patch("overcode.sister_poller.get_hostname", return_value="local"), \
+             patch("overcode.sister_poller.get_sisters_config", return_value=[
+                 {"name": "s", "url": self.url},
+             ]):
+            self.poller = SisterPoller()
+        yield
+        self.poller.close()
+        self.release.set()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_streamed_updates_replace_polling(self):
+        updates = []
+        self.poller.subscribe(lambda: updates.append(1))
+        deadline = time.monotonic() + 5
+        while len(updates) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert len(updates) == 2
+        assert self.poller.is_streaming(self.url)
+        sessions = self.poller.poll_all()
+        assert [(s.name, s.status) for s in sessions] == [("a", "waiting_user")]
+        # poll_all made no request
+        assert [urlparse(p).path for p in self.paths] == ["/api/stream"]
+
+
 class TestPollAllTimelines:
     """Test timeline polling from sisters."""
 
@@ -0,0 +1,107 @@
+"""
+Tests for state_watcher (hook file change notification).
+"""
+
+import sys
+import threading
+import time
+
+import pytest
+
+from overcode.state_watcher import (
+    InotifyWatcher,
+    PollingWatcher,
+    create_state_watcher,
+    hook_agent_name,
+    is_hook_file,
+)
+
+
+class TestHookAgentName:
+
+    def test_state_and_event_files(self):
+        assert hook_agent_name("hook_state_alpha.json") == "alpha"
+        assert hook_agent_name("hook_events_my-agent.jsonl") == "my-agent"
+
+    def test_other_files_ignored(self):
+        assert hook_agent_name("monitor_daemon_state.json") is None
+        assert hook_agent_name("hook_events_alpha.jsonl.tmp") is None
+        assert hook_agent_name("hook_state_.json") is None
+        assert not is_hook_file("activity_signal")
+
+
+def _write_later(path, text, delay=0.05):
+    def run():
+        time.sleep(delay)
+        path.write_text(text)
+    t = threading.Thread(target=run)
+    t.start()
+    return t
+
+
+class TestPollingWatcher:
+
+    def test_reports_changed_hook_file(self, tmp_path):
+        (tmp_path / "hook_state_a.json").write_text("{}")
+        watcher = PollingWatcher(tmp_path, poll_interval=0.02)
+        t = _write_later(tmp_path / "hook_state_a.json", '{"event": "Stop"}')
+        changed = watcher.wait(2.0)
+        t.join()
+        assert changed == {"hook_state_a.json"}
+
+    def test_ignores_unfiltered_files_and_times_out(self, tmp_path):
+        watcher = PollingWatcher(tmp_path, poll_interval=0.02)
+        (tmp_path / "monitor_daemon_state.json").write_text("{}")
+        start = time.monotonic()
+        assert watcher.wait(0.1) == set()
+        assert time.monotonic() - start >= 0.09
+
+    def test_new_file_detected(self, tmp_path):
+        watcher = PollingWatcher(tmp_path, poll_interval=0.02)
+        t = _write_later(tmp_path / "hook_events_b.jsonl", "{}\n")
+        changed = watcher.wait(2.0)
+        t.join()
+        assert changed == {"hook_events_b.jsonl"}
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+class TestInotifyWatcher:
+
+    def test_reports_write_and_replace(self, tmp_path):
+        watcher = InotifyWatcher(tmp_path)
+        try:
+            t = _write_later(tmp_path / "hook_state_a.json", "{}")
+            assert watcher.wait(2.0) == {"hook_state_a.json"}
+            t.join()
+            watcher.wait(0.05)  # trailing events from the same write
+
+            tmp = tmp_path / "hook_events_a.jsonl.tmp"
+            tmp.write_text("{}\n")
+            tmp.replace(tmp_path / "hook_events_a.jsonl")
+            assert watcher.wait(2.0) == {"hook_events_a.jsonl"}
+        finally:
+            watcher.close()
+
+    def test_filter_and_timeout(self, tmp_path):
+        watcher = InotifyWatcher(tmp_path)
+        try:
+            (tmp_path / "monitor_daemon.log").write_text("x")
+            assert watcher.wait(0.05) == set()
+        finally:
+            watcher.close()
+
+    def test_missing_directory_raises(self, tmp_path):
+        with pytest.raises(OSError):
+            InotifyWatcher(tmp_path / "missing")
+
+
+class TestCreateStateWatcher:
+
+    def test_falls_back_to_polling(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(sys, "platform", "darwin")
+        watcher = create_state_watcher(tmp_path)
+        assert isinstance(watcher, PollingWatcher)
+
+    def test_falls_back_when_inotify_fails(self, tmp_path):
+        watcher = create_state_watcher(tmp_path / "missing")
+        assert isinstance(watcher, PollingWatcher)
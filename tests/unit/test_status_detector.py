@@ -104,6 +104,20 @@ class TestStatusDetectorBasics:
         assert status == STATUS_RUNNING
 
 
+    def test_returns_pane_snapshot(self):
+        """The returned content is a PaneSnapshot that downstream extractors reuse"""
+        from overcode.status_patterns import PaneSnapshot, extract_from_pane
+        mock_tmux = create_mock_tmux_with_content("agents", 1, PANE_CONTENT_WAITING_USER)
+        detector = StatusDetector("agents", tmux=mock_tmux)
+        session = create_mock_session(tmux_window=1)
+
+        _, _, content = detector.detect_status(session)
+
+        assert isinstance(content, PaneSnapshot)
+        assert content.strip() == PANE_CONTENT_WAITING_USER.strip()
+        assert extract_from_pane(content) is extract_from_pane(content)
+
+
 class TestStatusDetectorStalledDetection:
     """Test detection of stalled sessions"""
 
@@ -876,3 +890,61 @@ mike@shirka overcode-main %
         assert status == STATUS_RUNNING, (
             f"Content changing should return RUNNING even with error text, got {status}: {activity}"
         )
+
+
+class TestDetectionMemo:
+    """Repeated content gets the memoized answer without re-running phases."""
+
+    def _detector(self, content):
+        mock_tmux = MockTmux()
+        mock_tmux.new_session("agents")
+        mock_tmux.sessions["agents"][1] = content
+        return StatusDetector("agents", tmux=mock_tmux), mock_tmux, create_mock_session(tmux_window=1)
+
+    def test_unchanged_pane_is_served_from_memo(self, monkeypatch):
+        detector, _, session = self._detector(PANE_CONTENT_RUNNING_WITH_TOOL)
+        first = detector.detect_status(session)
+        second = detector.detect_status(session)
+
+        calls = []
+        original = detector._detect_from_content
+        monkeypatch.setattr(detector, "_detect_from_content",
+                            lambda *a: calls.append(a) or original(*a))
+        third = detector.detect_status(session)
+
+        assert calls == []
+        assert third[:2] == second[:2]
+        assert third[2] == second[2]
+        # The first sighting counts as unchanged too, so only it ran the phases
+        assert (detector.memo_stats.hits, detector.memo_stats.misses) == (2, 1)
+        assert first[0] == STATUS_RUNNING
+
+    def test_change_flag_is_part_of_the_key(self):
+        idle = "Some idle output\nMore idle text\nNo spinners or tools running\n"
+        detector, mock_tmux, session = self._detector(idle)
+        assert detector.detect_status(session)[0] == STATUS_WAITING_USER
+        mock_tmux.sessions["agents"][1] = "Something else entirely\n"
+        detector.detect_status(session)
+        # Back to earlier content: it changed, so the earlier unchanged
+        # result must not be reused
+        mock_tmux.sessions["agents"][1] = idle
+        status, activity, _ = detector.detect_status(session)
+
+        assert status == STATUS_RUNNING
+        assert "Active:" in activity
+        assert detector.detect_status(session)[0] == STATUS_WAITING_USER
+
+    def test_hit_restores_phase_diagnostic(self):
+        detector, mock_tmux, session = self._detector(PANE_CONTENT_THINKING)
+        detector.detect_status(session)
+        detector.detect_status(session)
+        phase = detector._last_detect_phase[session.id]
+        mock_tmux.sessions["agents"][1] = PANE_CONTENT_WAITING_USER
+        detector.detect_status(session)
+        detector.detect_status(session)
+        mock_tmux.sessions["agents"][1] = PANE_CONTENT_THINKING
+        detector.detect_status(session)
+        detector.detect_status(session)
+
+        assert detector.memo_stats.hits >= 1
+        assert detector._last_detect_phase[session.id] == phase
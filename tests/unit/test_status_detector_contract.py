@@ -94,6 +94,22 @@ class ContractTests:
 
         assert status == "terminated"
 
+    def test_detect_statuses_matches_detect_status(self, tmp_path):
+        """detect_statuses gives the same result as detect_status per session."""
+        content = """
+⏺ Working...
+
+>
+  ? for shortcuts
+"""
+        mock_tmux = create_mock_tmux_with_content("agents", 1, content)
+        sessions = [create_mock_session(tmux_window=1), create_mock_session(tmux_window=2)]
+
+        batched = self.create_detector("agents", mock_tmux, tmp_path=tmp_path).detect_statuses(sessions)
+        single = self.create_detector("agents", mock_tmux, tmp_path=tmp_path)
+
+        assert batched == [single.detect_status(s) for s in sessions]
+
     def test_get_pane_content_returns_optional_str(self, tmp_path):
         """get_pane_content returns Optional[str]."""
         mock_tmux = create_mock_tmux_with_content("agents", 1, "hello world")
@@ -9,11 +9,18 @@ from pathlib import Path
 from tempfile import TemporaryDirectory
 
 from overcode.status_history import (
+    KIND_KEYFRAME,
+    KIND_TRANSITION,
     StatusHistoryFile,
+    StatusHistoryRecorder,
     log_agent_status,
     read_agent_status_history,
     get_agent_timeline,
     clear_old_history,
+    convert_history_file,
+    expand_status_history,
+    history_intervals,
+    is_legacy_history_file,
 )
 
 
@@ -477,3 +484,230 @@ class TestStatusHistoryFile:
                 history_file=Path("/nonexistent.csv")
             )
             assert empty == []
+
+
+def _write_rle_csv(path, rows):
+    """Write a run-length encoded CSV.
+
+    rows: list of (datetime, agent, status, kind) tuples
+    """
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['timestamp', 'agent', 'status', 'activity', 'session_id', 'hostname', 'kind'])
+        for ts, agent, status, kind in rows:
+            writer.writerow([ts.isoformat(), agent, status, '', '', '', kind])
+
+
+class TestStatusHistoryRecorder:
+    """Tests for change-only history recording."""
+
+    def test_writes_only_transitions(self, tmp_path):
+        path = tmp_path / "history.csv"
+        recorder = StatusHistoryRecorder(path)
+        t0 = datetime(2026, 1, 1, 12, 0, 0)
+
+        assert recorder.record("a1", "running", "x", now=t0) == KIND_TRANSITION
+        assert recorder.record("a1", "running", "y", now=t0 + timedelta(seconds=2)) is None
+        assert recorder.record("a1", "waiting_user", "", now=t0 + timedelta(seconds=4)) == KIND_TRANSITION
+
+        with open(path, newline='') as f:
+            rows = list(csv.reader(f))
+        assert rows[0][-1] == "kind"
+        assert [(r[2], r[6]) for r in rows[1:]] == [
+            ("running", "t"), ("waiting_user", "t"),
+        ]
+
+    def test_writes_keyframe_after_interval(self, tmp_path):
+        path = tmp_path / "history.csv"
+        recorder = StatusHistoryRecorder(path, keyframe_interval=60)
+        t0 = datetime(2026, 1, 1, 12, 0, 0)
+
+        recorder.record("a1", "running", now=t0)
+        assert recorder.record("a1", "running", now=t0 + timedelta(seconds=59)) is None
+        assert recorder.record("a1", "running", now=t0 + timedelta(seconds=60)) == KIND_KEYFRAME
+        assert recorder.record("a1", "running", now=t0 + timedelta(seconds=61)) is None
+
+    def test_tracks_agents_independently(self, tmp_path):
+        path = tmp_path / "history.csv"
+        recorder = StatusHistoryRecorder(path)
+        t0 = datetime(2026, 1, 1, 12, 0, 0)
+
+        assert recorder.record("a1", "running", now=t0) == KIND_TRANSITION
+        assert recorder.record("a2", "running", now=t0) == KIND_TRANSITION
+        assert recorder.record("a1", "running", session_id="new", now=t0) == KIND_TRANSITION
+
+    def test_forget_restarts_with_transition(self, tmp_path):
+        recorder = StatusHistoryRecorder(tmp_path / "history.csv")
+        t0 = datetime(2026, 1, 1, 12, 0, 0)
+        recorder.record("a1", "running", now=t0)
+        recorder.forget("a1")
+        assert recorder.record("a1", "running", now=t0) == KIND_TRANSITION
+
+
+class TestRunLengthReading:
+    """Reading the run-length encoded format."""
+
+    def test_carries_interval_in_progress_into_window(self, tmp_path):
+        """The state at the window start comes from the row before it."""
+        path = tmp_path / "history.csv"
+        now = datetime.now()
+        _write_rle_csv(path, [
+            (now - timedelta(minutes=64), "a1", "running", "t"),
+            (now - timedelta(minutes=62), "a1", "running", "k"),
+            (now - timedelta(minutes=30), "a1", "waiting_user", "t"),
+        ])
+
+        result = StatusHistoryFile(path).read(hours=1.0)
+
+        assert [e[2] for e in result] == ["running", "waiting_user"]
+        # Carried row is clamped to the window start
+        assert now - timedelta(minutes=61) < result[0][0] < now - timedelta(minutes=59)
+        assert all(len(e) == 6 for e in result)
+
+    def test_no_carry_for_legacy_rows(self, tmp_path):
+        path = tmp_path / "history.csv"
+        now = datetime.now()
+        _write_test_csv(path, [
+            (now - timedelta(minutes=62), "a1", "running", ""),
+            (now - timedelta(minutes=30), "a1", "waiting_user", ""),
+        ])
+
+        result = StatusHistoryFile(path).read(hours=1.0)
+
+        assert [e[2] for e in result] == ["waiting_user"]
+
+    def test_reads_mixed_file(self, tmp_path):
+        """Rows appended in the new format after legacy rows are read too."""
+        path = tmp_path / "history.csv"
+        now = datetime.now()
+        _write_test_csv(path, [(now - timedelta(minutes=5), "a1", "running", "")])
+        log_agent_status("a1", "waiting_user", "", path)
+
+        result = read_agent_status_history(hours=1.0, history_file=path)
+
+        assert [e[2] for e in result] == ["running", "waiting_user"]
+
+
+class TestHistoryIntervals:
+    """Tests for history_intervals and expand_status_history."""
+
+    def test_intervals_end_at_next_row_and_now(self):
+        t0 = datetime(2026, 1, 1, 12, 0, 0)
+        history = [
+            (t0, "a1", "running", "x", "", ""),
+            (t0 + timedelta(minutes=2), "a1", "waiting_user", "", "", ""),
+        ]
+
+        intervals = history_intervals(history, now=t0 + timedelta(minutes=3))
+
+        assert intervals == [
+            (t0, t0 + timedelta(minutes=2), "a1", "running", "x"),
+            (t0 + timedelta(minutes=2), t0 + timedelta(minutes=3), "a1", "waiting_user", ""),
+        ]
+
+    def test_intervals_capped_by_max_gap(self):
+        t0 = datetime(2026, 1, 1, 12, 0, 0)
+        history = [(t0, "a1", "running", "", "", "")]
+
+        intervals = history_intervals(history, now=t0 + timedelta(hours=2), max_gap_seconds=600)
+
+        assert intervals[0][1] == t0 + timedelta(seconds=600)
+
+    def test_expand_weights_by_duration(self):
+        """A 9-minute interval outweighs a 1-minute one, despite one row each."""
+        t0 = datetime(2026, 1, 1, 12, 0, 0)
+        history = [
+            (t0, "a1", "running", "", "", ""),
+            (t0 + timedelta(minutes=9), "a1", "waiting_user", "", "", ""),
+        ]
+
+        samples = expand_status_history(history, step_seconds=10, now=t0 + timedelta(minutes=10))
+
+        running = sum(1 for s in samples if s[2] == "running")
+        waiting = sum(1 for s in samples if s[2] == "waiting_user")
+        assert (running, waiting) == (54, 6)
+
+    def test_expand_keeps_dense_legacy_samples(self):
+        """Per-tick rows closer than the step come out one sample each."""
+        t0 = datetime(2026, 1, 1, 12, 0, 0)
+        history = [(t0 + timedelta(seconds=2 * i), "a1", "running", "") for i in range(5)]
+
+        samples = expand_status_history(history, step_seconds=10, now=t0 + timedelta(seconds=10))
+
+        assert len(samples) == 5
+
+
+class TestConvertHistoryFile:
+    """Tests for converting legacy per-tick files."""
+
+    def test_converts_per_tick_rows(self, tmp_path):
+        path = tmp_path / "history.csv"
+        t0 = datetime(2026, 1, 1, 12, 0, 0)
+        rows = [(t0 + timedelta(seconds=2 * i), "a1", "running", "") for i in range(200)]
+        rows += [(t0 + timedelta(seconds=400 + 2 * i), "a1", "waiting_user", "") for i in range(10)]
+        _write_test_csv(path, rows)
+        assert is_legacy_history_file(path)
+
+        rows_read, rows_written = convert_history_file(path, keyframe_interval=300)
+
+        assert rows_read == 210
+        with open(path, newline='') as f:
+            converted = list(csv.reader(f))
+        assert converted[0][-1] == "kind"
+        assert [(r[2], r[6]) for r in converted[1:]] == [
+            ("running", "t"), ("running", "k"), ("waiting_user", "t"),
+        ]
+        assert rows_written == 3
+        assert not is_legacy_history_file(path)
+
+    def test_preserves_gaps(self, tmp_path):
+        path = tmp_path / "history.csv"
+        t0 = datetime(2026, 1, 1, 12, 0, 0)
+        _write_test_csv(path, [
+            (t0, "a1", "running", ""),
+            (t0 + timedelta(seconds=2), "a1", "running", ""),
+            (t0 + timedelta(hours=1), "a1", "running", ""),
+        ])
+
+        convert_history_file(path, keyframe_interval=300, max_gap_seconds=600)
+
+        with open(path, newline='') as f:
+            converted = list(csv.reader(f))[1:]
+        assert [r[6] for r in converted] == ["t", "t"]
+
+    def test_idempotent(self, tmp_path):
+        path = tmp_path / "history.csv"
+        t0 = datetime(2026, 1, 1, 12, 0, 0)
+        _write_test_csv(path, [(t0 + timedelta(seconds=2 * i), "a1", "running", "") for i in range(10)])
+        convert_history_file(path)
+        first = path.read_text()
+
+        convert_history_file(path)
+
+        assert path.read_text() == first
+
+    def test_converted_timeline_matches(self, tmp_path):
+        """Slots rebuilt from the converted file match the per-tick original."""
+        from overcode.tui_helpers import build_timeline_slots
+
+        path = tmp_path / "history.csv"
+        now = datetime.now().replace(microsecond=0)
+        statuses = ["running"] * 300 + ["waiting_user"] * 300 + ["running"] * 300
+        rows = [
+            (now - timedelta(seconds=2 * (len(statuses) - i)), "a1", status, "")
+            for i, status in enumerate(statuses)
+        ]
+        _write_test_csv(path, rows)
+        before = read_agent_status_history(hours=1.0, history_file=path)
+
+        convert_history_file(path)
+        after = read_agent_status_history(hours=1.0, history_file=path)
+
+        assert len(after) < len(before) / 50
+        slots_before = build_timeline_slots([(e[0], e[2]) for e in before], 60, 1.0, now)
+        slots_after = build_timeline_slots([(e[0], e[2]) for e in after], 60, 1.0, now)
+        assert slots_after == slots_before
+
+    def test_missing_file(self, tmp_path):
+        assert convert_history_file(tmp_path / "missing.csv") == (0, 0)
+        assert not is_legacy_history_file(tmp_path / "missing.csv")
@@ -4,10 +4,16 @@ Tests for status detection patterns module.
 Tests the centralized pattern definitions and helper functions.
 """
 
+import time
+from dataclasses import fields
+
 import pytest
 
 from overcode.status_patterns import (
     StatusPatterns,
+    compile_patterns,
+    PaneSnapshot,
+    strip_ansi,
     DEFAULT_PATTERNS,
     get_patterns,
     matches_any,
@@ -28,6 +34,8 @@ from overcode.status_patterns import (
     extract_sleep_duration,
     extract_auto_accept_mode,
 )
+from tests import fixtures_realistic
+from unittest.mock import patch
 
 
 class TestExtractAutoAcceptMode:
@@ -804,3 +812,175 @@ class TestExtractFromPane:
         result = extract_from_pane(content)
         assert result.background_bash_count == 0
         assert result.bash_count_ambiguous is False
+
+
+REALISTIC_PANES = [
+    value for name, value in vars(fixtures_realistic).items()
+    if name.startswith("REALISTIC_")
+]
+
+LIST_CATEGORIES = [
+    f.name for f in fields(StatusPatterns)
+    if isinstance(getattr(DEFAULT_PATTERNS, f.name), list)
+]
+
+
+def _reference_matches_any(text, patterns, case_sensitive=False):
+    """The uncompiled implementation the matcher must agree with."""
+    if not case_sensitive:
+        text = text.lower()
+        return any(p.lower() in text for p in patterns)
+    return any(p in text for p in patterns)
+
+
+def _reference_starts_with_any(text, patterns, case_sensitive=False):
+    if not case_sensitive:
+        return any(text.lower().startswith(p.lower()) for p in patterns)
+    return any(text.startswith(p) for p in patterns)
+
+
+class TestCompiledPatterns:
+    """The compiled matcher gives the same answers as per-pattern matching."""
+
+    @pytest.mark.parametrize("category", LIST_CATEGORIES)
+    def test_matches_reference_on_realistic_panes(self, category):
+        patterns = getattr(DEFAULT_PATTERNS, category)
+        for case_sensitive in (False, True):
+            matcher = compile_patterns(patterns, case_sensitive)
+            for pane in REALISTIC_PANES:
+                for line in pane.split("\n"):
+                    stripped = line.strip()
+                    assert matcher.search(line) == _reference_matches_any(
+                        line, patterns, case_sensitive)
+                    assert matcher.startswith(stripped) == _reference_starts_with_any(
+                        stripped, patterns, case_sensitive)
+
+    def test_empty_pattern_list_never_matches(self):
+        matcher = compile_patterns([])
+        assert matcher.search("anything") is False
+        assert matcher.startswith("anything") is False
+
+    def test_cached_until_patterns_change(self):
+        patterns = StatusPatterns()
+        first = patterns.matcher("waiting_patterns")
+        assert patterns.matcher("waiting_patterns") is first
+        assert not first.search("custom marker")
+
+        patterns.waiting_patterns.append("Custom Marker")
+        assert patterns.matcher("waiting_patterns") is not first
+        assert patterns.matcher("waiting_patterns").search("custom marker")
+
+        patterns.waiting_patterns = ["other"]
+        assert patterns.matcher("waiting_patterns").search("other")
+
+        patterns.waiting_patterns[0] = "edited"
+        patterns.invalidate_matchers()
+        assert patterns.matcher("waiting_patterns").search("edited")
+
+    def test_helpers_accept_compiled_matcher(self):
+        matcher = DEFAULT_PATTERNS.matcher("active_indicators")
+        line = next(l for pane in REALISTIC_PANES for l in pane.split("\n")
+                    if _reference_matches_any(l, DEFAULT_PATTERNS.active_indicators))
+        assert matches_any(line, matcher)
+        assert find_matching_line([line], matcher) == line
+
+    def test_line_helpers_match_reference(self):
+        for pane in REALISTIC_PANES:
+            lines = [l for l in pane.split("\n") if l.strip()]
+            expected = next(
+                (l for l in reversed(lines)
+                 if _reference_matches_any(l, DEFAULT_PATTERNS.active_indicators)),
+                None,
+            )
+            assert find_matching_line(lines, DEFAULT_PATTERNS.active_indicators) == expected
+            for line in lines:
+                assert is_status_bar_line(line) == any(
+                    line.strip().startswith(p) for p in DEFAULT_PATTERNS.status_bar_prefixes)
+
+    @pytest.mark.benchmark
+    def test_faster_than_per_pattern_matching(self):
+        """Microbenchmark: the per-line checks of a detection pass."""
+        patterns = DEFAULT_PATTERNS
+        substring_names = [
+            "permission_patterns", "active_indicators",
+            "waiting_patterns", "spawn_failure_patterns",
+        ]
+        substring_categories = [getattr(patterns, name) for name in substring_names]
+        lines = [l.strip() for pane in REALISTIC_PANES for l in pane.split("\n")]
+
+        def reference(line):
+            any(line.startswith(p) for p in patterns.status_bar_prefixes)
+            _reference_starts_with_any(line, patterns.execution_indicators, True)
+            for category in substring_categories:
+                _reference_matches_any(line, category)
+
+        def compiled(line):
+            is_status_bar_line(line)
+            patterns.matcher("execution_indicators", True).startswith(line)
+            for name in substring_names:
+                patterns.matcher(name).search(line)
+
+        def best_of(check, rounds=5):
+            best = float("inf")
+            for _ in range(rounds):
+                start = time.perf_counter()
+                for _ in range(20):
+                    for line in lines:
+                        check(line)
+                best = min(best, time.perf_counter() - start)
+            return best
+
+        reference_time = best_of(reference)
+        compiled_time = best_of(compiled)
+        assert compiled_time < reference_time, (
+            f"compiled {compiled_time:.4f}s vs reference {reference_time:.4f}s")
+
+
+class TestPaneSnapshot:
+    """PaneSnapshot computes each derived view once and agrees with the helpers."""
+
+    CONTENT = (
+        "\x1b[1m⏺ Created https://github.com/o/r/pull/42\x1b[0m\n"
+        "\n"
+        "  ⎿  done\n"
+        "⏵⏵ bypass permissions on · 2 bashes · 1 monitor\n"
+    )
+
+    def test_is_the_captured_string(self):
+        snapshot = PaneSnapshot(self.CONTENT)
+        assert snapshot == self.CONTENT
+        assert snapshot.raw == self.CONTENT and type(snapshot.raw) is str
+        assert type(snapshot[:5]) is str
+        assert PaneSnapshot.of(snapshot) is snapshot
+        assert PaneSnapshot.of(None) is None
+
+    @pytest.mark.parametrize("content", REALISTIC_PANES + [CONTENT, ""])
+    def test_views_match_uncached_helpers(self, content):
+        snapshot = PaneSnapshot(content)
+        clean = strip_ansi(content)
+        lines = clean.strip().split("\n")
+        assert strip_ansi(snapshot) == snapshot.clean == clean
+        assert snapshot.lines == lines
+        assert snapshot.tail_lines == [l.strip() for l in lines[-10:] if l.strip()]
+        assert extract_from_pane(snapshot) == extract_from_pane(content)
+        assert extract_pr_number(snapshot) == extract_pr_number(content)
+
+    def test_extraction_computed_once(self):
+        snapshot = PaneSnapshot(self.CONTENT)
+        clean = strip_ansi(self.CONTENT)
+        with patch("overcode.status_patterns.ANSI_ESCAPE_PATTERN") as pattern:
+            pattern.sub.return_value = clean
+            first = extract_from_pane(snapshot)
+            assert extract_from_pane(snapshot) is first
+            assert extract_pr_number(snapshot) == 42
+            strip_ansi(snapshot)
+        assert pattern.sub.call_count == 1
+        assert first.background_bash_count == 2
+
+    def test_memo(self):
+        snapshot = PaneSnapshot(self.CONTENT)
+        calls = []
+        compute = lambda: calls.append(1) or len(calls)
+        assert snapshot.memo("key", compute) == 1
+        assert snapshot.memo("key", compute) == 1
+        assert snapshot.memo("other", compute) == 2
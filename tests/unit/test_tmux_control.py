@@ -0,0 +1,189 @@
+"""Tests for the tmux control-mode transport."""
+
+import os
+import shutil
+import subprocess
+import time
+from unittest.mock import patch
+
+import pytest
+
+from overcode.implementations import RealTmux
+from overcode.tmux_control import (
+    ControlModeTmux,
+    TmuxControlClient,
+    TmuxControlModeError,
+    create_tmux,
+    decode_output,
+    quote_arg,
+)
+
+
+class TestQuoting:
+
+    def test_plain(self):
+        assert quote_arg("agents:=w1") == '"agents:=w1"'
+
+    def test_special_characters_escaped(self):
+        assert quote_arg('a"b$c\\d') == '"a\\"b\\$c\\\\d"'
+
+    def test_control_characters_stay_on_one_line(self):
+        quoted = quote_arg("a\nb\tc\x1b")
+        assert "\n" not in quoted
+        assert quoted == '"a\\nb\\tc\\033"'
+
+    def test_decode_output(self):
+        assert decode_output("plain") == "plain"
+        assert decode_output("a\\134b\\015\\012") == "a\\b\r\n"
+        assert decode_output("\\342\\234\\273") == "✻"
+
+
+class TestWithoutServer:
+
+    def test_command_requires_connection(self):
+        client = TmuxControlClient(socket_name="overcode-test-none")
+        with pytest.raises(TmuxControlModeError):
+            client.command("list-sessions")
+
+    def test_failed_connect_is_rate_limited(self):
+        client = TmuxControlClient(socket_name="overcode-test-none")
+        with patch("overcode.tmux_control.subprocess.Popen", side_effect=OSError("no tmux")) as popen:
+            assert client.connect("agents") is False
+            assert client.connect("agents") is False
+        assert popen.call_count == 1
+
+    def test_falls_back_to_libtmux(self):
+        client = TmuxControlClient(socket_name="overcode-test-none")
+        tmux = ControlModeTmux(client=client)
+        with patch.object(client, "connect", return_value=False), \
+                patch.object(RealTmux, "capture_pane", return_value="fallback") as capture:
+            assert tmux.capture_pane("agents", "w1", lines=10) == "fallback"
+        capture.assert_called_once_with("agents", "w1", 10)
+
+    def test_create_tmux_follows_config(self, monkeypatch):
+        monkeypatch.setenv("OVERCODE_TMUX_CONTROL", "1")
+        assert isinstance(create_tmux("overcode-test-none"), ControlModeTmux)
+        monkeypatch.setenv("OVERCODE_TMUX_CONTROL", "0")
+        assert type(create_tmux("overcode-test-none")) is RealTmux
+
+
+@pytest.fixture
+def tmux_server():
+    if shutil.which("tmux") is None:
+        pytest.skip("tmux not installed")
+    socket_name = f"overcode-ctl-test-{os.getpid()}-{os.urandom(4).hex()}"
+    base = ["tmux", "-L", socket_name, "-f", "/dev/null"]
+    subprocess.run(base + ["new-session", "-d", "-s", "agents", "-n", "w1", "cat"], check=True)
+    yield socket_name, base
+    subprocess.run(base + ["kill-server"], capture_output=True)
+
+
+@pytest.mark.requires_tmux
+class TestWithServer:
+
+    def test_commands_over_one_connection(self, tmux_server):
+        socket_name, base = tmux_server
+        client = TmuxControlClient(socket_name)
+        tmux = ControlModeTmux(socket_name, client=client)
+        try:
+            windows = tmux.list_windows("agents")
+            assert [w["name"] for w in windows] == ["w1"]
+            proc = client._proc
+            assert tmux.get_pane_pid("agents", "w1") > 0
+            assert tmux.has_session("agents") is True
+            assert tmux.has_session("missing") is False
+
+            assert tmux.send_keys("agents", "w1", 'echo "$HOME" ; #{x}', enter=True)
+            deadline = time.time() + 5
+            content = ""
+            while time.time() < deadline and "#{x}" not in content:
+                content = tmux.capture_pane("agents", "w1", lines=20) or ""
+                time.sleep(0.05)
+            assert 'echo "$HOME" ; #{x}' in content
+            assert tmux.capture_pane("agents", "missing") is None
+            # Still the same client process: no fork per command
+            assert client._proc is proc
+        finally:
+            client.close()
+
+    def test_capture_panes(self, tmux_server):
+        socket_name, base = tmux_server
+        subprocess.run(base + ["new-window", "-d", "-t", "agents", "-n", "w2", "cat"], check=True)
+        client = TmuxControlClient(socket_name)
+        tmux = ControlModeTmux(socket_name, client=client)
+        try:
+            result = tmux.capture_panes("agents", ["w1", "gone", "w2"], lines=5)
+            assert result["gone"] is None
+            assert result["w1"] == "" and result["w2"] == ""
+            # The chained single-process path gives the same answer
+            assert RealTmux(socket_name).capture_panes("agents", ["w1", "gone", "w2"], lines=5) == result
+        finally:
+            client.close()
+
+    def test_pane_fingerprints(self, tmux_server):
+        socket_name, _ = tmux_server
+        client = TmuxControlClient(socket_name)
+        tmux = ControlModeTmux(socket_name, client=client)
+        try:
+            fingerprints = tmux.pane_fingerprints("agents")
+            assert list(fingerprints) == ["w1"]
+            pane_id, history, cursor, activity = fingerprints["w1"].split(" ")
+            assert pane_id.startswith("%") and "," in cursor
+            assert abs(int(activity) - time.time()) < 60
+            assert RealTmux(socket_name).pane_fingerprints("agents") == fingerprints
+            assert tmux.pane_fingerprints("missing") == {}
+        finally:
+            client.close()
+
+    def test_pipelined_results_stay_in_order(self, tmux_server):
+        socket_name, _ = tmux_server
+        client = TmuxControlClient(socket_name)
+        try:
+            assert client.connect("agents")
+            results = client.commands([
+                ["display-message", "-p", "one"],
+                ["has-session", "-t", "=missing"],
+                ["display-message", "-p", "three"],
+            ])
+            assert results[0] == (True, ["one"])
+            assert results[1][0] is False
+            assert results[2] == (True, ["three"])
+        finally:
+            client.close()
+
+    def test_missing_session_fails_fast(self, tmux_server):
+        socket_name, _ = tmux_server
+        client = TmuxControlClient(socket_name)
+        tmux = ControlModeTmux(socket_name, client=TmuxControlClient(socket_name))
+        try:
+            started = time.monotonic()
+            assert client.connect("nosuch") is False
+            with patch.object(RealTmux, "capture_pane", return_value="fallback"):
+                assert tmux.capture_pane("nosuch", "w1", lines=10) == "fallback"
+            assert time.monotonic() - started < 1.0
+        finally:
+            client.close()
+            tmux.client.close()
+
+    def test_notifications_and_reconnect(self, tmux_server):
+        socket_name, base = tmux_server
+        client = TmuxControlClient(socket_name)
+        events = []
+        client.add_listener(lambda name, args: events.append(name))
+        try:
+            assert client.connect("agents")
+            subprocess.run(base + ["new-window", "-d", "-t", "agents", "-n", "w2", "cat"], check=True)
+            subprocess.run(base + ["kill-server"], check=True)
+            deadline = time.time() + 5
+            while time.time() < deadline and "exit" not in events:
+                time.sleep(0.05)
+            assert "window-add" in events
+            assert "exit" in events
+            assert not client.connected
+
+            # Server comes back: the next call reconnects
+            subprocess.run(base + ["new-session", "-d", "-s", "agents", "-n", "w1", "cat"], check=True)
+            assert client.connect("agents")
+            assert client.command("display-message", "-p", "ok") == (True, ["ok"])
+        finally:
+            client.close()
@@ -509,6 +509,40 @@ class TestBuildAgentInfo:
         assert result["perm_emoji"] == "🏃"
 
 
+    def test_git_stats_from_fresh_snapshot(self):
+        """With a fresh daemon snapshot, git stats are read, not sampled."""
+        from overcode.web_api import _build_agent_info
+        from overcode.monitor_daemon_state import SessionDaemonState
+        from datetime import datetime
+
+        session = SessionDaemonState(
+            session_id="t", name="a", current_status="running",
+            start_directory="/tmp/repo", stats_generation=2,
+            claude_stats_generation=2, git_diff_files=3, git_diff_insertions=40, git_diff_deletions=5,
+            git_untracked=1,
+        )
+        with patch('overcode.web_api.get_git_diff_stats') as mock_diff:
+            result = _build_agent_info(session, datetime.now(), stats_fresh=True)
+        mock_diff.assert_not_called()
+        assert result["git_diff_files"] == 3
+        assert result["git_diff_insertions"] == 40
+        assert result["git_untracked"] == 1
+
+    def test_git_stats_sampled_when_snapshot_not_fresh(self):
+        from overcode.web_api import _build_agent_info
+        from overcode.monitor_daemon_state import SessionDaemonState
+        from datetime import datetime
+
+        session = SessionDaemonState(
+            session_id="t", name="a", current_status="running",
+            start_directory="/tmp/repo", stats_generation=2, git_diff_files=3,
+        )
+        with patch('overcode.web_api.get_git_diff_stats', return_value=(9, 9, 9)), \
+             patch('overcode.web_api.get_git_untracked_count', return_value=0):
+            result = _build_agent_info(session, datetime.now(), stats_fresh=False)
+        assert result["git_diff_files"] == 9
+
+
 class TestGetStatusData:
     """Tests for get_status_data function."""
 
@@ -555,6 +589,98 @@ class TestGetStatusData:
             assert result["agents"][0]["name"] == "agent1"
             assert result["agents"][1]["name"] == "agent2"
 
+    def test_captures_all_panes_in_one_call(self):
+        """Should capture every agent's pane with a single capture_panes call."""
+        from overcode.web_api import get_status_data
+        from overcode.monitor_daemon_state import MonitorDaemonState, SessionDaemonState
+        from datetime import datetime
+
+        state = MonitorDaemonState(
+            sessions=[
+                SessionDaemonState(session_id="1", name="agent1", tmux_window="agent1"),
+                SessionDaemonState(session_id="2", name="agent2", tmux_window="agent2"),
+            ]
+        )
+        state.last_loop_time = datetime.now().isoformat()
+        with patch('overcode.web_api.get_monitor_daemon_state', return_value=state), \
+                patch('overcode.tmux_control.create_tmux') as mock_create:
+            mock_create.return_value.capture_panes.return_value = {
+                "agent1": "pane one", "agent2": None,
+            }
+            result = get_status_data("test-session")
+
+        mock_create.return_value.capture_panes.assert_called_once_with(
+            "test-session", ["agent1", "agent2"], lines=100
+        )
+        mock_create.return_value.capture_pane.assert_not_called()
+        assert len(result["agents"]) == 2
+
+    def test_uses_daemon_published_panes(self):
+        """Panes the daemon published are not captured again."""
+        from overcode.web_api import get_status_data
+        from overcode.monitor_daemon_state import MonitorDaemonState, SessionDaemonState
+        from overcode.pane_store import PaneRecord
+        from datetime import datetime
+
+        state = MonitorDaemonState(
+            sessions=[
+                SessionDaemonState(session_id="1", name="agent1", tmux_window="agent1"),
+                SessionDaemonState(session_id="2", name="agent2", tmux_window="agent2"),
+            ]
+        )
+        state.last_loop_time = datetime.now().isoformat()
+        published = {"1": PaneRecord("1", "agent1", 3, 0.0, 500, "published one")}
+        with patch('overcode.web_api.get_monitor_daemon_state', return_value=state), \
+                patch('overcode.web_api.read_pane_store', return_value=published), \
+                patch('overcode.tmux_control.create_tmux') as mock_create:
+            mock_create.return_value.capture_panes.return_value = {"agent2": "live two"}
+            result = get_status_data("test-session")
+
+        mock_create.return_value.capture_panes.assert_called_once_with(
+            "test-session", ["agent2"], lines=100
+        )
+        assert [a["pane_content"] for a in result["agents"]] == ["published one", "live two"]
+
+    def test_without_pane_skips_capture(self):
+        """include_pane=False reads and captures no pane; agents= filters by name."""
+        from overcode.web_api import get_status_data
+        from overcode.monitor_daemon_state import MonitorDaemonState, SessionDaemonState
+        from datetime import datetime
+
+        state = MonitorDaemonState(
+            sessions=[
+                SessionDaemonState(session_id="1", name="agent1", tmux_window="agent1"),
+                SessionDaemonState(session_id="2", name="agent2", tmux_window="agent2"),
+            ]
+        )
+        state.last_loop_time = datetime.now().isoformat()
+        with patch('overcode.web_api.get_monitor_daemon_state', return_value=state), \
+                patch('overcode.web_api.read_pane_store') as mock_store, \
+                patch('overcode.tmux_control.create_tmux') as mock_create:
+            result = get_status_data("test-session", include_pane=False, agents=["agent2"])
+
+        mock_store.assert_not_called()
+        mock_create.assert_not_called()
+        assert [a["name"] for a in result["agents"]] == ["agent2"]
+        assert "pane_content" not in result["agents"][0]
+
+    def test_pane_lines_trims_published_capture(self):
+        from overcode.web_api import get_status_data
+        from overcode.monitor_daemon_state import MonitorDaemonState, SessionDaemonState
+        from overcode.pane_store import PaneRecord
+        from datetime import datetime
+
+        state = MonitorDaemonState(
+            sessions=[SessionDaemonState(session_id="1", name="agent1", tmux_window="agent1")]
+        )
+        state.last_loop_time = datetime.now().isoformat()
+        published = {"1": PaneRecord("1", "agent1", 3, 0.0, 500, "a\nb\nc")}
+        with patch('overcode.web_api.get_monitor_daemon_state', return_value=state), \
+                patch('overcode.web_api.read_pane_store', return_value=published):
+            result = get_status_data("test-session", pane_lines=2)
+
+        assert result["agents"][0]["pane_content"] == "b\nc"
+
 
 class TestGetTimelineData:
     """Tests for get_timeline_data function."""
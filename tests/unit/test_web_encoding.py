@@ -0,0 +1,82 @@
+"""Tests for web response encoding."""
+
+import gzip
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from overcode import web_encoding
+from overcode.web_encoding import choose_encoding, compress, dumps_json
+
+
+@pytest.fixture(params=["orjson", "json"])
+def serializer(request):
+    """Run a test with orjson (when installed) and with the stdlib fallback."""
+    if request.param == "orjson" and not web_encoding.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    with patch.object(web_encoding, "HAS_ORJSON", request.param == "orjson"):
+        yield request.param
+
+
+class TestDumpsJson:
+
+    def test_compact_by_default(self, serializer):
+        body, seconds = dumps_json({"a": [1, 2], "b": "x"})
+        assert body == b'{"a":[1,2],"b":"x"}'
+        assert seconds >= 0
+
+    def test_pretty_is_indented(self, serializer):
+        body, _ = dumps_json({"a": 1}, pretty=True)
+        assert body.decode() == '{\n  "a": 1\n}'
+
+    def test_unserializable_values_use_str(self, serializer):
+        body, _ = dumps_json({"t": datetime(2024, 6, 15, 12, 0), "s": {1}})
+        assert json.loads(body) == {"t": "2024-06-15 12:00:00", "s": "{1}"}
+
+    def test_non_ascii_is_utf8(self, serializer):
+        body, _ = dumps_json({"status": "🟢"})
+        assert body == '{"status":"🟢"}'.encode("utf-8")
+
+    def test_huge_int_falls_back_to_json(self):
+        body, _ = dumps_json({"n": 2 ** 70})
+        assert json.loads(body) == {"n": 2 ** 70}
+
+
+class TestChooseEncoding:
+
+    def test_none_without_header(self):
+        assert choose_encoding(None) is None
+        assert choose_encoding("identity") is None
+
+    def test_gzip(self):
+        assert choose_encoding("gzip, deflate, br") == "gzip"
+
+    def test_q_zero_refuses(self):
+        assert choose_encoding("gzip;q=0") is None
+        assert choose_encoding("*;q=0") is None
+
+    def test_wildcard_means_gzip(self):
+        assert choose_encoding("*") == "gzip"
+
+    def test_zstd_preferred_when_available(self):
+        with patch.object(web_encoding, "HAS_ZSTD", True):
+            assert choose_encoding("gzip, zstd") == "zstd"
+        with patch.object(web_encoding, "HAS_ZSTD", False):
+            assert choose_encoding("gzip, zstd") == "gzip"
+            assert choose_encoding("zstd") is None
+
+
+class TestCompress:
+
+    def test_gzip_round_trips(self):
+        body = b'{"pane":"' + b"line\\n" * 500 + b'"}'
+        compressed = compress(body, "gzip")
+        assert len(compressed) < len(body)
+        assert gzip.decompress(compressed) == body
+
+    @pytest.mark.skipif(not web_encoding.HAS_ZSTD, reason="zstandard not installed")
+    def test_zstd_round_trips(self):
+        body = b"x" * 5000
+        assert web_encoding.zstandard.ZstdDecompressor().decompress(compress(body, "zstd")) == body
@@ -0,0 +1,70 @@
+"""Tests for the web server load-test harness."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from overcode.web_loadtest import LatencyStats, run_load_test
+
+
+class TestLatencyStats:
+
+    def test_percentile_nearest_rank(self):
+        stats = LatencyStats(latencies=[0.4, 0.1, 0.3, 0.2])
+        assert stats.percentile(50) == 0.2
+        assert stats.percentile(99) == 0.4
+        assert stats.percentile(0) == 0.1
+
+    def test_percentile_empty(self):
+        assert LatencyStats().percentile(99) == 0.0
+
+    def test_summary(self):
+        stats = LatencyStats(latencies=[0.01, 0.02], errors=1)
+        summary = stats.summary("GET /api/status", 2.0)
+        assert summary.startswith("GET /api/status: 2 ok, 1 errors, 1.0 req/s")
+        assert "p99 20.0ms" in summary
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def _reply(self, code):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        self.send_response(code)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def do_GET(self):
+        self._reply(503 if self.path == "/busy" else 200)
+
+    def do_POST(self):
+        self._reply(200)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestRunLoadTest:
+
+    def test_polls_and_posts(self, server_url):
+        poll_stats, post_stats = run_load_test(
+            server_url, pollers=3, duration=0.3, post_path="/api/agents/cleanup",
+        )
+        assert poll_stats.latencies and poll_stats.errors == 0
+        assert len(post_stats.latencies) == 1
+
+    def test_busy_responses_count_as_errors(self, server_url):
+        poll_stats, post_stats = run_load_test(server_url, pollers=1, duration=0.1, path="/busy")
+        assert post_stats is None
+        assert poll_stats.errors > 0 and not poll_stats.latencies
@@ -1,6 +1,10 @@
 """Tests for web_server module."""
 
+import json
 import os
+import threading
+import urllib.error
+import urllib.request
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -12,6 +16,7 @@ from overcode.web_server import (
     _find_available_port,
     stop_web_server,
     OvercodeHandler,
+    OvercodeHTTPServer,
 )
 
 
@@ -705,6 +710,53 @@ class TestServeJson:
         assert content_length_calls[0][0][1] == str(len(written))
 
 
+    def test_compact_unless_pretty_requested(self):
+        handler = _make_handler()
+        handler.path = "/api/status"
+        OvercodeHandler._serve_json(handler, {"a": 1})
+        assert handler.wfile.write.call_args[0][0] == b'{"a":1}'
+
+        handler = _make_handler()
+        handler.path = "/api/status?pretty=1"
+        OvercodeHandler._serve_json(handler, {"a": 1})
+        assert handler.wfile.write.call_args[0][0] == b'{\n  "a": 1\n}'
+
+    def test_gzips_large_body_when_accepted(self):
+        import gzip
+        handler = _make_handler()
+        handler.headers = {"Accept-Encoding": "gzip"}
+        data = {"pane_content": "$ make test\n" * 500}
+
+        OvercodeHandler._serve_json(handler, data)
+
+        written = handler.wfile.write.call_args[0][0]
+        assert json.loads(gzip.decompress(written)) == data
+        handler.send_header.assert_any_call("Content-Encoding", "gzip")
+        handler.send_header.assert_any_call("Content-Length", str(len(written)))
+        handler.send_header.assert_any_call("Vary", "Accept-Encoding")
+
+    def test_small_or_unaccepted_bodies_are_not_compressed(self):
+        large = {"pane_content": "x" * 5000}
+        for headers, data in (({"Accept-Encoding": "gzip"}, {"ok": True}), ({}, large)):
+            handler = _make_handler()
+            handler.headers = headers
+            OvercodeHandler._serve_json(handler, data)
+            assert json.loads(handler.wfile.write.call_args[0][0]) == data
+            assert "Content-Encoding" not in [c[0][0] for c in handler.send_header.call_args_list]
+
+    def test_logs_size_and_serialization_time(self):
+        handler = _make_handler()
+        handler.headers = {"Accept-Encoding": "gzip"}
+
+        OvercodeHandler._serve_json(handler, {"pane_content": "x" * 5000})
+
+        code, detail = handler.log_request.call_args[0]
+        sent = len(handler.wfile.write.call_args[0][0])
+        assert code == 200
+        assert detail.startswith(f"{sent}B (gzip, ")
+        assert " json " in detail and detail.endswith("ms")
+
+
 class TestServeContent:
     """Tests for _serve_content — shared content serving helper."""
 
@@ -798,8 +850,9 @@ class TestDoOptions:
             "Access-Control-Allow-Methods", "GET, POST, PUT, DELETE, OPTIONS"
         )
         handler.send_header.assert_any_call(
-            "Access-Control-Allow-Headers", "Content-Type, X-API-Key"
+            "Access-Control-Allow-Headers", "Content-Type, X-API-Key, If-None-Match"
         )
+        handler.send_header.assert_any_call("Access-Control-Expose-Headers", "ETag")
         handler.send_header.assert_any_call("Access-Control-Max-Age", "86400")
         handler.end_headers.assert_called_once()
 
@@ -1018,9 +1071,33 @@ class TestAgentStatusRoute:
                 mock_fn.return_value = {"name": "my-agent", "status": "running"}
                 OvercodeHandler.do_GET(handler)
 
-                mock_fn.assert_called_once_with("test-session", "my-agent")
+                mock_fn.assert_called_once_with(
+                    "test-session", "my-agent", include_pane=True, pane_lines=100,
+                )
                 handler._serve_json.assert_called_once_with({"name": "my-agent", "status": "running"})
 
+    def test_projects_agent_fields(self):
+        """fields= narrows the agent; without pane_content no pane is read."""
+        handler = _make_handler()
+        handler.path = "/api/agents/my-agent/status?fields=status"
+
+        with patch('overcode.web_server.get_web_api_key', return_value=None):
+            with patch('overcode.web_server.get_single_agent_status') as mock_fn:
+                mock_fn.return_value = {"name": "my-agent", "status": "running", "cost_usd": 1.0}
+                OvercodeHandler.do_GET(handler)
+
+        assert mock_fn.call_args[1]["include_pane"] is False
+        handler._serve_json.assert_called_once_with({"name": "my-agent", "status": "running"})
+
+    def test_bad_pane_lines_is_400(self):
+        handler = _make_handler()
+        handler.path = "/api/agents/my-agent/status?pane_lines=lots"
+
+        with patch('overcode.web_server.get_web_api_key', return_value=None):
+            OvercodeHandler.do_GET(handler)
+
+        assert handler.send_error.call_args[0][0] == 400
+
     def test_returns_404_when_agent_not_found(self):
         """Should return 404 when agent does not exist."""
         handler = _make_handler()
@@ -1511,6 +1588,19 @@ class TestLogMessageEdgeCases:
             OvercodeHandler.log_message(handler, "%s %s", "GET /api/agents/x/status", "404")
             mock_stderr.write.assert_called()
 
+    def test_logs_expensive_api_poll_with_detail(self):
+        handler = _make_handler()
+
+        with patch('sys.stderr') as mock_stderr:
+            OvercodeHandler.log_message(handler, "%s %s %s", "GET /api/status", "200", "900B json 1.0ms")
+            mock_stderr.write.assert_not_called()
+            OvercodeHandler.log_message(
+                handler, "%s %s %s", "GET /api/status", "200", "700000B json 80.0ms (expensive)",
+            )
+            assert mock_stderr.write.call_args[0][0] == (
+                "[web] GET /api/status 200 700000B json 80.0ms (expensive)\n"
+            )
+
 
 class TestParseDateTime:
     """Additional _parse_datetime tests."""
@@ -1534,3 +1624,254 @@ class TestParseDateTime:
         result = OvercodeHandler._parse_datetime(handler, "2024-06-15")
         assert result is not None
         assert result.day == 15
+
+
+class TestOvercodeHTTPServer:
+    """Concurrency and lanes of OvercodeHTTPServer against a real socket."""
+
+    @pytest.fixture
+    def serve(self):
+        servers = []
+
+        def start(handler_class, **kwargs):
+            server = OvercodeHTTPServer(("127.0.0.1", 0), handler_class, **kwargs)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            servers.append(server)
+            return f"http://127.0.0.1:{server.server_address[1]}"
+
+        yield start
+        for server in servers:
+            server.shutdown()
+            server.server_close()
+
+    @staticmethod
+    def _blocking_handler(release, entered):
+        class Handler(OvercodeHandler):
+            def _serve_health(self, query):
+                entered.set()
+                release.wait(5)
+                self._serve_json({"status": "ok"})
+
+            def _serve_api_status(self, query):
+                self._serve_json({"agents": []})
+
+            def _dispatch_control(self, method, path, body):
+                return {"ok": True}
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    @staticmethod
+    def _get(url, timeout=5):
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return response.status
+
+    def test_slow_request_does_not_block_others(self, serve):
+        release, entered = threading.Event(), threading.Event()
+        url = serve(self._blocking_handler(release, entered), max_workers=4, request_timeout=5)
+        slow = threading.Thread(target=self._get, args=(url + "/health",), daemon=True)
+        try:
+            with patch("overcode.web_server.get_web_api_key", return_value=None), \
+                 patch("overcode.web_server.get_web_allow_control", return_value=True):
+                slow.start()
+                assert entered.wait(2)
+                assert self._get(url + "/api/status", timeout=2) == 200
+                request = urllib.request.Request(
+                    url + "/api/agents/cleanup", data=b"{}", method="POST",
+                    headers={"Content-Type": "application/json"},
+                )
+                with urllib.request.urlopen(request, timeout=2) as response:
+                    assert json.loads(response.read()) == {"ok": True}
+        finally:
+            release.set()
+            slow.join(5)
+
+    def test_busy_read_lane_answers_503(self, serve, capsys):
+        release, entered = threading.Event(), threading.Event()
+        url = serve(self._blocking_handler(release, entered), max_workers=1, request_timeout=0.2)
+        slow = threading.Thread(target=self._get, args=(url + "/health",), daemon=True)
+        try:
+            with patch("overcode.web_server.get_web_api_key", return_value=None):
+                slow.start()
+                assert entered.wait(2)
+                with pytest.raises(urllib.error.HTTPError) as exc_info:
+                    self._get(url + "/api/status", timeout=2)
+                assert exc_info.value.code == 503
+        finally:
+            release.set()
+            slow.join(5)
+        assert "read slot held" in capsys.readouterr().err
+
+    def test_slow_handler_is_logged(self, serve, capsys):
+        release, entered = threading.Event(), threading.Event()
+        release.set()
+        url = serve(self._blocking_handler(release, entered), max_workers=1, request_timeout=5)
+        with patch("overcode.web_server.get_web_api_key", return_value=None), \
+             patch("overcode.web_server.SLOW_HANDLER_SECONDS", 0.0):
+            assert self._get(url + "/health") == 200
+            assert self._get(url + "/health") == 200
+        err = capsys.readouterr().err
+        assert "slow read handler: GET /health" in err
+
+    def test_handler_uses_server_request_timeout(self):
+        handler = _make_handler()
+        handler.server = MagicMock(request_timeout=7.5)
+        with patch("http.server.BaseHTTPRequestHandler.setup"):
+            OvercodeHandler.setup(handler)
+        assert handler.timeout == 7.5
+
+
+class TestServeApiStatus:
+    """Tests for ETag / ?since= / long-poll handling of /api/status."""
+
+    @pytest.fixture
+    def feed(self):
+        from overcode.web_status_feed import StatusFeed
+        documents = [{"timestamp": "t1", "agents": [{"name": "a", "status": "running"}]}]
+        feed = StatusFeed("test-session", build=lambda ts: dict(documents[-1]))
+        feed.documents = documents
+        with patch("overcode.web_server.get_status_feed", return_value=feed):
+            yield feed
+
+    def test_full_document_with_etag(self, feed):
+        handler = _make_handler()
+        OvercodeHandler._serve_api_status(handler, {})
+
+        snapshot = feed.current()
+        data = handler._serve_json.call_args[0][0]
+        assert data["generation"] == snapshot.generation
+        assert data["agents"] == [{"name": "a", "status": "running"}]
+        assert handler._serve_json.call_args[1]["headers"] == {"ETag": snapshot.etag}
+
+    def test_matching_if_none_match_is_304(self, feed):
+        handler = _make_handler()
+        handler.headers = {"If-None-Match": f'W/{feed.current().etag}'}
+        OvercodeHandler._serve_api_status(handler, {})
+
+        handler._send_not_modified.assert_called_once_with(feed.current().etag)
+        handler._serve_json.assert_not_called()
+
+    def test_since_known_generation_returns_delta(self, feed):
+        old = feed.current()
+        feed.documents.append({"timestamp": "t2", "agents": [{"name": "a", "status": "waiting_user"}]})
+        feed._max_age = 0  # force a rebuild
+
+        handler = _make_handler()
+        OvercodeHandler._serve_api_status(handler, {"since": [old.generation]})
+
+        data = handler._serve_json.call_args[0][0]
+        assert data["delta"] is True
+        assert data["since"] == old.generation
+        assert data["agents"] == {"a": {"status": "waiting_user"}}
+
+    def test_since_unknown_generation_returns_full(self, feed):
+        handler = _make_handler()
+        OvercodeHandler._serve_api_status(handler, {"since": ["stale-1"]})
+
+        data = handler._serve_json.call_args[0][0]
+        assert "delta" not in data
+        assert data["agents"] == [{"name": "a", "status": "running"}]
+
+    def test_projection(self, feed):
+        handler = _make_handler()
+        with patch("overcode.web_server.get_status_feed", return_value=feed) as get_feed:
+            OvercodeHandler._serve_api_status(handler, {"fields": ["status"], "agents": ["b"]})
+
+        get_feed.assert_called_once_with("test-session", False)
+        assert handler._serve_json.call_args[0][0]["agents"] == []
+
+    def test_wait_uses_known_generation(self, feed):
+        handler = _make_handler()
+        handler.headers = {"If-None-Match": '"gen-1"'}
+        with patch.object(feed, "wait_for_change") as wait:
+            OvercodeHandler._wait_for_status_change(handler, {"wait": ["5"]})
+        wait.assert_called_once_with("gen-1", 5.0)
+
+    @pytest.mark.parametrize("wait", ["nan", "inf", "-1", "soon", ""])
+    def test_bad_wait_is_400(self, feed, wait):
+        handler = _make_handler()
+        handler.headers = {"If-None-Match": '"gen-1"'}
+        with patch.object(feed, "wait_for_change") as wait_for_change:
+            assert OvercodeHandler._wait_for_status_change(handler, {"wait": [wait]}) is False
+        wait_for_change.assert_not_called()
+        assert handler.send_error.call_args[0][0] == 400
+
+    def test_long_polls_have_a_lane_of_their_own(self, feed):
+        handler = _make_handler()
+        handler.path = "/api/status?wait=5&since=gen-1"
+        handler.server = MagicMock(request_timeout=0.01)
+        handler.server.wait_slots = threading.BoundedSemaphore(1)
+        handler.server.wait_slots.acquire()  # all taken
+        with patch("overcode.web_server.get_web_api_key", return_value=None), \
+                patch.object(feed, "wait_for_change") as wait:
+            OvercodeHandler.do_GET(handler)
+        wait.assert_not_called()
+        handler.send_error.assert_called_once_with(503, "Too many long-polls, try again")
+
+    def test_wait_without_generation_returns_immediately(self, feed):
+        handler = _make_handler()
+        with patch.object(feed, "wait_for_change") as wait:
+            OvercodeHandler._wait_for_status_change(handler, {"wait": ["5"]})
+        wait.assert_not_called()
+
+    def test_parse_etags(self):
+        from overcode.web_server import _parse_etags
+        assert _parse_etags(None) == []
+        assert _parse_etags('"a", W/"b"') == ["a", "b"]
+
+
+class TestServeStream:
+    """Server-Sent Events on /api/stream against a real socket."""
+
+    def test_snapshot_then_deltas(self):
+        from overcode.web_status_feed import StatusFeed, read_events
+
+        documents = [{"agents": [{"name": "a", "status": "running"}]}]
+        feed = StatusFeed("test-session", build=lambda ts: dict(documents[-1]), max_age=0)
+
+        class Handler(OvercodeHandler):
+            def log_message(self, format, *args):
+                pass
+
+        server = OvercodeHTTPServer(("127.0.0.1", 0), Handler, request_timeout=5)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/api/stream"
+        try:
+            with patch("overcode.web_server.get_web_api_key", return_value=None), \
+                 patch("overcode.web_server.get_status_feed", return_value=feed), \
+                 urllib.request.urlopen(url, timeout=5) as response:
+                assert response.headers["Content-Type"] == "text/event-stream"
+                events = read_events(response)
+
+                event, event_id, data = next(events)
+                assert event == "snapshot"
+                assert data["agents"] == [{"name": "a", "status": "running"}]
+
+                documents.append({"agents": [{"name": "a", "status": "waiting_user"}]})
+                event, next_id, data = next(events)
+                assert event == "delta"
+                assert data["since"] == event_id and data["generation"] == next_id
+                assert data["transitions"] == [{"name": "a", "from": "running", "to": "waiting_user"}]
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_resume_from_last_event_id_sends_delta(self):
+        from overcode.web_status_feed import StatusFeed
+
+        documents = [{"agents": [{"name": "a", "status": "running"}]}]
+        feed = StatusFeed("test-session", build=lambda ts: dict(documents[-1]), max_age=0)
+        old = feed.current()
+        documents.append({"agents": [{"name": "a", "status": "done"}]})
+
+        handler = _make_handler()
+        handler.headers = {"Last-Event-ID": old.generation}
+        handler.wfile.write.side_effect = [None, BrokenPipeError()]
+        with patch("overcode.web_server.get_status_feed", return_value=feed), \
+             patch("overcode.web_server.STREAM_KEEPALIVE", 0):
+            OvercodeHandler._serve_stream(handler, {})
+
+        first = handler.wfile.write.call_args_list[0][0][0]
+        assert first.startswith(b"id: ") and b"event: delta" in first
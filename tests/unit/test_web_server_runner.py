@@ -78,7 +78,7 @@ class TestMain:
                         with patch("overcode.settings.get_web_server_port_path") as mock_port_path:
                             mock_port_obj = MagicMock()
                             mock_port_path.return_value = mock_port_obj
-                            with patch("overcode.web_server_runner.HTTPServer") as mock_server_cls:
+                            with patch("overcode.web_server.OvercodeHTTPServer") as mock_server_cls:
                                 mock_server = MagicMock()
                                 mock_server.serve_forever.side_effect = KeyboardInterrupt()
                                 mock_server_cls.return_value = mock_server
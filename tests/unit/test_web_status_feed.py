@@ -0,0 +1,261 @@
+"""Tests for generation-tracked status documents."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from overcode import web_status_feed
+from overcode.web_status_feed import (
+    StatusFeed,
+    StatusProjection,
+    StatusSnapshot,
+    apply_pane_diff,
+    apply_status_delta,
+    format_event,
+    pane_diff,
+    read_events,
+    status_delta,
+)
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def paths(tmp_path, monkeypatch):
+    state = tmp_path / "monitor_daemon_state.json"
+    panes = tmp_path / "panes.json"
+    monkeypatch.setattr(web_status_feed, "get_monitor_daemon_state_path", lambda s: state)
+    monkeypatch.setattr(web_status_feed, "get_pane_store_path", lambda s: panes)
+    return state, panes
+
+
+def make_feed(documents, clock=None, **kwargs):
+    """A feed whose builds return successive ``documents`` (the last repeats)."""
+    calls = []
+
+    def build(tmux_session):
+        calls.append(tmux_session)
+        return dict(documents[min(len(calls), len(documents)) - 1])
+
+    return StatusFeed("agents", build=build, clock=clock or FakeClock(), **kwargs), calls
+
+
+def doc(status="running", timestamp="t1", **extra):
+    return {
+        "timestamp": timestamp,
+        "summary": {"total_agents": 1},
+        "agents": [{"name": "a", "status": status, "daemon_state": {"x": 1, "y": 2}}],
+        **extra,
+    }
+
+
+class TestStatusFeed:
+
+    def test_reuses_document_until_source_changes(self, paths):
+        state, _ = paths
+        feed, calls = make_feed([doc(), doc("waiting_user")])
+        first = feed.current()
+        assert feed.current() is first
+        assert len(calls) == 1
+
+        state.write_text("{}")
+        second = feed.current()
+        assert len(calls) == 2
+        assert second.generation != first.generation
+        assert second.etag == f'"{second.generation}"'
+
+    def test_rebuilds_after_max_age(self, paths):
+        clock = FakeClock()
+        feed, calls = make_feed([doc(), doc("waiting_user")], clock=clock, max_age=10)
+        first = feed.current()
+        clock.now += 11
+        assert feed.current().generation != first.generation
+        assert len(calls) == 2
+
+    def test_unchanged_rebuild_keeps_generation(self, paths):
+        state, _ = paths
+        feed, calls = make_feed([doc(timestamp="t1"), doc(timestamp="t2")])
+        first = feed.current()
+        state.write_text("{}")
+        assert feed.current().generation == first.generation
+        assert len(calls) == 2
+
+    def test_history_is_bounded(self, paths):
+        state, _ = paths
+        feed, _ = make_feed([doc(str(n)) for n in range(5)], history=2)
+        generations = []
+        for n in range(4):
+            state.write_text("x" * (n + 1))
+            generations.append(feed.current().generation)
+        assert feed.get(generations[0]) is None
+        assert feed.get(generations[-1]) is not None
+
+    def test_wait_returns_on_change(self, paths):
+        state, _ = paths
+        feed, _ = make_feed([doc(), doc("waiting_user")], clock=time.monotonic)
+        first = feed.current()
+        timer = threading.Timer(0.1, lambda: state.write_text("{}"))
+        timer.start()
+        try:
+            started = time.monotonic()
+            changed = feed.wait_for_change(first.generation, 5)
+            assert changed.generation != first.generation
+            assert time.monotonic() - started < 2
+        finally:
+            timer.cancel()
+
+    def test_wait_times_out_unchanged(self, paths):
+        feed, _ = make_feed([doc()], clock=time.monotonic)
+        first = feed.current()
+        assert feed.wait_for_change(first.generation, 0.05) is first
+
+    def test_wait_nan_is_bounded(self, paths):
+        feed, _ = make_feed([doc()], clock=time.monotonic)
+        first = feed.current()
+        with patch("overcode.web_status_feed.MAX_WAIT", 0.05):
+            assert feed.wait_for_change(first.generation, float("nan")) is first
+
+
+class TestStatusDelta:
+
+    def snapshot(self, generation, document):
+        return StatusSnapshot(generation, document, 0.0)
+
+    def test_only_changed_fields(self):
+        old = self.snapshot("g1", doc())
+        new_doc = doc(timestamp="t2")
+        new_doc["agents"][0]["daemon_state"]["y"] = 3
+        delta = status_delta(old, self.snapshot("g2", new_doc))
+
+        assert delta["since"] == "g1" and delta["generation"] == "g2"
+        assert delta["changed"] == {"timestamp": "t2"}
+        assert delta["agents"] == {"a": {"daemon_state": {"y": 3}}}
+        assert delta["removed"] == []
+
+    def test_unchanged_agents_are_omitted(self):
+        delta = status_delta(self.snapshot("g1", doc()), self.snapshot("g1", doc()))
+        assert delta["agents"] == {} and delta["changed"] == {}
+
+    def test_round_trip_with_added_and_removed_agents(self):
+        old_doc = doc()
+        old_doc["agents"].append({"name": "gone", "status": "done"})
+        new_doc = doc("waiting_user", timestamp="t2")
+        new_doc["agents"].insert(0, {"name": "new", "status": "running"})
+        new_doc["summary"] = {"total_agents": 2}
+
+        delta = status_delta(self.snapshot("g1", old_doc), self.snapshot("g2", new_doc))
+        assert delta["removed"] == ["gone"]
+        assert apply_status_delta(old_doc, delta) == dict(new_doc, generation="g2")
+
+
+class TestPaneDiff:
+
+    def test_scroll_above_footer(self):
+        old = "\n".join(["l1", "l2", "l3", "l4", "> prompt", "status"])
+        new = "\n".join(["l3", "l4", "l5", "l6", "> prompt", "status"])
+        diff = pane_diff(old, new)
+        assert diff == {"drop": 2, "keep": 2, "lines": ["l5", "l6"], "tail": 2}
+        assert apply_pane_diff(old, diff) == new
+
+    def test_unrelated_content_is_not_diffed(self):
+        assert pane_diff("a\nb", "c\nd") is None
+
+    def test_round_trip_edge_cases(self):
+        cases = [("", "x"), ("a\nb\nc", "a\nb\nc\nd"), ("a\nb", ""), ("x\ny\nx\ny", "x\ny\nz")]
+        for old, new in cases:
+            diff = pane_diff(old, new)
+            if diff is not None:
+                assert apply_pane_diff(old, diff) == new
+
+    def test_status_delta_carries_pane_diff_and_transitions(self):
+        old_doc = doc()
+        old_doc["agents"][0]["pane_content"] = "a\nb\nc\n>"
+        new_doc = doc("waiting_user")
+        new_doc["agents"][0]["pane_content"] = "b\nc\nd\n>"
+
+        delta = status_delta(StatusSnapshot("g1", old_doc, 0.0), StatusSnapshot("g2", new_doc, 0.0))
+
+        assert "pane_content" not in delta["agents"]["a"]
+        assert delta["agents"]["a"]["pane_diff"]["lines"] == ["d"]
+        assert delta["transitions"] == [{"name": "a", "from": "running", "to": "waiting_user"}]
+        assert apply_status_delta(old_doc, delta)["agents"][0] == new_doc["agents"][0]
+
+
+class TestFeedDelta:
+
+    def test_delta_is_computed_once(self, paths):
+        state, _ = paths
+        feed, _ = make_feed([doc(), doc("waiting_user")])
+        old = feed.current()
+        state.write_text("{}")
+        new = feed.current()
+        assert feed.delta(old, new) is feed.delta(old, new)
+
+
+class TestEvents:
+
+    def test_round_trip(self):
+        stream = (
+            format_event("snapshot", {"agents": []}, "g1")
+            + b": keepalive\n\n"
+            + format_event("delta", {"agents": {"a": {"status": "done"}}}, "g2")
+        )
+        lines = [line + b"\n" for line in stream.split(b"\n")]
+        assert list(read_events(lines)) == [
+            ("snapshot", "g1", {"agents": []}),
+            ("delta", "g2", {"agents": {"a": {"status": "done"}}}),
+        ]
+
+
+class TestStatusProjection:
+
+    def test_default_is_full(self):
+        projection = StatusProjection.from_query({})
+        assert projection.is_full
+        document = doc()
+        assert projection.apply(document) is document
+
+    def test_fields_and_agents(self):
+        projection = StatusProjection.from_query({"fields": ["status"], "agents": ["a,b"]})
+        assert projection.fields == {"name", "status"}
+        assert projection.agents == {"a", "b"}
+        assert projection.include_pane is False
+
+        document = doc()
+        document["agents"].append({"name": "c", "status": "done"})
+        assert projection.apply(document)["agents"] == [{"name": "a", "status": "running"}]
+        assert len(document["agents"][0]) == 3  # input untouched
+
+    def test_pane_options(self):
+        projection = StatusProjection.from_query({"pane_lines": ["2"]})
+        agent = {"name": "a", "pane_content": "1\n2\n3"}
+        assert projection.project_agent(agent)["pane_content"] == "2\n3"
+
+        assert StatusProjection.from_query({"include_pane": ["0"]}).project_agent(agent) == {"name": "a"}
+        assert StatusProjection.from_query({"pane_lines": ["0"]}).include_pane is False
+        with pytest.raises(ValueError):
+            StatusProjection.from_query({"pane_lines": ["-1"]})
+
+    def test_projected_delta(self, paths):
+        state, _ = paths
+        first = doc()
+        first["agents"][0]["cost_usd"] = 1.0
+        second = doc("waiting_user")
+        second["agents"][0]["cost_usd"] = 2.0
+        feed, _ = make_feed([first, second])
+        old = feed.current()
+        state.write_text("{}")
+        new = feed.current()
+
+        projection = StatusProjection.from_query({"fields": ["status"]})
+        delta = feed.delta(old, new, projection)
+        assert delta["agents"] == {"a": {"status": "waiting_user"}}